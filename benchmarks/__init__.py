@@ -0,0 +1,8 @@
+# © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
+
+"""Benchmarks for the application's hot paths.
+
+Nothing in here is imported by the application or shipped with it. Run one
+from the repository root with ``python -m benchmarks.<name>``; it prints
+what its ``benchmark()`` returns.
+"""
@@ -0,0 +1,79 @@
+# © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
+
+"""Offscreen GL context and framebuffer for the benchmarks that draw."""
+
+import contextlib
+
+from OpenGL import GL
+from PySide6.QtGui import QGuiApplication, QOffscreenSurface, QOpenGLContext, QSurfaceFormat
+
+
+_app = None
+
+
+@contextlib.contextmanager
+def context():
+    """
+    Make a GL context current on an offscreen surface, in the format
+    app.py sets as the default for the canvases (3.3 compatibility, 24 bit
+    depth).
+
+    :raises RuntimeError: If no such context can be created.
+    """
+    global _app
+
+    _app = QGuiApplication.instance() or QGuiApplication([])
+
+    fmt = QSurfaceFormat()
+    fmt.setVersion(3, 3)
+    fmt.setProfile(QSurfaceFormat.OpenGLContextProfile.CompatibilityProfile)
+    fmt.setDepthBufferSize(24)
+
+    surface = QOffscreenSurface()
+    surface.setFormat(fmt)
+    surface.create()
+
+    ctx = QOpenGLContext()
+    ctx.setFormat(fmt)
+
+    if not ctx.create() or not ctx.makeCurrent(surface):
+        surface.destroy()
+        raise RuntimeError('could not create an OpenGL 3.3 context')
+
+    try:
+        yield ctx
+    finally:
+        ctx.doneCurrent()
+        surface.destroy()
+
+
+@contextlib.contextmanager
+def framebuffer(width: int, height: int):
+    """
+    Bind a *width* x *height* color and depth framebuffer, set the viewport
+    to it and turn depth testing on, for as long as the block runs.
+    """
+    fbo = GL.glGenFramebuffers(1)
+    color, depth = GL.glGenRenderbuffers(2)
+
+    GL.glBindRenderbuffer(GL.GL_RENDERBUFFER, color)
+    GL.glRenderbufferStorage(GL.GL_RENDERBUFFER, GL.GL_RGBA8, width, height)
+    GL.glBindRenderbuffer(GL.GL_RENDERBUFFER, depth)
+    GL.glRenderbufferStorage(GL.GL_RENDERBUFFER, GL.GL_DEPTH24_STENCIL8, width, height)
+    GL.glBindRenderbuffer(GL.GL_RENDERBUFFER, 0)
+
+    GL.glBindFramebuffer(GL.GL_FRAMEBUFFER, fbo)
+    GL.glFramebufferRenderbuffer(GL.GL_FRAMEBUFFER, GL.GL_COLOR_ATTACHMENT0,
+                                 GL.GL_RENDERBUFFER, color)
+    GL.glFramebufferRenderbuffer(GL.GL_FRAMEBUFFER, GL.GL_DEPTH_STENCIL_ATTACHMENT,
+                                 GL.GL_RENDERBUFFER, depth)
+
+    GL.glViewport(0, 0, width, height)
+    GL.glEnable(GL.GL_DEPTH_TEST)
+
+    try:
+        yield fbo
+    finally:
+        GL.glBindFramebuffer(GL.GL_FRAMEBUFFER, 0)
+        GL.glDeleteFramebuffers(1, [fbo])
+        GL.glDeleteRenderbuffers(2, [color, depth])
@@ -0,0 +1,150 @@
+# © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
+
+"""Scene build time of :class:`harness_designer.ray_tracing.accel.SceneAccel`
+over a sequence of renders, and BLAS packing against the per-node splice it
+replaced."""
+
+import time
+
+import numpy as np
+
+from harness_designer.ray_tracing import accel as _accel
+
+
+def _legacy_splice(blases: list[_accel.BLAS]) -> np.ndarray:
+    # how Scene.build used to offset the trees it concatenated: node by node
+    result = []
+    node_offset = 0
+    index_offset = 0
+
+    for blas in blases:
+        structure = blas.structure.copy()
+        num_nodes = len(structure) // 4
+
+        for i in range(num_nodes):
+            if structure[i * 4 + 0] != -1:
+                structure[i * 4 + 0] += node_offset
+            if structure[i * 4 + 1] != -1:
+                structure[i * 4 + 1] += node_offset
+            if structure[i * 4 + 2] != -1:
+                structure[i * 4 + 2] += index_offset
+
+        result.append(structure)
+        node_offset += num_nodes
+        index_offset += len(blas.indices)
+
+    return np.concatenate(result)
+
+
+class _BenchMesh:
+    # stands in for a mesh handler: all BLASCache looks at is its bounds
+
+    def __init__(self):
+        self.local_aabb = np.array([[-0.5, -0.5, -0.5], [0.5, 0.5, 0.5]], dtype=np.float32)
+
+
+class _BenchBLAS(_accel.BLAS):
+    # a BLAS of a complete tree of *num_nodes* nodes around a unit cube,
+    # without a mesh (or bvh_fast) behind it
+
+    def __init__(self, mesh: _BenchMesh, num_nodes: int):  # NOQA
+        nodes = np.arange(num_nodes, dtype=np.int32)
+        internal = nodes < num_nodes // 2
+
+        structure = np.empty((num_nodes, 4), dtype=np.int32)
+        structure[:, 0] = np.where(internal, nodes * 2 + 1, -1)
+        structure[:, 1] = np.where(internal, nodes * 2 + 2, -1)
+        structure[:, 2] = np.where(internal, -1, nodes - num_nodes // 2)
+        structure[:, 3] = np.where(internal, 0, 1)
+
+        self.source = mesh.local_aabb
+        self.vertices = np.zeros((3, 3), dtype=np.float32)
+        self.faces = np.zeros((1, 3), dtype=np.int32)
+        self.bounds = np.tile(mesh.local_aabb.ravel(), num_nodes)
+        self.structure = structure.ravel()
+        self.indices = np.zeros(num_nodes - num_nodes // 2, dtype=np.int32)
+        self.build_ms = 0.0
+
+
+def benchmark(count: int = 2000, meshes: int = 40, nodes: int = 32767,
+              renders: int = 20, seed: int = 0) -> dict:
+    """
+    Time the build of a synthetic scene the way a sequence of renders
+    sees it.
+
+    *count* instances of *meshes* different meshes (stand-in BLAS of
+    *nodes* nodes each, already in the cache, so ``bvh_fast`` isn't
+    needed) are scattered through a 2000 unit cube. The first build packs
+    the pool and builds the TLAS; before each of the *renders* builds after
+    it one instance is moved, like moving one housing between renders.
+
+    :returns: ``instances``, ``first_ms`` (the first build), the
+              ``mean_ms``/``max_ms`` of the builds after it with the TLAS
+              ``refits`` and ``rebuilds`` among them, and ``splice_ms`` /
+              ``legacy_splice_ms``: packing the BLAS of every mesh into one
+              array set, against the per-node loop Scene.build used.
+    :rtype: dict
+    """
+    rng = np.random.default_rng(seed)
+
+    accel = _accel.SceneAccel()
+
+    handlers = [_BenchMesh() for _ in range(meshes)]
+    blases = []
+    for mesh in handlers:
+        blas = _BenchBLAS(mesh, nodes)
+        accel.blas_cache._entries[mesh] = blas  # NOQA
+        blases.append(blas)
+
+    positions = rng.uniform(-1000.0, 1000.0, size=(count, 3))
+    kinds = rng.integers(0, meshes, size=count)
+    rotation = np.eye(3)
+    scale = np.ones(3)
+    material = np.zeros(12, dtype=np.float32)
+
+    def scene():
+        return [_accel.Instance(i, handlers[kinds[i]], positions[i], rotation, scale, material)
+                for i in range(count)]
+
+    start = time.perf_counter()
+    accel.build(scene())
+    first_ms = (time.perf_counter() - start) * 1000.0
+
+    timings = []
+    refits = 0
+    rebuilds = 0
+
+    for _ in range(renders):
+        positions[rng.integers(0, count)] += rng.uniform(-5.0, 5.0, size=3)
+        instances = scene()
+
+        start = time.perf_counter()
+        accel.build(instances)
+        timings.append((time.perf_counter() - start) * 1000.0)
+
+        refits += accel.stats['tlas'] == 'refit'
+        rebuilds += accel.stats['tlas'] == 'built'
+
+    start = time.perf_counter()
+    _accel._Pool(blases)
+    splice_ms = (time.perf_counter() - start) * 1000.0
+
+    start = time.perf_counter()
+    _legacy_splice(blases)
+    legacy_splice_ms = (time.perf_counter() - start) * 1000.0
+
+    return dict(
+        instances=count,
+        first_ms=first_ms,
+        mean_ms=float(np.mean(timings)),
+        max_ms=float(np.max(timings)),
+        refits=refits,
+        rebuilds=rebuilds,
+        splice_ms=splice_ms,
+        legacy_splice_ms=legacy_splice_ms
+    )
+
+
+if __name__ == '__main__':
+    for key, value in benchmark().items():
+        print(f'{key}: {value}')
@@ -0,0 +1,85 @@
+# © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
+
+"""Batched adds, lookups and removes on the object browser's
+:class:`harness_designer.ui.object_browser.browser_model.BrowserModel`."""
+
+import time
+
+from PySide6 import QtCore
+
+from harness_designer.ui.object_browser import browser_model as _browser_model
+
+
+class _BenchObject:
+
+    def __init__(self, name):
+        self.name = name
+
+
+def benchmark(count: int = 20000, repeat: int = 200) -> dict:
+    """
+    Time a project-load sized batch of adds and the lookups the browser
+    makes afterwards.
+
+    *count* objects are added to one category between
+    :meth:`BrowserModel.begin_batch` and :meth:`BrowserModel.end_batch`,
+    each with a builder producing three cross-reference rows. Then :meth:`BrowserModel.index_of` is timed on
+    *repeat* of them, *repeat* rows are removed one at a time and another
+    *repeat* in one :meth:`BrowserModel.remove_nodes` call.
+
+    :returns: ``objects``, ``add_ms`` (the adds plus the reset),
+              ``index_us`` and ``remove_us`` (per call), ``remove_many_ms``
+              and ``built`` (cross-reference rows built, 0 since nothing
+              was expanded).
+    :rtype: dict
+    """
+    app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])  # NOQA
+
+    model = _browser_model.BrowserModel(('Wires',))
+    category = model.category('Wires')
+    objects = [_BenchObject(f'Wire {i}') for i in range(count)]
+
+    start = time.perf_counter()
+    model.begin_batch()
+
+    for obj in objects:
+        def _builder(obj_=obj):
+            return [model.mention(f'Terminal: {obj_.name}', None) for _ in range(3)]
+
+        model.add(category, _browser_model.Node(obj.name, builder=_builder), obj)
+
+    model.end_batch()
+    add_ms = (time.perf_counter() - start) * 1000.0
+
+    step = max(1, count // (repeat * 2))
+    sample = objects[::step][:repeat * 2]
+    singles = sample[::2]
+    many = sample[1::2]
+
+    start = time.perf_counter()
+    for obj in sample:
+        model.index_of(obj)
+
+    index_us = (time.perf_counter() - start) * 1e6 / len(sample)
+
+    start = time.perf_counter()
+    for obj in singles:
+        model.remove(model.node_of(obj))
+
+    remove_us = (time.perf_counter() - start) * 1e6 / len(singles)
+
+    start = time.perf_counter()
+    model.remove_nodes([model.node_of(obj) for obj in many])
+    remove_many_ms = (time.perf_counter() - start) * 1000.0
+
+    assert len(category.children) == count - len(singles) - len(many)
+    assert all(child.row == i for i, child in enumerate(category.children))
+
+    return dict(objects=count, add_ms=add_ms, index_us=index_us,
+                remove_us=remove_us, remove_many_ms=remove_many_ms,
+                built=model.stats['built'])
+
+
+if __name__ == '__main__':
+    for key, value in benchmark().items():
+        print(f'{key}: {value}')
@@ -0,0 +1,172 @@
+# © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
+
+"""Circuit lookups and design-rule checks through
+:class:`harness_designer.ui.editor_ciruit.circuit_index.CircuitIndex` against
+the scan it replaced."""
+
+import time
+import types
+import random
+import statistics
+
+from harness_designer.ui.editor_ciruit import circuit_index as _circuit_index
+from harness_designer.ui.editor_ciruit import design_rules as _design_rules
+
+
+def _bench_id(kind: int, number: int) -> bytes:
+    return kind.to_bytes(2, 'big') + number.to_bytes(14, 'big')
+
+
+def benchmark(circuits: int = 5000, wires_per_circuit: int = 2, bundles: int = 250,
+              bundles_per_wire: int = 3, edits: int = 200, seed: int = 0) -> dict:
+    """
+    Time the index against the scan it replaced on a synthetic harness.
+
+    *circuits* circuits of *wires_per_circuit* wires each are laid through
+    *bundles_per_wire* of *bundles* bundles (one concentric of one layer
+    per bundle), with a start and an end terminal per circuit.
+
+    ``bundles_scan_ms`` and ``bundles_index_ms`` list every circuit's
+    bundles the old way (every wire of every bundle, per circuit) and from
+    the index. ``full_check_ms`` runs the design rules and split
+    suggestions on every circuit; ``edit_check_ms`` is the median over
+    *edits* random single edits (a terminal load, a wire part, a bundle
+    rename) of applying the write and checking only the circuits it
+    touched, ``edit_touched`` the median number of those.
+
+    :returns: The timings and counts described above.
+    :rtype: dict
+    """
+    rng = random.Random(seed)
+
+    bundle_ids = [_bench_id(1, i) for i in range(bundles)]
+    circuit_ids = [_bench_id(2, i) for i in range(circuits)]
+    wire_rows = []
+    terminal_rows = []
+    laid: dict[bytes, list[bytes]] = {bundle_id: [] for bundle_id in bundle_ids}
+
+    for i, circuit_id in enumerate(circuit_ids):
+        terminal_rows.append((_bench_id(3, i * 2), circuit_id, None))
+        terminal_rows.append((_bench_id(3, i * 2 + 1), circuit_id, None))
+
+        for j in range(wires_per_circuit):
+            wire_id = _bench_id(4, i * wires_per_circuit + j)
+            wire_rows.append((wire_id, circuit_id))
+
+            for bundle_id in rng.sample(bundle_ids, bundles_per_wire):
+                laid[bundle_id].append(wire_id)
+
+    concentric_rows = [(_bench_id(5, i), bundle_id) for i, bundle_id in enumerate(bundle_ids)]
+    layer_rows = [(_bench_id(6, i), _bench_id(5, i)) for i in range(bundles)]
+    concentric_wire_rows = []
+    for i, bundle_id in enumerate(bundle_ids):
+        for wire_id in laid[bundle_id]:
+            concentric_wire_rows.append((_bench_id(7, len(concentric_wire_rows)), wire_id, _bench_id(6, i)))
+
+    start = time.perf_counter()
+    index = _circuit_index.CircuitIndex(
+        types.SimpleNamespace(topology=types.SimpleNamespace(built=False)))
+    index.add_rows(_circuit_index._CIRCUITS, ('id',),
+                   [(circuit_id,) for circuit_id in circuit_ids])
+    index.add_rows(_circuit_index._BUNDLES, ('id', 'name'),
+                   [(bundle_id, f'B{i}') for i, bundle_id in enumerate(bundle_ids)])
+    index.add_rows(_circuit_index._WIRES, ('id', 'circuit_id'), wire_rows)
+    index.add_rows(_circuit_index._TERMINALS, ('id', 'circuit_id', 'cavity_id'), terminal_rows)
+    index.add_rows(_circuit_index._CONCENTRICS, ('id', 'bundle_id'), concentric_rows)
+    index.add_rows(_circuit_index._LAYERS, ('id', 'concentric_id'), layer_rows)
+    index.add_rows(_circuit_index._CONCENTRIC_WIRES, ('id', 'wire_id', 'layer_id'),
+                   concentric_wire_rows)
+    index._built = True  # NOQA
+    build_ms = (time.perf_counter() - start) * 1000.0
+
+    # stands in for pjt_wires_table -- all _wire_od() reads is part.od_mm
+    gauges = sorted(_design_rules.AWG_AMPACITY)
+    wire_gauge = {wire_id: rng.choice(gauges) for wire_id, _ in wire_rows}
+    index.db.pjt_wires_table = {
+        wire_id: types.SimpleNamespace(part=types.SimpleNamespace(od_mm=_design_rules.awg_to_od_mm(awg)))
+        for wire_id, awg in wire_gauge.items()}
+
+    circuit_wires = {}
+    for wire_id, circuit_id in wire_rows:
+        circuit_wires.setdefault(circuit_id, []).append(wire_id)
+
+    loads = {circuit_id: rng.uniform(0.0, 30.0) for circuit_id in circuit_ids}
+    bundle_lists = [(bundle_id, f'B{i}', laid[bundle_id]) for i, bundle_id in enumerate(bundle_ids)]
+
+    def _scan_bundles(circuit_id):
+        # the walk _bundles_for_circuit does without the index
+        cw_ids = set(circuit_wires[circuit_id])
+        names = []
+        for _, name, bundle_wires in bundle_lists:
+            for wire_id in bundle_wires:
+                if wire_id in cw_ids:
+                    if name not in names:
+                        names.append(name)
+                    break
+
+        return names
+
+    def _check(circuit_id):
+        awg = wire_gauge[circuit_wires[circuit_id][0]]
+        row = types.SimpleNamespace(
+            wire_gauge_awg=awg, wire_gauge_mm2=None, od_mm=None, total_load_a=loads[circuit_id],
+            volts=12.0, voltage_drop_v=0.0, voltage_drop_pct=0.0,
+            bundle_names=index.bundle_names(circuit_id))
+
+        row.issues = _design_rules.run_drt(row)
+        row.suggestions = _design_rules.generate_suggestions(row, None, index.bundle_wire_ods)
+        row.worst_severity = _design_rules.worst_severity(row.issues)
+        return row
+
+    start = time.perf_counter()
+    scanned = [_scan_bundles(circuit_id) for circuit_id in circuit_ids]
+    bundles_scan_ms = (time.perf_counter() - start) * 1000.0
+
+    start = time.perf_counter()
+    indexed = [index.bundle_names(circuit_id) for circuit_id in circuit_ids]
+    bundles_index_ms = (time.perf_counter() - start) * 1000.0
+
+    if [sorted(names) for names in scanned] != [sorted(names) for names in indexed]:
+        raise RuntimeError('bundle names differ between the scan and the index')
+
+    start = time.perf_counter()
+    for circuit_id in circuit_ids:
+        _check(circuit_id)
+    full_check_ms = (time.perf_counter() - start) * 1000.0
+
+    edit_timings = []
+    edit_touched = []
+    for i in range(edits):
+        kind = i % 3
+        if kind == 0:
+            terminal_id, circuit_id, _ = rng.choice(terminal_rows)
+            loads[circuit_id] = rng.uniform(0.0, 30.0)
+            index.table_written(_circuit_index._TERMINALS, terminal_id, {'load': loads[circuit_id]})
+        elif kind == 1:
+            wire_id, _ = rng.choice(wire_rows)
+            wire_gauge[wire_id] = rng.choice(gauges)
+            index.db.pjt_wires_table[wire_id].part.od_mm = _design_rules.awg_to_od_mm(wire_gauge[wire_id])
+            index.table_written(_circuit_index._WIRES, wire_id, {'part_id': i})
+        else:
+            bundle_id = rng.choice(bundle_ids)
+            index.table_written(_circuit_index._BUNDLES, bundle_id,
+                                {'name': f'B{bundle_ids.index(bundle_id)}'})
+
+        start = time.perf_counter()
+        touched, _ = index.apply_pending()
+        for circuit_id in touched:
+            _check(circuit_id)
+
+        edit_timings.append((time.perf_counter() - start) * 1000.0)
+        edit_touched.append(len(touched))
+
+    return dict(circuits=circuits, wires=len(wire_rows), bundles=bundles,
+                concentric_wires=len(concentric_wire_rows), build_ms=build_ms,
+                bundles_scan_ms=bundles_scan_ms, bundles_index_ms=bundles_index_ms,
+                full_check_ms=full_check_ms, edit_check_ms=statistics.median(edit_timings),
+                edit_touched=statistics.median(edit_touched))
+
+
+if __name__ == '__main__':
+    for key, value in benchmark().items():
+        print(f'{key}: {value}')
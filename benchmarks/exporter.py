@@ -0,0 +1,119 @@
+# © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
+
+"""OCP triangulation build time in :mod:`harness_designer.exporter.exporter`,
+the old per-vertex fill against the deduplicated serial and parallel
+paths."""
+
+import os
+import time
+
+import numpy as np
+from OCP.gp import gp_Dir
+from OCP.gp import gp_Pnt
+from OCP.Poly import Poly_Triangulation, Poly_Triangle
+
+from harness_designer.exporter import exporter as _exporter
+
+
+def _bench_mesh(grid: int):
+    # a grid x grid height field as triangle soup, the way the GL side hands
+    # meshes to the exporter: 6 soup vertices per cell, most of them shared
+    xs, ys = np.meshgrid(np.arange(grid + 1, dtype=np.float32),
+                         np.arange(grid + 1, dtype=np.float32))
+    zs = np.sin(xs * 0.1) * np.cos(ys * 0.1)
+    points = np.stack([xs, ys, zs], axis=-1)
+
+    a = points[:-1, :-1].reshape(-1, 3)
+    b = points[:-1, 1:].reshape(-1, 3)
+    c = points[1:, 1:].reshape(-1, 3)
+    d = points[1:, :-1].reshape(-1, 3)
+    verts = np.stack([a, b, c, a, c, d], axis=1).reshape(-1, 3)
+
+    # smooth-ish normals: one per grid point, shared by every corner on it
+    point_normals = np.stack([-np.cos(xs * 0.1) * 0.1, np.sin(ys * 0.1) * 0.1,
+                              np.ones_like(xs)], axis=-1)
+    na = point_normals[:-1, :-1].reshape(-1, 3)
+    nb = point_normals[:-1, 1:].reshape(-1, 3)
+    nc = point_normals[1:, 1:].reshape(-1, 3)
+    nd = point_normals[1:, :-1].reshape(-1, 3)
+    normals = np.stack([na, nb, nc, na, nc, nd], axis=1).reshape(-1, 3)
+
+    return verts.astype(np.float32), normals.astype(np.float32)
+
+
+def _legacy_fill(verts: np.ndarray, normals: np.ndarray):
+    # how the triangulation was filled before _prepare_part(): every soup
+    # vertex as its own node, read back one numpy scalar at a time
+    n_verts = len(verts)
+    n_tris = n_verts // 3
+
+    tri = Poly_Triangulation(n_verts, n_tris, False, True)
+
+    for i in range(n_verts):
+        tri.SetNode(i + 1, gp_Pnt(float(verts[i, 0]), float(verts[i, 1]), float(verts[i, 2])))
+        nx, ny, nz = normals[i, 0], normals[i, 1], normals[i, 2]
+        if nx * nx + ny * ny + nz * nz < 1e-12:
+            tri.SetNormal(i + 1, gp_Dir(0.0, 0.0, 1.0))
+        else:
+            tri.SetNormal(i + 1, gp_Dir(float(nx), float(ny), float(nz)))
+
+    for i in range(n_tris):
+        tri.SetTriangle(i + 1, Poly_Triangle(i * 3 + 1, i * 3 + 2, i * 3 + 3))
+
+    return tri
+
+
+def benchmark(grid: int = 300, parts: int = 8, path: str | None = None) -> dict:
+    """
+    Time building the OCP triangulation the old way and the new way.
+
+    The mesh is a *grid* x *grid* height field as triangle soup (6 soup
+    vertices per cell), split into *parts* objects for the parallel run.
+    If *path* is given the result is also written there as BREP, so the
+    build can be compared against the time the write itself takes.
+
+    :returns: ``vertices``, ``nodes``, ``triangles``, ``legacy_ms``,
+              ``serial_ms``, ``parallel_ms`` (with their ``prepare_ms`` /
+              ``fill_ms`` split) and, with *path*, ``write_ms``.
+    :rtype: dict
+    """
+    verts, normals = _bench_mesh(grid)
+    results = {}
+
+    start = time.perf_counter()
+    _exporter._make_face(_legacy_fill(verts, normals))
+    results['legacy_ms'] = (time.perf_counter() - start) * 1000.0
+
+    stats = {}
+    start = time.perf_counter()
+    _exporter._build_ocp_shape(verts, normals, stats=stats)
+    results['serial_ms'] = (time.perf_counter() - start) * 1000.0
+    results.update(stats)
+    results['serial_prepare_ms'] = results.pop('prepare_ms')
+    results['serial_fill_ms'] = results.pop('fill_ms')
+
+    # whole triangles per part, the last part taking the remainder
+    per_part = len(verts) // 3 // parts * 3
+    part_sizes = [per_part] * (parts - 1) + [len(verts) - per_part * (parts - 1)]
+
+    stats = {}
+    start = time.perf_counter()
+    shape = _exporter._build_ocp_shape(verts, normals, part_sizes,
+                                       workers=os.cpu_count() or 1, stats=stats)
+    results['parallel_ms'] = (time.perf_counter() - start) * 1000.0
+    results['parallel_prepare_ms'] = stats['prepare_ms']
+    results['parallel_fill_ms'] = stats['fill_ms']
+
+    if path is not None:
+        from OCP.BRepTools import BRepTools
+
+        start = time.perf_counter()
+        BRepTools.Write_s(shape, path)
+        results['write_ms'] = (time.perf_counter() - start) * 1000.0
+
+    return results
+
+
+if __name__ == '__main__':
+    for key, value in benchmark().items():
+        print(f'{key}: {value}')
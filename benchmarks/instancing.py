@@ -0,0 +1,217 @@
+# © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
+
+"""Frame time of a scene of repeated parts with instancing off and on.
+
+Compares the two ways ``CanvasBase._draw_scene`` draws objects that share
+a pooled mesh: one ``BaseVar.render`` per object (three transform uniforms
+and a draw call per pass) and one ``glDrawArraysInstanced`` per group and
+pass through :class:`harness_designer.gl.instancing.InstanceBatcher` --
+``Config.editor_3d.renderer.instancing`` switches between them.
+"""
+
+import time
+
+import numpy as np
+from OpenGL import GL
+
+from harness_designer import color as _color
+from harness_designer import utils as _utils
+from harness_designer.geometry import angle as _angle
+from harness_designer.geometry import point as _point
+from harness_designer.gl import instancing as _instancing
+from harness_designer.gl import materials as _materials
+from harness_designer.gl import shaders as _shaders
+from harness_designer.gl import vbo as _vbo
+from harness_designer.objects import objectsvar as _objectsvar
+from harness_designer.shapes import torus as _torus
+
+from . import _gl
+
+
+class _View(_objectsvar.BaseVar):
+    # a plain single-mesh object the way Base3D sets one up, without the
+    # editor it hangs off
+    _instanced = True
+
+    @property
+    def _selected_color(self):
+        return _color.Color(1.0, 0.5, 0.0, 1.0)
+
+    @property
+    def is_visible(self) -> bool:
+        return True
+
+
+def _look_at(eye, target, up) -> np.ndarray:
+    forward = target - eye
+    forward /= np.linalg.norm(forward)
+    side = np.cross(forward, up)
+    side /= np.linalg.norm(side)
+    up = np.cross(side, forward)
+
+    view = np.identity(4, dtype=np.float32)
+    view[0, :3] = side
+    view[1, :3] = up
+    view[2, :3] = -forward
+    view[:3, 3] = -view[:3, :3] @ eye
+
+    return view
+
+
+def _perspective(fov: float, aspect: float, near: float, far: float) -> np.ndarray:
+    f = 1.0 / np.tan(np.radians(fov) / 2.0)
+
+    projection = np.zeros((4, 4), dtype=np.float32)
+    projection[0, 0] = f / aspect
+    projection[1, 1] = f
+    projection[2, 2] = (far + near) / (near - far)
+    projection[2, 3] = 2.0 * far * near / (near - far)
+    projection[3, 2] = -1.0
+
+    return projection
+
+
+def _meshes(count: int) -> list[_vbo.PooledVBOHandler]:
+    # one pooled model per part number, a few hundred triangles each like
+    # a converted terminal or cavity plug
+    vbos = []
+
+    for i in range(count):
+        vertices, faces = _torus.create(1.0, 0.3 + 0.01 * i, 16, 10 + i % 6)
+        packed, vertex_count = _utils.compute_normals(vertices, faces)
+
+        aabb1, aabb2 = _utils.compute_aabb(packed[:vertex_count * 3].reshape(-1, 3))
+        aabb = np.array([aabb1.as_float, aabb2.as_float], dtype=np.float32)
+
+        vbos.append(_vbo.PooledVBOHandler(
+            f'benchmark.instancing.{i}', packed, vertex_count,
+            aabb=aabb, obb=_utils.compute_obb(aabb1, aabb2)))
+
+    return vbos
+
+
+def benchmark(count: int = 5000, meshes: int = 25, frames: int = 60,
+              width: int = 1280, height: int = 720) -> dict:
+    """
+    Time the frames of *count* objects spread over *meshes* pooled meshes
+    (one material each), drawn into a *width* x *height* offscreen
+    framebuffer with instancing off and on.
+
+    The objects stand on a grid in front of a perspective camera with a
+    random rotation each; only the faces pass runs, as with the default
+    ``Config.debug.rendering3d``. Needs a GL 3.3 capable display.
+
+    :returns: ``objects``, ``meshes`` and the ``renderer``, and per run
+              (``off``, ``on``) the ``draw_calls`` of one frame, the
+              ``submit_ms`` it took to issue them and the ``mean_ms``/
+              ``median_ms``/``max_ms`` frame time (``glFinish`` included),
+              plus the ``max_pixel_difference`` between the two runs'
+              last frames.
+    :rtype: dict
+    """
+    with _gl.context(), _gl.framebuffer(width, height):
+        faces_program = _shaders.compile_faces_program()
+        edges_program = _shaders.compile_edges_program()
+        vertices_program = _shaders.compile_vertices_program()
+
+        columns = int(np.ceil(np.sqrt(count * 2.0)))
+        rows = (count + columns - 1) // columns
+        spacing = 3.0
+
+        eye = np.array([0.0, rows * spacing * 0.8, rows * spacing * 1.2], dtype=np.float32)
+        view = _look_at(eye, np.zeros(3, dtype=np.float32),
+                        np.array([0.0, 1.0, 0.0], dtype=np.float32))
+        projection = _perspective(45.0, width / height, 0.1, 10000.0)
+
+        for program in (faces_program, edges_program, vertices_program):
+            GL.glUseProgram(program)
+            GL.glUniformMatrix4fv(GL.glGetUniformLocation(program, 'projection'),
+                                  1, GL.GL_TRUE, projection)
+            GL.glUniformMatrix4fv(GL.glGetUniformLocation(program, 'view'),
+                                  1, GL.GL_TRUE, view)
+
+        GL.glUseProgram(faces_program)
+        GL.glUniform3f(GL.glGetUniformLocation(faces_program, 'lightPosition'), *eye)
+        GL.glUniform4f(GL.glGetUniformLocation(faces_program, 'lightDiffuse'), 1.0, 1.0, 1.0, 1.0)
+        GL.glUseProgram(0)
+
+        vbos = _meshes(meshes)
+        rng = np.random.default_rng(0)
+
+        materials = [_materials.Plastic(_color.Color(*rng.uniform(0.2, 1.0, 3).tolist(), 1.0))
+                     for _ in range(meshes)]
+
+        views = []
+        for i in range(count):
+            row, column = divmod(i, columns)
+            position = _point.Point((column - columns / 2.0) * spacing, 0.0,
+                                    (row - rows / 2.0) * spacing)
+            angle = _angle.Angle.from_euler(*rng.uniform(-180.0, 180.0, 3).tolist())
+            part = int(rng.integers(meshes))
+
+            views.append(_View(None, None, vbos[part], angle, position,
+                               _point.Point(1.0, 1.0, 1.0), materials[part]))
+
+        batcher = _instancing.InstanceBatcher()
+
+        def _off():
+            for obj in views:
+                obj.render(faces_program, edges_program, vertices_program)
+
+            return len(views)
+
+        def _on():
+            remaining, _ = batcher.collect(views, lambda obj: obj)
+            batcher.flush(faces_program, edges_program, vertices_program)
+
+            for obj in remaining:
+                obj.render(faces_program, edges_program, vertices_program)
+
+            return batcher.stats['draw_calls'] + len(remaining)
+
+        result = dict(objects=count, meshes=meshes,
+                      renderer=GL.glGetString(GL.GL_RENDERER).decode())
+
+        images = []
+
+        for name, draw in (('off', _off), ('on', _on)):
+            # warm-up: the VAOs of every mesh are created on the first draw
+            draw()
+            GL.glFinish()
+
+            submit = []
+            timings = []
+            calls = 0
+
+            for _ in range(frames):
+                start = time.perf_counter()
+                GL.glClear(GL.GL_COLOR_BUFFER_BIT | GL.GL_DEPTH_BUFFER_BIT)
+                calls = draw()
+                submit.append((time.perf_counter() - start) * 1000.0)
+                GL.glFinish()
+                timings.append((time.perf_counter() - start) * 1000.0)
+
+            timings = np.array(timings)
+            result[name] = dict(draw_calls=calls, submit_ms=float(np.median(submit)),
+                                mean_ms=float(timings.mean()),
+                                median_ms=float(np.median(timings)),
+                                max_ms=float(timings.max()))
+
+            images.append(np.frombuffer(
+                GL.glReadPixels(0, 0, width, height, GL.GL_RGBA, GL.GL_UNSIGNED_BYTE),
+                dtype=np.uint8).astype(np.int16))
+
+        # the last frame of each run, channel by channel
+        result['max_pixel_difference'] = int(np.abs(images[0] - images[1]).max())
+
+        batcher.release()
+
+        for vbo in vbos:
+            vbo.release()
+
+        return result
+
+
+if __name__ == '__main__':
+    for key, value in benchmark().items():
+        print(f'{key}: {value}')
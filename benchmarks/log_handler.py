@@ -0,0 +1,113 @@
+# © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
+
+"""Log entries per second through the block formatter in
+:mod:`harness_designer.logger.log_handler` against the per-entry DataFrame
+it replaced."""
+
+import datetime
+import io
+import time
+
+import pandas as pd
+
+# the logger package binds the running LogHandler to the name log_handler,
+# so the module's own names have to be imported from it directly
+from harness_designer.logger.log_handler import _ColumnBlock, _message_mapping
+
+
+def _legacy_entry_csv(log_entry):
+    # how LogHandler formatted entries before _ColumnBlock: one DataFrame
+    # and one to_csv() call per entry
+    return pd.DataFrame([log_entry]).to_csv(
+        header=False, index=False, encoding='utf-8', lineterminator='\n',
+        date_format='%Y-%m-%dT%H:%M:%S.%f')
+
+
+def benchmark(count: int = 100000, legacy_count: int = 5000) -> dict:
+    """
+    Time the block formatter against the per-entry DataFrame it replaced.
+
+    *count* synthetic entries (a mix of levels, with a comma, a quote or a
+    line break in some messages so CSV quoting is exercised) are formatted
+    both ways into an in-memory file, along with building what the log
+    viewer receives: one DataFrame per entry concatenated onto a buffer
+    before, one DataFrame per delivered chunk now. The per-entry paths run
+    over the first *legacy_count* entries only; they are slow enough that
+    the full count would dominate the run.
+
+    :returns: ``count``, ``identical`` (whether both formatters produced
+              the same bytes for the shared entries) and, for each of
+              ``write`` and ``viewer``, ``<op>_entry_per_sec`` and
+              ``<op>_block_per_sec`` in messages per second.
+    :rtype: dict
+    """
+    levels = list(_message_mapping.values())
+    start = datetime.datetime(2026, 1, 1)
+    entries = []
+    for i in range(count):
+        if i % 10 == 0:
+            message = f'wire {i}, length "{i * 3}" mm\n  second line'
+        else:
+            message = f'message number {i} from the benchmark'
+
+        entries.append({
+            'timestamp': start + datetime.timedelta(microseconds=i * 37),
+            'level': levels[i % len(levels)],
+            'message': message,
+        })
+
+    legacy_count = min(legacy_count, count)
+    results = {'count': count}
+
+    def _rate(entry_count, seconds):
+        return round(entry_count / seconds) if seconds else float('inf')
+
+    # write: entry -> CSV text -> file
+    out = io.StringIO()
+    t = time.perf_counter()
+    for entry in entries[:legacy_count]:
+        out.write(_legacy_entry_csv(entry))
+    results['write_entry_per_sec'] = _rate(legacy_count, time.perf_counter() - t)
+    legacy_text = out.getvalue()
+
+    out = io.StringIO()
+    block = _ColumnBlock()
+    chunks = []
+    t = time.perf_counter()
+    for entry in entries:
+        if block.append(entry):
+            out.write(block.to_csv())
+            chunks.append(block.columns())
+            block.clear()
+
+    if len(block):
+        out.write(block.to_csv())
+        chunks.append(block.columns())
+        block.clear()
+
+    results['write_block_per_sec'] = _rate(count, time.perf_counter() - t)
+    block_text = out.getvalue()
+
+    results['identical'] = block_text[:len(legacy_text)] == legacy_text
+
+    # viewer: what the GUI does with what it's handed
+    t = time.perf_counter()
+    buffer = None
+    for entry in entries[:legacy_count]:
+        df = pd.DataFrame([entry])
+        buffer = df if buffer is None else pd.concat([buffer, df], ignore_index=True)
+    results['viewer_entry_per_sec'] = _rate(legacy_count, time.perf_counter() - t)
+
+    t = time.perf_counter()
+    frames = [pd.DataFrame({'timestamp': timestamps, 'level': levels_,
+                            'message': messages})
+              for timestamps, levels_, messages in chunks]
+    pd.concat(frames, ignore_index=True)
+    results['viewer_block_per_sec'] = _rate(count, time.perf_counter() - t)
+
+    return results
+
+
+if __name__ == '__main__':
+    for key, value in benchmark().items():
+        print(f'{key}: {value}')
@@ -0,0 +1,95 @@
+# © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
+
+"""Pick time of :class:`harness_designer.gl.pick_bvh.PickBVH` on a
+synthetic scene."""
+
+import math
+import time
+
+import numpy as np
+
+from harness_designer.gl import pick_bvh as _pick_bvh
+
+
+class _BenchObject:
+    # the aabb and the registration list PickBVH reads off a BaseVar
+    def __init__(self, center: np.ndarray, half_size: float):
+        self.aabb = np.array([center - half_size, center + half_size], dtype=np.float32)
+        self.scene_slots = []
+
+
+def benchmark(count: int = 10000, picks: int = 500, moved: int = 20,
+              seed: int = 0) -> dict:
+    """
+    Time :meth:`harness_designer.gl.pick_bvh.PickBVH.pick_candidates` on
+    a synthetic scene.
+
+    *count* boxes are scattered through a 2000 unit cube in front of a
+    camera at the origin looking down -Z, and *picks* rays are cast from
+    the camera through random points of a 60 degree field of view -- a
+    mouse hovering over the scene. Before every pick *moved* of the boxes
+    are moved and marked dirty, the way a drag does, so each query also
+    syncs and refits.
+
+    :returns: ``objects``, ``picks``, ``build_ms`` (the first query, which
+              fills every slot and builds the tree), the
+              ``mean_ms``/``median_ms``/``max_ms`` of the per-pick time
+              after that, ``mean_candidates`` and ``rebuilds``.
+    :rtype: dict
+    """
+    rng = np.random.default_rng(seed)
+
+    centers = rng.uniform((-1000.0, -1000.0, -2000.0), (1000.0, 1000.0, 0.0),
+                          size=(count, 3)).astype(np.float32)
+    sizes = rng.uniform(0.5, 20.0, size=count).astype(np.float32)
+
+    index = _pick_bvh.PickBVH(lambda obj: obj)
+    objects = []
+
+    for i in range(count):
+        obj = _BenchObject(centers[i], sizes[i])
+        objects.append(obj)
+        index.add(obj)
+
+    origin = np.zeros(3, dtype=np.float32)
+    half = math.tan(math.radians(30.0))
+
+    # the first query fills every slot and builds the tree
+    index.pick_candidates(origin, np.array((0.0, 0.0, -1.0), dtype=np.float32),
+                          objects, lambda obj: obj)
+    build_ms = index.stats['query_ms']
+
+    timings = []
+    candidates = []
+    rebuilds = 0
+
+    for _ in range(picks):
+        for i in rng.integers(0, count, size=moved):
+            obj = objects[i]
+            obj.aabb += rng.uniform(-1.0, 1.0, size=3).astype(np.float32)
+
+            for buffer, slot in obj.scene_slots:
+                buffer.mark_dirty(slot)
+
+        x, y = rng.uniform(-half, half, size=2)
+        direction = np.array((x, y, -1.0), dtype=np.float32)
+        direction /= np.linalg.norm(direction)
+
+        start = time.perf_counter()
+        found = index.pick_candidates(origin, direction, objects, lambda obj: obj)
+        timings.append((time.perf_counter() - start) * 1000.0)
+
+        candidates.append(len(found))
+        rebuilds += int(index.stats['rebuilt'])
+
+    timings = np.array(timings)
+
+    return dict(objects=len(index), picks=picks, build_ms=build_ms,
+                mean_ms=float(timings.mean()), median_ms=float(np.median(timings)),
+                max_ms=float(timings.max()), mean_candidates=float(np.mean(candidates)),
+                rebuilds=rebuilds)
+
+
+if __name__ == '__main__':
+    for key, value in benchmark().items():
+        print(f'{key}: {value}')
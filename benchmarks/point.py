@@ -0,0 +1,64 @@
+# © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
+
+"""Per-operation cost of :class:`harness_designer.geometry.point.Point`
+arithmetic and rotation and of setting an
+:class:`harness_designer.geometry.angle.Angle`."""
+
+import timeit
+
+from harness_designer.geometry import angle as _angle
+from harness_designer.geometry import point as _point
+
+
+def benchmark(number: int = 20000, repeat: int = 3) -> dict:
+    """
+    Time the Point and Angle operations a drag runs for every point it
+    moves.
+
+    Each operation is run *number* times, *repeat* times over, on points
+    and angles without a database id (no callbacks are registered, so
+    what is timed is the arithmetic and the bookkeeping around it).
+
+    :returns: per operation, the best run's cost of one call in
+              microseconds: ``point_new``, ``x_getter``, ``add``, ``sub``,
+              ``iadd``, ``matmul`` (rotate by an Angle), ``imatmul``,
+              ``set_angle`` (rotate about an origin), ``angle_x_setter``
+              and ``angle_from_euler``; plus ``number`` and ``repeat``.
+    :rtype: dict
+    """
+    p1 = _point.Point(1.0, 2.0, 3.0)
+    p2 = _point.Point(0.5, -0.25, 4.0)
+    moving = _point.Point(3.0, 2.0, 1.0)
+    origin = _point.Point(10.0, 0.0, -5.0)
+    angle = _angle.Angle.from_euler(10.0, 20.0, 30.0)
+    step = _angle.Angle.from_euler(0.0, 0.0, 0.01)
+    setting = _angle.Angle.from_euler(0.0, 0.0, 0.0)
+
+    def _angle_x_setter():
+        setting.x = 15.0
+
+    operations = (
+        ('point_new', lambda: _point.Point(1.0, 2.0, 3.0)),
+        ('x_getter', lambda: p1.x),
+        ('add', lambda: p1 + p2),
+        ('sub', lambda: p1 - p2),
+        ('iadd', lambda: moving.__iadd__(p2)),
+        ('matmul', lambda: p1 @ angle),
+        ('imatmul', lambda: moving.__imatmul__(step)),
+        ('set_angle', lambda: moving.set_angle(step, origin)),
+        ('angle_x_setter', _angle_x_setter),
+        ('angle_from_euler', lambda: _angle.Angle.from_euler(10.0, 20.0, 30.0)),
+    )
+
+    result = dict(number=number, repeat=repeat)
+
+    for name, func in operations:
+        best = min(timeit.Timer(func).repeat(repeat, number))
+        result[f'{name}_us'] = best / number * 1e6
+
+    return result
+
+
+if __name__ == '__main__':
+    for key, value in benchmark().items():
+        print(f'{key}: {value}')
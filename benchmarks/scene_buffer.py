@@ -0,0 +1,99 @@
+# © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
+
+"""Cull time of :class:`harness_designer.gl.culling.SceneBuffer` on a
+synthetic scene."""
+
+import weakref
+
+import numpy as np
+
+from harness_designer.gl.culling import scene_buffer as _scene_buffer
+
+
+class _BenchObject:
+    # the three arrays and the registration list SceneBuffer reads off a
+    # BaseVar, nothing else
+    def __init__(self, center: np.ndarray, half_size: float, is_opaque: int):
+        self.aabb = np.array([center - half_size, center + half_size], dtype=np.float32)
+        self.numpy_position = np.array(center, dtype=np.float32)
+        self.is_opaque = np.array([is_opaque], dtype=np.uint8)
+        self.scene_slots = []
+
+
+def benchmark(count: int = 10000, frames: int = 200, moved: int = 100,
+              seed: int = 0) -> dict:
+    """
+    Time :meth:`harness_designer.gl.culling.SceneBuffer.cull` on a synthetic scene.
+
+    *count* boxes (a quarter of them transparent) are scattered through a
+    2000 unit cube in front of a camera at the origin looking down -Z with
+    a 60 degree field of view. Every frame *moved* of them are moved and
+    marked dirty before the cull, the way a drag does.
+
+    :returns: ``objects``, ``visible`` (last frame), ``frames``,
+              ``fill_ms`` (the first cull, which fills every slot) and the
+              ``mean_ms``/``median_ms``/``max_ms`` of the per-frame cull
+              time after that, which includes syncing the moved slots.
+    :rtype: dict
+    """
+    rng = np.random.default_rng(seed)
+
+    centers = rng.uniform((-1000.0, -1000.0, -2000.0), (1000.0, 1000.0, 0.0),
+                          size=(count, 3)).astype(np.float32)
+    sizes = rng.uniform(0.5, 20.0, size=count).astype(np.float32)
+    opaque = (rng.random(count) >= 0.25).astype(np.uint8)
+
+    scene = _scene_buffer.SceneBuffer()
+    objects = []
+
+    for i in range(count):
+        obj = _BenchObject(centers[i], sizes[i], int(opaque[i]))
+        objects.append(obj)
+        scene.add(weakref.ref(obj), obj)
+
+    # inward-facing planes of a symmetric perspective frustum
+    half = np.radians(30.0)
+    cos_h = float(np.cos(half))
+    sin_h = float(np.sin(half))
+    near = 0.1
+    far = 5000.0
+
+    normals = np.array([[cos_h, 0.0, -sin_h],    # left
+                        [-cos_h, 0.0, -sin_h],   # right
+                        [0.0, cos_h, -sin_h],    # bottom
+                        [0.0, -cos_h, -sin_h],   # top
+                        [0.0, 0.0, -1.0],        # near
+                        [0.0, 0.0, 1.0]],        # far
+                       dtype=np.float32)
+    distances = np.array([0.0, 0.0, 0.0, 0.0, -near, far], dtype=np.float32)
+    camera_pos = np.zeros(3, dtype=np.float32)
+
+    # the first cull fills every slot added above
+    slots = scene.cull(normals, distances, camera_pos)
+    fill_ms = scene.stats['cull_ms']
+
+    timings = []
+
+    for _ in range(frames):
+        for index in rng.integers(0, count, size=moved):
+            obj = objects[index]
+            offset = rng.uniform(-1.0, 1.0, size=3).astype(np.float32)
+            obj.aabb += offset
+            obj.numpy_position += offset
+
+            for buffer, slot in obj.scene_slots:
+                buffer.mark_dirty(slot)
+
+        slots = scene.cull(normals, distances, camera_pos)
+        timings.append(scene.stats['cull_ms'])
+
+    timings = np.array(timings)
+
+    return dict(objects=len(scene), visible=len(slots), frames=frames, fill_ms=fill_ms,
+                mean_ms=float(timings.mean()), median_ms=float(np.median(timings)),
+                max_ms=float(timings.max()))
+
+
+if __name__ == '__main__':
+    for key, value in benchmark().items():
+        print(f'{key}: {value}')
@@ -0,0 +1,183 @@
+# © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
+
+"""Frame time of a label-heavy schematic drawn glyph by glyph, label by
+label and through :class:`harness_designer.gl.text_batching.TextBatcher`."""
+
+import time
+
+import numpy as np
+from OpenGL import GL
+
+from harness_designer import color as _color
+from harness_designer.geometry import angle as _angle
+from harness_designer.geometry import point as _point
+from harness_designer.gl import materials as _materials
+from harness_designer.gl import shaders as _shaders
+from harness_designer.gl import text_batching as _text_batching
+from harness_designer.shapes import text as _text
+
+from . import _gl
+
+
+class _BenchLabel:
+    # the parts of BaseVar TextBatcher reads, around one Text label
+    _text_only = True
+
+    def __init__(self, text, position, angle, scale, material):
+        self.text = text
+        self.position = position
+        self.angle = angle
+        self.scale = scale
+        self.material = material
+        self.smooth = False
+        self.texts_batched = False
+
+    def text_placements(self):
+        return [(self.text, self.position, self.angle, self.scale, self.material)]
+
+    def _edge_material(self):
+        return self.material
+
+
+def benchmark(labels: int = 2000, frames: int = 60, moved: int = 20) -> dict:
+    """
+    Time the frames of a label-heavy schematic, glyph by glyph, label by
+    label and through a
+    :class:`~harness_designer.gl.text_batching.TextBatcher`.
+
+    *labels* cavity names (``"1"`` to ``"24"``) and as many wire names
+    (``"W0001-0.35-BK"``...) are laid out on a grid, the way a schematic
+    with *labels* populated cavities reads, and drawn for *frames* frames
+    into a 1920x1080 offscreen framebuffer through the faces program.
+    In the batched run *moved* labels move every frame, the way a
+    housing drag does. Needs a GL 3.3 capable display and builds the
+    few glyphs it uses first (see
+    :func:`~harness_designer.shapes.text.ensure_chars`).
+
+    :returns: per run (``per_glyph``, ``per_label``, ``batched``) the
+              ``draw_calls`` of one frame and the ``mean_ms``/
+              ``median_ms``/``max_ms`` frame time (``glFinish`` included),
+              plus ``labels``, ``glyphs`` and the batched run's first
+              frame (``bake_ms``, every label baked and uploaded).
+    :rtype: dict
+    """
+    with _gl.context(), _gl.framebuffer(1920, 1080):
+        _text.ensure_chars('0123456789W-.BKRDGNYL')
+
+        program = _shaders.compile_faces_program()
+        GL.glUseProgram(program)
+
+        colors = ('BK', 'RD', 'GN', 'YL', 'BN')
+        strings = [str(i % 24 + 1) for i in range(labels)]
+        strings += [f'W{i + 1:04d}-0.35-{colors[i % len(colors)]}' for i in range(labels)]
+
+        columns = int(np.ceil(np.sqrt(len(strings))))
+        material = _materials.Generic(_color.Color(0.9, 0.9, 0.9, 1.0))
+        identity = _angle.Angle()
+        unit = _point.Point(1.0, 1.0, 1.0)
+
+        items = []
+        for i, string in enumerate(strings):
+            position = _point.Point(float(i % columns) * 16.0, float(i // columns) * 2.0, 0.0)
+            items.append(_BenchLabel(_text.Text(string, 1.0, 1), position, identity, unit, material))
+
+        width = columns * 16.0
+        height = (len(strings) // columns + 1) * 2.0
+
+        # orthographic over the whole grid, identity view
+        projection = np.identity(4, dtype=np.float32)
+        projection[0, 0] = 2.0 / width
+        projection[1, 1] = 2.0 / height
+        projection[2, 2] = -1.0
+        projection[0, 3] = -1.0
+        projection[1, 3] = -1.0
+
+        GL.glUniformMatrix4fv(GL.glGetUniformLocation(program, 'projection'), 1, GL.GL_TRUE, projection)
+        GL.glUniformMatrix4fv(GL.glGetUniformLocation(program, 'view'), 1, GL.GL_TRUE,
+                              np.identity(4, dtype=np.float32))
+
+        pos_loc = GL.glGetUniformLocation(program, 'objectPosition')
+        rot_loc = GL.glGetUniformLocation(program, 'objectRotation')
+        scale_loc = GL.glGetUniformLocation(program, 'objectScale')
+        normal_loc = GL.glGetUniformLocation(program, 'normalMode')
+
+        def _per_glyph():
+            # what Text.render did before labels were merged
+            calls = 0
+            for item in items:
+                text = item.text
+                angle, glyph_scale = text.placement(item.angle, item.scale)
+                size = text._size  # NOQA
+
+                for vbo, local in zip(text._vbos, text._locals):  # NOQA
+                    world = item.position + (_point.Point(local.x * size, local.y * size, local.z) @ angle)
+                    vbo.render(pos_loc, rot_loc, scale_loc, normal_loc, world, angle, glyph_scale, False)
+                    calls += 1
+
+            return calls
+
+        def _per_label():
+            for item in items:
+                item.text.render(pos_loc, rot_loc, scale_loc, normal_loc,
+                                 item.position, item.angle, item.scale, False)
+
+            return len(items)
+
+        batcher = _text_batching.TextBatcher()
+        rng = np.random.default_rng(0)
+
+        def _batched():
+            for index in rng.integers(0, len(items), size=moved).tolist():
+                position = items[index].position
+                with position:
+                    position.x += 0.01
+
+            batcher.collect(items, lambda obj: obj)
+            batcher.flush(program, program, program)
+            GL.glUseProgram(program)
+
+            return batcher.stats['text_draw_calls']
+
+        def _run(draw):
+            timings = []
+            calls = 0
+
+            for _ in range(frames):
+                start = time.perf_counter()
+                GL.glClear(GL.GL_COLOR_BUFFER_BIT | GL.GL_DEPTH_BUFFER_BIT)
+                calls = draw()
+                GL.glFinish()
+                timings.append((time.perf_counter() - start) * 1000.0)
+
+            return timings, calls
+
+        material.set(program)
+
+        result = dict(labels=len(items),
+                      glyphs=sum(len(item.text._vbos) for item in items))  # NOQA
+
+        # warm-up: every label mesh and VAO is created on first draw
+        _per_label()
+        GL.glFinish()
+
+        for name, draw in (('per_glyph', _per_glyph), ('per_label', _per_label),
+                           ('batched', _batched)):
+            timings, calls = _run(draw)
+
+            if name == 'batched':
+                result['bake_ms'] = timings[0]
+                timings = timings[1:] or timings
+
+            timings = np.array(timings)
+            result[name] = dict(draw_calls=calls, mean_ms=float(timings.mean()),
+                                median_ms=float(np.median(timings)),
+                                max_ms=float(timings.max()))
+
+        batcher.release()
+
+        return result
+
+
+if __name__ == '__main__':
+    for key, value in benchmark().items():
+        print(f'{key}: {value}')
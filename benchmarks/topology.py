@@ -0,0 +1,178 @@
+# © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
+
+"""Point-reference lookups through
+:class:`harness_designer.database.project_db.topology.TopologyIndex` against
+the per-hop SQL it replaced."""
+
+import time
+import sqlite3
+import statistics
+
+from harness_designer.database.project_db import topology as _topology
+
+
+_BENCH_SCHEMA = (
+    'CREATE TABLE pjt_bundles (id BLOB PRIMARY KEY, start_point3d_id BLOB, stop_point3d_id BLOB);',
+    'CREATE TABLE pjt_bundle_layouts (id BLOB PRIMARY KEY, point3d_id BLOB);',
+    'CREATE TABLE pjt_wires (id BLOB PRIMARY KEY, start_point3d_id BLOB, stop_point3d_id BLOB);',
+    'CREATE TABLE pjt_housings (id BLOB PRIMARY KEY, point3d_id BLOB, cover_point3d_id BLOB);',
+)
+
+
+def _bench_id(kind: int, number: int) -> bytes:
+    return kind.to_bytes(2, 'big') + number.to_bytes(14, 'big')
+
+
+def _sql_walk_bundle(con, section_id: bytes, point_id: bytes) -> list:
+    # the query pattern _walk_bundle_chain used before the index
+    chain = []
+    visited = {section_id}
+
+    while True:
+        chain.append(point_id)
+
+        if not con.execute('SELECT id FROM pjt_bundle_layouts WHERE point3d_id = ?;',
+                           (point_id,)).fetchall():
+            break
+
+        rows = (con.execute('SELECT id FROM pjt_bundles WHERE start_point3d_id = ?;',
+                            (point_id,)).fetchall() +
+                con.execute('SELECT id FROM pjt_bundles WHERE stop_point3d_id = ?;',
+                            (point_id,)).fetchall())
+
+        next_id = None
+        for row in rows:
+            if row[0] not in visited:
+                next_id = row[0]
+                break
+
+        if next_id is None:
+            break
+
+        visited.add(next_id)
+        next_start, next_stop = con.execute(
+            'SELECT start_point3d_id, stop_point3d_id FROM pjt_bundles WHERE id = ?;',
+            (next_id,)).fetchone()
+
+        point_id = next_stop if next_start == point_id else next_start
+
+    return chain
+
+
+def benchmark(sections: int = 500, wires: int = 2000, repeat: int = 20) -> dict:
+    """
+    Time the index against the per-hop SQL it replaced on a synthetic
+    bundle network.
+
+    One bundle of *sections* sections (joined by a layout at every inner
+    point) has *wires* wires routed along it and a housing at each end --
+    stored both in an in-memory sqlite database shaped like the pjt_*
+    tables and in a :class:`~harness_designer.database.project_db.topology.TopologyIndex` built from the same rows.
+
+    Each of walking the chain from its middle section, checking every
+    point for orphans and repointing one end to a new point (and back) is
+    run *repeat* times both ways.
+
+    :returns: ``sections``, ``points``, ``build_ms`` and, for each of
+              ``walk``, ``orphans`` and ``repoint``, the median
+              ``<op>_sql_ms`` and ``<op>_index_ms``.
+    :rtype: dict
+    """
+    points = [_bench_id(1, i) for i in range(sections + 1)]
+    bundles = [(_bench_id(2, i), points[i], points[i + 1]) for i in range(sections)]
+    layouts = [(_bench_id(3, i), points[i]) for i in range(1, sections)]
+    routed = [(_bench_id(4, i), points[i % sections], points[i % sections + 1])
+              for i in range(wires)]
+    housings = [(_bench_id(5, 0), points[0], None), (_bench_id(5, 1), points[-1], None)]
+
+    tables = (('pjt_bundles', ('id', 'start_point3d_id', 'stop_point3d_id'), bundles),
+              ('pjt_bundle_layouts', ('id', 'point3d_id'), layouts),
+              ('pjt_wires', ('id', 'start_point3d_id', 'stop_point3d_id'), routed),
+              ('pjt_housings', ('id', 'point3d_id', 'cover_point3d_id'), housings))
+
+    con = sqlite3.connect(':memory:')
+    for statement in _BENCH_SCHEMA:
+        con.execute(statement)
+
+    for table_name, columns, rows in tables:
+        con.executemany(f'INSERT INTO {table_name} VALUES ({", ".join("?" * len(columns))});', rows)
+
+    con.commit()
+
+    start = time.perf_counter()
+    index = _topology.TopologyIndex(None)
+    for table_name, columns, rows in tables:
+        index.add_rows(table_name, {name: i for i, name in enumerate(columns)}, rows)
+
+    index._built = True
+    build_ms = (time.perf_counter() - start) * 1000.0
+
+    reference_columns = [(table_name, column) for table_name, columns, _ in tables
+                         for column in columns if _topology._is_point_column(column)]
+
+    middle = bundles[sections // 2]
+
+    def _sql_walk():
+        toward_start = _sql_walk_bundle(con, middle[0], middle[1])
+        return list(reversed(toward_start)) + _sql_walk_bundle(con, middle[0], middle[2])
+
+    def _index_walk():
+        return index.bundle_chain(middle[0])
+
+    def _sql_orphans():
+        orphans = []
+        for point_id in points:
+            for table_name, column in reference_columns:
+                if con.execute(f'SELECT id FROM {table_name} WHERE {column} = ? LIMIT 1;',
+                               (point_id,)).fetchall():
+                    break
+            else:
+                orphans.append(point_id)
+
+        return orphans
+
+    def _index_orphans():
+        return [point_id for point_id in points if not index.is_referenced(point_id)]
+
+    new_point = _bench_id(1, sections + 1)
+
+    def _sql_repoint():
+        for old, new in ((points[0], new_point), (new_point, points[0])):
+            for table_name, column in reference_columns:
+                con.execute(f'UPDATE {table_name} SET {column} = ? WHERE {column} = ?;', (new, old))
+
+            con.commit()
+
+    def _index_repoint():
+        for old, new in ((points[0], new_point), (new_point, points[0])):
+            for table_name, column, row_id in index.references(old):
+                index.update(table_name, row_id, {column: new})
+
+    if _sql_walk() != _index_walk():
+        raise RuntimeError('bundle chain mismatch between SQL and index')
+
+    if _sql_orphans() != _index_orphans():
+        raise RuntimeError('orphan check mismatch between SQL and index')
+
+    result = dict(sections=sections, points=len(points), build_ms=build_ms)
+
+    for name, sql_func, index_func in (('walk', _sql_walk, _index_walk),
+                                       ('orphans', _sql_orphans, _index_orphans),
+                                       ('repoint', _sql_repoint, _index_repoint)):
+        for label, func in (('sql', sql_func), ('index', index_func)):
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                func()
+                timings.append((time.perf_counter() - start) * 1000.0)
+
+            result[f'{name}_{label}_ms'] = statistics.median(timings)
+
+    con.close()
+
+    return result
+
+
+if __name__ == '__main__':
+    for key, value in benchmark().items():
+        print(f'{key}: {value}')
@@ -4,6 +4,8 @@ from . import callback_mixin as _callback_mixin
 
 
 CallbackMixin = _callback_mixin.CallbackMixin
+CallbackBatch = _callback_mixin.CallbackBatch
+coalesce = _callback_mixin.coalesce
 
 
 del _callback_mixin
@@ -1,9 +1,112 @@
 # © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
 
+import threading
 import weakref
 from .. import check_types as _check_types
 
 
+_batch_state = threading.local()
+
+
+@_check_types.do
+def coalesce(func):
+    """
+    Mark a callback as safe to coalesce across sources inside a batch.
+
+    By default a :class:`CallbackBatch` only merges repeated notifications
+    from the *same* object, because some callbacks look at which object
+    they were handed (``objects_schematic.wire_marker`` tells its own
+    position apart from the wire endpoints that way).  A callback that
+    ignores its argument and recomputes from its owner's state -- a wire
+    or bundle rebuilding from all of its points -- can be decorated with
+    this so that it runs once per flush no matter how many of the points
+    it is bound to changed.
+
+    Apply it above ``_check_types.do`` so the mark lands on the outer
+    wrapper.
+    """
+
+    func.__coalesce__ = True
+    return func
+
+
+class CallbackBatch:
+    """
+    Collect callback notifications and fire each one once at the end.
+
+    Obtained from :meth:`CallbackMixin.batch`.  While a batch is open on a
+    thread, :meth:`CallbackMixin._process_callbacks` doesn't fire anything;
+    it records the object as dirty instead.  When the outermost batch
+    closes the dirty objects are flushed in the order they were first
+    dirtied:
+
+    * an object dirtied any number of times fires its callbacks once
+    * a callback marked with :func:`coalesce` fires once per flush round
+      even when several dirty objects have it bound; it receives the first
+      of those objects
+    * callbacks fired during the flush that dirty *other* objects are
+      collected and flushed in another round, so a chain (root point ->
+      attached delegators -> wire geometry) still settles inside the batch
+
+    Nested batches join the outermost one.  Unlike ``with point:`` nothing
+    is lost: every object that asked to notify is flushed.
+
+    The counters describe the last flush of this batch: ``requested`` is
+    the number of ``_process_callbacks()`` calls that were deferred,
+    ``dispatched`` the callbacks actually invoked and ``coalesced`` the
+    invocations that were dropped as duplicates.
+    """
+
+    @_check_types.do
+    def __init__(self):
+        self.requested = 0
+        self.dispatched = 0
+        self.coalesced = 0
+
+    @_check_types.do
+    def __enter__(self) -> "CallbackBatch":
+        depth = getattr(_batch_state, 'depth', 0)
+
+        if not depth:
+            _batch_state.dirty = {}
+            _batch_state.batch = self
+
+        _batch_state.depth = depth + 1
+        return _batch_state.batch
+
+    @_check_types.do
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _batch_state.depth -= 1
+
+        if _batch_state.depth:
+            return
+
+        batch = _batch_state.batch
+
+        try:
+            # keep the batch open (depth 1) while flushing so that anything a
+            # callback dirties lands in the next round instead of firing
+            # recursively.
+            _batch_state.depth = 1
+
+            while _batch_state.dirty:
+                dirty = list(_batch_state.dirty.values())
+                _batch_state.dirty = {}
+
+                fired = set()
+                for obj in dirty:
+                    obj._fire_callbacks(fired, batch)  # NOQA
+        finally:
+            _batch_state.depth = 0
+            _batch_state.dirty = {}
+            _batch_state.batch = None
+
+        CallbackBatch.last = batch
+
+    # counters of the most recently flushed batch on any thread
+    last: "CallbackBatch" = None
+
+
 class CallbackMixin:
 
     # these need to be explicitly set in the child classes __init__ function
@@ -40,6 +143,24 @@ class CallbackMixin:
 
         self.__ref_count__ -= 1
 
+    @staticmethod
+    @_check_types.do
+    def batch() -> CallbackBatch:
+        """
+        Return a context manager that defers and dedupes callbacks.
+
+        ::
+
+            with CallbackMixin.batch() as batch:
+                ...  # any number of setters on any number of objects
+
+            print(batch.coalesced)
+
+        See :class:`CallbackBatch`.
+        """
+
+        return CallbackBatch()
+
     @_check_types.do
     def _remove_cb(self, ref):
         """
@@ -128,6 +249,9 @@ class CallbackMixin:
         anything.  This is the mechanism that allows multiple coordinate
         components to be updated atomically.
 
+        If a :class:`CallbackBatch` is open on this thread the object is only
+        recorded as dirty and its callbacks fire once when the batch closes.
+
         Dead weakrefs (callbacks whose owning object has been collected) are
         silently pruned during iteration.  Duplicate callbacks are detected
         and removed — each unique callback fires at most once per update cycle
@@ -144,6 +268,27 @@ class CallbackMixin:
         if self.__ref_count__:
             return
 
+        if getattr(_batch_state, 'depth', 0):
+            _batch_state.batch.requested += 1
+            _batch_state.dirty.setdefault(id(self), self)
+            return
+
+        self._fire_callbacks(None, None)
+
+    @_check_types.do
+    def _fire_callbacks(self, fired: set | None, batch: CallbackBatch | None):
+        """
+        Fire the callbacks of this object; the body of ``_process_callbacks``.
+
+        :param fired: Keys of the callbacks already invoked in the current
+                      flush round of a :class:`CallbackBatch`, or ``None``
+                      outside of a batch.  A callback whose key is already
+                      in the set is skipped.
+        :type fired: set | None
+        :param batch: Batch whose counters are updated, or ``None``.
+        :type batch: CallbackBatch | None
+        """
+
         del self.__unbound_callbacks__[:]
         used_callbacks = []
         callbacks = self.__callbacks__[:]
@@ -155,6 +300,21 @@ class CallbackMixin:
             cb = ref()
             if cb is None:
                 continue
+
+            if fired is not None:
+                if getattr(cb, '__coalesce__', False):
+                    key = (id(cb.__self__), cb.__func__)
+                else:
+                    key = (id(cb.__self__), cb.__func__, id(self))
+
+                if key in fired:
+                    batch.coalesced += 1
+                    used_callbacks.append(ref)
+                    continue
+
+                fired.add(key)
+                batch.dispatched += 1
+
             cb(self)
             used_callbacks.append(ref)
 
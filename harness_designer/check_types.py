@@ -1,4 +1,6 @@
+import functools
 import inspect
+import os
 import types
 import sys
 import typing
@@ -7,6 +9,41 @@ import traceback
 
 _FROZEN = hasattr(sys, 'frozen')
 
+_MODE_OFF = 'off'
+_MODE_ALL = 'all'
+_MODE_SAMPLE = 'sample'
+
+
+def _read_policy():
+    # HARNESS_DESIGNER_CHECK_TYPES selects the policy for the whole run:
+    #   unset / "off" / "0"   pass-through, `do` returns the original function
+    #   "all" / "on" / "1"    every call is checked
+    #   "sample:N" or "N"     one call in every N is checked
+    value = os.environ.get('HARNESS_DESIGNER_CHECK_TYPES', _MODE_OFF).strip().lower()
+
+    if value in ('', '0', 'off', 'false', 'no'):
+        return _MODE_OFF, 1
+
+    if value in ('1', 'on', 'all', 'true', 'yes'):
+        return _MODE_ALL, 1
+
+    if value.startswith(_MODE_SAMPLE):
+        value = value[len(_MODE_SAMPLE):].lstrip(':= ')
+
+    try:
+        rate = int(value)
+    except ValueError:
+        print(f'check_types: unknown HARNESS_DESIGNER_CHECK_TYPES value {value!r}, checking disabled')
+        return _MODE_OFF, 1
+
+    if rate <= 1:
+        return _MODE_ALL, 1
+
+    return _MODE_SAMPLE, rate
+
+
+_MODE, _SAMPLE_RATE = _read_policy()
+
 
 _NO_SELF = object()  # sentinel: no bound self/cls arg available for this call
 
@@ -221,10 +258,156 @@ def _check_type(type_, value, arg_name, func, no_print=False, self_arg=_NO_SELF)
     return True
 
 
-def do(func):
-    return func
+def set_policy(mode: str, sample_rate: int = 1) -> None:
+    """Change the checking policy for functions decorated from now on.
+
+    The policy is applied at decoration time, so this only has an effect
+    when called before the modules of interest are imported (e.g. from a
+    launcher script, ahead of ``import harness_designer``). Functions that
+    were already decorated keep the policy they were decorated under.
+
+    :param mode: ``'off'`` (pass-through, the original function is returned
+        untouched), ``'all'`` (check every call) or ``'sample'`` (check one
+        call in every ``sample_rate`` calls).
+    :param sample_rate: Call interval used by ``'sample'`` mode.
+    """
+    global _MODE
+    global _SAMPLE_RATE
+
+    if mode not in (_MODE_OFF, _MODE_ALL, _MODE_SAMPLE):
+        raise ValueError(f'unknown check_types mode: {mode!r}')
+
+    if mode == _MODE_SAMPLE and sample_rate <= 1:
+        mode = _MODE_ALL
+
+    _MODE = mode
+    _SAMPLE_RATE = max(int(sample_rate), 1)
+
+
+def _compile_annotation(annot, globalns):
+    # Resolves one annotation a single time and returns its cached validator
+    # entry as `(fast_types, type_)`, or None when the annotation can never
+    # be verified. `fast_types` is a class or tuple of classes the value can
+    # be tested against with one isinstance() call (the overwhelmingly common
+    # case: plain classes and unions of plain classes); when that test fails,
+    # or there is no fast form, the already-resolved `type_` goes through the
+    # full _check_type walk, which also produces the report.
+    if annot is typing.Self:
+        return None, annot
+
+    type_, resolved = _resolve_annotation(annot, globalns)
+    if not resolved:
+        return None
+
+    if _is_union(type_):
+        members = []
+        all_plain = True
+
+        for member in _union_args(type_):
+            if member is typing.Self:
+                # Needs the bound self per call -- leave the original union
+                # to the slow path, which resolves Self itself.
+                return None, type_
+
+            member, ok = _resolve_annotation(member, globalns)
+            if not ok:
+                # Same "accept at face value" rule _check_type applies to a
+                # union with an unresolvable member: it can never report a
+                # mismatch, so there is nothing worth checking.
+                return None
+
+            if not isinstance(member, type) or typing.get_origin(member) is not None:
+                all_plain = False
+
+            members.append(member)
+
+        type_ = typing.Union[tuple(members)]
+
+        if all_plain:
+            return tuple(members), type_
+
+        return None, type_
+
+    if isinstance(type_, type) and typing.get_origin(type_) is None:
+        return type_, type_
+
+    return None, type_
+
 
-    if _FROZEN:
+class _Signature:
+    # Per-function validator, compiled once. Annotations that aren't strings
+    # are compiled at decoration time; quoted forward references can't be --
+    # for self-referencing classes the name doesn't exist in the module yet
+    # at that point -- so those are compiled on the first call instead, once
+    # the module has finished loading, and never resolved again after that.
+
+    __slots__ = ('func', 'globalns', 'arg_entries', 'ret_entry',
+                 'has_return', '_pending')
+
+    def __init__(self, func, arg_spec):
+        self.func = func
+        self.globalns = getattr(func, '__globals__', {})
+
+        annotations = arg_spec.annotations
+        self._pending = []
+        self.arg_entries = []
+
+        for index, name in enumerate(arg_spec.args):
+            if name in annotations:
+                self._pending.append((index, name, annotations[name]))
+
+        self.has_return = 'return' in annotations
+        self.ret_entry = None
+
+        if self.has_return:
+            self._pending.append((-1, 'return', annotations['return']))
+
+        if not any(isinstance(item[2], (str, typing.ForwardRef)) for item in self._pending):
+            self.compile()
+
+    def compile(self):
+        for index, name, annot in self._pending:
+            entry = _compile_annotation(annot, self.globalns)
+
+            if index == -1:
+                self.ret_entry = entry
+            elif entry is not None:
+                self.arg_entries.append((index, name, entry[0], entry[1]))
+
+        self._pending = None
+
+    def check_args(self, args, self_arg):
+        if self._pending is not None:
+            self.compile()
+
+        num_args = len(args)
+
+        for index, name, fast_types, type_ in self.arg_entries:
+            if index >= num_args:
+                break
+
+            value = args[index]
+            if fast_types is not None and isinstance(value, fast_types):
+                continue
+
+            _check_type(type_, value, name, self.func, self_arg=self_arg)
+
+    def check_return(self, value, self_arg):
+        entry = self.ret_entry
+        if entry is None:
+            return
+
+        fast_types, type_ = entry
+        if fast_types is not None and isinstance(value, fast_types):
+            return
+
+        _check_type(type_, value, 'return', self.func, self_arg=self_arg)
+
+
+def do(func):
+    if _FROZEN or _MODE == _MODE_OFF:
+        # Production policy: hand back the original function untouched so
+        # decorated code pays nothing at all per call.
         return func
 
     try:
@@ -232,44 +415,47 @@ def do(func):
     except TypeError:
         return func
 
-    arg_names = arg_spec.args
-    arg_annot = arg_spec.annotations
-    # Quoted forward-reference annotations (e.g. `-> "Point"`) can't be
-    # resolved at decoration time -- for self-referencing classes the name
-    # doesn't exist in the module yet at that point. Resolve them lazily on
-    # each call instead, once the module has finished loading. Annotations
-    # that still can't be resolved (e.g. names only imported under
-    # TYPE_CHECKING, which never exist at runtime) are skipped rather than
-    # raising.
-    globalns = getattr(func, '__globals__', {})
+    if not arg_spec.annotations:
+        return func
 
+    signature = _Signature(func, arg_spec)
+
+    @functools.wraps(func)
     def _wrapper(*args, **kwargs):
         # `Self` (see _resolve_annotation) resolves against the actual bound
         # self/cls -- always the first positional argument for a method
         # call, or absent entirely for a plain module-level function.
-        self_arg = args[0] if args else _NO_SELF
+        if args:
+            self_arg = args[0]
+        else:
+            self_arg = _NO_SELF
 
-        for i, name in enumerate(arg_names):
-            if len(args) == i:
-                break
+        signature.check_args(args, self_arg)
+        ret = func(*args, **kwargs)
 
-            arg = args[i]
-            if name not in arg_annot:
-                continue
+        if signature.has_return:
+            signature.check_return(ret, self_arg)
 
-            annot, resolved = _resolve_annotation(arg_annot[name], globalns, self_arg=self_arg)
-            if not resolved:
-                continue
+        return ret
 
-            _check_type(annot, arg, name, func, self_arg=self_arg)
+    if _MODE == _MODE_ALL:
+        return _wrapper
 
-        ret = func(*args, **kwargs)
+    sample_rate = _SAMPLE_RATE
+    call_count = 0
 
-        if 'return' in arg_annot:
-            annot, resolved = _resolve_annotation(arg_annot['return'], globalns, self_arg=self_arg)
-            if resolved:
-                _check_type(annot, ret, 'return', func, self_arg=self_arg)
+    @functools.wraps(func)
+    def _sampled_wrapper(*args, **kwargs):
+        # Checks one call in every `sample_rate`; the rest go straight
+        # through. The counter isn't locked -- a call counted twice (or not
+        # at all) by two racing threads only shifts which call gets sampled.
+        nonlocal call_count
 
-        return ret
+        call_count += 1
+        if call_count < sample_rate:
+            return func(*args, **kwargs)
+
+        call_count = 0
+        return _wrapper(*args, **kwargs)
 
-    return _wrapper
+    return _sampled_wrapper
@@ -6,6 +6,9 @@ import binascii
 import sqlite3
 import weakref
 import threading
+import atexit
+import copy
+import time
 import os
 
 from . import utils as _utils
@@ -18,6 +21,15 @@ _lock = threading.RLock()
 
 DEBUG_CONFIG = False
 
+# seconds a setting write waits before it is written to the database
+# together with every other write made in the meantime (see _ConfigDB)
+WRITE_BEHIND_DELAY = 0.5
+
+_EMPTY = {}
+
+# values a ConfigSnapshot can share with the config class instead of copying
+_IMMUTABLE = (int, float, str, bool, bytes, type(None))
+
 
 @_check_types.do
 def DEBUG(*args):
@@ -37,18 +49,24 @@ class _ConfigTable:
 
     This class mimicks some of the features of a dictionary so the saved
     entries are able to be accessed by using the attribute name as a key.
+
+    Writes are not committed here. They are handed to the owning
+    :class:`_ConfigDB`, which holds them until its write-behind timer runs
+    and then writes every pending key of every table in one transaction.
+    Reads look at those pending writes first so a value reads back as
+    soon as it has been set.
     """
 
     @_check_types.do
-    def __init__(self, con, name):
+    def __init__(self, db, name):
         """Initialise a table wrapper.
 
-        :param con: Open SQLite connection.
-        :type con: sqlite3.Connection
+        :param db: Owning database wrapper.
+        :type db: _ConfigDB
         :param name: Table name.
         :type name: str
         """
-        self._con = con
+        self._db = db
         self.name = name
 
     @_check_types.do
@@ -61,10 +79,17 @@ class _ConfigTable:
         :rtype: bool
         """
         with _lock:
-            with self._con:
-                cur = self._con.cursor()
-                cur.execute(f'SELECT id FROM [{self.name}] WHERE key = "{item}";')
-                DEBUG('__contains__.SELECT:', self.name, item)
+            pending = self._db.pending(self.name)
+            if item in pending:
+                return pending[item] is not None
+
+            con = self._db.connection
+            with con:
+                cur = con.cursor()
+                cur.execute(f'SELECT id FROM [{self.name}] WHERE key = ?;', (item,))
+                if DEBUG_CONFIG:
+                    DEBUG('__contains__.SELECT:', self.name, item)
+
                 if cur.fetchall():
                     cur.close()
                     return True
@@ -81,29 +106,42 @@ class _ConfigTable:
         :type item: str
         :returns: Stored value.
         :rtype: UNKNOWN
+        :raises IndexError: If the key is not stored or its delete is queued.
         """
         with _lock:
-            with self._con:
-                cur = self._con.cursor()
+            pending = self._db.pending(self.name)
+            if item in pending:
+                if pending[item] is None:
+                    # a queued delete: the row is gone even though the
+                    # database still has it until the next flush
+                    raise IndexError(f'{self.name}.{item} has been deleted')
 
-                cur.execute(f'SELECT value, decode FROM [{self.name}] WHERE key = "{item}";')
-                value, decode = cur.fetchall()[0]
+                value, decode = pending[item]
+            else:
+                con = self._db.connection
+                with con:
+                    cur = con.cursor()
 
-                DEBUG('__getitem__.SELECT:', self.name, item, value)
-                cur.close()
+                    cur.execute(f'SELECT value, decode FROM [{self.name}] WHERE key = ?;', (item,))
+                    value, decode = cur.fetchall()[0]
 
-            if decode:
-                value = binascii.unhexlify(value)
-                value = value.decode('utf-8')
+                    if DEBUG_CONFIG:
+                        DEBUG('__getitem__.SELECT:', self.name, item, value)
 
-            try:
-                return eval(value)
-            except:  # NOQA
-                return value
+                    cur.close()
+
+        if decode:
+            value = binascii.unhexlify(value)
+            value = value.decode('utf-8')
+
+        try:
+            return eval(value)
+        except:  # NOQA
+            return value
 
     @_check_types.do
     def __setitem__(self, key, value):
-        """Insert or update a stored value.
+        """Queue an insert or update of a stored value.
 
         :param key: Setting key.
         :type key: str
@@ -119,55 +157,39 @@ class _ConfigTable:
         else:
             decode = False
 
-        if key not in self:
-            with _lock:
-                with self._con:
-                    cur = self._con.cursor()
-                    DEBUG('__setitem__.INSERT:', self.name, key, value)
+        if DEBUG_CONFIG:
+            DEBUG('__setitem__.QUEUE:', self.name, key, value, decode)
 
-                    try:
-                        cur.execute(f'INSERT INTO [{self.name}] (key, value, decode) VALUES(?, ?, ?);', (key, value, int(decode)))
-                    except sqlite3.IntegrityError:
-                        DEBUG('__setitem__.UPDATE:', self.name, key, value, decode)
-                        cur.execute(f'UPDATE [{self.name}] SET value = ?, decode = ? WHERE key = ?;', (value, int(decode), key))
-
-                    self._con.commit()
-                    cur.close()
-        else:
-            with _lock:
-                with self._con:
-                    cur = self._con.cursor()
-                    DEBUG('__setitem__.UPDATE:', self.name, key, value)
-                    cur.execute(f'UPDATE [{self.name}] SET value = ?, decode = ? WHERE key = ?;', (value, int(decode), key))
-
-                    self._con.commit()
-                    cur.close()
+        self._db.queue(self.name, key, (value, int(decode)))
 
     @_check_types.do
     def __delitem__(self, key):
-        """Delete a stored key from the table.
+        """Queue the delete of a stored key from the table.
 
         :param key: Setting key.
         :type key: str
         """
-        with _lock:
-            with self._con:
-                cur = self._con.cursor()
-                DEBUG('__delitem__.DELETE:', self.name, key)
+        if DEBUG_CONFIG:
+            DEBUG('__delitem__.QUEUE:', self.name, key)
 
-                cur.execute(f'DELETE FROM [{self.name}] WHERE key = "{key}"')
-                self._con.commit()
-                cur.close()
+        self._db.queue(self.name, key, None)
 
 
 class _ConfigDB:
     """
     This class handles the actual connection to the sqlite database.
 
-    Handles what table in the database is to be accessed. The tables are
-    not cached because most of the information that is stored only gets loaded
-    when the application starts and data gets saved to the database if a value
-    gets modified and also when the application exits.
+    Handles what table in the database is to be accessed. The names of the
+    tables in the database are read once and then kept, so asking for a
+    table doesn't query ``sqlite_master`` every time.
+
+    Writes are collected per table and key (the last write of a key wins)
+    and written by :meth:`flush` in one transaction -- an ``UPSERT`` per
+    key with ``executemany`` and a single commit. Flushing happens
+    :data:`WRITE_BEHIND_DELAY` seconds after the first write that wasn't
+    flushed yet, and when the database is closed. Dragging a slider in a
+    settings dialog used to be a ``SELECT``, an ``UPDATE`` and a commit
+    (an fsync) for every step of the drag.
     """
 
     @_check_types.do
@@ -176,6 +198,14 @@ class _ConfigDB:
 
         """
         self._con = None
+        self._tables = None
+        self._wrappers = {}
+
+        # table name -> {key: (value, decode) or None for a delete}
+        self._pending = {}
+        self._timer = None
+
+        self.stats = dict(queued=0, flushes=0, written=0, flush_ms=0.0)
 
     @_check_types.do
     def open(self):
@@ -190,8 +220,65 @@ class _ConfigDB:
 
         save_all = not os.path.exists(path)
         self._con = sqlite3.connect(path, check_same_thread=False)
+
+        # the write-behind timer is a daemon thread, so anything it hasn't
+        # written yet would be lost if the interpreter exits without close()
+        atexit.register(self.flush)
         return save_all
 
+    @property
+    @_check_types.do
+    def connection(self):
+        """Return the open SQLite connection.
+
+        :returns: Open connection.
+        :rtype: sqlite3.Connection
+        """
+        return self._con
+
+    @_check_types.do
+    def _table_names(self):
+        """Return the names of the tables in the database, reading them the
+        first time.
+
+        :returns: Table names.
+        :rtype: set[str]
+        """
+        if self._tables is None:
+            with self._con:
+                cur = self._con.cursor()
+                cur.execute('SELECT [name] FROM sqlite_master WHERE type="table";')
+                self._tables = {row[0] for row in cur.fetchall()}
+                cur.close()
+
+        return self._tables
+
+    @_check_types.do
+    def _create(self, name):
+        """Create a settings table if it doesn't exist.
+
+        :param name: Table name.
+        :type name: str
+        """
+        if name in self._table_names():
+            return
+
+        with self._con:
+            cur = self._con.cursor()
+            if DEBUG_CONFIG:
+                DEBUG('__getitem__.table.CREATE:', name)
+
+            cur.execute(f'CREATE TABLE [{name}]('
+                        'id INTEGER PRIMARY KEY AUTOINCREMENT, '
+                        'key TEXT UNIQUE NOT NULL, '
+                        'value TEXT NOT NULL, '
+                        'decode INT NOT NULL'
+                        ');')
+            self._con.commit()
+            cur.close()
+
+        self._tables.add(name)
+
     @_check_types.do
     def __contains__(self, item):
         """Return whether a table exists in the database.
@@ -202,33 +289,16 @@ class _ConfigDB:
         :rtype: bool
         """
         with _lock:
-            with self._con:
-                cur = self._con.cursor()
-                cur.execute('SELECT [name] FROM sqlite_master WHERE type="table";')
-                tables = [row[0] for row in cur.fetchall()]
-                cur.close()
-
-            ret = item in tables
-            DEBUG('__contains__.table.SELECT:', item, ret)
+            ret = item in self._table_names()
+            if DEBUG_CONFIG:
+                DEBUG('__contains__.table.SELECT:', item, ret)
 
             return ret
 
     @_check_types.do
     def __setitem__(self, key, value):
         with _lock:
-            if key not in self:
-                with self._con:
-                    cur = self._con.cursor()
-                    DEBUG('__getitem__.table.CREATE:', key)
-
-                    cur.execute(f'CREATE TABLE [{key}]('
-                                'id INTEGER PRIMARY KEY AUTOINCREMENT, '
-                                'key TEXT UNIQUE NOT NULL, '
-                                'value TEXT NOT NULL, '
-                                'decode INT NOT NULL'
-                                ');')
-                    self._con.commit()
-                    cur.close()
+            self._create(key)
 
     @_check_types.do
     def __getitem__(self, item):
@@ -240,29 +310,208 @@ class _ConfigDB:
         :rtype: _ConfigTable
         """
         with _lock:
-            if item not in self:
+            self._create(item)
+
+            table = self._wrappers.get(item, None)
+            if table is None:
+                table = _ConfigTable(self, item)
+                self._wrappers[item] = table
+
+            return table
+
+    @_check_types.do
+    def pending(self, table):
+        """Return the writes of a table that haven't been flushed.
+
+        :param table: Table name.
+        :type table: str
+        :returns: ``{key: (value, decode) or None}``.
+        :rtype: dict
+        """
+        return self._pending.get(table, _EMPTY)
+
+    @_check_types.do
+    def queue(self, table, key, value):
+        """Hold a write until the next flush.
+
+        :param table: Table name.
+        :type table: str
+        :param key: Setting key.
+        :type key: str
+        :param value: ``(value, decode)`` to write, ``None`` to delete.
+        :type value: tuple | None
+        """
+        with _lock:
+            if table not in self._pending:
+                self._pending[table] = {}
+
+            self._pending[table][key] = value
+            self.stats['queued'] += 1
+
+            if self._timer is None:
+                self._schedule()
+
+    @_check_types.do
+    def _schedule(self):
+        """Start the write-behind timer."""
+        self._timer = threading.Timer(WRITE_BEHIND_DELAY, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    @_check_types.do
+    def flush(self):
+        """Write every pending insert, update and delete in one transaction.
+
+        If the transaction fails the writes stay pending -- a key queued
+        again while the flush ran keeps its newer value -- the error is
+        logged and the timer is started again to retry them.
+        """
+        with _lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+            if not self._pending or self._con is None:
+                return
+
+            pending = self._pending
+            self._pending = {}
+
+            start = time.perf_counter()
+            written = 0
+
+            try:
                 with self._con:
                     cur = self._con.cursor()
-                    DEBUG('__getitem__.table.CREATE:', item)
-
-                    cur.execute(f'CREATE TABLE [{item}]('
-                                'id INTEGER PRIMARY KEY AUTOINCREMENT, '
-                                'key TEXT UNIQUE NOT NULL, '
-                                'value TEXT NOT NULL, '
-                                'decode INT NOT NULL'
-                                ');')
+
+                    for table, items in pending.items():
+                        upserts = [(key, value[0], value[1]) for key, value in items.items() if value is not None]
+                        deletes = [(key,) for key, value in items.items() if value is None]
+
+                        if upserts:
+                            cur.executemany(f'INSERT INTO [{table}] (key, value, decode) VALUES(?, ?, ?) '
+                                            'ON CONFLICT(key) DO UPDATE SET '
+                                            'value = excluded.value, decode = excluded.decode;', upserts)
+                        if deletes:
+                            cur.executemany(f'DELETE FROM [{table}] WHERE key = ?;', deletes)
+
+                        written += len(upserts) + len(deletes)
+
                     self._con.commit()
                     cur.close()
+            except Exception as err:  # NOQA
+                # the connection's context manager has rolled back; put the
+                # writes back under anything queued since
+                for table, items in pending.items():
+                    items.update(self._pending.get(table, _EMPTY))
+                    self._pending[table] = items
+
+                # the logger package imports this module
+                from . import logger as _logger
 
-            return _ConfigTable(self._con, item)
+                _logger.traceback(err, f'config flush failed, '
+                                       f'{sum(len(items) for items in pending.values())} '
+                                       f'keys kept for the next flush')
+
+                if self._timer is None:
+                    self._schedule()
+
+                raise
+
+            self.stats['flushes'] += 1
+            self.stats['written'] += written
+            self.stats['flush_ms'] += (time.perf_counter() - start) * 1000.0
+
+            if DEBUG_CONFIG:
+                DEBUG('flush:', written, 'keys in', len(pending), 'tables')
 
     @_check_types.do
     def close(self):
-        """Close the configuration database connection.
+        """Flush pending writes and close the configuration database
+        connection.
 
         """
         with _lock:
+            self.flush()
             self._con.close()
+            self._con = None
+            self._tables = None
+            self._wrappers.clear()
+
+
+class ConfigSnapshot:
+    """
+    Read-only copy of the settings of a :class:`ConfigDB` class.
+
+    Reading a setting straight off a config class goes through
+    :meth:`ConfigDB.__getattribute__` -- a metaclass hook that is type
+    checked in debug builds -- for every attribute of every dotted path.
+    The render loop and the mouse handlers read dozens of those per frame
+    or per mouse move. A snapshot is a plain object holding the same
+    values, so one ``ConfigDB.snapshot()`` call at the start of the frame
+    or event and plain attribute reads after that.
+
+    Snapshots are built the first time they are asked for and kept until a
+    setting of any config class is written (see :attr:`ConfigDB.__version__`),
+    so most frames get back the object the previous frame had. Nested
+    :class:`ConfigDB` classes become nested snapshots. Nested plain classes
+    (``floor.reflections`` and friends) aren't persisted or tracked, so
+    those are left as the live class. Lists and dicts are copied so
+    changing one in place doesn't change a snapshot that's already been
+    handed out.
+
+    ``__version__`` is the config version the snapshot was built from.
+    """
+
+    @_check_types.do
+    def __init__(self, source, version):
+        """Copy the settings of *source*.
+
+        :param source: Config class to copy.
+        :type source: ConfigDB
+        :param version: Config version being copied.
+        :type version: int
+        """
+        values = {}
+
+        for key in dir(source):
+            if key.startswith('_'):
+                continue
+
+            value = getattr(source, key)
+
+            if type(value) is ConfigDB:
+                value = value.snapshot()
+            elif inspect.isclass(value):
+                pass
+            elif callable(value):
+                continue
+            elif not isinstance(value, _IMMUTABLE):
+                value = copy.deepcopy(value)
+
+            values[key] = value
+
+        values['__version__'] = version
+        values['_source'] = source
+
+        object.__getattribute__(self, '__dict__').update(values)
+
+    def __getattr__(self, item):
+        # only reached for names that weren't copied, i.e. values that
+        # exist only in the settings table
+        if item.startswith('_'):
+            raise AttributeError(item)
+
+        return getattr(self._source, item)
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f'config snapshots are read-only ({key})')
+
+    def __delattr__(self, item):
+        raise AttributeError(f'config snapshots are read-only ({item})')
+
+    def __repr__(self):
+        return f'<ConfigSnapshot {self._source.__qualname__} v{self.__version__}>'
 
 
 class ConfigDB(type):
@@ -271,6 +520,11 @@ class ConfigDB(type):
     __classes__ = []
     __callbacks__ = {}
 
+    # bumped on every write; snapshots built from an older version are
+    # thrown away (see ConfigSnapshot)
+    __version__ = 0
+    __snapshots__ = {}
+
     @_check_types.do
     def __init__(cls, name, bases, dct):
         """Register a configuration class with the metaclass registry.
@@ -335,6 +589,7 @@ class ConfigDB(type):
             if cls.__table_name__ in ConfigDB.__db__:
                 if key in cls.__table__:
                     type.__setattr__(cls, key, cls.__table__[key])
+                    ConfigDB._invalidate()
 
                 elif save_all:
                     value = getattr(cls, key)
@@ -356,7 +611,8 @@ class ConfigDB(type):
                 continue
 
             cls.__table__[key] = value
-            DEBUG('_save:', cls.__name__, cls.__table_name__, key, repr(value), '\n\n')
+            if DEBUG_CONFIG:
+                DEBUG('_save:', cls.__name__, cls.__table_name__, key, repr(value), '\n\n')
 
     @_check_types.do
     def _process_change(cls, setting_name):
@@ -373,6 +629,32 @@ class ConfigDB(type):
                 else:
                     cb(cls, setting_name)
 
+    @staticmethod
+    @_check_types.do
+    def _invalidate():
+        """Throw away every snapshot after a setting has been written.
+
+        """
+        ConfigDB.__version__ += 1
+        ConfigDB.__snapshots__.clear()
+
+    @_check_types.do
+    def snapshot(cls) -> ConfigSnapshot:
+        """Return a read-only copy of the current settings.
+
+        The same object is returned until a setting is written, so this is
+        cheap enough to call once per frame or per input event.
+
+        :returns: Settings snapshot.
+        :rtype: ConfigSnapshot
+        """
+        snapshot = ConfigDB.__snapshots__.get(cls, None)
+        if snapshot is None:
+            snapshot = ConfigSnapshot(cls, ConfigDB.__version__)
+            ConfigDB.__snapshots__[cls] = snapshot
+
+        return snapshot
+
     @property
     @_check_types.do
     def __table_name__(cls):
@@ -404,7 +686,9 @@ class ConfigDB(type):
         :returns: Stored attribute value.
         :rtype: UNKNOWN
         """
-        DEBUG('__getitem__:', cls.__table_name__, cls.__name__, item)
+        if DEBUG_CONFIG:
+            DEBUG('__getitem__:', cls.__table_name__, cls.__name__, item)
+
         value = getattr(cls, item)
 
         return value
@@ -422,16 +706,21 @@ class ConfigDB(type):
         if item.startswith('_'):
             return type.__getattribute__(cls, item)
 
+        # the DEBUG calls are guarded here rather than inside DEBUG so the
+        # repr() of the value isn't built on every attribute read
         try:
             value = type.__getattribute__(cls, item)
-            DEBUG('type.__getattribute__:', cls.__table_name__, cls.__name__, item, repr(value), '\n')
+            if DEBUG_CONFIG:
+                DEBUG('type.__getattribute__:', cls.__table_name__, cls.__name__, item, repr(value), '\n')
+
             return value
         except AttributeError:
             pass
 
         if item in cls.__table__:
             value = cls.__table__[item]
-            DEBUG('__getattribute__:', cls.__table_name__, cls.__name__, item, repr(value), '\n')
+            if DEBUG_CONFIG:
+                DEBUG('__getattribute__:', cls.__table_name__, cls.__name__, item, repr(value), '\n')
 
             return value
 
@@ -446,7 +735,8 @@ class ConfigDB(type):
         :param value: Value to store.
         :type value: UNKNOWN
         """
-        DEBUG('__setitem__:', cls.__table_name__, cls.__name__, key, repr(value))
+        if DEBUG_CONFIG:
+            DEBUG('__setitem__:', cls.__table_name__, cls.__name__, key, repr(value))
 
         setattr(cls, key, value)
 
@@ -463,8 +753,11 @@ class ConfigDB(type):
             type.__setattr__(cls, key, value)
 
         else:
-            DEBUG('__setattr__:', cls.__table_name__, cls.__name__, key, repr(value), '\n')
+            if DEBUG_CONFIG:
+                DEBUG('__setattr__:', cls.__table_name__, cls.__name__, key, repr(value), '\n')
+
             type.__setattr__(cls, key, value)
+            ConfigDB._invalidate()
 
             cls.__table__[key] = value
             cls._process_change(key)
@@ -489,6 +782,7 @@ class ConfigDB(type):
             del cls.__table__[item]
 
         type.__delattr__(cls, item)
+        ConfigDB._invalidate()
 
     @staticmethod
     @_check_types.do
@@ -506,6 +800,7 @@ class ConfigDB(type):
     def close():
         """Save all registered configuration classes and close the database.
 
+        The saves are queued and written by the one flush ``close`` does.
         """
         for cls in ConfigDB.__classes__:
             cls._save()
@@ -636,6 +931,10 @@ class Config(metaclass=ConfigDB):
             smooth_transitions = True
             smooth_splices = True
             smooth_wire_markers = True
+            # Draw Text labels (cavity/terminal names, notes, corner labels)
+            # out of a few world-space layers per material (see
+            # gl/text_batching.py) instead of one draw call per label.
+            text_batching = True
 
         class drag_handler(metaclass=ConfigDB):
             mode = ''
@@ -832,6 +1131,10 @@ class Config(metaclass=ConfigDB):
             smooth_transitions = True
             smooth_splices = True
             smooth_wire_markers = True
+            # Draw Text labels (cavity/terminal names, notes, corner labels)
+            # out of a few world-space layers per material (see
+            # gl/text_batching.py) instead of one draw call per label.
+            text_batching = True
 
         class drag_handler(metaclass=ConfigDB):
             mode = ''
@@ -965,6 +1268,24 @@ class Config(metaclass=ConfigDB):
             smooth_transitions = True
             smooth_splices = True
             smooth_wire_markers = True
+            # Draw objects that share a pooled mesh, material and shading
+            # mode with one glDrawArraysInstanced per pass (gl/instancing.py)
+            # instead of one draw call per object.
+            instancing = True
+            # Draw converted models from a coarser level of their LOD chain
+            # (see process/model_process._build_lods) once they get small on
+            # screen. lod_screen_sizes are the projected diameters, in
+            # pixels, below which level 1, 2, ... is used; an object has to
+            # get lod_hysteresis (a fraction) past a size before it switches
+            # so one sitting right on a boundary doesn't flicker between two
+            # levels while the camera moves.
+            lod = True
+            lod_screen_sizes = [120.0, 30.0]
+            lod_hysteresis = 0.15
+            # Draw Text labels (cavity/terminal names, notes, corner labels)
+            # out of a few world-space layers per material (see
+            # gl/text_batching.py) instead of one draw call per label.
+            text_batching = True
 
         class focal_target(metaclass=ConfigDB):
             enable = True
@@ -1100,6 +1421,9 @@ class Config(metaclass=ConfigDB):
         num_archives = 10
         num_logfiles = 10
         max_logfile_size = 10485760
+        # longest the log viewer waits for newly written entries; they
+        # reach it as one chunk per interval rather than one per entry
+        viewer_update_ms = 100
         log_notice = True
         log_warning = True
         log_debug = False
@@ -1177,6 +1501,12 @@ class Config(metaclass=ConfigDB):
         connector = CONNECTOR_SQLITE
         monitor_duration = 60
 
+        # buffer pjt_* inserts/updates/deletes and write them in one
+        # transaction (see database.project_db.unit_of_work.UnitOfWork);
+        # write_behind_ms is the longest a write waits for a flush
+        write_behind = True
+        write_behind_ms = 250
+
         class maintenance(metaclass=ConfigDB):
             """Database maintenance batch settings."""
             point_batch_size = 50
@@ -1292,5 +1622,13 @@ class Config(metaclass=ConfigDB):
         last_project = None
         model_dir = _utils.get_documents()
 
+        # threads preparing model geometry while a project opens
+        # (0 = one per CPU), see objects.project_loader.ModelPrefetch
+        load_workers = 0
+
+        # how long the GUI thread builds objects between repaints while a
+        # project opens, see objects.project_loader.TimeSlicer
+        load_slice_ms = 50
+
 
 Config.open()
@@ -157,6 +157,16 @@ class ConnectorBase:
         """
         raise NotImplementedError
 
+    @_check_types.do
+    def rollback(self) -> None:
+        """Discard every statement executed since the last commit.
+
+        :returns: ``None``.
+        :rtype: None
+        :raises NotImplementedError: Raised by the abstract base implementation.
+        """
+        raise NotImplementedError
+
     @_check_types.do
     def close(self) -> None:
         """Close the connector and release any open resources.
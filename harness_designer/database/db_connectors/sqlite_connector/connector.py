@@ -499,6 +499,17 @@ class SQLConnector(_base.ConnectorBase):
 
         self._connection.commit()
 
+    @_check_types.do
+    def rollback(self):
+        """
+        Roll back the active SQLite transaction.
+
+        :returns: ``None``.
+        :rtype: None
+        """
+
+        self._connection.rollback()
+
     @_check_types.do
     def close(self):
         """
@@ -256,6 +256,11 @@ class TableBase:
         self.db = db
         self._con = db.connector
 
+        # bumped by every write made through this table, so anything caching
+        # what it read (the editor grids' row counts, see
+        # ui.editor_db.keyset_pager) can tell when to read it again
+        self.write_generation = 0
+
         if self.__table_name__ not in table_names:
             splash.SetText(f'Creating {self.__table_name__.replace("_", " ")} database table...')
             splash.flush()
@@ -457,6 +462,7 @@ class TableBase:
         values = ', '.join(values)
         self._con.execute(f'INSERT INTO {self.__table_name__} ({fields}) VALUES ({values});', args)
         self._con.commit()
+        self.write_generation += 1
 
         if self.__uses_uuid_id__:
             return new_id.bytes
@@ -563,6 +569,7 @@ class TableBase:
         """
         self._con.execute(f'DELETE FROM {self.__table_name__} WHERE id = ?;', (db_id,))
         self._con.commit()
+        self.write_generation += 1
 
     @_check_types.do
     def update(self, db_id: int | bytes, **kwargs):
@@ -586,6 +593,7 @@ class TableBase:
         values.append(db_id)
         self._con.execute(f'UPDATE {self.__table_name__} SET {fields} WHERE id = ?;', values)
         self._con.commit()
+        self.write_generation += 1
 
     @_check_types.do
     def execute(self, cmd, params=None):
@@ -613,6 +621,9 @@ class TableBase:
         """
         self._con.commit()
 
+        # raw SQL written through execute() is committed here
+        self.write_generation += 1
+
     @property
     @_check_types.do
     def lastrowid(self):
@@ -179,6 +179,82 @@ class Model3D(EntryBase):
 
         return path
 
+    @property
+    @_check_types.do
+    def indices_path(self) -> str | None:
+        """
+        Return the path of the element array stored next to the packed
+        geometry (``<uuid>.idx.npy``).
+
+        Only models converted to the indexed format have one; for older
+        triangle-soup conversions this returns ``None``.
+
+        :returns: Property value.
+        :rtype: str | None
+        """
+        data_path = self.data_path
+
+        if data_path is None:
+            return None
+
+        path = data_path[:-len('.npy')] + '.idx.npy'
+
+        if not os.path.exists(path):
+            return None
+
+        return path
+
+    @property
+    @_check_types.do
+    def indices(self) -> np.ndarray | None:
+        """
+        Return the memory mapped ``uint32`` element array of the packed
+        geometry, or ``None`` when the model is stored as triangle soup.
+
+        :returns: Property value.
+        :rtype: numpy.ndarray | None
+        """
+        path = self.indices_path
+
+        if path is None:
+            return None
+
+        return np.load(path, mmap_mode='r')
+
+    @property
+    @_check_types.do
+    def lod_paths(self) -> list[tuple[str, str]]:
+        """
+        Return the ``(packed, element array)`` file paths of every coarser
+        level of detail stored next to the model (``<uuid>.lod<n>.npy`` and
+        ``<uuid>.lod<n>.idx.npy``), level 1 first.
+
+        Models converted before the LOD chain existed, and models too small
+        to get one, have none.
+
+        :returns: Property value.
+        :rtype: list[tuple[str, str]]
+        """
+        data_path = self.data_path
+
+        if data_path is None:
+            return []
+
+        base = data_path[:-len('.npy')]
+        paths = []
+
+        while True:
+            level = len(paths) + 1
+            packed_path = f'{base}.lod{level}.npy'
+            indices_path = f'{base}.lod{level}.idx.npy'
+
+            if not os.path.exists(packed_path) or not os.path.exists(indices_path):
+                break
+
+            paths.append((packed_path, indices_path))
+
+        return paths
+
     _stored_path: str | DefaultStoredValueType = DefaultStoredValue
 
     @property
@@ -219,7 +295,9 @@ class Model3D(EntryBase):
     @_check_types.do
     def vertex_count(self) -> int | None:
         """
-        Return the cached mesh vertex count (triangle-soup vertices).
+        Return the cached mesh vertex count -- the vertices stored in the
+        packed file (unique vertices for an indexed model, see
+        :attr:`indices`; triangle-soup vertices for older conversions).
 
         :returns: Property value or ``None`` when the model has not been
                   converted yet.
@@ -811,8 +889,9 @@ class Model3D(EntryBase):
         to continue working on other things while the model is being loaded and
         converted instead of having to sit there and wait. The new format of the
         data can be larger than the original but not always. The new format
-        packages both the smooth normals as well as face normals with it and
-        both of these get uploaded to the GPU. This allows for realtime quick
+        is an indexed mesh (unique vertices plus an element array) that
+        packages the smooth normals with it; face normals are derived per
+        triangle on the GPU. This allows for realtime quick
         changing of smooth shading and and this is now able to be done on a
         per object basis. I have found that some models regardless of type will
         look better with smooth shading while others will not and this is not
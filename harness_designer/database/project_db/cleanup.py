@@ -147,6 +147,10 @@ class ProjectCleanup:
         con = self.project.connector
         project_id_low, project_id_high = _project_id_bounds(self.project.project_id)
 
+        # these queries go to the connector directly, so buffered writes
+        # (a point that just got referenced) have to land first
+        self.project.ptables.flush()
+
         # Compare cursor against the actual highest ID in the table.
         # len(rows) < BATCH_SIZE cannot reliably signal end-of-table
         # because deleted rows leave gaps in the ID sequence — there
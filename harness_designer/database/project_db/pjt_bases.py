@@ -1,7 +1,8 @@
 # © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
 
-from typing import Iterable as _Iterable, TYPE_CHECKING
+from typing import Any as _Any, Iterable as _Iterable, TYPE_CHECKING
 
+import time
 import weakref
 import threading
 import functools
@@ -10,6 +11,8 @@ from ... import logger as _logger
 from ..common_db import callback as _callback
 from ... import check_types as _check_types
 from .. import id_generator as _id_generator
+from . import unit_of_work as _unit_of_work
+from . import topology as _topology
 
 
 if TYPE_CHECKING:
@@ -368,6 +371,11 @@ class PJTTableBase:
         self._con = db.connector
         self.__field_names__ = None
 
+        # Row cache filled by preload() for the duration of a project load
+        # -- see preload() for what it serves and when it's dropped.
+        self._preloaded: dict[int | bytes, tuple] | None = None
+        self._preload_columns: dict[str, int] | None = None
+
         if self.__table_name__ not in table_names:
             splash.SetText(f'Creating {self.__table_name__.replace("_", " ")} database table...')
 
@@ -429,6 +437,100 @@ class PJTTableBase:
 
         return rows
 
+    @_check_types.do
+    def preload(self, project_id: int) -> int:
+        """Bulk-read every row this table holds for *project_id*.
+
+        Opening a project builds every wrapper object, and every wrapper
+        reads its entry's properties through the ``_stored_*`` getters --
+        each one a ``select('<column>', id=<db_id>)`` round trip on its
+        first access. On a project with a few thousand objects that is
+        tens of thousands of single-row SELECTs, most of them against
+        pjt_points3d.
+
+        This runs the one :meth:`get_records` range query instead and keeps
+        the rows in memory until :meth:`release_preload` is called.
+        While they are held, :meth:`select` answers ``select(<columns>,
+        id=<db_id>)`` from them, so every getter's first access seeds its
+        ``_stored_*`` cache from memory with whatever conversion the getter
+        itself applies (``bool(...)``, entry lookups, ...) and no getter
+        needs to know about the preload. :meth:`__iter__` and
+        :meth:`__contains__` are served from the same rows.
+
+        :meth:`update`, :meth:`batch_update` and :meth:`delete` keep the
+        held rows current. Rows inserted after the preload aren't held --
+        every lookup for them falls through to the database as usual.
+
+        :param project_id: The project being opened.
+        :type project_id: int
+        :returns: The number of rows read.
+        :rtype: int
+        """
+        rows = self.get_records(project_id)
+        header = rows.pop(0)
+
+        self._preload_columns = {name: i for i, name in enumerate(header)}
+        self._preloaded = {row[0]: tuple(row) for row in rows}
+
+        return len(rows)
+
+    @_check_types.do
+    def release_preload(self) -> None:
+        """Drop the rows held by :meth:`preload`.
+
+        Called once the project has finished loading. From then on every
+        read goes to the database again -- other seats sharing the same
+        database may change rows at any time, so the held rows are only
+        trusted for the load itself.
+        """
+        self._preloaded = None
+        self._preload_columns = None
+
+    @_check_types.do
+    def _flush_writes(self) -> None:
+        """Write out every buffered write before this table reads from the
+        database, so the read sees them -- see
+        :class:`~.unit_of_work.UnitOfWork`.
+        """
+        unit_of_work = self.db.unit_of_work
+        if unit_of_work.pending:
+            unit_of_work.flush()
+
+    @_check_types.do
+    def _write_behind(self) -> bool:
+        """Whether this table's writes go through the unit of work.
+
+        ``ProjectsTable`` (``__uses_uuid_id__ = False``) always writes
+        straight through: a new project's id comes back from the database
+        (``lastrowid``), so its insert can't wait.
+        """
+        return self.__uses_uuid_id__ and self.db.unit_of_work.enabled
+
+    @_check_types.do
+    def _preloaded_row(self, args: tuple, OR: bool, kwargs: dict) -> list[tuple] | None:
+        """Answer a :meth:`select` from the preloaded rows when possible.
+
+        Only the ``select(<columns>, id=<db_id>)`` form the entry getters
+        use is served; anything else (other filters, ``OR``, expressions
+        like ``COUNT(*)``) returns ``None`` so the caller runs the query.
+
+        :returns: The result rows, or ``None`` when the select has to go
+            to the database.
+        :rtype: list[tuple] | None
+        """
+        if OR or len(kwargs) != 1 or 'id' not in kwargs:
+            return None
+
+        row = self._preloaded.get(kwargs['id'], None)
+        if row is None:
+            return None
+
+        columns = self._preload_columns
+        try:
+            return [tuple(row[columns[name]] for name in args)]
+        except KeyError:
+            return None
+
     @_check_types.do
     def set_project(self, project_id: int | None = None):
         """Set the project.
@@ -483,6 +585,7 @@ class PJTTableBase:
         :returns: Return value. UNKNOWN details.
         :rtype: UNKNOWN
         """
+        self._flush_writes()
         self._con.execute(f'SELECT * FROM {self.__table_name__} WHERE id = ?;',
                           (item,))
 
@@ -498,6 +601,14 @@ class PJTTableBase:
         :returns: Iterator or iterable result. UNKNOWN details.
         :rtype: _Iterable[int]
         """
+        if self._preloaded is not None and self.project_id is not None:
+            # list() -- wrappers built while iterating may insert or
+            # delete rows, which mutates the preloaded dict
+            yield from list(self._preloaded)
+            return
+
+        self._flush_writes()
+
         if self.project_id is None:
             self._con.execute(f'SELECT id FROM {self.__table_name__};')
         else:
@@ -531,6 +642,10 @@ class PJTTableBase:
         :returns: ``True`` when the condition is satisfied.
         :rtype: bool
         """
+        if self._preloaded is not None and db_id in self._preloaded:
+            return True
+
+        self._flush_writes()
         self._con.execute(f'SELECT id FROM {self.__table_name__} WHERE id = ?;',
                           (db_id,))
 
@@ -558,10 +673,21 @@ class PJTTableBase:
 
         if self.__uses_uuid_id__:
             new_id = _id_generator.generate_project_row_id(self._con, self.project_id)
+
+            if self._write_behind():
+                self.db.unit_of_work.insert(self.__table_name__, new_id.bytes, kwargs)
+                self.db.topology.insert(self.__table_name__, new_id.bytes, kwargs)
+                self.db.notify_write(self.__table_name__, new_id.bytes, kwargs)
+                return new_id.bytes
+
             fields.append('id')
             values.append('?')
             args.append(new_id.bytes)
 
+        # written straight through -- everything buffered before it has to
+        # reach the database first
+        self._flush_writes()
+
         # There is no real project_id column -- see _project_id_bounds()
         # for why -- so project_id is never inserted directly; it's only
         # ever read back out of the leading bytes of id.
@@ -577,6 +703,8 @@ class PJTTableBase:
         self._con.commit()
 
         if self.__uses_uuid_id__:
+            self.db.topology.insert(self.__table_name__, new_id.bytes, kwargs)
+            self.db.notify_write(self.__table_name__, new_id.bytes, kwargs)
             return new_id.bytes
 
         return self._con.lastrowid
@@ -596,6 +724,13 @@ class PJTTableBase:
         :returns: Return value. UNKNOWN details.
         :rtype: UNKNOWN
         """
+        if self._preloaded is not None:
+            res = self._preloaded_row(args, OR, kwargs)
+            if res is not None:
+                return res
+
+        self._flush_writes()
+
         args = ', '.join(args)
 
         kwarg_clauses = []
@@ -645,10 +780,20 @@ class PJTTableBase:
         :param db_id: Identifier for the database.
         :type db_id: int | bytes
         """
-        self._con.execute(f'DELETE FROM {self.__table_name__} WHERE id = ?;',
-                          (db_id,))
+        if self._write_behind():
+            self.db.unit_of_work.delete(self.__table_name__, db_id)
+        else:
+            self._flush_writes()
+            self._con.execute(f'DELETE FROM {self.__table_name__} WHERE id = ?;',
+                              (db_id,))
 
-        self._con.commit()
+            self._con.commit()
+
+        if self._preloaded is not None:
+            self._preloaded.pop(db_id, None)
+
+        self.db.topology.delete(self.__table_name__, db_id)
+        self.db.notify_write(self.__table_name__, db_id, None)
 
     @_check_types.do
     def update(self, db_id: int | bytes, **kwargs):
@@ -661,17 +806,28 @@ class PJTTableBase:
         :param kwargs: Additional keyword arguments.
         :type kwargs: UNKNOWN
         """
-        fields = []
-        values = []
+        if self._write_behind():
+            self.db.unit_of_work.update(self.__table_name__, db_id, kwargs)
+        else:
+            self._flush_writes()
 
-        for key, value in kwargs.items():
-            fields.append(f'{key} = ?')
-            values.append(value)
+            fields = []
+            values = []
 
-        fields = ', '.join(fields)
-        values.append(db_id)
-        self._con.execute(f'UPDATE {self.__table_name__} SET {fields} WHERE id = ?;', values)
-        self._con.commit()
+            for key, value in kwargs.items():
+                fields.append(f'{key} = ?')
+                values.append(value)
+
+            fields = ', '.join(fields)
+            values.append(db_id)
+            self._con.execute(f'UPDATE {self.__table_name__} SET {fields} WHERE id = ?;', values)
+            self._con.commit()
+
+        if self._preloaded is not None:
+            self._update_preloaded(db_id, kwargs)
+
+        self.db.topology.update(self.__table_name__, db_id, kwargs)
+        self.db.notify_write(self.__table_name__, db_id, kwargs)
 
     @_check_types.do
     def batch_update(self, field_names: list, rows: list) -> None:
@@ -685,10 +841,54 @@ class PJTTableBase:
         """
         if not rows:
             return
-        set_clause = ', '.join(f'{f} = ?' for f in field_names)
-        sql = f'UPDATE {self.__table_name__} SET {set_clause} WHERE id = ?'
-        self._con.executemany(sql, rows)
-        self._con.commit()
+
+        if self._write_behind():
+            unit_of_work = self.db.unit_of_work
+            for row in rows:
+                unit_of_work.update(self.__table_name__, row[-1], dict(zip(field_names, row[:-1])))
+        else:
+            self._flush_writes()
+
+            set_clause = ', '.join(f'{f} = ?' for f in field_names)
+            sql = f'UPDATE {self.__table_name__} SET {set_clause} WHERE id = ?'
+            self._con.executemany(sql, rows)
+            self._con.commit()
+
+        if self._preloaded is not None:
+            for row in rows:
+                self._update_preloaded(row[-1], dict(zip(field_names, row[:-1])))
+
+        topology = self.db.topology
+        if topology.built:
+            for row in rows:
+                topology.update(self.__table_name__, row[-1], dict(zip(field_names, row[:-1])))
+
+        if self.db.write_observers:
+            for row in rows:
+                self.db.notify_write(self.__table_name__, row[-1], dict(zip(field_names, row[:-1])))
+
+    @_check_types.do
+    def _update_preloaded(self, db_id: int | bytes, values: dict[str, _Any]) -> None:
+        """Apply an update to the preloaded copy of row *db_id*, if held.
+
+        A column the preload didn't read drops the row instead, so the
+        next lookup for it goes to the database.
+        """
+        row = self._preloaded.get(db_id, None)
+        if row is None:
+            return
+
+        columns = self._preload_columns
+        row = list(row)
+
+        for name, value in values.items():
+            if name not in columns:
+                del self._preloaded[db_id]
+                return
+
+            row[columns[name]] = value
+
+        self._preloaded[db_id] = tuple(row)
 
     @property
     @_check_types.do
@@ -832,6 +1032,7 @@ class PJTTableBase:
             all_params.append(high)
             all_params.extend(params)
 
+        self._flush_writes()
         self._con.execute(query, all_params)
 
         ret = {row[0] for row in self._con.fetchall() if row[0] is not None}
@@ -850,6 +1051,8 @@ class PJTTableBase:
         :returns: Return value. UNKNOWN details.
         :rtype: UNKNOWN
         """
+        self._flush_writes()
+
         if params is None:
             return self._con.execute(cmd)
         else:
@@ -883,6 +1086,7 @@ class PJTTableBase:
 
         UNKNOWN details are inferred from the callable name and signature.
         """
+        self._flush_writes()
         self._con.commit()
 
     @property
@@ -949,6 +1153,16 @@ class PJTTables:
         self.global_db = mainframe.global_db
         self.connector = mainframe.db_connector
 
+        # every pjt_* write is buffered here -- see unit_of_work.UnitOfWork
+        self.unit_of_work = _unit_of_work.UnitOfWork(self.connector)
+
+        # which rows reference which point -- see topology.TopologyIndex
+        self.topology = _topology.TopologyIndex(self)
+
+        # told about every pjt_* write after the topology index -- see
+        # add_write_observer()
+        self.write_observers = weakref.WeakSet()
+
         tables = self.connector.get_tables()
         self._projects_table = ProjectsTable(self, None, tables, splash)
 
@@ -1006,7 +1220,16 @@ class PJTTables:
         :param project_id: Identifier for the project.
         :type project_id: UNKNOWN
         """
+        # the outgoing project's buffered writes go out before anything of
+        # it is torn down
+        self.flush()
+
         self.mainframe.unload()
+        self.topology.clear()
+
+        for observer in list(self.write_observers):
+            observer.tables_reset()
+
         tables = self.connector.get_tables()
 
         _logger.database('TABLES:', tables)
@@ -1058,6 +1281,81 @@ class PJTTables:
         self._pjt_points_pegboard_table = PJTPointsPegboardTable(self, project_id, tables, Splash)
         self._pjt_pegboard_tables_table = PJTPegboardTablesTable(self, project_id, tables, Splash)
 
+    @_check_types.do
+    def add_write_observer(self, observer) -> None:
+        """
+        Have *observer* told about every pjt_* insert, update and delete.
+
+        The observer gets ``table_written(table_name, row_id, values)``
+        after each write -- ``values`` being the columns written, or
+        ``None`` for a delete -- and ``tables_reset()`` when another
+        project is loaded. It is called on whichever thread made the write,
+        so it should only record what changed and leave the work for
+        later. Only a weak reference is kept.
+
+        :param observer: The object to notify.
+        :type observer: UNKNOWN
+        """
+        self.write_observers.add(observer)
+
+    @_check_types.do
+    def remove_write_observer(self, observer) -> None:
+        """Stop notifying *observer* (see :meth:`add_write_observer`)."""
+        self.write_observers.discard(observer)
+
+    @_check_types.do
+    def notify_write(self, table_name: str, row_id, values: dict[str, _Any] | None) -> None:
+        """Pass one pjt_* write on to every write observer."""
+        for observer in list(self.write_observers):
+            observer.table_written(table_name, row_id, values)
+
+    @_check_types.do
+    def flush(self) -> None:
+        """Write every buffered pjt_* insert, update and delete to the
+        database now (see :class:`~.unit_of_work.UnitOfWork`)."""
+        self.unit_of_work.flush()
+
+    @_check_types.do
+    def preload(self, project_id: int) -> None:
+        """Bulk-read every pjt_* table for *project_id*, one range query
+        per table (see :meth:`PJTTableBase.preload`), and log the time
+        spent per table.
+
+        Must be paired with :meth:`release_preload` once the project has
+        finished loading.
+
+        :param project_id: The project being opened.
+        :type project_id: int
+        """
+        timings = []
+        total_start = time.perf_counter()
+
+        for table in self.tables:
+            if not table.__uses_uuid_id__:
+                continue
+
+            start = time.perf_counter()
+            row_count = table.preload(project_id)
+            timings.append((table.table_name, row_count, time.perf_counter() - start))
+
+        # built from the rows just read, so it costs no queries of its own
+        self.topology.build()
+
+        total = time.perf_counter() - total_start
+
+        _logger.info(f'project preload: {sum(t[1] for t in timings)} rows '
+                     f'in {round(total * 1000.0, 2)} ms')
+
+        for table_name, row_count, duration in sorted(timings, key=lambda t: t[2], reverse=True):
+            _logger.database(f'    {table_name}: {row_count} rows, {round(duration * 1000.0, 2)} ms')
+
+    @_check_types.do
+    def release_preload(self) -> None:
+        """Drop the rows held by :meth:`preload` on every table."""
+        for table in self.tables:
+            if table is not None:
+                table.release_preload()
+
     @property
     @_check_types.do
     def pjt_bundles_table(self) -> PJTBundlesTable:
@@ -13,6 +13,7 @@ from ..common_db.lazy_tab_mixin import LazyTabMixin
 from .pjt_bases import PJTEntryBase, PJTTableBase, DefaultStoredValue
 from ...geometry import point as _point
 from ...geometry import angle as _angle
+from ...geometry.point_arena import POINT_ARENA as _POINT_ARENA
 from . import pjt_cover as _pjt_cover
 from . import pjt_tpa_lock as _pjt_tpa_lock
 from . import pjt_cpa_lock as _pjt_cpa_lock
@@ -436,6 +437,9 @@ class PJTHousing(PJTEntryBase, NameMixin, PartMixin, Position2DMixin, Position3D
         cavity_table = self._table.db.pjt_cavities_table
         terminal_table = self._table.db.pjt_terminals_table
 
+        # straight to the connector, not through a table -- see
+        # PJTTableBase._flush_writes
+        self._table.db.flush()
         self._table.db.connector.execute(
             'SELECT cavity.id, cavity.name, terminal.id, terminal.name '
             'FROM pjt_cavities AS cavity '
@@ -1188,16 +1192,17 @@ class PJTHousing(PJTEntryBase, NameMixin, PartMixin, Position2DMixin, Position3D
             key = pos.db_id[:-8]
             if key not in seen:
                 seen[key] = pos
-        all_positions = list(seen.values())
+        all_positions = _POINT_ARENA.roots(seen.values())
 
         if not all_positions:
             return
 
-        all_positions_array = np.array([pos.as_float for pos in all_positions], dtype=np.float32)
-        new_pos_arr = all_positions_array + delta
+        # One vectorised pass over the point arena moves every position
+        # (no callbacks fire, see PointArena); the DB rows are built from
+        # the same float64 result.
+        f_position_array = _POINT_ARENA.translate(all_positions, delta).tolist()
 
         db_ids = [p.db_id[:-8] for p in all_positions]
-        f_position_array = [[float(str(axis)) for axis in point] for point in new_pos_arr]
         rows = [[*pos, db_id] for pos, db_id in zip(f_position_array, db_ids)]
 
         self._table.db.pjt_points_pegboard_table.batch_update(['x', 'y', 'z'], rows)
@@ -1209,13 +1214,9 @@ class PJTHousing(PJTEntryBase, NameMixin, PartMixin, Position2DMixin, Position3D
         # persisted all of them.
         _pjt_point_pegboard.PJTPointPegboard._skip_db_write = True
         try:
-            for i, pos in enumerate(all_positions):
-                with pos:
-                    pos.x = f_position_array[i][0]
-                    pos.y = f_position_array[i][1]
-                    pos.z = f_position_array[i][2]
-
-                pos._process_callbacks()  # NOQA
+            with _point.Point.batch():
+                for pos in all_positions:
+                    pos._process_callbacks()  # NOQA
         finally:
             _pjt_point_pegboard.PJTPointPegboard._skip_db_write = False
 
@@ -1329,69 +1330,59 @@ class PJTHousing(PJTEntryBase, NameMixin, PartMixin, Position2DMixin, Position3D
             key = pos.db_id[:-2]
             if key not in seen:
                 seen[key] = pos
-        all_positions = list(seen.values())
+        all_positions = _POINT_ARENA.roots(seen.values())
 
         if not all_positions:
             return
 
-        # changed the data type to a float32
-        all_positions_array = np.array([pos.as_float for pos in all_positions], dtype=np.float32)
-
-        # ONE numpy operation for all positions at once.
-        # there is no need to turn the delta into a numpy array. the code
-        # already exists to directly apply a Point delta directly
-        # to a numpy array.
-
-        new_pos_arr = all_positions_array + delta
+        # ONE numpy operation for all positions at once. Every position is a
+        # row in the point arena, so the gather + add + scatter happens in
+        # float64 directly on the arena columns and each Point's own float
+        # values are updated along with it -- no per-point setter calls and
+        # no float32 round trip. Nothing fires here, see the callback
+        # handling below.
+        f_position_array = _POINT_ARENA.translate(all_positions, delta).tolist()
 
         # ONE batch DB write for everything (one executemany + one commit).
         db_ids = [p.db_id[:-2] for p in all_positions]
 
-        # The row handling seen commented below is inefficient and would produce
-        # incorrect values because of how the conversion from a numpy array to a
-        # float array was being done.
-        # rows = [
-        #     (float(new_pos_arr[i, 0]), float(new_pos_arr[i, 1]), float(new_pos_arr[i, 2]), db_ids[i])
-        #     for i in range(len(all_positions))
-        # ]
-        f_position_array = [[float(str(axis)) for axis in point] for point in new_pos_arr]
-
         # each row is [x, y, z, db_id] — four elements matching the four ? placeholders
         rows = [[*pos, db_id] for pos, db_id in zip(f_position_array, db_ids)]
 
         self._table.db.pjt_points3d_table.batch_update(['x', 'y', 'z'], rows)
 
         # The DB row for each point was already batch-written above in one
-        # shot, so the per-point mutation below is wrapped in `with pos:`
-        # to suppress any *individual* DB write a bound callback might
-        # otherwise trigger. _process_callbacks() is fired explicitly once
-        # the block closes, so rendering-side geometry recompute and
-        # Point.attach() delegate-sync (_on_delegate_changed) still run --
-        # both of which must run for a .attach()-shared point (a wire
-        # ending on a terminal/layout, or a snapped cover/seal/lock) to
-        # actually follow the housing.
+        # shot and the arena already moved the coordinates without firing
+        # anything. _process_callbacks() is fired explicitly per point, so
+        # rendering-side geometry recompute and Point.attach()
+        # delegate-sync (_on_delegate_changed) still run -- both of which
+        # must run for a .attach()-shared point (a wire ending on a
+        # terminal/layout, or a snapped cover/seal/lock) to actually follow
+        # the housing.
         #
         # PJTPoint3D._skip_db_write additionally suppresses the specific
         # DB-writing callback (PJTPoint3D._update_point) for the
         # skip_write_ids group, since the batch write above already
         # persisted them -- see the comments above on cavity_positions/
         # accessory_positions/wire_positions vs. terminal_positions.
+        #
+        # Each group is flushed through its own Point.batch() so a wire or
+        # bundle bound to many of these points rebuilds once per group
+        # instead of once per point. The batch has to close inside the
+        # try so the skip group's flush still sees _skip_db_write set.
         _pjt_point3d.PJTPoint3D._skip_db_write = True
         try:
-            for i, pos in enumerate(all_positions):
-                with pos:
-                    pos.x = f_position_array[i][0]
-                    pos.y = f_position_array[i][1]
-                    pos.z = f_position_array[i][2]
-
-                if pos.db_id[:-2] in skip_write_ids:
-                    pos._process_callbacks()  # NOQA
+            with _point.Point.batch():
+                for pos in all_positions:
+                    if pos.db_id[:-2] in skip_write_ids:
+                        pos._process_callbacks()  # NOQA
         finally:
             _pjt_point3d.PJTPoint3D._skip_db_write = False
 
-        for pos in all_positions:
-            if pos.db_id[:-2] not in skip_write_ids:
-                pos._process_callbacks()  # NOQA
+        with _point.Point.batch():
+            for pos in all_positions:
+                if pos.db_id[:-2] not in skip_write_ids:
+                    pos._process_callbacks()  # NOQA
 
     _o_position3d: _point.Point = None
 
@@ -1446,29 +1437,23 @@ class PJTHousing(PJTEntryBase, NameMixin, PartMixin, Position2DMixin, Position3D
         self._o_position2d = point.copy()
 
         cavities = [c for c in self.cavities if c is not None]
-        positions = [cavity.position2d for cavity in cavities]
+        positions = _POINT_ARENA.roots(cavity.position2d for cavity in cavities)
 
         if not positions:
             return
 
-        positions_array = np.array([pos.as_float for pos in positions], dtype=np.float32)
-        new_pos_arr = positions_array + delta
+        f_position_array = _POINT_ARENA.translate(positions, delta).tolist()
 
         db_ids = [p.db_id[:-2] for p in positions]
-        f_position_array = [[float(str(axis)) for axis in pt] for pt in new_pos_arr]
         rows = [[pos[0], pos[2], db_id] for pos, db_id in zip(f_position_array, db_ids)]
 
         self._table.db.pjt_points2d_table.batch_update(['x', 'y'], rows)
 
         _pjt_point2d.PJTPoint2D._skip_db_write = True
         try:
-            for i, pos in enumerate(positions):
-                with pos:
-                    pos.x = f_position_array[i][0]
-                    pos.y = f_position_array[i][1]
-                    pos.z = f_position_array[i][2]
-
-                pos._process_callbacks()  # NOQA
+            with _point.Point.batch():
+                for pos in positions:
+                    pos._process_callbacks()  # NOQA
         finally:
             _pjt_point2d.PJTPoint2D._skip_db_write = False
 
@@ -1546,9 +1531,7 @@ class PJTHousing(PJTEntryBase, NameMixin, PartMixin, Position2DMixin, Position3D
         position = self.position3d
         cavities = [c for c in self.cavities if c is not None]
 
-        w_d, x_d, y_d, z_d = actual_delta_q.as_float
-        qvec_d = np.array([x_d, y_d, z_d], dtype=np.float32)
-        center = position.as_numpy.copy()
+        delta_q = actual_delta_q.as_float
 
         # ── Collect all positions for one vectorized rotation ─────────────────
         # Same skip_write / normal split as _update_position3d: cavity,
@@ -1601,35 +1584,29 @@ class PJTHousing(PJTEntryBase, NameMixin, PartMixin, Position2DMixin, Position3D
             if key not in seen:
                 seen[key] = pos
 
-        all_positions = list(seen.values())
+        all_positions = _POINT_ARENA.roots(seen.values())
 
         if all_positions:
-            pos_arr = np.array([list(p.as_float) for p in all_positions], dtype=np.float32)
-            rel = pos_arr - center
-            t_vec = np.cross(qvec_d, rel)
-            new_pos_arr = rel + 2.0 * w_d * t_vec + 2.0 * np.cross(qvec_d, t_vec) + center
-
-            f_position_array = [[float(str(axis)) for axis in point] for point in new_pos_arr]
+            # Same vectorised v' = v + 2w(q x v) + 2q x (q x v) as before,
+            # run by the arena in float64 on the arena rows.
+            f_position_array = _POINT_ARENA.rotate(all_positions, delta_q, position).tolist()
             db_ids = [p.db_id[:-2] for p in all_positions]
             rows = [[*pos, db_id] for pos, db_id in zip(f_position_array, db_ids)]
             self._table.db.pjt_points3d_table.batch_update(['x', 'y', 'z'], rows)
 
             _pjt_point3d.PJTPoint3D._skip_db_write = True
             try:
-                for i, pos in enumerate(all_positions):
-                    with pos:
-                        pos.x = f_position_array[i][0]
-                        pos.y = f_position_array[i][1]
-                        pos.z = f_position_array[i][2]
-
-                    if pos.db_id[:-2] in skip_write_ids:
-                        pos._process_callbacks()  # NOQA
+                with _point.Point.batch():
+                    for pos in all_positions:
+                        if pos.db_id[:-2] in skip_write_ids:
+                            pos._process_callbacks()  # NOQA
             finally:
                 _pjt_point3d.PJTPoint3D._skip_db_write = False
 
-            for pos in all_positions:
-                if pos.db_id[:-2] not in skip_write_ids:
-                    pos._process_callbacks()  # NOQA
+            with _point.Point.batch():
+                for pos in all_positions:
+                    if pos.db_id[:-2] not in skip_write_ids:
+                        pos._process_callbacks()  # NOQA
 
         # ── Per-cavity angle computation (OBB-based) ──────────────────────────
         angle_results = []  # [(cavity, q_acc_new, new_euler), ...]
@@ -1869,9 +1846,7 @@ class PJTHousing(PJTEntryBase, NameMixin, PartMixin, Position2DMixin, Position3D
         position = self.position_pegboard
         cavities = [c for c in self.cavities if c is not None]
 
-        w_d, x_d, y_d, z_d = actual_delta_q.as_float
-        qvec_d = np.array([x_d, y_d, z_d], dtype=np.float32)
-        center = position.as_numpy.copy()
+        delta_q = actual_delta_q.as_float
 
         cavity_positions = [cavity.position_pegboard for cavity in cavities]
 
@@ -1891,28 +1866,21 @@ class PJTHousing(PJTEntryBase, NameMixin, PartMixin, Position2DMixin, Position3D
             if key not in seen:
                 seen[key] = pos
 
-        all_positions = list(seen.values())
+        all_positions = _POINT_ARENA.roots(seen.values())
 
         if all_positions:
-            pos_arr = np.array([list(p.as_float) for p in all_positions], dtype=np.float32)
-            rel = pos_arr - center
-            t_vec = np.cross(qvec_d, rel)
-            new_pos_arr = rel + 2.0 * w_d * t_vec + 2.0 * np.cross(qvec_d, t_vec) + center
-
-            f_position_array = [[float(str(axis)) for axis in point] for point in new_pos_arr]
+            # Same vectorised v' = v + 2w(q x v) + 2q x (q x v) as before,
+            # run by the arena in float64 on the arena rows.
+            f_position_array = _POINT_ARENA.rotate(all_positions, delta_q, position).tolist()
             db_ids = [p.db_id[:-8] for p in all_positions]
             rows = [[*pos, db_id] for pos, db_id in zip(f_position_array, db_ids)]
             self._table.db.pjt_points_pegboard_table.batch_update(['x', 'y', 'z'], rows)
 
             _pjt_point_pegboard.PJTPointPegboard._skip_db_write = True
             try:
-                for i, pos in enumerate(all_positions):
-                    with pos:
-                        pos.x = f_position_array[i][0]
-                        pos.y = f_position_array[i][1]
-                        pos.z = f_position_array[i][2]
-
-                    pos._process_callbacks()  # NOQA
+                with _point.Point.batch():
+                    for pos in all_positions:
+                        pos._process_callbacks()  # NOQA
             finally:
                 _pjt_point_pegboard.PJTPointPegboard._skip_db_write = False
 
@@ -2024,32 +1992,21 @@ class PJTHousing(PJTEntryBase, NameMixin, PartMixin, Position2DMixin, Position3D
         position = self.position2d
 
         cavities = [c for c in self.cavities if c is not None]
-        positions = [cavity.position2d for cavity in cavities]
+        positions = _POINT_ARENA.roots(cavity.position2d for cavity in cavities)
 
         if positions:
-            w_d, x_d, y_d, z_d = actual_delta_q.as_float
-            qvec_d = np.array([x_d, y_d, z_d], dtype=np.float32)
-            center = position.as_numpy.copy()
+            f_position_array = _POINT_ARENA.rotate(
+                positions, actual_delta_q.as_float, position).tolist()
 
-            pos_arr = np.array([list(p.as_float) for p in positions], dtype=np.float32)
-            rel = pos_arr - center
-            t_vec = np.cross(qvec_d, rel)
-            new_pos_arr = rel + 2.0 * w_d * t_vec + 2.0 * np.cross(qvec_d, t_vec) + center
-
-            f_position_array = [[float(str(axis)) for axis in pt] for pt in new_pos_arr]
             db_ids = [p.db_id[:-2] for p in positions]
             rows = [[pos[0], pos[2], db_id] for pos, db_id in zip(f_position_array, db_ids)]
             self._table.db.pjt_points2d_table.batch_update(['x', 'y'], rows)
 
             _pjt_point2d.PJTPoint2D._skip_db_write = True
             try:
-                for i, pos in enumerate(positions):
-                    with pos:
-                        pos.x = f_position_array[i][0]
-                        pos.y = f_position_array[i][1]
-                        pos.z = f_position_array[i][2]
-
-                    pos._process_callbacks()  # NOQA
+                with _point.Point.batch():
+                    for pos in positions:
+                        pos._process_callbacks()  # NOQA
             finally:
                 _pjt_point2d.PJTPoint2D._skip_db_write = False
 
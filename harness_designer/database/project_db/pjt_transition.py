@@ -3,7 +3,6 @@
 from typing import TYPE_CHECKING, Iterable as _Iterable
 
 import weakref
-import numpy as np
 from PySide6.QtWidgets import QTabWidget
 
 from ...ui import prop_ctrls as _prop_ctrls
@@ -12,6 +11,7 @@ from ..global_db import transition as _transition
 from .pjt_bases import PJTEntryBase, PJTTableBase, DefaultStoredValue, DefaultStoredValueType
 from ...geometry import point as _point
 from ...geometry import angle as _angle
+from ...geometry.point_arena import POINT_ARENA as _POINT_ARENA
 from . import pjt_point3d as _pjt_point3d
 from . import pjt_point_pegboard as _pjt_point_pegboard
 from .mixins import (
@@ -293,33 +293,27 @@ class PJTTransition(PJTEntryBase, Angle3DMixin, Position3DMixin, PositionPegboar
         delta = point - self._o_position3d
         self._o_position3d = point.copy()
 
-        positions = [b.position3d for b in self.branches]
+        positions = _POINT_ARENA.roots(b.position3d for b in self.branches)
 
         if not positions:
             return
 
-        positions_array = np.array([pos.as_float for pos in positions], dtype=np.float32)
-        new_pos_arr = positions_array + delta
+        f_position_array = _POINT_ARENA.translate(positions, delta).tolist()
 
         db_ids = [p.db_id[:-2] for p in positions]
-        f_position_array = [[float(str(axis)) for axis in pt] for pt in new_pos_arr]
         rows = [[*pos, db_id] for pos, db_id in zip(f_position_array, db_ids)]
 
         self._table.db.pjt_points3d_table.batch_update(['x', 'y', 'z'], rows)
 
         # The DB row for each branch point was already batch-written above
-        # in one shot -- suppress PJTPoint3D's own per-point DB write while
-        # applying the same values to the live Point (still need
-        # _process_callbacks() to fire so rendering/geometry recompute).
+        # in one shot and the arena already moved the live Points -- suppress
+        # PJTPoint3D's own per-point DB write while firing
+        # _process_callbacks() so rendering/geometry recompute.
         _pjt_point3d.PJTPoint3D._skip_db_write = True
         try:
-            for i, pos in enumerate(positions):
-                with pos:
-                    pos.x = f_position_array[i][0]
-                    pos.y = f_position_array[i][1]
-                    pos.z = f_position_array[i][2]
-
-                pos._process_callbacks()  # NOQA
+            with _point.Point.batch():
+                for pos in positions:
+                    pos._process_callbacks()  # NOQA
         finally:
             _pjt_point3d.PJTPoint3D._skip_db_write = False
 
@@ -371,29 +365,23 @@ class PJTTransition(PJTEntryBase, Angle3DMixin, Position3DMixin, PositionPegboar
         delta = point - self._o_position_pegboard
         self._o_position_pegboard = point.copy()
 
-        positions = [b.position_pegboard for b in self.branches]
+        positions = _POINT_ARENA.roots(b.position_pegboard for b in self.branches)
 
         if not positions:
             return
 
-        positions_array = np.array([pos.as_float for pos in positions], dtype=np.float32)
-        new_pos_arr = positions_array + delta
+        f_position_array = _POINT_ARENA.translate(positions, delta).tolist()
 
         db_ids = [p.db_id[:-8] for p in positions]
-        f_position_array = [[float(str(axis)) for axis in pt] for pt in new_pos_arr]
         rows = [[*pos, db_id] for pos, db_id in zip(f_position_array, db_ids)]
 
         self._table.db.pjt_points_pegboard_table.batch_update(['x', 'y', 'z'], rows)
 
         _pjt_point_pegboard.PJTPointPegboard._skip_db_write = True
         try:
-            for i, pos in enumerate(positions):
-                with pos:
-                    pos.x = f_position_array[i][0]
-                    pos.y = f_position_array[i][1]
-                    pos.z = f_position_array[i][2]
-
-                pos._process_callbacks()  # NOQA
+            with _point.Point.batch():
+                for pos in positions:
+                    pos._process_callbacks()  # NOQA
         finally:
             _pjt_point_pegboard.PJTPointPegboard._skip_db_write = False
 
@@ -439,34 +427,22 @@ class PJTTransition(PJTEntryBase, Angle3DMixin, Position3DMixin, PositionPegboar
         actual_delta_q = angle._q - o_angle._q  # NOQA
         position = self.position3d
 
-        positions = [b.position3d for b in self.branches]
+        positions = _POINT_ARENA.roots(b.position3d for b in self.branches)
 
         if not positions:
             return
 
-        w_d, x_d, y_d, z_d = actual_delta_q.as_float
-        qvec_d = np.array([x_d, y_d, z_d], dtype=np.float32)
-        center = position.as_numpy.copy()
-
-        pos_arr = np.array([list(p.as_float) for p in positions], dtype=np.float32)
-        rel = pos_arr - center
-        t_vec = np.cross(qvec_d, rel)
-        new_pos_arr = rel + 2.0 * w_d * t_vec + 2.0 * np.cross(qvec_d, t_vec) + center
+        f_position_array = _POINT_ARENA.rotate(positions, actual_delta_q.as_float, position).tolist()
 
-        f_position_array = [[float(str(axis)) for axis in pt] for pt in new_pos_arr]
         db_ids = [p.db_id[:-2] for p in positions]
         rows = [[*pos, db_id] for pos, db_id in zip(f_position_array, db_ids)]
         self._table.db.pjt_points3d_table.batch_update(['x', 'y', 'z'], rows)
 
         _pjt_point3d.PJTPoint3D._skip_db_write = True
         try:
-            for i, pos in enumerate(positions):
-                with pos:
-                    pos.x = f_position_array[i][0]
-                    pos.y = f_position_array[i][1]
-                    pos.z = f_position_array[i][2]
-
-                pos._process_callbacks()  # NOQA
+            with _point.Point.batch():
+                for pos in positions:
+                    pos._process_callbacks()  # NOQA
         finally:
             _pjt_point3d.PJTPoint3D._skip_db_write = False
 
@@ -504,34 +480,22 @@ class PJTTransition(PJTEntryBase, Angle3DMixin, Position3DMixin, PositionPegboar
         actual_delta_q = angle._q - o_angle._q  # NOQA
         position = self.position_pegboard
 
-        positions = [b.position_pegboard for b in self.branches]
+        positions = _POINT_ARENA.roots(b.position_pegboard for b in self.branches)
 
         if not positions:
             return
 
-        w_d, x_d, y_d, z_d = actual_delta_q.as_float
-        qvec_d = np.array([x_d, y_d, z_d], dtype=np.float32)
-        center = position.as_numpy.copy()
-
-        pos_arr = np.array([list(p.as_float) for p in positions], dtype=np.float32)
-        rel = pos_arr - center
-        t_vec = np.cross(qvec_d, rel)
-        new_pos_arr = rel + 2.0 * w_d * t_vec + 2.0 * np.cross(qvec_d, t_vec) + center
+        f_position_array = _POINT_ARENA.rotate(positions, actual_delta_q.as_float, position).tolist()
 
-        f_position_array = [[float(str(axis)) for axis in pt] for pt in new_pos_arr]
         db_ids = [p.db_id[:-8] for p in positions]
         rows = [[*pos, db_id] for pos, db_id in zip(f_position_array, db_ids)]
         self._table.db.pjt_points_pegboard_table.batch_update(['x', 'y', 'z'], rows)
 
         _pjt_point_pegboard.PJTPointPegboard._skip_db_write = True
         try:
-            for i, pos in enumerate(positions):
-                with pos:
-                    pos.x = f_position_array[i][0]
-                    pos.y = f_position_array[i][1]
-                    pos.z = f_position_array[i][2]
-
-                pos._process_callbacks()  # NOQA
+            with _point.Point.batch():
+                for pos in positions:
+                    pos._process_callbacks()  # NOQA
         finally:
             _pjt_point_pegboard.PJTPointPegboard._skip_db_write = False
 
@@ -0,0 +1,404 @@
+# © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
+
+"""In-memory index of which pjt_* rows reference which 3D point."""
+
+from typing import Any as _Any, Iterable as _Iterable, TYPE_CHECKING
+
+import time
+
+from ... import logger as _logger
+from ... import check_types as _check_types
+
+
+if TYPE_CHECKING:
+    from . import pjt_bases as _pjt_bases
+
+
+_BUNDLES = 'pjt_bundles'
+_BUNDLE_LAYOUTS = 'pjt_bundle_layouts'
+_POINTS3D = 'pjt_points3d'
+
+
+@_check_types.do
+def _is_point_column(name: str) -> bool:
+    # housings, cavities, bundle layouts and friends call it plain
+    # point3d_id, the two ended objects start_/stop_point3d_id
+    return name == 'point3d_id' or name.endswith('_point3d_id')
+
+
+class TopologyIndex:
+    """
+    Every point reference held by the open project's pjt_* rows, kept in
+    two dictionaries:
+
+    * ``point_id -> {(table_name, column, row_id), ...}`` -- who uses a point
+    * ``(table_name, row_id) -> {column: point_id}`` -- which points a row uses
+
+    The routing handlers used to answer "what is connected to this point"
+    with SQL: walking a bundle chain ran two SELECTs per section (neither
+    point column is indexed, so each one is a scan of the project's
+    bundles) plus one more against the layouts, checking whether a point
+    was orphaned probed every table that has a point column, and
+    repointing issued an UPDATE per column of every such table. Here each
+    of those is a dictionary lookup whose cost is the number of rows that
+    actually touch the point.
+
+    The index is built from the rows :meth:`PJTTables.preload` already
+    holds when a project is opened (or with one range query per table the
+    first time it's used, if it wasn't) and :class:`PJTTableBase` keeps it
+    current from ``insert``/``update``/``batch_update``/``delete`` --
+    buffered or not. It is dropped when another project is loaded.
+
+    Only writes made through this process's tables are seen. Another seat
+    editing the same project, or raw SQL against a pjt_* table, makes the
+    index drift from the database; :meth:`check` reports any difference
+    and :meth:`build` starts over.
+
+    ``stats`` counts ``builds``, the ``rows`` and ``references`` held after
+    the last build, ``build_ms`` and the ``updates`` applied since.
+    """
+
+    @_check_types.do
+    def __init__(self, db: "_pjt_bases.PJTTables | None"):
+        self.db = db
+
+        self._refs: dict[_Any, set[tuple[str, str, _Any]]] = {}
+        self._rows: dict[tuple[str, _Any], dict[str, _Any]] = {}
+        self._columns: dict[str, tuple[str, ...]] = {}
+        self._tables: dict[str, "_pjt_bases.PJTTableBase"] = {}
+        self._built = False
+
+        self.stats = dict(builds=0, rows=0, references=0, build_ms=0.0, updates=0)
+
+    @property
+    @_check_types.do
+    def built(self) -> bool:
+        return self._built
+
+    @_check_types.do
+    def clear(self) -> None:
+        """Forget everything -- the next query builds the index again."""
+        self._refs.clear()
+        self._rows.clear()
+        self._columns.clear()
+        self._tables.clear()
+        self._built = False
+
+    @_check_types.do
+    def _point_columns(self, table_name: str, field_names: _Iterable[str]) -> tuple[str, ...]:
+        columns = self._columns.get(table_name, None)
+        if columns is None:
+            if table_name == _POINTS3D:
+                columns = ()
+            else:
+                columns = tuple(name for name in field_names if _is_point_column(name))
+
+            self._columns[table_name] = columns
+
+        return columns
+
+    @_check_types.do
+    def build(self) -> None:
+        """
+        (Re)build the index from every pjt_* table of the open project.
+
+        A table holding preloaded rows is read from them, any other with
+        one :meth:`~PJTTableBase.get_records` range query.
+        """
+        self.clear()
+
+        start = time.perf_counter()
+
+        for table in self.db.tables:
+            if table is None or not table.__uses_uuid_id__:
+                continue
+
+            table_name = table.table_name
+            self._tables[table_name] = table
+
+            columns = self._point_columns(table_name, table.field_names)
+            if not columns:
+                continue
+
+            # preload() holds exactly the rows get_records() returns, keyed
+            # by id, with the header split out into _preload_columns
+            preloaded = table._preloaded  # NOQA
+            if preloaded is not None:
+                header = table._preload_columns  # NOQA
+                rows = preloaded.values()
+            else:
+                rows = table.get_records(table.project_id)
+                header = {name: i for i, name in enumerate(rows.pop(0))}
+
+            self.add_rows(table_name, header, rows)
+
+        self._built = True
+        self._finish_build(start)
+
+    @_check_types.do
+    def _finish_build(self, start: float) -> None:
+        stats = self.stats
+        stats['builds'] += 1
+        stats['rows'] = len(self._rows)
+        stats['references'] = sum(len(refs) for refs in self._refs.values())
+        stats['build_ms'] = (time.perf_counter() - start) * 1000.0
+
+        _logger.database(f'topology index: {stats["rows"]} rows, {stats["references"]} '
+                         f'point references in {round(stats["build_ms"], 2)} ms')
+
+    @_check_types.do
+    def add_rows(self, table_name: str, header: dict[str, int], rows: _Iterable[tuple]) -> None:
+        """
+        Index *rows* of *table_name*.
+
+        :param header: Column name -> position in each row; must include
+            ``id`` and every point column of the table.
+        :type header: dict[str, int]
+        :param rows: The rows.
+        :type rows: iterable of tuple
+        """
+        columns = self._point_columns(table_name, header)
+        if not columns:
+            return
+
+        id_index = header['id']
+        positions = [(column, header[column]) for column in columns]
+        refs = self._refs
+        index_rows = self._rows
+
+        for row in rows:
+            row_id = row[id_index]
+            points = {}
+
+            for column, position in positions:
+                point_id = row[position]
+                if point_id is None:
+                    continue
+
+                points[column] = point_id
+
+                ref = refs.get(point_id, None)
+                if ref is None:
+                    refs[point_id] = {(table_name, column, row_id)}
+                else:
+                    ref.add((table_name, column, row_id))
+
+            if points:
+                index_rows[(table_name, row_id)] = points
+
+    @_check_types.do
+    def _ensure_built(self) -> None:
+        if not self._built:
+            self.build()
+
+    # -- write hooks (PJTTableBase) -----------------------------------------
+
+    @_check_types.do
+    def insert(self, table_name: str, row_id, values: dict[str, _Any]) -> None:
+        """Index a row that was just inserted."""
+        self.update(table_name, row_id, values)
+
+    @_check_types.do
+    def update(self, table_name: str, row_id, values: dict[str, _Any]) -> None:
+        """Apply the point columns among *values* to row *row_id*."""
+        if not self._built:
+            return
+
+        columns = self._columns.get(table_name, None)
+        if columns is None:
+            table = self._tables.get(table_name, None)
+            if table is None:
+                return
+
+            columns = self._point_columns(table_name, table.field_names)
+
+        if not columns:
+            return
+
+        key = (table_name, row_id)
+        points = None
+        refs = self._refs
+
+        for column, point_id in values.items():
+            if column not in columns:
+                continue
+
+            if points is None:
+                points = self._rows.setdefault(key, {})
+
+            old_point_id = points.pop(column, None)
+            if old_point_id is not None:
+                self._drop_ref(old_point_id, (table_name, column, row_id))
+
+            if point_id is not None:
+                points[column] = point_id
+                refs.setdefault(point_id, set()).add((table_name, column, row_id))
+
+            self.stats['updates'] += 1
+
+        if points is not None and not points:
+            del self._rows[key]
+
+    @_check_types.do
+    def delete(self, table_name: str, row_id) -> None:
+        """Drop every reference row *row_id* held."""
+        if not self._built:
+            return
+
+        points = self._rows.pop((table_name, row_id), None)
+        if not points:
+            return
+
+        for column, point_id in points.items():
+            self._drop_ref(point_id, (table_name, column, row_id))
+
+        self.stats['updates'] += 1
+
+    @_check_types.do
+    def _drop_ref(self, point_id, ref: tuple[str, str, _Any]) -> None:
+        refs = self._refs.get(point_id, None)
+        if refs is None:
+            return
+
+        refs.discard(ref)
+        if not refs:
+            del self._refs[point_id]
+
+    # -- queries -------------------------------------------------------------
+
+    @_check_types.do
+    def table(self, table_name: str) -> "_pjt_bases.PJTTableBase":
+        """The open project's table called *table_name*."""
+        self._ensure_built()
+        return self._tables[table_name]
+
+    @_check_types.do
+    def references(self, point_id) -> list[tuple[str, str, _Any]]:
+        """Every ``(table_name, column, row_id)`` that references *point_id*."""
+        self._ensure_built()
+        return list(self._refs.get(point_id, ()))
+
+    @_check_types.do
+    def is_referenced(self, point_id) -> bool:
+        self._ensure_built()
+        return point_id in self._refs
+
+    @_check_types.do
+    def rows(self, table_name: str, point_id, column: str | None = None) -> list:
+        """
+        The ids of the *table_name* rows that reference *point_id*, in any
+        point column or only in *column*.
+        """
+        self._ensure_built()
+
+        return [row_id for ref_table, ref_column, row_id in self._refs.get(point_id, ())
+                if ref_table == table_name and (column is None or ref_column == column)]
+
+    @_check_types.do
+    def row_points(self, table_name: str, row_id) -> dict[str, _Any]:
+        """``{column: point_id}`` for every point row *row_id* references."""
+        self._ensure_built()
+        return dict(self._rows.get((table_name, row_id), {}))
+
+    @_check_types.do
+    def bundle_chain(self, section_id) -> list:
+        """
+        Walk a bundle from one free end to the other.
+
+        A bundle is drawn as a chain of sections joined at layout points;
+        starting from *section_id* this follows the chain through every
+        point that has a bundle layout on it, in both directions.
+
+        :returns: The ordered point ids ``[end_a, layout, ..., end_b]``.
+        :rtype: list
+        """
+        self._ensure_built()
+
+        points = self._rows.get((_BUNDLES, section_id), {})
+        toward_start = self._walk_bundle(section_id, points.get('start_point3d_id', None))
+        toward_stop = self._walk_bundle(section_id, points.get('stop_point3d_id', None))
+
+        return list(reversed(toward_start)) + toward_stop
+
+    @_check_types.do
+    def _walk_bundle(self, section_id, point_id) -> list:
+        chain = []
+        visited = {section_id}
+
+        while point_id is not None:
+            chain.append(point_id)
+
+            refs = self._refs.get(point_id, ())
+            if not any(ref[0] == _BUNDLE_LAYOUTS for ref in refs):
+                break
+
+            next_id = None
+            for table_name, _, row_id in refs:
+                if table_name == _BUNDLES and row_id not in visited:
+                    next_id = row_id
+                    break
+
+            if next_id is None:
+                break
+
+            visited.add(next_id)
+
+            points = self._rows[(_BUNDLES, next_id)]
+            next_start = points.get('start_point3d_id', None)
+            next_stop = points.get('stop_point3d_id', None)
+            point_id = next_stop if next_start == point_id else next_start
+
+        return chain
+
+    # -- consistency ---------------------------------------------------------
+
+    @_check_types.do
+    def check(self) -> list[str]:
+        """
+        Compare the index with the database.
+
+        Buffered writes are flushed, every table is read again and a
+        fresh index built from those rows is diffed against this one.
+        Nothing is changed -- call :meth:`build` to resync.
+
+        :returns: One line per difference; empty when they agree.
+        :rtype: list[str]
+        """
+        self._ensure_built()
+        self.db.flush()
+
+        fresh = TopologyIndex(None)
+        for table_name, table in self._tables.items():
+            if not self._columns.get(table_name, None):
+                continue
+
+            rows = table.get_records(table.project_id)
+            header = {name: i for i, name in enumerate(rows.pop(0))}
+            fresh.add_rows(table_name, header, rows)
+
+        problems = self.diff(fresh)
+
+        for problem in problems:
+            _logger.error(f'topology index: {problem}')
+
+        return problems
+
+    @_check_types.do
+    def diff(self, other: "TopologyIndex") -> list[str]:
+        """Every row whose point references differ between *self* and *other*."""
+        problems = []
+
+        for key in sorted(self._rows.keys() | other._rows.keys(), key=repr):
+            mine = self._rows.get(key, {})
+            theirs = other._rows.get(key, {})
+            if mine != theirs:
+                table_name, row_id = key
+                problems.append(f'{table_name} row {row_id!r}: indexed {mine!r}, stored {theirs!r}')
+
+        # the forward map is derived from the rows above; a difference here
+        # with none there means the two halves of this index disagree
+        for point_id in sorted(self._refs.keys() | other._refs.keys(), key=repr):
+            if self._refs.get(point_id, set()) != other._refs.get(point_id, set()):
+                problems.append(f'point {point_id!r}: references differ')
+
+        return problems
@@ -0,0 +1,226 @@
+# © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
+
+"""Write-behind buffer for pjt_* table inserts, updates and deletes."""
+
+from typing import Any as _Any
+
+import time
+import threading
+
+from ... import config as _config
+from ... import logger as _logger
+from ... import check_types as _check_types
+
+
+Config = _config.Config.database
+
+
+_INSERT = 0
+_UPDATE = 1
+_DELETE = 2
+
+
+class _Run:
+    """
+    Consecutive buffered statements of one kind against one table and one
+    column set -- everything a single ``executemany`` can write.
+
+    ``rows`` is keyed by row id, so a later update of a row already in the
+    run replaces its values in place (the per-row merge) instead of adding
+    a second statement.
+    """
+
+    @_check_types.do
+    def __init__(self, kind: int, table_name: str, fields: tuple[str, ...]):
+        self.kind = kind
+        self.table_name = table_name
+        self.fields = fields
+        self.rows: dict[int | bytes, tuple] = {}
+
+    @_check_types.do
+    def sql(self) -> str:
+        if self.kind == _INSERT:
+            fields = ', '.join(self.fields)
+            values = ', '.join('?' * len(self.fields))
+            return f'INSERT INTO {self.table_name} ({fields}) VALUES ({values});'
+
+        if self.kind == _UPDATE:
+            fields = ', '.join(f'{field} = ?' for field in self.fields)
+            return f'UPDATE {self.table_name} SET {fields} WHERE id = ?;'
+
+        return f'DELETE FROM {self.table_name} WHERE id = ?;'
+
+
+class UnitOfWork:
+    """
+    Buffer every write ``PJTTableBase`` makes and send them to the database
+    in one transaction.
+
+    ``insert``/``update``/``delete`` used to execute and ``commit()`` one
+    statement each, so dragging something with 50 waypoints committed (an
+    fsync on SQLite, a round trip on MySQL) 50+ times per mouse-move. They
+    now record the statement here and return; :meth:`flush` writes
+    everything recorded since the last flush with one ``executemany`` per
+    run and a single ``commit()``.
+
+    Statements are kept in the order they were made -- MySQL enforces
+    foreign keys, and an insert/delete moved past a statement that depends
+    on it would fail (or cascade). Consecutive statements that fit one
+    ``executemany`` (same kind, table and columns) form a run, and an
+    update of a row already in the open run is merged into it: every
+    mouse-move of a drag updates the same points' ``x, y, z``, so the whole
+    drag flushes as one statement with one row per point.
+
+    A flush happens:
+
+    - ``Config.database.write_behind_ms`` after the first buffered write
+      (a single-shot timer on the GUI thread),
+    - on mouse-up in any editor (``MouseHandlerBase``),
+    - before any read through a pjt_* table, so a read always sees every
+      write made before it,
+    - before a write that can't be buffered (``ProjectsTable``, whose new
+      ids come from the database),
+    - explicitly, via :meth:`PJTTables.flush`, when a project is unloaded
+      and when the application closes.
+
+    With ``Config.database.write_behind`` off every write is executed and
+    committed immediately, exactly as before.
+
+    ``stats`` counts ``flushes``, ``statements`` (``executemany`` calls),
+    ``rows`` written, ``merged`` (buffered writes folded into an earlier
+    one) and ``failures`` (flushes rolled back, see :meth:`flush`) since the
+    unit of work was created.
+    """
+
+    @_check_types.do
+    def __init__(self, connector):
+        self._con = connector
+        self._runs: list[_Run] = []
+        self._lock = threading.RLock()
+        self._timer_pending = False
+        self.stats = dict(flushes=0, statements=0, rows=0, merged=0, failures=0)
+
+    @property
+    @_check_types.do
+    def enabled(self) -> bool:
+        return bool(Config.write_behind)
+
+    @property
+    @_check_types.do
+    def pending(self) -> int:
+        """Number of buffered rows not yet written."""
+        with self._lock:
+            return sum(len(run.rows) for run in self._runs)
+
+    @_check_types.do
+    def _record(self, kind: int, table_name: str, fields: tuple[str, ...],
+                db_id: int | bytes, values: tuple) -> None:
+        with self._lock:
+            if self._runs:
+                run = self._runs[-1]
+                if run.kind != kind or run.table_name != table_name or run.fields != fields:
+                    run = None
+            else:
+                run = None
+
+            if run is None:
+                run = _Run(kind, table_name, fields)
+                self._runs.append(run)
+            elif db_id in run.rows:
+                self.stats['merged'] += 1
+
+            run.rows[db_id] = values
+
+            schedule = not self._timer_pending
+            self._timer_pending = True
+
+        if schedule:
+            self._schedule_flush()
+
+    @_check_types.do
+    def _schedule_flush(self) -> None:
+        from ... import app as _app
+
+        @_check_types.do
+        def _do():
+            from PySide6 import QtCore
+
+            QtCore.QTimer.singleShot(int(Config.write_behind_ms), self._on_timer)
+
+        # the timer has to live on the GUI thread; CallAfter runs _do right
+        # away when this already is the GUI thread
+        _app.CallAfter(_do)
+
+    @_check_types.do
+    def _on_timer(self) -> None:
+        try:
+            self.flush()
+        except Exception:  # NOQA
+            # already logged by flush, and the statements are still queued:
+            # the next write schedules another flush, as does the next read
+            pass
+
+    @_check_types.do
+    def insert(self, table_name: str, db_id: bytes, values: dict[str, _Any]) -> None:
+        """Buffer ``INSERT INTO table_name (id, ...) VALUES (db_id, ...)``."""
+        fields = ('id',) + tuple(values.keys())
+        self._record(_INSERT, table_name, fields, db_id, (db_id,) + tuple(values.values()))
+
+    @_check_types.do
+    def update(self, table_name: str, db_id: int | bytes, values: dict[str, _Any]) -> None:
+        """Buffer ``UPDATE table_name SET ... WHERE id = db_id``."""
+        fields = tuple(values.keys())
+        self._record(_UPDATE, table_name, fields, db_id, tuple(values.values()) + (db_id,))
+
+    @_check_types.do
+    def delete(self, table_name: str, db_id: int | bytes) -> None:
+        """Buffer ``DELETE FROM table_name WHERE id = db_id``."""
+        self._record(_DELETE, table_name, (), db_id, (db_id,))
+
+    @_check_types.do
+    def flush(self) -> None:
+        """Write every buffered statement in one transaction.
+
+        If a statement or the commit fails, the transaction is rolled back
+        and every buffered statement stays queued for the next flush --
+        nothing is dropped, and nothing the failed flush executed is left
+        for a later commit to write. The error is logged and raised again.
+        """
+        with self._lock:
+            runs = self._runs
+            self._timer_pending = False
+
+            if not runs:
+                return
+
+            start = time.perf_counter()
+            rows = 0
+
+            try:
+                for run in runs:
+                    self._con.executemany(run.sql(), list(run.rows.values()))
+                    rows += len(run.rows)
+
+                self._con.commit()
+            except Exception as err:
+                try:
+                    self._con.rollback()
+                except Exception as rollback_err:  # NOQA
+                    _logger.traceback(rollback_err, 'write-behind rollback failed')
+
+                self.stats['failures'] += 1
+                _logger.traceback(
+                    err, f'write-behind flush failed, {self.pending} rows kept for the next flush')
+                raise
+
+            # the lock is held for the whole flush, so nothing was buffered
+            # while it ran
+            self._runs = []
+
+            stats = self.stats
+            stats['flushes'] += 1
+            stats['statements'] += len(runs)
+            stats['rows'] += rows
+
+        _logger.database(f'write-behind flush: {rows} rows, {len(runs)} statements, '
+                         f'{round((time.perf_counter() - start) * 1000.0, 2)} ms')
@@ -7,14 +7,18 @@ cadquery: IGES BREP VRML
 
 """
 
+import concurrent.futures
 import ctypes
+import itertools
+import os
+import time
 from pyassimp import structs
 from OCP.gp import gp_Dir
 from OCP.gp import gp_Pnt
 from OCP.Poly import Poly_Triangulation, Poly_Triangle
 from OCP.TopLoc import TopLoc_Location
 from OCP.BRep import BRep_Builder
-from OCP.TopoDS import TopoDS_Face
+from OCP.TopoDS import TopoDS_Face, TopoDS_Compound
 import numpy as np
 import pyassimp.core as _assimp
 from .. import check_types as _check_types
@@ -41,30 +45,129 @@ def _unpack(packed: np.ndarray, vertex_count: int):
 # OCP path — BREP / IGES / VRML
 # ---------------------------------------------------------------------------
 
+# OCP's bindings don't expose the node/triangle arrays of a
+# Poly_Triangulation as buffers, so every node still goes in with its own
+# SetNode() call. What used to make that slow was everything around the
+# call: six numpy scalar lookups and float() conversions per vertex, a
+# zero-length check per normal, and three times as many nodes as the mesh
+# has, because the triangle soup repeats every shared corner. All of that
+# is now done up front with whole-array numpy operations (_prepare_part())
+# so the fill loop (_fill_triangulation()) only walks plain Python floats
+# for the unique nodes.
+
+# Rows handed to SetNode()/SetTriangle() between progress reports.
+_PROGRESS_CHUNK = 65536
+
+
 @_check_types.do
-def _safe_dir(nx, ny, nz):
-    """Return a gp_Dir; falls back to (0,0,1) for zero-length normals."""
+def _safe_normals(normals: np.ndarray) -> np.ndarray:
+    """Unit-length copy of *normals*; zero-length ones become (0,0,1)."""
 
-    if nx * nx + ny * ny + nz * nz < 1e-12:
-        return gp_Dir(0.0, 0.0, 1.0)
+    normals = np.asarray(normals, dtype=np.float32).reshape(-1, 3)
+    lengths = np.linalg.norm(normals, axis=1)
+    degenerate = lengths < 1e-6
 
-    return gp_Dir(float(nx), float(ny), float(nz))
+    result = np.empty_like(normals)
+    np.divide(normals, np.where(degenerate, 1.0, lengths)[:, None], out=result)
+    result[degenerate] = (0.0, 0.0, 1.0)
+    return result
 
 
 @_check_types.do
-def _build_ocp_face(verts: np.ndarray, normals: np.ndarray):
-    n_verts = len(verts)
-    n_tris = n_verts // 3
+def _dedupe_vertices(verts: np.ndarray, normals: np.ndarray):
+    """
+    Collapse triangle-soup vertices that share both position and normal.
 
-    tri = Poly_Triangulation(n_verts, n_tris, False, True)  # hasUV=False, hasNormals=True
+    Vertices are only merged when they are bit-for-bit identical, so a
+    flat-shaded mesh keeps its hard edges (the corners there differ in
+    normal) and nothing moves.
 
-    for i in range(n_verts):
-        tri.SetNode(i + 1, gp_Pnt(float(verts[i, 0]), float(verts[i, 1]), float(verts[i, 2])))
-        tri.SetNormal(i + 1, _safe_dir(normals[i, 0], normals[i, 1], normals[i, 2]))
+    Returns (nodes, node_normals, triangles): the unique positions and
+    normals, (M,3) float32 each, and the (F,3) int32 0-based node indices
+    of every triangle.
+    """
+    n = len(verts)
 
-    for i in range(n_tris):
-        tri.SetTriangle(i + 1, Poly_Triangle(i * 3 + 1, i * 3 + 2, i * 3 + 3))
+    rows = np.empty((n, 6), dtype=np.float32)
+    rows[:, :3] = verts
+    rows[:, 3:] = normals
+    # -0.0 + 0.0 == +0.0: without this, a zero that came out negative from
+    # the transform would keep two otherwise identical vertices apart.
+    rows += 0.0
+
+    if n == 0:
+        return rows[:, :3], rows[:, 3:], np.empty((0, 3), dtype=np.int32)
+
+    bits = rows.view(np.uint32)
+    # lexsort's last key is the primary one
+    order = np.lexsort(bits.T[::-1])
+    ordered = bits[order]
 
+    is_first = np.empty(n, dtype=bool)
+    is_first[0] = True
+    np.any(ordered[1:] != ordered[:-1], axis=1, out=is_first[1:])
+
+    inverse = np.empty(n, dtype=np.int32)
+    inverse[order] = np.cumsum(is_first, dtype=np.int32) - 1
+
+    unique = rows[order[is_first]]
+    return unique[:, :3], unique[:, 3:], inverse.reshape(-1, 3)
+
+
+@_check_types.do
+def _prepare_part(verts: np.ndarray, normals: np.ndarray):
+    """Everything a part needs before it is handed to OCCT, done with
+    whole-array numpy operations. See :func:`_dedupe_vertices`."""
+
+    verts = np.asarray(verts, dtype=np.float32).reshape(-1, 3)
+    # a trailing partial triangle can't be expressed as a Poly_Triangle
+    count = len(verts) // 3 * 3
+    return _dedupe_vertices(verts[:count], _safe_normals(normals)[:count])
+
+
+@_check_types.do
+def _fill_triangulation(nodes: np.ndarray, normals: np.ndarray,
+                        triangles: np.ndarray, progress=None):
+    """
+    Build a Poly_Triangulation from prepared (deduplicated) arrays.
+
+    ``progress(count)`` is called after every _PROGRESS_CHUNK nodes or
+    triangles with how many were added by that chunk.
+    """
+    tri = Poly_Triangulation(len(nodes), len(triangles), False, True)  # hasUV=False, hasNormals=True
+
+    set_node = tri.SetNode
+    set_normal = tri.SetNormal
+    set_triangle = tri.SetTriangle
+
+    for first in range(0, len(nodes), _PROGRESS_CHUNK):
+        last = first + _PROGRESS_CHUNK
+        # tolist() turns the whole chunk into Python floats in one call,
+        # instead of a numpy scalar lookup + float() per coordinate
+        for i, (x, y, z), (nx, ny, nz) in zip(
+                itertools.count(first + 1),
+                nodes[first:last].tolist(), normals[first:last].tolist()):
+            set_node(i, gp_Pnt(x, y, z))
+            set_normal(i, gp_Dir(nx, ny, nz))
+
+        if progress is not None:
+            progress(min(last, len(nodes)) - first)
+
+    for first in range(0, len(triangles), _PROGRESS_CHUNK):
+        last = first + _PROGRESS_CHUNK
+        # OCCT node indices are 1-based
+        for i, (a, b, c) in zip(itertools.count(first + 1),
+                                (triangles[first:last] + 1).tolist()):
+            set_triangle(i, Poly_Triangle(a, b, c))
+
+        if progress is not None:
+            progress(min(last, len(triangles)) - first)
+
+    return tri
+
+
+@_check_types.do
+def _make_face(tri) -> TopoDS_Face:
     builder = BRep_Builder()
     face = TopoDS_Face()
     builder.MakeFace(face)
@@ -73,6 +176,94 @@ def _build_ocp_face(verts: np.ndarray, normals: np.ndarray):
     return face
 
 
+@_check_types.do
+def _split_parts(verts: np.ndarray, normals: np.ndarray, part_sizes=None):
+    """(verts, normals) slices for each part; the whole mesh is one part
+    when *part_sizes* (vertex counts, in order) isn't given."""
+
+    if not part_sizes:
+        return [(verts, normals)]
+
+    bounds = np.cumsum([0] + list(part_sizes))
+    return [(verts[a:b], normals[a:b])
+            for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+
+
+@_check_types.do
+def _build_ocp_shape(verts: np.ndarray, normals: np.ndarray,
+                     part_sizes=None, workers: int = 1, progress_cb=None,
+                     stats: dict | None = None):
+    """
+    Build the shape written by the OCP exporters.
+
+    Each part (see :func:`_split_parts`) becomes one triangulated face; a
+    single part is returned as that face, several as a compound of them.
+    With *workers* > 1 the parts are prepared (:func:`_prepare_part`)
+    concurrently on a thread pool - numpy releases the GIL for the sorts,
+    compares and copies that dominate it - and then filled into OCCT one
+    after another, since that part is bound to the interpreter.
+
+    *stats*, when given, receives ``vertices``, ``nodes``, ``triangles``,
+    ``prepare_ms`` and ``fill_ms``.
+    """
+    parts = _split_parts(verts, normals, part_sizes)
+
+    start = time.perf_counter()
+    if progress_cb:
+        progress_cb(0, len(parts), 'Merging duplicate vertices')
+
+    if workers > 1 and len(parts) > 1:
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(workers, len(parts))) as executor:
+            futures = [executor.submit(_prepare_part, v, n) for v, n in parts]
+            prepared = []
+            for i, future in enumerate(futures):
+                prepared.append(future.result())
+                if progress_cb:
+                    progress_cb(i + 1, len(parts), 'Merging duplicate vertices')
+    else:
+        prepared = []
+        for i, (v, n) in enumerate(parts):
+            prepared.append(_prepare_part(v, n))
+            if progress_cb:
+                progress_cb(i + 1, len(parts), 'Merging duplicate vertices')
+
+    prepare_ms = (time.perf_counter() - start) * 1000.0
+
+    node_count = sum(len(nodes) for nodes, _, _ in prepared)
+    tri_count = sum(len(tris) for _, _, tris in prepared)
+    total = node_count + tri_count
+    done = [0]
+
+    progress = None
+    if progress_cb:
+        progress_cb(0, total, 'Building OCP triangulation')
+
+        def progress(count):
+            done[0] += count
+            progress_cb(done[0], total, 'Building OCP triangulation')
+
+    start = time.perf_counter()
+    faces = [_make_face(_fill_triangulation(nodes, node_normals, tris, progress))
+             for nodes, node_normals, tris in prepared if len(tris)]
+    fill_ms = (time.perf_counter() - start) * 1000.0
+
+    if stats is not None:
+        stats.update(vertices=len(verts), nodes=node_count, triangles=tri_count,
+                     prepare_ms=prepare_ms, fill_ms=fill_ms)
+
+    if len(faces) == 1:
+        return faces[0]
+
+    builder = BRep_Builder()
+    compound = TopoDS_Compound()
+    builder.MakeCompound(compound)
+    for face in faces:
+        builder.Add(compound, face)
+
+    return compound
+
+
 @_check_types.do
 def _export_ocp(
     packed: np.ndarray,
@@ -95,7 +286,7 @@ def _export_ocp(
         One of 'brep', 'iges', 'vrml'.
     """
     verts, _, normals = _unpack(packed, vertex_count)
-    shape = _build_ocp_face(verts, normals)
+    shape = _build_ocp_shape(verts, normals)
 
     fmt = fmt.lower()
 
@@ -248,34 +439,6 @@ def _export_assimp(
         del refs
 
 
-@_check_types.do
-def _build_ocp_face_with_progress(verts: np.ndarray, normals: np.ndarray, progress_cb=None):
-    n_verts = len(verts)
-    n_tris = n_verts // 3
-    total = n_verts + n_tris
-    _step = max(1, total // 200)
-
-    tri = Poly_Triangulation(n_verts, n_tris, False, True)  # hasUV=False, hasNormals=True
-
-    for i in range(n_verts):
-        tri.SetNode(i + 1, gp_Pnt(float(verts[i, 0]), float(verts[i, 1]), float(verts[i, 2])))
-        tri.SetNormal(i + 1, _safe_dir(normals[i, 0], normals[i, 1], normals[i, 2]))
-        if progress_cb and i % _step == 0:
-            progress_cb(i, total, 'Building OCP nodes & normals')
-
-    for i in range(n_tris):
-        tri.SetTriangle(i + 1, Poly_Triangle(i * 3 + 1, i * 3 + 2, i * 3 + 3))
-        if progress_cb and i % max(1, n_tris // 50) == 0:
-            progress_cb(n_verts + i, total, 'Building OCP triangles')
-
-    builder = BRep_Builder()
-    face = TopoDS_Face()
-    builder.MakeFace(face)
-    builder.UpdateFace(face, tri, TopLoc_Location(), 1e-7)
-
-    return face
-
-
 @_check_types.do
 def _build_assimp_scene_with_progress(verts: np.ndarray, normals: np.ndarray, progress_cb=None):
     n_verts = len(verts)
@@ -365,39 +528,49 @@ def _build_assimp_scene_with_progress(verts: np.ndarray, normals: np.ndarray, pr
 
 @_check_types.do
 def export_ocp(verts: np.ndarray, normals: np.ndarray, path: str, fmt: str,
-               progress_cb=None):
+               progress_cb=None, part_sizes=None, workers: int | None = None):
     """
     Export a mesh (verts + normals, each (N,3) float32) via OCP/OCCT.
 
     progress_cb(current: int, total: int, phase: str) — called periodically.
     fmt: 'brep', 'iges', or 'vrml'.
+    part_sizes: vertex count of each object in verts/normals, in order;
+    every object is written as its own face. None writes one face.
+    workers: threads preparing objects concurrently (None = one per CPU,
+    1 = none).
     """
     fmt = fmt.lower()
 
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    def _build():
+        return _build_ocp_shape(verts, normals, part_sizes, workers, progress_cb)
+
     if fmt == 'brep':
         from OCP.BRepTools import BRepTools
-        face = _build_ocp_face_with_progress(verts, normals, progress_cb)
+        shape = _build()
         if progress_cb:
             progress_cb(-1, -1, 'Writing BREP file')
-        BRepTools.Write_s(face, path)
+        BRepTools.Write_s(shape, path)
 
     elif fmt == 'iges':
         from OCP.IGESControl import IGESControl_Writer
-        face = _build_ocp_face_with_progress(verts, normals, progress_cb)
+        shape = _build()
         if progress_cb:
             progress_cb(-1, -1, 'Writing IGES file')
         writer = IGESControl_Writer()
-        writer.AddShape(face)
+        writer.AddShape(shape)
         writer.ComputeModel()
         writer.Write(path)
 
     elif fmt == 'vrml':
         from OCP.VrmlAPI import VrmlAPI_Writer
-        face = _build_ocp_face_with_progress(verts, normals, progress_cb)
+        shape = _build()
         if progress_cb:
             progress_cb(-1, -1, 'Writing VRML file')
         writer = VrmlAPI_Writer()
-        writer.Write(face, path)
+        writer.Write(shape, path)
 
     else:
         raise ValueError(f'Unknown OCP export format: {fmt!r}')
@@ -495,10 +668,15 @@ OCP_FORMAT_STRINGS = {
     EXPORT_TYPE_VRML: 'vrml',
 }
 
+# written by scene_exporter straight from the objects' mesh handlers,
+# instanced and streamed, instead of from one flattened mesh
+SCENE_FORMAT_STRINGS = {
+    EXPORT_TYPE_OBJ:  'obj',
+    EXPORT_TYPE_GLTF: 'gltf',
+}
+
 ASSIMP_FORMAT_IDS = {
-    EXPORT_TYPE_OBJ:     'obj',
     EXPORT_TYPE_OPENGEX: 'ogex',
-    EXPORT_TYPE_GLTF:    'gltf2',
     EXPORT_TYPE_PLY:     'ply',
     EXPORT_TYPE_3DS:     '3ds',
     EXPORT_TYPE_ASSBIN:  'assbin',
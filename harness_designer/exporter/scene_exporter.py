@@ -0,0 +1,509 @@
+# © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
+
+"""Instance-preserving, streaming scene export to glTF 2.0 and Wavefront OBJ."""
+
+import json
+import os
+
+import numpy as np
+
+from .. import check_types as _check_types
+
+
+# The flattened exporters (exporter.export_assimp/export_ocp) take every
+# visible object already transformed into world space and concatenated into
+# two (N,3) arrays - memory several times the size of the scene before a
+# byte is written, and every part that appears forty times is written forty
+# times with nothing to say it was ever the same part.
+#
+# Here a scene is a list of ScenePart: the mesh handler an object draws
+# with, plus its transform and material. Nothing is transformed or copied
+# up front. glTF writes each distinct mesh handler once and places every
+# object as a node with its own matrix and material; OBJ has no instancing,
+# so each object is written out in world space - but in both cases the
+# vertex and index data goes from the handler to the file CHUNK_ROWS rows
+# at a time (VBOHandlerBase.read_rows), so the memory an export needs is
+# bounded by the chunk, not by the scene.
+
+# stored vertices (or triangles, for index data) read, converted and
+# written per chunk
+CHUNK_ROWS = 65536
+
+# packed block numbers, see VBOHandlerBase.read_rows
+_POSITIONS = 0
+_SMOOTH_NORMALS = 1
+_FACE_NORMALS = 2
+
+_GLTF_ARRAY_BUFFER = 34962
+_GLTF_ELEMENT_ARRAY_BUFFER = 34963
+_GLTF_FLOAT = 5126
+_GLTF_UNSIGNED_INT = 5125
+_GLTF_TRIANGLES = 4
+
+
+class ScenePart:
+    """
+    One placed object: the mesh handler it draws and where, how and in what
+    it draws it.
+
+    :param name: Node/object name written to the file.
+    :param vbo: The object's mesh handler (``obj3d.vbo``); objects sharing
+                a handler share the mesh in a glTF file.
+    :param smooth: Smooth normals rather than flat ones.
+    :param position: World position, (3,).
+    :param rotation: (3,3) rotation in the row-vector convention the GL
+                     side uses - ``v @ rotation`` rotates ``v``.
+    :param scale: Per-axis scale, (3,), applied before the rotation.
+    :param material: The object's ``GLMaterial``, or ``None``.
+    :param group: Name of the group (glTF parent node) the object is
+                  placed under; ``''`` places it at the scene root.
+    """
+
+    @_check_types.do
+    def __init__(self, name: str, vbo, smooth: bool, position: np.ndarray,
+                 rotation: np.ndarray, scale: np.ndarray, material=None,
+                 group: str = ''):
+        self.name = name
+        self.vbo = vbo
+        self.smooth = smooth
+        self.position = np.asarray(position, dtype=np.float32).reshape(3)
+        self.rotation = np.asarray(rotation, dtype=np.float32).reshape(3, 3)
+        self.scale = np.asarray(scale, dtype=np.float32).reshape(3)
+        self.material = material
+        self.group = group
+
+    @property
+    @_check_types.do
+    def matrix(self) -> np.ndarray:
+        """The world transform as a 4x4 column-vector matrix: scale, then
+        rotate, then translate."""
+        matrix = np.eye(4, dtype=np.float64)
+        matrix[:3, :3] = self.rotation.T.astype(np.float64) * self.scale
+        matrix[:3, 3] = self.position
+        return matrix
+
+    @_check_types.do
+    def transform_positions(self, rows: np.ndarray) -> np.ndarray:
+        return (rows * self.scale) @ self.rotation + self.position
+
+    @_check_types.do
+    def transform_normals(self, rows: np.ndarray) -> np.ndarray:
+        # rotate only, the way the flattened export always has
+        rows = rows @ self.rotation
+        lengths = np.linalg.norm(rows, axis=1, keepdims=True)
+        np.maximum(lengths, 1e-8, out=lengths)
+        return rows / lengths
+
+
+class _Geometry:
+    """What gets written for one (mesh handler, shading) pair."""
+
+    @_check_types.do
+    def __init__(self, vbo, smooth: bool):
+        self.vbo = vbo
+        self.smooth = smooth
+
+        self.vertex_count = vbo.stored_vertex_count
+        self.indexed = vbo.is_indexed
+        self.triangle_count = vbo.triangle_count
+
+        # An indexed mesh only stores smooth normals - face normals exist
+        # per triangle corner, which is the soup an indexed mesh avoids. A
+        # flat one is written without normals: glTF requires readers to
+        # derive flat normals then, and OBJ readers shade it flat.
+        if smooth:
+            self.normal_block = _SMOOTH_NORMALS
+        elif self.indexed:
+            self.normal_block = None
+        else:
+            self.normal_block = _FACE_NORMALS
+
+    @property
+    @_check_types.do
+    def work(self) -> int:
+        """Rows written for this geometry, for progress reporting."""
+        rows = self.vertex_count
+        if self.normal_block is not None:
+            rows += self.vertex_count
+
+        return rows + self.triangle_count
+
+    @_check_types.do
+    def rows(self, block: int):
+        """Yield one packed block in chunks of (n,3) float32 rows."""
+        for start in range(0, self.vertex_count, CHUNK_ROWS):
+            yield self.vbo.read_rows(block, start, min(start + CHUNK_ROWS, self.vertex_count))
+
+    @_check_types.do
+    def triangles(self):
+        """Yield the 0-based triangle corners in chunks of (n,3) uint32."""
+        if self.indexed:
+            indices = self.vbo.indices
+            step = CHUNK_ROWS * 3
+            for start in range(0, self.triangle_count * 3, step):
+                yield np.asarray(indices[start:start + step], dtype=np.uint32).reshape(-1, 3)
+        else:
+            # triangle soup: corners are consecutive stored vertices
+            for start in range(0, self.triangle_count, CHUNK_ROWS):
+                stop = min(start + CHUNK_ROWS, self.triangle_count)
+                yield np.arange(start * 3, stop * 3, dtype=np.uint32).reshape(-1, 3)
+
+
+class _Progress:
+
+    @_check_types.do
+    def __init__(self, callback, total: int, phase: str):
+        self._callback = callback
+        self._total = total
+        self._phase = phase
+        self._done = 0
+        # a report roughly every half percent, not every chunk
+        self._step = max(1, total // 200)
+        self._next = 0
+
+        if callback:
+            callback(0, total, phase)
+
+    @_check_types.do
+    def add(self, count: int):
+        self._done += count
+        if self._callback and self._done >= self._next:
+            self._next = self._done + self._step
+            self._callback(min(self._done, self._total), self._total, self._phase)
+
+
+@_check_types.do
+def _geometries(parts: list) -> tuple[list, dict]:
+    """The distinct (handler, shading) pairs in *parts*, in first-use order,
+    and each part's index into them. Parts with an empty mesh are left
+    out of the mapping."""
+    geometries = []
+    keys = {}
+    part_geometry = {}
+
+    for i, part in enumerate(parts):
+        key = (id(part.vbo), bool(part.smooth))
+        if key not in keys:
+            geometry = _Geometry(part.vbo, bool(part.smooth))
+            if not geometry.triangle_count:
+                continue
+
+            keys[key] = len(geometries)
+            geometries.append(geometry)
+
+        part_geometry[i] = keys[key]
+
+    return geometries, part_geometry
+
+
+@_check_types.do
+def _material_key(material):
+    return None if material is None else material.batch_key
+
+
+# ---------------------------------------------------------------------------
+# glTF 2.0 - JSON document plus one external .bin buffer
+# ---------------------------------------------------------------------------
+
+@_check_types.do
+def _gltf_material(material, name: str) -> dict:
+    r, g, b, a = (float(value) for value in material.color_scalar)
+    cl = material.cl_array
+
+    result = {
+        'name': name,
+        'pbrMetallicRoughness': {
+            'baseColorFactor': [r, g, b, a],
+            'metallicFactor': float(cl[7]),
+            'roughnessFactor': float(cl[8]),
+        },
+    }
+
+    if a < 1.0:
+        result['alphaMode'] = 'BLEND'
+
+    return result
+
+
+@_check_types.do
+def export_gltf(parts: list, path: str, progress_cb=None) -> dict:
+    """
+    Write *parts* as a glTF 2.0 scene.
+
+    The JSON goes to *path*, the binary buffer next to it with a ``.bin``
+    extension. Each distinct (mesh handler, shading) pair is written once;
+    each part becomes a node with its own matrix, under one parent node per
+    :attr:`ScenePart.group`, drawing a mesh that pairs the shared geometry
+    with the part's material.
+
+    progress_cb(current: int, total: int, phase: str) — called periodically.
+
+    :returns: ``objects``, ``meshes`` (distinct geometries written),
+              ``triangles`` (written), ``placed_triangles`` (drawn by all
+              objects together) and ``bytes`` (size of the buffer).
+    :rtype: dict
+    """
+    geometries, part_geometry = _geometries(parts)
+    progress = _Progress(progress_cb, sum(g.work for g in geometries),
+                         'Writing mesh data')
+
+    bin_path = os.path.splitext(path)[0] + '.bin'
+
+    buffer_views = []
+    accessors = []
+    primitives = []
+    offset = 0
+
+    with open(bin_path, 'wb') as f:
+
+        def _write_view(chunks, target, component_type, kind, bounds=False):
+            nonlocal offset
+
+            start = offset
+            count = 0
+            low = high = None
+
+            for chunk in chunks:
+                f.write(np.ascontiguousarray(chunk).tobytes())
+                offset += chunk.nbytes
+                count += len(chunk) * (3 if kind == 'SCALAR' else 1)
+                progress.add(len(chunk))
+
+                if bounds:
+                    chunk_low = chunk.min(axis=0)
+                    chunk_high = chunk.max(axis=0)
+                    low = chunk_low if low is None else np.minimum(low, chunk_low)
+                    high = chunk_high if high is None else np.maximum(high, chunk_high)
+
+            buffer_views.append({'buffer': 0, 'byteOffset': start,
+                                 'byteLength': offset - start, 'target': target})
+
+            accessor = {'bufferView': len(buffer_views) - 1,
+                        'componentType': component_type,
+                        'count': count, 'type': kind}
+            if bounds:
+                # required on POSITION accessors
+                accessor['min'] = [float(value) for value in low]
+                accessor['max'] = [float(value) for value in high]
+
+            accessors.append(accessor)
+            return len(accessors) - 1
+
+        for geometry in geometries:
+            attributes = {'POSITION': _write_view(
+                geometry.rows(_POSITIONS), _GLTF_ARRAY_BUFFER, _GLTF_FLOAT,
+                'VEC3', bounds=True)}
+
+            if geometry.normal_block is not None:
+                attributes['NORMAL'] = _write_view(
+                    geometry.rows(geometry.normal_block), _GLTF_ARRAY_BUFFER,
+                    _GLTF_FLOAT, 'VEC3')
+
+            primitive = {'attributes': attributes, 'mode': _GLTF_TRIANGLES}
+
+            if geometry.indexed:
+                primitive['indices'] = _write_view(
+                    geometry.triangles(), _GLTF_ELEMENT_ARRAY_BUFFER,
+                    _GLTF_UNSIGNED_INT, 'SCALAR')
+
+            primitives.append(primitive)
+
+    if progress_cb:
+        progress_cb(-1, -1, 'Writing glTF scene')
+
+    materials = []
+    material_index = {}
+    meshes = []
+    mesh_index = {}
+    groups = {}
+    nodes = []
+    scene_nodes = []
+    placed_triangles = 0
+
+    for i, part in enumerate(parts):
+        if i not in part_geometry:
+            continue
+
+        geometry_index = part_geometry[i]
+
+        # a glTF mesh binds its material, so one geometry drawn in two
+        # materials is two meshes sharing the same accessors
+        material_key = _material_key(part.material)
+        if material_key is not None and material_key not in material_index:
+            material_index[material_key] = len(materials)
+            materials.append(_gltf_material(part.material, f'material{len(materials)}'))
+
+        key = (geometry_index, material_key)
+        if key not in mesh_index:
+            primitive = dict(primitives[geometry_index])
+            if material_key is not None:
+                primitive['material'] = material_index[material_key]
+
+            vbo = geometries[geometry_index].vbo
+            mesh_index[key] = len(meshes)
+            meshes.append({'name': str(getattr(vbo, 'id', f'mesh{geometry_index}')),
+                           'primitives': [primitive]})
+
+        nodes.append({'name': part.name, 'mesh': mesh_index[key],
+                      # column-major
+                      'matrix': part.matrix.T.ravel().tolist()})
+        node = len(nodes) - 1
+        placed_triangles += geometries[geometry_index].triangle_count
+
+        if not part.group:
+            scene_nodes.append(node)
+        elif part.group in groups:
+            groups[part.group].append(node)
+        else:
+            groups[part.group] = [node]
+
+    for group, children in groups.items():
+        nodes.append({'name': group, 'children': children})
+        scene_nodes.append(len(nodes) - 1)
+
+    document = {
+        'asset': {'version': '2.0', 'generator': 'Harness Designer'},
+        'scene': 0,
+        'scenes': [{'nodes': scene_nodes}],
+        'nodes': nodes,
+        'meshes': meshes,
+        'accessors': accessors,
+        'bufferViews': buffer_views,
+        'buffers': [{'uri': os.path.basename(bin_path), 'byteLength': offset}],
+    }
+
+    if materials:
+        document['materials'] = materials
+
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(document, f)
+
+    return {'objects': len(nodes) - len(groups), 'meshes': len(geometries),
+            'triangles': sum(g.triangle_count for g in geometries),
+            'placed_triangles': placed_triangles, 'bytes': offset}
+
+
+# ---------------------------------------------------------------------------
+# Wavefront OBJ - .obj plus a .mtl for the materials
+# ---------------------------------------------------------------------------
+
+@_check_types.do
+def _obj_lines(template: str, rows: np.ndarray) -> str:
+    # one % over the whole chunk instead of a format call per row
+    return (template * len(rows)) % tuple(rows.ravel().tolist())
+
+
+@_check_types.do
+def _obj_name(name: str) -> str:
+    # names run to the end of the line; whitespace inside one splits it
+    # for most readers
+    return '_'.join(name.split()) or 'object'
+
+
+@_check_types.do
+def export_obj(parts: list, path: str, progress_cb=None) -> dict:
+    """
+    Write *parts* as a Wavefront OBJ file, with their materials in a
+    ``.mtl`` file next to it.
+
+    OBJ has no instancing, so every part is written in world space as its
+    own ``o`` object - streamed from its mesh handler a chunk at a time
+    like the glTF writer, so memory stays bounded all the same.
+
+    progress_cb(current: int, total: int, phase: str) — called periodically.
+
+    :returns: ``objects``, ``meshes`` (distinct geometries),
+              ``triangles`` (written) and ``placed_triangles`` (the same
+              here).
+    :rtype: dict
+    """
+    geometries, part_geometry = _geometries(parts)
+    progress = _Progress(
+        progress_cb,
+        sum(geometries[part_geometry[i]].work for i in range(len(parts)) if i in part_geometry),
+        'Writing OBJ data')
+
+    mtl_path = os.path.splitext(path)[0] + '.mtl'
+    material_names = {}
+    mtl_lines = []
+
+    objects = 0
+    triangles = 0
+    # OBJ indices are 1-based and global to the file
+    vertex_base = 1
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f'mtllib {os.path.basename(mtl_path)}\n')
+
+        for i, part in enumerate(parts):
+            if i not in part_geometry:
+                continue
+
+            geometry = geometries[part_geometry[i]]
+
+            f.write(f'o {_obj_name(part.name)}\n')
+
+            material_key = _material_key(part.material)
+            if material_key is not None:
+                if material_key not in material_names:
+                    name = f'material{len(material_names)}'
+                    material_names[material_key] = name
+
+                    r, g, b, a = (float(value) for value in part.material.color_scalar)
+                    mtl_lines.append(f'newmtl {name}\nKd {r:.6g} {g:.6g} {b:.6g}\n'
+                                     f'd {a:.6g}\n\n')
+
+                f.write(f'usemtl {material_names[material_key]}\n')
+
+            for rows in geometry.rows(_POSITIONS):
+                f.write(_obj_lines('v %.6g %.6g %.6g\n', part.transform_positions(rows)))
+                progress.add(len(rows))
+
+            if geometry.normal_block is not None:
+                # one vn per v, so a corner's normal index is its vertex index
+                for rows in geometry.rows(geometry.normal_block):
+                    f.write(_obj_lines('vn %.6g %.6g %.6g\n', part.transform_normals(rows)))
+                    progress.add(len(rows))
+
+                template = 'f %d//%d %d//%d %d//%d\n'
+            else:
+                template = 'f %d %d %d\n'
+
+            for corners in geometry.triangles():
+                corners = corners.astype(np.int64) + vertex_base
+                if geometry.normal_block is not None:
+                    corners = np.repeat(corners, 2, axis=1)
+
+                f.write(_obj_lines(template, corners))
+                progress.add(len(corners))
+
+            vertex_base += geometry.vertex_count
+            objects += 1
+            triangles += geometry.triangle_count
+
+    with open(mtl_path, 'w', encoding='utf-8') as f:
+        f.write(''.join(mtl_lines))
+
+    return {'objects': objects, 'meshes': len(geometries),
+            'triangles': triangles, 'placed_triangles': triangles}
+
+
+SCENE_EXPORTERS = {
+    'gltf': export_gltf,
+    'obj': export_obj,
+}
+
+
+@_check_types.do
+def export_scene(parts: list, path: str, fmt: str, progress_cb=None) -> dict:
+    """
+    Export *parts* (a list of :class:`ScenePart`) with the writer for *fmt*.
+
+    fmt: 'gltf' or 'obj'.
+    """
+    try:
+        writer = SCENE_EXPORTERS[fmt.lower()]
+    except KeyError:
+        raise ValueError(f'Unknown scene export format: {fmt!r}  (expected gltf/obj)')
+
+    return writer(parts, path, progress_cb)
@@ -10,7 +10,6 @@ import numpy as np
 
 from . import quaternion as _quaternion
 from .. import point as _point
-from ..decimal import Decimal as _d
 from ... import app_mixins as _app_mixins
 from ... import check_types as _check_types
 
@@ -127,12 +126,12 @@ class Angle(_app_mixins.CallbackMixin, metaclass=AngleMeta):
                     # euler angle array
                     if inputs.shape == (3,):
                         # arr = np.array(self.as_float, dtype=np.float32)
-                        angle = self.from_euler(*[float(str(v)) for v in inputs.tolist()])
+                        angle = self.from_euler(*inputs.tolist())
                         angle += self
                         return angle.as_euler_numpy
                     # quat array
                     elif inputs.shape == (4,):
-                        angle = self.from_quat([float(str(v)) for v in inputs.tolist()])
+                        angle = self.from_quat(inputs.tolist())
                         angle += self
                         return angle.as_quat_numpy
                     # we assume this is a matrix array
@@ -147,13 +146,13 @@ class Angle(_app_mixins.CallbackMixin, metaclass=AngleMeta):
                     # euler angle array
                     if out.shape == (3,):
                         # arr = np.array(self.as_float, dtype=np.float32)
-                        angle = self.from_euler(*[float(str(v)) for v in out.tolist()])
+                        angle = self.from_euler(*out.tolist())
                         angle += self
                         out[:] = angle.as_euler_numpy
                         return out
                     # quat array
                     elif out.shape == (4,):
-                        angle = self.from_quat([float(str(v)) for v in out.tolist()])
+                        angle = self.from_quat(out.tolist())
                         angle += self
                         out[:] = angle.as_quat_numpy
                         return out
@@ -173,12 +172,12 @@ class Angle(_app_mixins.CallbackMixin, metaclass=AngleMeta):
                     # euler angle array
                     if inputs.shape == (3,):
                         # arr = np.array(self.as_float, dtype=np.float32)
-                        angle = self.from_euler(*[float(str(v)) for v in inputs.tolist()])
+                        angle = self.from_euler(*inputs.tolist())
                         angle -= self
                         return angle.as_euler_numpy
                     # quat array
                     elif inputs.shape == (4,):
-                        angle = self.from_quat([float(str(v)) for v in inputs.tolist()])
+                        angle = self.from_quat(inputs.tolist())
                         angle -= self
                         return angle.as_quat_numpy
                     # we assume this is a matrix array
@@ -194,13 +193,13 @@ class Angle(_app_mixins.CallbackMixin, metaclass=AngleMeta):
                     # euler angle array
                     if out.shape == (3,):
                         # arr = np.array(self.as_float, dtype=np.float32)
-                        angle = self.from_euler(*[float(str(v)) for v in out.tolist()])
+                        angle = self.from_euler(*out.tolist())
                         angle -= self
                         out[:] = angle.as_euler_numpy
                         return out
                     # quat array
                     elif out.shape == (4,):
-                        angle = self.from_quat([float(str(v)) for v in out.tolist()])
+                        angle = self.from_quat(out.tolist())
                         angle -= self
                         out[:] = angle.as_quat_numpy
                         return out
@@ -239,7 +238,9 @@ class Angle(_app_mixins.CallbackMixin, metaclass=AngleMeta):
         if euler_angles is None:
             self.__euler_angles = None
         else:
-            self.__euler_angles = np.array(euler_angles, dtype=np.float32)
+            # float64 so the cached Euler values read back exactly as they
+            # were written, without a str() round-trip to hide float32 noise.
+            self.__euler_angles = np.array(euler_angles, dtype=np.float64)
 
         self.__callbacks__ = []
         self.__unbound_callbacks__ = []
@@ -286,7 +287,7 @@ class Angle(_app_mixins.CallbackMixin, metaclass=AngleMeta):
             # self.__euler_angles = self._q.as_euler
             return math.nan
 
-        return float(str(self.__euler_angles[0]))
+        return float(self.__euler_angles[0])
 
     @x.setter
     @_check_types.do
@@ -342,7 +343,7 @@ class Angle(_app_mixins.CallbackMixin, metaclass=AngleMeta):
             # self.__euler_angles = self._q.as_euler
             return math.nan
 
-        return float(str(self.__euler_angles[1]))
+        return float(self.__euler_angles[1])
 
     @y.setter
     @_check_types.do
@@ -380,7 +381,7 @@ class Angle(_app_mixins.CallbackMixin, metaclass=AngleMeta):
             # self.__euler_angles = self._q.as_euler
             return math.nan
 
-        return float(str(self.__euler_angles[2]))
+        return float(self.__euler_angles[2])
 
     @z.setter
     @_check_types.do
@@ -400,7 +401,7 @@ class Angle(_app_mixins.CallbackMixin, metaclass=AngleMeta):
 
         self.__euler_angles[2] = value
 
-        q = _quaternion.Quaternion.from_euler(*[float(str(v)) for v in self.__euler_angles.tolist()])
+        q = _quaternion.Quaternion.from_euler(*self.__euler_angles.tolist())
 
         self.__update_quat(q)
         self._process_callbacks()
@@ -415,9 +416,9 @@ class Angle(_app_mixins.CallbackMixin, metaclass=AngleMeta):
         """
 
         if self.__euler_angles is not None:
-            return Angle.from_quat([float(str(v)) for v in self._q.as_numpy.tolist()], euler_angles=[float(str(v)) for v in self.__euler_angles.tolist()])
+            return Angle.from_quat(self._q.as_numpy.tolist(), euler_angles=self.__euler_angles.tolist())
         else:
-            return Angle.from_quat([float(str(v)) for v in self._q.as_numpy.tolist()])
+            return Angle.from_quat(self._q.as_numpy.tolist())
 
     @staticmethod
     @_check_types.do
@@ -482,18 +483,17 @@ class Angle(_app_mixins.CallbackMixin, metaclass=AngleMeta):
         if isinstance(other, Angle):
             x2, y2, z2 = other.x, other.y, other.z
             if math.nan not in (x2, y2, z2) and self.__euler_angles is not None:
-                x1, y1, z1 = [_d(str(item)) for item in self.__euler_angles.tolist()]
-                x2, y2, z2 = [_d(item) for item in (x2, y2, z2)]
+                x1, y1, z1 = self.__euler_angles.tolist()
 
                 x1 += x2
                 y1 += y2
                 z1 += z2
 
-                self.__euler_angles[0] = float(x1)
-                self.__euler_angles[1] = float(y1)
-                self.__euler_angles[2] = float(z1)
+                self.__euler_angles[0] = x1
+                self.__euler_angles[1] = y1
+                self.__euler_angles[2] = z1
 
-                q = _quaternion.Quaternion.from_euler(*[float(str(v)) for v in self.__euler_angles.tolist()])
+                q = _quaternion.Quaternion.from_euler(*self.__euler_angles.tolist())
 
                 self.__update_quat(q)
                 self._process_callbacks()
@@ -518,14 +518,13 @@ class Angle(_app_mixins.CallbackMixin, metaclass=AngleMeta):
         if isinstance(other, Angle):
             x2, y2, z2 = other.x, other.y, other.z
             if math.nan not in (x2, y2, z2) and self.__euler_angles is not None:
-                x1, y1, z1 = [_d(str(item)) for item in self.__euler_angles.tolist()]
-                x2, y2, z2 = [_d(item) for item in (x2, y2, z2)]
+                x1, y1, z1 = self.__euler_angles.tolist()
 
                 x = x1 + x2
                 y = y1 + y2
                 z = z1 + z2
 
-                return self.from_euler(float(x), float(y), float(z))
+                return self.from_euler(x, y, z)
 
         q = self._q + self.__get_quat_from_other(other)
 
@@ -545,18 +544,17 @@ class Angle(_app_mixins.CallbackMixin, metaclass=AngleMeta):
         if isinstance(other, Angle):
             x2, y2, z2 = other.x, other.y, other.z
             if math.nan not in (x2, y2, z2) and self.__euler_angles is not None:
-                x1, y1, z1 = [_d(str(item)) for item in self.__euler_angles.tolist()]
-                x2, y2, z2 = [_d(item) for item in (x2, y2, z2)]
+                x1, y1, z1 = self.__euler_angles.tolist()
 
                 x1 -= x2
                 y1 -= y2
                 z1 -= z2
 
-                self.__euler_angles[0] = float(x1)
-                self.__euler_angles[1] = float(y1)
-                self.__euler_angles[2] = float(z1)
+                self.__euler_angles[0] = x1
+                self.__euler_angles[1] = y1
+                self.__euler_angles[2] = z1
 
-                q = _quaternion.Quaternion.from_euler(*[float(str(v)) for v in self.__euler_angles.tolist()])
+                q = _quaternion.Quaternion.from_euler(*self.__euler_angles.tolist())
 
                 self.__update_quat(q)
                 self._process_callbacks()
@@ -581,14 +579,13 @@ class Angle(_app_mixins.CallbackMixin, metaclass=AngleMeta):
         if isinstance(other, Angle):
             x2, y2, z2 = other.x, other.y, other.z
             if math.nan not in (x2, y2, z2) and self.__euler_angles is not None:
-                x1, y1, z1 = [_d(str(item)) for item in self.__euler_angles.tolist()]
-                x2, y2, z2 = [_d(item) for item in (x2, y2, z2)]
+                x1, y1, z1 = self.__euler_angles.tolist()
 
                 x = x1 - x2
                 y = y1 - y2
                 z = z1 - z2
 
-                return self.from_euler(float(x), float(y), float(z))
+                return self.from_euler(x, y, z)
 
         q = self._q - self.__get_quat_from_other(other)
         return self.from_quat(q)
@@ -724,7 +721,7 @@ class Angle(_app_mixins.CallbackMixin, metaclass=AngleMeta):
 
         if self.__euler_angles is None:
             return [math.nan, math.nan, math.nan]
-        return tuple(float(str(item)) for item in self.__euler_angles.tolist())
+        return tuple(self.__euler_angles.tolist())
 
     @property
     @_check_types.do
@@ -748,7 +745,7 @@ class Angle(_app_mixins.CallbackMixin, metaclass=AngleMeta):
         :rtype: tuple[float, float, float]
         """
 
-        return tuple(float(str(item)) for item in self._q.as_numpy.tolist())
+        return tuple(self._q.as_numpy.tolist())
 
     @property
     @_check_types.do
@@ -774,7 +771,7 @@ class Angle(_app_mixins.CallbackMixin, metaclass=AngleMeta):
         :rtype: list[list[float, float, float], list[float, float, float], list[float, float, float]]
         """
 
-        return tuple([float(str(item)) for item in row] for row in self._matrix.tolist())
+        return tuple(self._matrix.tolist())
 
     @property
     @_check_types.do
@@ -118,19 +118,13 @@ class Quaternion:
         :rtype: None
         """
 
-        norm = _d(np.linalg.norm(self._data))
+        w, x, y, z = self._data.tolist()
+        norm = math.sqrt(w * w + x * x + y * y + z * z)
 
-        w, x, y, z = self.as_decimal
-
-        w /= norm
-        x /= norm
-        y /= norm
-        z /= norm
-
-        self._data[0] = w
-        self._data[1] = x
-        self._data[2] = y
-        self._data[3] = z
+        self._data[0] = w / norm
+        self._data[1] = x / norm
+        self._data[2] = y / norm
+        self._data[3] = z / norm
 
     @_check_types.do
     def __enter__(self):
@@ -178,7 +172,9 @@ class Quaternion:
         """
 
         if q is None:
-            self._data = np.array([w, x, y, z], dtype=np.float32)
+            # float64, matching the arrays __mul produces, so rotations
+            # applied to Point's float64 coordinates keep full precision.
+            self._data = np.array([w, x, y, z], dtype=np.float64)
         else:
             self._data = q
 
@@ -310,7 +306,7 @@ class Quaternion:
         :rtype: list[float]
         """
 
-        return [float(str(item)) for item in self._data.tolist()]
+        return self._data.tolist()
 
     @property
     @_check_types.do
@@ -383,8 +379,8 @@ class Quaternion:
         :rtype: :class:`Quaternion`
         """
 
-        wb, xb, yb, zb = qb.as_decimal
-        wa, xa, ya, za = qa.as_decimal
+        wb, xb, yb, zb = qb.as_float
+        wa, xa, ya, za = qa.as_float
         q = np.array([wb * wa - xb * xa - yb * ya - zb * za,
                       wb * xa + xb * wa + yb * za - zb * ya,
                       wb * ya - xb * za + yb * wa + zb * xa,
@@ -617,7 +613,7 @@ class Quaternion:
         :rtype: collections.abc.Iterable[float]
         """
 
-        return iter(float(str(item)) for item in self._data.tolist())
+        return iter(self._data.tolist())
 
     @_check_types.do
     def conj(self) -> "Quaternion":
@@ -628,7 +624,7 @@ class Quaternion:
         :rtype: :class:`Quaternion`
         """
 
-        w, x, y, z = [float(str(item)) for item in self._data.tolist()]
+        w, x, y, z = self._data.tolist()
         return Quaternion(w, -x, -y, -z)
 
     @_check_types.do
@@ -660,10 +656,14 @@ class Quaternion:
         :rtype: :class:`Quaternion`
         """
 
-        rx, ry, rz = [_d(item) for item in np.deg2rad([float(str(x)), float(str(y)), float(str(z))])]
-        qx = cls(math.cos(rx / TWO), math.sin(rx / TWO), 0.0, 0.0)
-        qy = cls(math.cos(ry / TWO), 0.0, math.sin(ry / TWO), 0.0)
-        qz = cls(math.cos(rz / TWO), 0.0, 0.0, math.sin(rz / TWO))
+        # half angles, in radians
+        rx = math.radians(float(x)) / 2.0
+        ry = math.radians(float(y)) / 2.0
+        rz = math.radians(float(z)) / 2.0
+
+        qx = cls(math.cos(rx), math.sin(rx), 0.0, 0.0)
+        qy = cls(math.cos(ry), 0.0, math.sin(ry), 0.0)
+        qz = cls(math.cos(rz), 0.0, 0.0, math.sin(rz))
 
         q = cls.__mul(qz, cls.__mul(qx, qy))  # qy ⊗ qx ⊗ qz
         return cls(*q.as_float)
@@ -714,19 +714,15 @@ class Quaternion:
         :rtype: :class:`numpy.ndarray`
         """
 
-        w, x, y, z = self.as_decimal
+        w, x, y, z = self.as_float
 
         xx, yy, zz = x * x, y * y, z * z
         xy, xz, yz = x * y, x * z, y * z
         wx, wy, wz = w * x, w * y, w * z
 
-        m1 = [ONE - TWO * (yy + zz), TWO * (xy - wz), TWO * (xz + wy)]
-        m2 = [TWO * (xy + wz), ONE - TWO * (xx + zz), TWO * (yz - wx)]
-        m3 = [TWO * (xz - wy), TWO * (yz + wx), ONE - TWO * (xx + yy)]
-
-        return np.array([[float(item) for item in m1],
-                         [float(item) for item in m2],
-                         [float(item) for item in m3]
+        return np.array([[1.0 - 2.0 * (yy + zz), 2.0 * (xy - wz), 2.0 * (xz + wy)],
+                         [2.0 * (xy + wz), 1.0 - 2.0 * (xx + zz), 2.0 * (yz - wx)],
+                         [2.0 * (xz - wy), 2.0 * (yz + wx), 1.0 - 2.0 * (xx + yy)]
                          ], dtype=np.float32)
 
     @classmethod
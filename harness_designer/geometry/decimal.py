@@ -42,7 +42,16 @@ class Decimal(_Decimal):
         :rtype: :class:`Decimal`
         """
 
-        value = str(float(str(value)))
+        if isinstance(value, (float, int, _Decimal)):
+            # float() of these is already correctly rounded, so the extra
+            # str() parse of the input is skipped; repr() of a float is the
+            # same shortest round-trip string str() produces.
+            value = repr(float(value))
+        else:
+            # numpy float32 scalars and strings still go through str() first
+            # so a float32 like 0.1 becomes '0.1' and not its widened
+            # float64 value.
+            value = str(float(str(value)))
 
         return super().__new__(cls, value, *args, **kwargs)
 
@@ -40,15 +40,7 @@ class Line:
             if isinstance(instance, np.ndarray):
                 arr = self.as_numpy
                 arr @= instance
-                p1, p2 = [[float(str(item)) for item in row] for row in arr.tolist()]
-
-                self._p1.x = p1[0]
-                self._p1.y = p1[1]
-                self._p1.z = p1[1]
-
-                self._p2.x = p2[0]
-                self._p2.y = p2[1]
-                self._p2.z = p2[1]
+                self.__store(arr)
 
                 return self
             else:
@@ -58,15 +50,7 @@ class Line:
             if isinstance(instance, np.ndarray):
                 arr = self.as_numpy
                 arr += instance
-                p1, p2 = [[float(str(item)) for item in row] for row in arr.tolist()]
-
-                self._p1.x = p1[0]
-                self._p1.y = p1[1]
-                self._p1.z = p1[1]
-
-                self._p2.x = p2[0]
-                self._p2.y = p2[1]
-                self._p2.z = p2[1]
+                self.__store(arr)
                 return self
             else:
                 return inputs + self.as_numpy
@@ -75,21 +59,40 @@ class Line:
             if isinstance(instance, np.ndarray):
                 arr = self.as_numpy
                 arr -= instance
-                p1, p2 = [[float(str(item)) for item in row] for row in arr.tolist()]
-
-                self._p1.x = p1[0]
-                self._p1.y = p1[1]
-                self._p1.z = p1[1]
-
-                self._p2.x = p2[0]
-                self._p2.y = p2[1]
-                self._p2.z = p2[1]
+                self.__store(arr)
                 return self
             else:
                 return inputs + self.as_numpy
 
         raise RuntimeError
 
+    @_check_types.do
+    def __store(self, arr: np.ndarray) -> None:
+        """
+        Write a ``2 x 3`` array back into the endpoints.
+
+        Each endpoint fires its callbacks once, on the last component.
+
+        :param arr: New start and end coordinates.
+        :type arr: :class:`numpy.ndarray`
+        :returns: ``None``
+        :rtype: None
+        """
+
+        p1, p2 = arr.tolist()
+
+        with self._p1:
+            self._p1.x = p1[0]
+            self._p1.y = p1[1]
+
+        self._p1.z = p1[2]
+
+        with self._p2:
+            self._p2.x = p2[0]
+            self._p2.y = p2[1]
+
+        self._p2.z = p2[2]
+
     @_check_types.do
     def __init__(self, p1: _point.Point,
                  p2: _point.Point | None = None,
@@ -306,27 +309,25 @@ class Line:
         :raises ValueError: If the specified distance places the point beyond p2.
         """
 
-        # Convert points to numpy arrays
-        p1 = self._p1.as_numpy
-        p2 = self._p2.as_numpy
+        x1, y1, z1 = self._p1.as_float
+        x2, y2, z2 = self._p2.as_float
 
         # Compute the vector from p1 to p2
-        vector = p2 - p1
+        dx = x2 - x1
+        dy = y2 - y1
+        dz = z2 - z1
 
         # Compute the total distance between p1 and p2
-        total_distance = np.linalg.norm(vector)
+        total_distance = math.sqrt(dx * dx + dy * dy + dz * dz)
 
         # Check if the specified distance is valid
         if distance > total_distance:
             raise ValueError("calculated point is not on the line")
 
-        # Normalize the vector to get the unit direction vector
-        unit_vector = vector / total_distance
-
-        # Calculate the third point
-        p3 = p1 + distance * unit_vector
+        # Scale the direction by distance / length to get the third point
+        scale = distance / total_distance
 
-        return _point.Point(p3[0], p3[1], p3[2])
+        return _point.Point(x1 + dx * scale, y1 + dy * scale, z1 + dz * scale)
 
     @_check_types.do
     def __isub__(self, other: _point.Point | np.ndarray) -> "Line":
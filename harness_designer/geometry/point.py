@@ -9,6 +9,7 @@ import weakref
 import numpy as np
 
 from .decimal import Decimal as _d
+from .point_arena import POINT_ARENA as _POINT_ARENA
 from .. import app_mixins as _app_mixins
 from .. import check_types as _check_types
 
@@ -74,10 +75,17 @@ class PointMeta(type):
 
     @classmethod
     @_check_types.do
-    def _remove_ref(cls, ref):
+    def _remove_ref(cls, db_id, ref):
         """
         Remove a collected weak reference from the singleton cache.
 
+        Bound per entry with its own ``db_id`` (see :meth:`_make_ref`) so
+        removal is a single dict lookup instead of a scan of every live
+        Point. The entry is only removed if it is still this exact weakref
+        -- the id may already have been re-registered to a newer instance.
+
+        :param db_id: Key the reference was stored under.
+        :type db_id: bytes
         :param ref: Weak reference previously stored in :attr:`_instances`.
         :type ref: :class:`weakref.ReferenceType`
         :returns: ``None``
@@ -85,13 +93,28 @@ class PointMeta(type):
         """
 
         with cls._instances_lock:
-            for key, value in cls._instances.items():
-                if value == ref:
-                    break
-            else:
-                return
+            if cls._instances.get(db_id) is ref:
+                del cls._instances[db_id]
+
+    @classmethod
+    @_check_types.do
+    def _make_ref(cls, db_id: bytes, instance: "Point") -> weakref.ref:
+        """
+        Return the weak reference stored in :attr:`_instances` for *instance*.
 
-            del cls._instances[key]
+        :param db_id: Singleton key.
+        :type db_id: bytes
+        :param instance: Live Point.
+        :type instance: :class:`Point`
+        :rtype: :class:`weakref.ReferenceType`
+        """
+
+        remove_ref = cls._remove_ref
+
+        def _callback(ref):
+            remove_ref(db_id, ref)
+
+        return weakref.ref(instance, _callback)
 
     @_check_types.do
     def __call__(cls, x: int | float | _d | np.float32, y: int | float | _d | np.float32,
@@ -111,16 +134,16 @@ class PointMeta(type):
         :rtype: :class:`Point`
         """
 
-        x = float(str(x))
-        y = float(str(y))
+        x = float(x)
+        y = float(y)
         if z is not None:
-            z = float(str(z))
+            z = float(z)
 
         if db_id is not None:
             with cls._instances_lock:
                 if db_id not in cls._instances:
                     instance = super().__call__(x, y, z, db_id)
-                    cls._instances[db_id] = weakref.ref(instance)
+                    cls._instances[db_id] = cls._make_ref(db_id, instance)
 
                 elif cls._instances[db_id]() is None:
                     # Handle edge case where a reference has been removed
@@ -131,7 +154,7 @@ class PointMeta(type):
                     # the newly added reference
                     del cls._instances[db_id]
                     instance = super().__call__(x, y, z, db_id)
-                    cls._instances[db_id] = weakref.ref(instance)
+                    cls._instances[db_id] = cls._make_ref(db_id, instance)
                 else:
                     instance = cls._instances[db_id]()
         else:
@@ -256,9 +279,26 @@ class Point(_app_mixins.CallbackMixin, metaclass=PointMeta):
 
     NUMPY INTEROPERABILITY
     ----------------------
-    ``_data`` is a contiguous float64 numpy array ``[x, y, z]``.  All
-    arithmetic uses Decimal for the computation to avoid floating-point
-    accumulation errors, then stores the result back into ``_data``.
+    The canonical coordinates live in ``_xyz``, a list of three plain Python
+    floats (IEEE float64).  All arithmetic, rotation and comparison runs on
+    those floats directly -- no Decimal or string parsing on the hot path.
+    ``_data`` is a contiguous float32 numpy mirror ``[x, y, z]`` that is
+    rewritten on every mutation; it exists for the consumers that alias the
+    raw buffer (the Cython culler's ``float[::1]`` views, GL uploads), see
+    :attr:`as_numpy`.
+
+    POINT ARENA
+    -----------
+    A Point constructed with a ``db_id`` doesn't own its arrays: it holds a
+    slot in :data:`~.point_arena.POINT_ARENA`, a columnar N x 3 store, and
+    ``_data`` is a row view into the arena's float32 column (``_row64`` is
+    the matching float64 row).  Scalar mutations through the Point API keep
+    ``_xyz`` and both rows in step, so whole groups of points (every point
+    on a housing, a wire chain, an export) can be read or moved in one
+    vectorised NumPy pass through the arena's ``gather``/``translate``/
+    ``rotate``/``assign`` instead of point by point.  The slot is released
+    when the Point is garbage-collected.  Temporary Points (no ``db_id``)
+    keep their own small arrays and never touch the arena.
 
     ``__array_ufunc__`` is implemented so that numpy ufuncs (matmul, add,
     subtract, multiply) can accept a Point as either operand, enabling code
@@ -438,7 +478,18 @@ class Point(_app_mixins.CallbackMixin, metaclass=PointMeta):
         else:
             self.is2d = False
 
-        self._data = np.ascontiguousarray(np.array([x, y, z], dtype=np.float32))
+        self._xyz = [x, y, z]
+
+        if db_id is None:
+            self._slot = None
+            self._row64 = None
+            self._data = np.array(self._xyz, dtype=np.float32)
+        else:
+            slot = _POINT_ARENA.allocate(db_id, x, y, z)
+            self._slot = slot
+            self._row64 = _POINT_ARENA.row64(slot)
+            self._data = _POINT_ARENA.row32(slot)
+            self._arena_finalizer = weakref.finalize(self, _POINT_ARENA.release, db_id, slot)
 
         self.__callbacks__ = []
         self.__unbound_callbacks__ = []
@@ -463,6 +514,13 @@ class Point(_app_mixins.CallbackMixin, metaclass=PointMeta):
     @db_id.setter
     @_check_types.do
     def db_id(self, value: bytes | None) -> None:
+        if self._slot is not None:
+            _POINT_ARENA.rekey(self._db_id, value, self._slot)
+            # The finalizer still carries the old key; detach it and
+            # register a fresh one so the slot is released under the new one.
+            self._arena_finalizer.detach()
+            self._arena_finalizer = weakref.finalize(self, _POINT_ARENA.release, value, self._slot)
+
         self._db_id = value
 
     @_check_types.do
@@ -490,7 +548,7 @@ class Point(_app_mixins.CallbackMixin, metaclass=PointMeta):
         :rtype: :class:`~harness_designer.geometry.decimal.Decimal`
         """
 
-        return float(str(self._data[0]))
+        return self._xyz[0]
 
     @x.setter
     @_check_types.do
@@ -505,7 +563,13 @@ class Point(_app_mixins.CallbackMixin, metaclass=PointMeta):
             self._root.x = value
             return
 
-        self._data[0] = float(value)
+        value = float(value)
+        self._xyz[0] = value
+        self._data[0] = value
+
+        if self._row64 is not None:
+            self._row64[0] = value
+
         self._process_callbacks()
 
     @property
@@ -518,7 +582,7 @@ class Point(_app_mixins.CallbackMixin, metaclass=PointMeta):
         :rtype: :class:`~harness_designer.geometry.decimal.Decimal`
         """
 
-        return float(str(self._data[1]))
+        return self._xyz[1]
 
     @y.setter
     @_check_types.do
@@ -533,7 +597,13 @@ class Point(_app_mixins.CallbackMixin, metaclass=PointMeta):
             self._root.y = value
             return
 
-        self._data[1] = float(value)
+        value = float(value)
+        self._xyz[1] = value
+        self._data[1] = value
+
+        if self._row64 is not None:
+            self._row64[1] = value
+
         self._process_callbacks()
 
     @property
@@ -546,7 +616,7 @@ class Point(_app_mixins.CallbackMixin, metaclass=PointMeta):
         :rtype: :class:`~harness_designer.geometry.decimal.Decimal`
         """
 
-        return float(str(self._data[2]))
+        return self._xyz[2]
 
     @z.setter
     @_check_types.do
@@ -561,7 +631,13 @@ class Point(_app_mixins.CallbackMixin, metaclass=PointMeta):
             self._root.z = value
             return
 
-        self._data[2] = float(value)
+        value = float(value)
+        self._xyz[2] = value
+        self._data[2] = value
+
+        if self._row64 is not None:
+            self._row64[2] = value
+
         self._process_callbacks()
 
     @_check_types.do
@@ -576,34 +652,93 @@ class Point(_app_mixins.CallbackMixin, metaclass=PointMeta):
         singleton for anything that needs to participate in the callback chain.
         """
 
-        return Point(*[float(str(item)) for item in self._data.tolist()])
+        x, y, z = self._xyz
+        return Point(x, y, z)
+
+    @_check_types.do
+    def _store(self, x: float, y: float, z: float) -> None:
+        """
+        Write new coordinates into both the float64 values and the float32
+        mirror, then fire callbacks (unless batching).
+
+        :param x: New X component.
+        :type x: float
+        :param y: New Y component.
+        :type y: float
+        :param z: New Z component.
+        :type z: float
+        :returns: ``None``
+        :rtype: None
+        """
+
+        xyz = self._xyz
+        xyz[0] = x
+        xyz[1] = y
+        xyz[2] = z
+
+        data = self._data
+        data[0] = x
+        data[1] = y
+        data[2] = z
+
+        row64 = self._row64
+        if row64 is not None:
+            row64[0] = x
+            row64[1] = y
+            row64[2] = z
+
+        self._process_callbacks()
 
     @staticmethod
     @_check_types.do
-    def __other_to_decimal(other: Union[_d, float, "Point", np.ndarray]) -> tuple[_d, _d, _d]:
+    def __other_to_float(other: Union[_d, float, int, "Point", np.ndarray]) -> tuple[float, float, float]:
         """
-        Convert supported operand types to decimal coordinate triples.
+        Convert supported operand types to float coordinate triples.
 
         :param other: Operand to normalize.
-        :type other: :class:`~harness_designer.geometry.decimal.Decimal` | float | :class:`Point` | :class:`numpy.ndarray`
-        :returns: Decimal ``(x, y, z)`` components.
-        :rtype: tuple[:class:`~harness_designer.geometry.decimal.Decimal`, :class:`~harness_designer.geometry.decimal.Decimal`, :class:`~harness_designer.geometry.decimal.Decimal`]
+        :type other: :class:`~harness_designer.geometry.decimal.Decimal` | float | int | :class:`Point` | :class:`numpy.ndarray`
+        :returns: Float ``(x, y, z)`` components.
+        :rtype: tuple[float, float, float]
         :raises TypeError: If ``other`` cannot be converted.
         """
 
-        if isinstance(other, np.ndarray):
-            x, y, z = [_d(str(item)) for item in other.tolist()]
-        elif isinstance(other, Point):
-            x, y, z = other.as_decimal
-        elif isinstance(other, float):
-            x = y = z = _d(other)
-        elif isinstance(other, _d):
-            x = y = z = other
+        if isinstance(other, Point):
+            x, y, z = other._xyz  # NOQA
+        elif isinstance(other, np.ndarray):
+            x, y, z = other.tolist()
+        elif isinstance(other, (float, int, _d)):
+            x = y = z = float(other)
         else:
             raise TypeError(f'incorrect type "{type(other)}"')
 
         return x, y, z
 
+    @staticmethod
+    @_check_types.do
+    def __other_to_quat(other: Union[np.ndarray, "_angle.Angle"]) -> tuple[float, float, float, float]:
+        """
+        Return the ``(w, x, y, z)`` rotation quaternion described by *other*.
+
+        :param other: Angle, 3-element euler array or 4-element quaternion array.
+        :type other: :class:`numpy.ndarray` | :class:`~harness_designer.geometry.angle.Angle`
+        :returns: Quaternion components as floats.
+        :rtype: tuple[float, float, float, float]
+        :raises TypeError: If ``other`` cannot be converted.
+        """
+
+        if isinstance(other, np.ndarray):
+            if other.shape[0] == 3:
+                other = _angle.Angle.from_euler(*other.tolist())
+            elif other.shape[0] == 4:
+                other = _angle.Angle.from_quat(other.tolist())
+            else:
+                raise TypeError
+        elif not isinstance(other, _angle.Angle):
+            raise TypeError(f'incorrect type "{type(other)}"')
+
+        w, x, y, z = other._q.as_numpy.tolist()  # NOQA
+        return w, x, y, z
+
     @_check_types.do
     def __iadd__(self, other: Union["Point", np.ndarray, float]) -> Self:
         """
@@ -623,14 +758,10 @@ class Point(_app_mixins.CallbackMixin, metaclass=PointMeta):
             self._root += other
             return self
 
-        x1, y1, z1 = self.as_decimal
-        x2, y2, z2 = self.__other_to_decimal(other)
-
-        self._data[0] = x1 + x2
-        self._data[1] = y1 + y2
-        self._data[2] = z1 + z2
+        x1, y1, z1 = self._xyz
+        x2, y2, z2 = self.__other_to_float(other)
 
-        self._process_callbacks()
+        self._store(x1 + x2, y1 + y2, z1 + z2)
 
         return self
 
@@ -644,8 +775,8 @@ class Point(_app_mixins.CallbackMixin, metaclass=PointMeta):
         you intend to move a shared Point.
         """
 
-        x1, y1, z1 = self.as_decimal
-        x2, y2, z2 = self.__other_to_decimal(other)
+        x1, y1, z1 = self._xyz
+        x2, y2, z2 = self.__other_to_float(other)
 
         return Point(x1 + x2, y1 + y2, z1 + z2)
 
@@ -661,14 +792,10 @@ class Point(_app_mixins.CallbackMixin, metaclass=PointMeta):
             self._root -= other
             return self
 
-        x1, y1, z1 = self.as_decimal
-        x2, y2, z2 = self.__other_to_decimal(other)
+        x1, y1, z1 = self._xyz
+        x2, y2, z2 = self.__other_to_float(other)
 
-        self._data[0] = x1 - x2
-        self._data[1] = y1 - y2
-        self._data[2] = z1 - z2
-
-        self._process_callbacks()
+        self._store(x1 - x2, y1 - y2, z1 - z2)
 
         return self
 
@@ -676,8 +803,8 @@ class Point(_app_mixins.CallbackMixin, metaclass=PointMeta):
     def __sub__(self, other: Union["Point", np.ndarray, float, _d]) -> "Point":
         """Return a new Point (no db_id, no callbacks) with the difference."""
 
-        x1, y1, z1 = self.as_decimal
-        x2, y2, z2 = self.__other_to_decimal(other)
+        x1, y1, z1 = self._xyz
+        x2, y2, z2 = self.__other_to_float(other)
 
         return Point(x1 - x2, y1 - y2, z1 - z2)
 
@@ -698,14 +825,10 @@ class Point(_app_mixins.CallbackMixin, metaclass=PointMeta):
             self._root *= other
             return self
 
-        x1, y1, z1 = self.as_decimal
-        x2, y2, z2 = self.__other_to_decimal(other)
-
-        self._data[0] = x1 * x2
-        self._data[1] = y1 * y2
-        self._data[2] = z1 * z2
+        x1, y1, z1 = self._xyz
+        x2, y2, z2 = self.__other_to_float(other)
 
-        self._process_callbacks()
+        self._store(x1 * x2, y1 * y2, z1 * z2)
 
         return self
 
@@ -713,8 +836,8 @@ class Point(_app_mixins.CallbackMixin, metaclass=PointMeta):
     def __mul__(self, other: Union[float, "Point", np.ndarray, _d]) -> "Point":
         """Return a new Point (no db_id) with the component-wise product."""
 
-        x1, y1, z1 = self.as_decimal
-        x2, y2, z2 = self.__other_to_decimal(other)
+        x1, y1, z1 = self._xyz
+        x2, y2, z2 = self.__other_to_float(other)
 
         return Point(x1 * x2, y1 * y2, z1 * z2)
 
@@ -726,14 +849,10 @@ class Point(_app_mixins.CallbackMixin, metaclass=PointMeta):
             self._root /= other
             return self
 
-        x1, y1, z1 = self.as_decimal
-        x2, y2, z2 = self.__other_to_decimal(other)
-
-        self._data[0] = x1 / x2
-        self._data[1] = y1 / y2
-        self._data[2] = z1 / z2
+        x1, y1, z1 = self._xyz
+        x2, y2, z2 = self.__other_to_float(other)
 
-        self._process_callbacks()
+        self._store(x1 / x2, y1 / y2, z1 / z2)
 
         return self
 
@@ -741,8 +860,8 @@ class Point(_app_mixins.CallbackMixin, metaclass=PointMeta):
     def __truediv__(self, other: Union[_d, float, "Point", np.ndarray]) -> "Point":
         """Return a new Point (no db_id) with the component-wise quotient."""
 
-        x1, y1, z1 = self.as_decimal
-        x2, y2, z2 = self.__other_to_decimal(other)
+        x1, y1, z1 = self._xyz
+        x2, y2, z2 = self.__other_to_float(other)
 
         return Point(x1 / x2, y1 / y2, z1 / z2)
 
@@ -759,22 +878,8 @@ class Point(_app_mixins.CallbackMixin, metaclass=PointMeta):
         in-place and propagate the change to all connected objects.
         """
 
-        if isinstance(other, np.ndarray):
-            if other.shape[0] == 3:
-                angle = _angle.Angle.from_euler(*[float(str(v)) for v in other.tolist()])
-            elif other.shape[0] == 4:
-                angle = _angle.Angle.from_quat(*[float(str(v)) for v in other.tolist()])
-            else:
-                raise TypeError
-        else:
-            angle = other
-
-        p = self.as_numpy
-        p @= angle._q  # NOQA
-
-        p = Point(*[float(str(item)) for item in p.tolist()])
-
-        return p
+        x, y, z = _rotate(self.__other_to_quat(other), self._xyz)
+        return Point(x, y, z)
 
     @_check_types.do
     def __imatmul__(self, other: Union[np.ndarray, "_angle.Angle"]) -> "Point":
@@ -798,27 +903,8 @@ class Point(_app_mixins.CallbackMixin, metaclass=PointMeta):
             self._root @= other
             return self
 
-        if isinstance(other, np.ndarray):
-            if other.shape[0] == 3:
-                angle = _angle.Angle.from_euler(*[float(str(v)) for v in other.tolist()])
-            elif other.shape[0] == 4:
-                angle = _angle.Angle.from_quat(*[float(str(v)) for v in other.tolist()])
-            else:
-                raise TypeError
-        elif isinstance(other, _angle.Angle):
-            angle = other
-
-        else:
-            raise RuntimeError
-
-        p = self.as_numpy
-        p @= angle._q  # NOQA
-
-        self._data[0] = p[0]
-        self._data[1] = p[1]
-        self._data[2] = p[2]
-
-        self._process_callbacks()
+        x, y, z = _rotate(self.__other_to_quat(other), self._xyz)
+        self._store(x, y, z)
 
         return self
 
@@ -838,18 +924,11 @@ class Point(_app_mixins.CallbackMixin, metaclass=PointMeta):
             self._root.set_angle(angle, origin)
             return
 
-        p = self.copy()
-
-        p -= origin
-        p @= angle
-        p += origin
+        ox, oy, oz = origin._xyz  # NOQA
+        x, y, z = self._xyz
 
-        x, y, z = p.as_float
-        self._data[0] = x
-        self._data[1] = y
-        self._data[2] = z
-
-        self._process_callbacks()
+        x, y, z = _rotate(self.__other_to_quat(angle), (x - ox, y - oy, z - oz))
+        self._store(x + ox, y + oy, z + oz)
 
     @_check_types.do
     def _on_delegate_changed(self, delegate: "Point") -> None:
@@ -861,7 +940,12 @@ class Point(_app_mixins.CallbackMixin, metaclass=PointMeta):
         # callbacks first, then each delegator receives this call in turn.
         # Result: one mutation anywhere in the chain fires every callback
         # on every point in the chain exactly once.
+        self._xyz[:] = delegate._xyz
         np.copyto(self._data, delegate._data)
+
+        if self._row64 is not None:
+            self._row64[:] = self._xyz
+
         self._process_callbacks()
 
     @_check_types.do
@@ -942,7 +1026,11 @@ class Point(_app_mixins.CallbackMixin, metaclass=PointMeta):
                 PointMeta._instances.pop(other._db_id, None)
 
         other._root = actual_root
+        other._xyz[:] = actual_root._xyz
         np.copyto(other._data, actual_root._data)
+
+        if other._row64 is not None:
+            other._row64[:] = other._xyz
         actual_root.bind(other._on_delegate_changed)
         actual_root._delegators.append(weakref.ref(other))
 
@@ -962,7 +1050,7 @@ class Point(_app_mixins.CallbackMixin, metaclass=PointMeta):
             self._root = None
             if self._db_id is not None:
                 with PointMeta._instances_lock:
-                    PointMeta._instances[self._db_id] = weakref.ref(self)
+                    PointMeta._instances[self._db_id] = PointMeta._make_ref(self._db_id, self)
 
     @_check_types.do
     def get_angle(self, origin: "Point") -> "_angle.Angle":
@@ -981,8 +1069,9 @@ class Point(_app_mixins.CallbackMixin, metaclass=PointMeta):
         from genuine zero-coordinates.
         """
 
-        arr = np.array([0.0, 0.0, 0.0], dtype=np.float32)
-        return not all(np.isclose(self._data, arr))
+        # Same tolerance numpy.isclose applies against zero (atol=1e-8).
+        x, y, z = self._xyz
+        return not (abs(x) <= 1e-8 and abs(y) <= 1e-8 and abs(z) <= 1e-8)
 
     @_check_types.do
     def __eq__(self, other: "Point") -> bool:
@@ -997,7 +1086,13 @@ class Point(_app_mixins.CallbackMixin, metaclass=PointMeta):
         if not isinstance(other, Point):
             return False
 
-        return all(np.isclose(self._data, other.as_numpy))
+        # Same test numpy.isclose performs (rtol=1e-5, atol=1e-8), done on
+        # the floats directly instead of allocating arrays per comparison.
+        for v1, v2 in zip(self._xyz, other._xyz):  # NOQA
+            if abs(v1 - v2) > 1e-8 + 1e-5 * abs(v2):
+                return False
+
+        return True
 
     @_check_types.do
     def __ne__(self, other: "Point") -> bool:
@@ -1024,7 +1119,7 @@ class Point(_app_mixins.CallbackMixin, metaclass=PointMeta):
     def as_float(self) -> tuple[float, float, float]:
         """Return (x, y, z) as plain Python floats."""
 
-        x, y, z = [float(str(v)) for v in self._data.tolist()]
+        x, y, z = self._xyz
         return x, y, z
 
     @property
@@ -1039,68 +1134,41 @@ class Point(_app_mixins.CallbackMixin, metaclass=PointMeta):
     @_check_types.do
     def as_numpy(self) -> np.ndarray:
         """
-        Return the underlying float64 numpy array directly — not a copy.
+        Return the underlying float32 numpy mirror directly — not a copy.
 
-        This property is central to how the 3D culling pipeline stays current
-        without any explicit synchronisation.
+        This property is how the 3D culling pipeline finds an object's
+        current position.
 
         HOW IT FITS INTO THE CULLING PIPELINE
         ---------------------------------------
-        When a 3D object is registered with the canvas, ``Base3D.__init__``
-        does::
+        When a 3D object is constructed, ``BaseVar.__init__`` does::
 
             self.numpy_position = self._position.as_numpy
 
         This stores a direct reference to the Point's own ``_data`` buffer.
-        The canvas then builds a culling row::
-
-            [aabb_min, aabb_max, pos, is_opaque, obj_address]
-
-        where ``pos`` is that same ``numpy_position`` reference — the same
-        C-contiguous float64 array that lives inside the Point.
+        When the object is added to a canvas, the canvas's
+        ``gl.culling.SceneBuffer`` gives it a slot and keeps that same
+        reference (with the object's ``aabb`` and ``is_opaque`` arrays) as
+        the slot's source.
 
         When the Point's position changes (via ``_update_position``)::
 
             self.numpy_position[:] = position.as_numpy
 
-        the write goes *in-place* into the existing buffer.  The culling row
-        already holds a reference to that buffer, so the Cython culling code
-        sees the updated position the next time it reads from that pointer —
-        with no row rebuild, no re-registration, no copying.
-
-        THE GIL-BOUNDARY TRICK
-        -----------------------
-        The culling code runs ``with nogil:`` so Python objects cannot cross
-        the GIL boundary.  The position data gets through because it is a raw
-        C pointer to a numpy buffer — not a Python object.
+        the write goes *in-place* into the existing buffer, and the AABB
+        recompute that follows marks the object's slots dirty. The next
+        cull copies the slot from the buffer it already references -- no
+        re-registration, no lookup.
 
-        The scene object itself is carried across the boundary using a
-        different mechanism::
-
-            obj_ref     = weakref.ref(obj, self.__remove_obj_ref)
-            obj_address = id(obj_ref)           # integer — crosses GIL freely
-            row.append(obj_address)
-
-        ``id()`` returns the memory address of the weakref object as a plain
-        Python integer.  On the back side, after the nogil block completes,
-        the canvas reconstructs the weakref::
-
-            obj_ref = ctypes.cast(ref_address, ctypes.py_object).value
-            obj     = obj_ref()
-
-        If the object was collected while the culling thread was running,
-        ``obj_ref()`` returns ``None`` and the row is silently skipped.  This
-        is rock-solid safe: the weakref's own finaliser has already been called
-        by CPython's reference counting, so the memory address is still valid
-        (the weakref object is kept alive by ``self._object_refs``), and
-        calling a dead weakref is always safe — it just returns None.
+        The buffer is the float32 mirror of the canonical float64 values in
+        ``_xyz``; every mutation through the Point API rewrites both.
 
         WHY as_numpy MUST NOT RETURN A COPY
         -------------------------------------
-        If ``as_numpy`` returned ``self._data.copy()``, the culling row would
-        hold a snapshot that goes stale the moment the Point moves.  Returning
-        ``self._data`` directly means every in-place write to the Point
-        propagates to the culling buffer automatically, with no extra work.
+        If ``as_numpy`` returned ``self._data.copy()``, the scene buffer's
+        source would be a snapshot that goes stale the moment the Point
+        moves.  Returning ``self._data`` directly means every in-place write
+        to the Point is what the scene buffer copies at the next cull.
 
         IMPORTANT — never mutate the returned array directly::
 
@@ -1173,7 +1241,7 @@ class Point(_app_mixins.CallbackMixin, metaclass=PointMeta):
         :rtype: :class:`Point`
         """
 
-        x, y, z = [float(str(v)) for v in self._data.tolist()]
+        x, y, z = self._xyz
         return Point(-x, -y, -z)
 
     @property
@@ -1184,6 +1252,36 @@ class Point(_app_mixins.CallbackMixin, metaclass=PointMeta):
         return -self
 
 
+@_check_types.do
+def _rotate(q: tuple[float, float, float, float],
+            v: list[float, float, float] | tuple[float, float, float]) -> tuple[float, float, float]:
+    """
+    Rotate the vector *v* by the unit quaternion *q* (``w, x, y, z``).
+
+    Same formula :meth:`Quaternion.__rmatmul__` uses
+    (``v + 2w(q x v) + 2 q x (q x v)``), written out on plain floats so a
+    single point rotation doesn't allocate any numpy arrays.
+
+    :param q: Unit quaternion components.
+    :type q: tuple[float, float, float, float]
+    :param v: Vector to rotate.
+    :type v: list[float, float, float] | tuple[float, float, float]
+    :returns: Rotated vector.
+    :rtype: tuple[float, float, float]
+    """
+
+    qw, qx, qy, qz = q
+    vx, vy, vz = v
+
+    tx = 2.0 * (qy * vz - qz * vy)
+    ty = 2.0 * (qz * vx - qx * vz)
+    tz = 2.0 * (qx * vy - qy * vx)
+
+    return (vx + qw * tx + (qy * tz - qz * ty),
+            vy + qw * ty + (qz * tx - qx * tz),
+            vz + qw * tz + (qx * ty - qy * tx))
+
+
 ZERO_POINT = Point(0.0, 0.0, 0.0)
 
 from . import angle as _angle  # NOQA
@@ -0,0 +1,349 @@
+# © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
+
+"""Columnar coordinate store backing every database-backed Point."""
+
+from typing import Iterable as _Iterable, TYPE_CHECKING, Union as _Union
+
+import threading
+import numpy as np
+
+from .. import check_types as _check_types
+
+
+if TYPE_CHECKING:
+    from . import point as _point
+
+
+# Rows per block. Blocks are never reallocated or resized -- a Point's
+# ``_data`` is a row *view* into a block, and that view is aliased by the
+# 3D canvas's scene buffer (see Point.as_numpy), so a block's memory has to
+# stay put for as long as the Point lives. Growing the arena appends a new
+# block instead.
+BLOCK_SIZE = 4096
+
+
+class PointArena:
+    """
+    Contiguous N x 3 coordinate storage shared by every Point that has a
+    ``db_id`` (one row per ``pjt_points3d`` / ``pjt_points2d`` singleton).
+
+    Each slot holds the point's coordinates twice: a float64 row, the
+    canonical values bulk operations read and write, and a float32 row that
+    the Point exposes as its ``_data`` buffer (what the culling scene buffer
+    and GL uploads alias). Point keeps both rows current on every scalar mutation;
+    the bulk methods here keep both rows *and* each Point's own float values
+    current, so either side can be used at any time.
+
+    Slot numbers are ``block * BLOCK_SIZE + row``. Released slots are reused
+    before a new block is appended.
+
+    Bulk operations (:meth:`translate`, :meth:`rotate`, :meth:`assign`) only
+    move coordinates; they never fire callbacks. The caller decides when and
+    on which points ``_process_callbacks()`` runs -- exactly like the
+    ``with point:`` batching pattern the housing move/rotate cascade already
+    uses. A Point attached to another one (see :meth:`Point.attach`) is
+    moved through its root and only the root's callbacks bring it up to
+    date, so callers resolve their points with :meth:`roots` first and fire
+    the callbacks on what it returns.
+    """
+
+    @_check_types.do
+    def __init__(self):
+        self._blocks64: list[np.ndarray] = []
+        self._blocks32: list[np.ndarray] = []
+        self._free: list[int] = []
+        self._next_slot = 0
+        self._index: dict[bytes, int] = {}
+        self._lock = threading.Lock()
+
+    @_check_types.do
+    def __len__(self) -> int:
+        """Number of slots currently in use."""
+        return self._next_slot - len(self._free)
+
+    @_check_types.do
+    def __contains__(self, db_id: bytes) -> bool:
+        return db_id in self._index
+
+    @property
+    @_check_types.do
+    def capacity(self) -> int:
+        """Number of slots allocated across all blocks."""
+        return len(self._blocks64) * BLOCK_SIZE
+
+    @_check_types.do
+    def allocate(self, db_id: bytes, x: float, y: float, z: float) -> int:
+        """
+        Reserve a slot for *db_id* and write its initial coordinates.
+
+        :param db_id: Point singleton key.
+        :type db_id: bytes
+        :param x: Initial X component.
+        :type x: float
+        :param y: Initial Y component.
+        :type y: float
+        :param z: Initial Z component.
+        :type z: float
+        :returns: The slot number.
+        :rtype: int
+        """
+        with self._lock:
+            if self._free:
+                slot = self._free.pop()
+            else:
+                slot = self._next_slot
+                self._next_slot += 1
+
+                if slot >= len(self._blocks64) * BLOCK_SIZE:
+                    self._blocks64.append(np.zeros((BLOCK_SIZE, 3), dtype=np.float64))
+                    self._blocks32.append(np.zeros((BLOCK_SIZE, 3), dtype=np.float32))
+
+            self._index[db_id] = slot
+
+        block, row = divmod(slot, BLOCK_SIZE)
+        self._blocks64[block][row] = (x, y, z)
+        self._blocks32[block][row] = (x, y, z)
+
+        return slot
+
+    @_check_types.do
+    def release(self, db_id: bytes | None, slot: int) -> None:
+        """
+        Return *slot* to the free list.
+
+        Called from the owning Point's finalizer. The id mapping is only
+        dropped when it still points at this slot -- a new Point for the
+        same ``db_id`` may already have been allocated before the old one
+        was collected.
+
+        :param db_id: Key the slot was allocated (or last re-keyed) under.
+        :type db_id: bytes | None
+        :param slot: Slot number to release.
+        :type slot: int
+        """
+        with self._lock:
+            if db_id is not None and self._index.get(db_id) == slot:
+                del self._index[db_id]
+
+            self._free.append(slot)
+
+    @_check_types.do
+    def rekey(self, old_db_id: bytes | None, new_db_id: bytes | None, slot: int) -> None:
+        """
+        Move the id mapping for *slot* from *old_db_id* to *new_db_id*.
+
+        :param old_db_id: Previous key.
+        :type old_db_id: bytes | None
+        :param new_db_id: New key.
+        :type new_db_id: bytes | None
+        :param slot: Slot owned by the Point being re-keyed.
+        :type slot: int
+        """
+        with self._lock:
+            if old_db_id is not None and self._index.get(old_db_id) == slot:
+                del self._index[old_db_id]
+
+            if new_db_id is not None:
+                self._index[new_db_id] = slot
+
+    @_check_types.do
+    def slot_of(self, db_id: bytes) -> int:
+        """
+        Return the slot allocated for *db_id*.
+
+        :raises KeyError: If no live Point holds that id.
+        """
+        return self._index[db_id]
+
+    @_check_types.do
+    def row64(self, slot: int) -> np.ndarray:
+        """Return the float64 row view for *slot*."""
+        block, row = divmod(slot, BLOCK_SIZE)
+        return self._blocks64[block][row]
+
+    @_check_types.do
+    def row32(self, slot: int) -> np.ndarray:
+        """Return the float32 row view for *slot* (a Point's ``_data``)."""
+        block, row = divmod(slot, BLOCK_SIZE)
+        return self._blocks32[block][row]
+
+    @staticmethod
+    @_check_types.do
+    def slots(points: _Iterable["_point.Point"]) -> np.ndarray:
+        """
+        Return the slot of every Point in *points* as an index array.
+
+        A Point attached to a root (see :meth:`Point.attach`) resolves to
+        the root's slot, since that is where its writes go.
+
+        :param points: Arena-backed Points.
+        :type points: Iterable[:class:`~.point.Point`]
+        :returns: ``int64`` slot numbers in input order.
+        :rtype: :class:`numpy.ndarray`
+        :raises ValueError: If a Point has no slot (no ``db_id``).
+        """
+        slots = []
+
+        for point in points:
+            if point._root is not None:  # NOQA
+                point = point._root  # NOQA
+
+            slot = point._slot  # NOQA
+            if slot is None:
+                raise ValueError('Point has no arena slot (it has no db_id)')
+
+            slots.append(slot)
+
+        return np.array(slots, dtype=np.int64)
+
+    @staticmethod
+    @_check_types.do
+    def roots(points: _Iterable["_point.Point"]) -> list["_point.Point"]:
+        """
+        Return the root of every Point in *points*, each root once, in the
+        order first seen.
+
+        A Point attached to a root (see :meth:`Point.attach`) keeps its own
+        coordinates until the root's ``_process_callbacks()`` syncs it --
+        firing the attached Point's own callbacks after a bulk move leaves it
+        (and everything bound to it) at the old position. Moving the roots
+        and firing their callbacks updates every Point attached to them.
+
+        :param points: Arena-backed Points.
+        :type points: Iterable[:class:`~.point.Point`]
+        :rtype: list[:class:`~.point.Point`]
+        """
+        res = {}
+
+        for point in points:
+            if point._root is not None:  # NOQA
+                point = point._root  # NOQA
+
+            res.setdefault(id(point), point)
+
+        return list(res.values())
+
+    @_check_types.do
+    def _split(self, slots: np.ndarray) -> list[tuple[int, np.ndarray, np.ndarray]]:
+        """
+        Group *slots* per block.
+
+        :returns: ``(block, rows_in_block, positions_in_input)`` per block touched.
+        :rtype: list[tuple[int, numpy.ndarray, numpy.ndarray]]
+        """
+        blocks, rows = np.divmod(slots, BLOCK_SIZE)
+
+        if len(self._blocks64) == 1:
+            return [(0, rows, np.arange(len(slots)))]
+
+        res = []
+        for block in np.unique(blocks).tolist():
+            positions = np.flatnonzero(blocks == block)
+            res.append((block, rows[positions], positions))
+
+        return res
+
+    @_check_types.do
+    def gather(self, slots: np.ndarray) -> np.ndarray:
+        """
+        Return a fresh ``(N, 3)`` float64 array of the coordinates at *slots*.
+
+        :param slots: Slot numbers from :meth:`slots`.
+        :type slots: :class:`numpy.ndarray`
+        :rtype: :class:`numpy.ndarray`
+        """
+        out = np.empty((len(slots), 3), dtype=np.float64)
+
+        for block, rows, positions in self._split(slots):
+            out[positions] = self._blocks64[block][rows]
+
+        return out
+
+    @_check_types.do
+    def scatter(self, slots: np.ndarray, coords: np.ndarray) -> None:
+        """
+        Write *coords* into the arena rows at *slots* (both precisions).
+
+        Does not touch the Points' own float values -- use :meth:`assign`
+        for anything a Point might read afterwards.
+        """
+        for block, rows, positions in self._split(slots):
+            values = coords[positions]
+            self._blocks64[block][rows] = values
+            self._blocks32[block][rows] = values
+
+    @_check_types.do
+    def assign(self, points: list["_point.Point"], coords: np.ndarray) -> None:
+        """
+        Set every Point in *points* to the matching row of *coords*, in one
+        vectorised write, without firing any callbacks.
+
+        :param points: Arena-backed Points, in the same order as *coords*.
+        :type points: list[:class:`~.point.Point`]
+        :param coords: ``(N, 3)`` new coordinates.
+        :type coords: :class:`numpy.ndarray`
+        """
+        slots = self.slots(points)
+        coords = np.asarray(coords, dtype=np.float64)
+
+        self.scatter(slots, coords)
+
+        for point, values in zip(points, coords.tolist()):
+            if point._root is not None:  # NOQA
+                point = point._root  # NOQA
+
+            point._xyz[:] = values  # NOQA
+
+    @_check_types.do
+    def translate(self, points: list["_point.Point"],
+                  delta: _Union["_point.Point", np.ndarray]) -> np.ndarray:
+        """
+        Move every Point in *points* by *delta* in one vectorised pass.
+
+        No callbacks fire; see the class docstring.
+
+        :param points: Arena-backed root Points, see :meth:`roots`.
+        :type points: list[:class:`~.point.Point`]
+        :param delta: Offset to add.
+        :type delta: :class:`~.point.Point` | :class:`numpy.ndarray`
+        :returns: The new ``(N, 3)`` coordinates, in input order.
+        :rtype: :class:`numpy.ndarray`
+        """
+        if not isinstance(delta, np.ndarray):
+            delta = np.array(delta.as_float, dtype=np.float64)
+
+        coords = self.gather(self.slots(points)) + delta
+        self.assign(points, coords)
+
+        return coords
+
+    @_check_types.do
+    def rotate(self, points: list["_point.Point"],
+               quat: list[float] | tuple[float, ...],
+               origin: _Union["_point.Point", np.ndarray]) -> np.ndarray:
+        """
+        Rotate every Point in *points* about *origin* by the unit quaternion
+        *quat* (``w, x, y, z``) in one vectorised pass.
+
+        Same rotation formula as :func:`harness_designer.geometry.point._rotate`.
+        No callbacks fire; see the class docstring.
+
+        :returns: The new ``(N, 3)`` coordinates, in input order.
+        :rtype: :class:`numpy.ndarray`
+        """
+        if not isinstance(origin, np.ndarray):
+            origin = np.array(origin.as_float, dtype=np.float64)
+
+        qw = quat[0]
+        qvec = np.array(quat[1:], dtype=np.float64)
+
+        rel = self.gather(self.slots(points)) - origin
+        t_vec = 2.0 * np.cross(qvec, rel)
+        coords = rel + qw * t_vec + np.cross(qvec, t_vec) + origin
+
+        self.assign(points, coords)
+
+        return coords
+
+
+POINT_ARENA = PointArena()
@@ -202,6 +202,30 @@ class Canvas(_canvas_base.CanvasBase):
     def _get_view_object(obj):
         return obj.obj3d
 
+    @_check_types.do
+    def _instancing_enabled(self) -> bool:
+        # only the main editor config carries the toggle
+        return bool(getattr(self.frame_config.renderer, 'instancing', False))
+
+    @_check_types.do
+    def _lod_settings(self) -> tuple[float, list[float], float] | None:
+        renderer = self.frame_config.renderer
+
+        # only the main editor config carries the LOD settings
+        if not getattr(renderer, 'lod', False):
+            return None
+
+        fov = self.camera.field_of_view
+        viewport = self.camera.viewport
+
+        if not fov or viewport is None or not viewport[3]:
+            return None
+
+        # size in pixels of something one unit across at distance one
+        pixel_scale = float(viewport[3]) / (2.0 * math.tan(math.radians(fov) * 0.5))
+
+        return pixel_scale, list(renderer.lod_screen_sizes), float(renderer.lod_hysteresis)
+
     def _render_floor_after(self):
         try:
             self._floor.render(self._floor_program)
@@ -150,7 +150,9 @@ class Floor(_floor_base.FloorBase):
     def render(self, program):
         """Draw the procedural floor in a single pass."""
 
-        if not self.config.enable or self._vao is None:
+        config = self.config.snapshot()
+
+        if not config.enable or self._vao is None:
             return
 
         with self.canvas.context:
@@ -164,7 +166,7 @@ class Floor(_floor_base.FloorBase):
                 self._loc_mvp, 1, GL.GL_TRUE, self.canvas.camera.clip)
 
             # Grid dimensions ─────────────────────────────────────────────────────
-            cfg = self.config.grid
+            cfg = config.grid
             has_minor = 1 if cfg.enable else 0
             tile_size = cfg.size
             minor_sz = tile_size / (cfg.secondary_lines_per_tile + 1)
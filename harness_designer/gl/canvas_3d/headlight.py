@@ -62,13 +62,15 @@ class Headlight:
         :type program: UNKNOWN
         """
 
+        config = self.config.snapshot()
+
         with self.canvas.context:
             GL.glUseProgram(program)
             GL.glUniform3fv(self._headlightPosition, 1, self.canvas.camera.position.as_numpy)
             GL.glUniform3fv(self._headlightDirection, 1, self.light_direction)
-            GL.glUniform4fv(self._headlightDiffuse, 1, np.array(self.config.color, dtype=np.float32))
+            GL.glUniform4fv(self._headlightDiffuse, 1, np.array(config.color, dtype=np.float32))
 
-            GL.glUniform1f(self._headlightDiameter, math.radians(self.config.cutoff))
-            GL.glUniform1i(self._headlightEnabled, self.config.enable)
+            GL.glUniform1f(self._headlightDiameter, math.radians(config.cutoff))
+            GL.glUniform1i(self._headlightEnabled, config.enable)
             GL.glUseProgram(0)
 
@@ -3,8 +3,9 @@
 from typing import Self, TYPE_CHECKING
 
 from OpenGL import GL
-import ctypes
+import time
 import weakref
+import numpy as np
 
 from PySide6 import QtCore
 from PySide6 import QtGui
@@ -14,6 +15,10 @@ from .. import shaders as _shaders
 from ... import debug as _debug
 from ... import config as _config
 from .. import culling as _culling
+from .. import instancing as _instancing
+from .. import pick_bvh as _pick_bvh
+from .. import text_batching as _text_batching
+from .. import vbo as _vbo
 from ... import logger as _logger
 from ... import check_types as _check_types
 from . import camera_base as _camera_base
@@ -371,6 +376,12 @@ class CanvasBase(QtOpenGLWidgets.QOpenGLWidget):
         self.mainframe = mainframe
 
         self.config = config
+
+        # read-only copy of ``config`` taken at the start of every frame
+        # (see config.ConfigSnapshot) -- everything the frame draws reads
+        # its settings from this rather than going through the ConfigDB
+        # metaclass attribute by attribute
+        self.frame_config = None
         self._mode = None
 
         from .. import context as _context
@@ -398,12 +409,34 @@ class CanvasBase(QtOpenGLWidgets.QOpenGLWidget):
         self._vertices_projection = None
         self._vertices_view = None
 
-        self._last_culled = []
-        self._object_refs = []
         self._objects_in_view = []
-        self._object_addr_mapping = {}
 
-        self._object_data = [[], [], [], [], [], [], [], [], [], []]
+        # Every object's AABB/position/opacity lives in one slot of the
+        # scene buffer for as long as the object is in the scene; the
+        # culler runs over the buffer's columns (see gl.culling).
+        self._scene = _culling.SceneBuffer()
+        self._object_slots = {}
+
+        # and its view's AABB in the picking BVH (see gl.object_picker),
+        # refit from the same dirty notifications
+        self._pick_bvh = _pick_bvh.PickBVH(self._get_view_object)
+        self._pick_slots = {}
+
+        self._instance_batcher = _instancing.InstanceBatcher()
+        self._text_batcher = _text_batching.TextBatcher()
+
+        # CPU time spent culling and issuing the last frame's object draws
+        # plus the batchers' counters -- compare with instancing and text
+        # batching toggled on and off. ``triangles`` is what the scene objects submitted at
+        # the levels of detail picked for them, ``full_triangles`` what
+        # they would have submitted at full detail. ``stream_ms`` is the
+        # time spent streaming model meshes into the arena at the start of
+        # the frame and ``stream_pending`` the meshes still queued after it.
+        self.frame_stats = dict(cull_ms=0.0, draw_ms=0.0, objects=0, groups=0,
+                                instances=0, draw_calls=0, triangles=0,
+                                full_triangles=0, stream_ms=0.0, stream_pending=0,
+                                text_layers=0, text_labels=0, text_draw_calls=0,
+                                text_baked=0, text_uploaded=0)
 
         self.size = None
 
@@ -448,6 +481,13 @@ class CanvasBase(QtOpenGLWidgets.QOpenGLWidget):
         """
         return self._objects_in_view
 
+    @property
+    @_check_types.do
+    def pick_bvh(self) -> _pick_bvh.PickBVH:
+        """The picking index over every object in the scene; used by
+        ``gl.object_picker.find_object`` through ``camera.canvas``."""
+        return self._pick_bvh
+
     @_check_types.do
     def set_mode(self, mode: int) -> None:
         """Set the mode.
@@ -490,44 +530,21 @@ class CanvasBase(QtOpenGLWidgets.QOpenGLWidget):
         """
         Add an object.
 
+        Adding an object that is already in the scene does nothing.
+
         :param obj: Object instance to operate on.
         :type obj: UNKNOWN
         """
 
-        found_container = self._object_data[0]
-        container_len = 9999999999
-
-        for container in self._object_data:
-            if len(container) < container_len:
-                found_container = container
-                container_len = len(container)
-
-        aabb_min, aabb_max = obj.obj3d.aabb
-        pos = obj.obj3d.position.as_numpy
-        is_opaque = obj.obj3d.is_opaque
-
-        obj_ref = weakref.ref(obj, self.__remove_obj_ref)
-        obj_address = id(obj_ref)
-
-        self._object_refs.append(obj_ref)
-        self._object_addr_mapping[obj] = obj_address
+        if obj in self._object_slots:
+            return
 
-        found_container.append([aabb_min, aabb_max, pos, is_opaque, obj_address])
+        self._object_slots[obj] = self._scene.add(weakref.ref(obj), obj.obj3d)
         self._objects.append(obj)
 
-    @_check_types.do
-    def __remove_obj_ref(self, ref):
-        """
-        Remove the obj ref.
-
-        :param ref: Value for ``ref``.
-        :type ref: UNKNOWN
-        """
-
-        try:
-            self._object_refs.remove(ref)
-        except ValueError:
-            pass
+        pick_slot = self._pick_bvh.add(obj)
+        if pick_slot is not None:
+            self._pick_slots[obj] = pick_slot
 
     @_check_types.do
     def remove_object(self, obj):
@@ -548,16 +565,13 @@ class CanvasBase(QtOpenGLWidgets.QOpenGLWidget):
         except ValueError:
             pass
 
-        if obj in self._object_addr_mapping:
-            obj_address = self._object_addr_mapping.pop(obj)
-            for container in self._object_data:
-                for i, line in enumerate(container):
-                    if line[-1] == obj_address:
-                        container.pop(i)
-                        break
-                else:
-                    continue
-                break
+        slot = self._object_slots.pop(obj, None)
+        if slot is not None:
+            self._scene.remove(slot)
+
+        pick_slot = self._pick_slots.pop(obj, None)
+        if pick_slot is not None:
+            self._pick_bvh.remove(pick_slot)
 
         self.update()  # Qt: schedules a repaint (≈ wx Refresh)
 
@@ -573,10 +587,11 @@ class CanvasBase(QtOpenGLWidgets.QOpenGLWidget):
         project can hold thousands of objects.
         """
 
-        self._object_refs = []
         self._objects_in_view = []
-        self._object_addr_mapping = {}
-        self._object_data = [[], [], [], [], [], [], [], [], [], []]
+        self._object_slots = {}
+        self._scene.clear()
+        self._pick_slots = {}
+        self._pick_bvh.clear()
         self._objects = []
         self._selected = None
         self.update()
@@ -622,17 +637,19 @@ class CanvasBase(QtOpenGLWidgets.QOpenGLWidget):
         :type dy: float
         """
 
-        if self.config.input.truck_pedestal.mouse is None:
+        config = self.config.input.snapshot().truck_pedestal
+
+        if config.mouse is None:
             return
 
-        if self.config.input.truck_pedestal.mouse & MOUSE_REVERSE_X_AXIS:
+        if config.mouse & MOUSE_REVERSE_X_AXIS:
             dx = -dx
 
-        if self.config.input.truck_pedestal.mouse & MOUSE_REVERSE_Y_AXIS:
+        if config.mouse & MOUSE_REVERSE_Y_AXIS:
             dy = -dy
 
-        sens = self.config.input.truck_pedestal.sensitivity
-        self.camera.TruckPedestal(dx * sens, dy * sens, self.config.truck_pedestal.speed)
+        sens = config.sensitivity
+        self.camera.TruckPedestal(dx * sens, dy * sens, config.speed)
 
     @_debug.logfunc
     @_check_types.do
@@ -646,10 +663,11 @@ class CanvasBase(QtOpenGLWidgets.QOpenGLWidget):
         :param _: Value for ``_``.
         :type _: UNKNOWN
         """
-        if self.config.input.zoom.sensitivity is None:
+        sens = self.config.input.snapshot().zoom.sensitivity
+        if sens is None:
             return
 
-        dx *= self.config.input.zoom.sensitivity
+        dx *= sens
         self.camera.Zoom(dx)
 
     def Dolly(self, distance: float) -> None:
@@ -667,7 +685,7 @@ class CanvasBase(QtOpenGLWidgets.QOpenGLWidget):
         :type dy: float
         """
 
-        sens = self.config.input.rotate.sensitivity
+        sens = self.config.input.snapshot().rotate.sensitivity
         if sens is None:
             return
 
@@ -690,8 +708,9 @@ class CanvasBase(QtOpenGLWidgets.QOpenGLWidget):
             self.PanTilt(dx * 6.0, 0.0)
             return
 
-        sens = self.config.input.walk.sensitivity
-        self.camera.Walk(dx * sens, dy * sens, self.config.input.walk.speed)
+        config = self.config.input.snapshot().walk
+        sens = config.sensitivity
+        self.camera.Walk(dx * sens, dy * sens, config.speed)
         self.PanTilt(dx * 2.0, 0.0)
 
     @_debug.logfunc
@@ -708,7 +727,7 @@ class CanvasBase(QtOpenGLWidgets.QOpenGLWidget):
         :type dy: float
         """
 
-        sens = self.config.input.pan_tilt.sensitivity
+        sens = self.config.input.snapshot().pan_tilt.sensitivity
         if sens is None:
             return
 
@@ -867,8 +886,8 @@ class CanvasBase(QtOpenGLWidgets.QOpenGLWidget):
         projection_matrix = self.camera.projection
         view_matrix = self.camera.modelview
 
-        has_reflection = int(self.config.floor.reflections.enable and
-                             self.config.floor.enable_floor_lock)
+        floor = self.frame_config.floor
+        has_reflection = int(floor.reflections.enable and floor.enable_floor_lock)
 
         # ---------- Faces program
         GL.glUseProgram(self._faces_program)
@@ -876,7 +895,7 @@ class CanvasBase(QtOpenGLWidgets.QOpenGLWidget):
 
         GL.glUniformMatrix4fv(self._faces_projection, 1, GL.GL_TRUE, projection_matrix)
         GL.glUniformMatrix4fv(self._faces_view, 1, GL.GL_TRUE, view_matrix)
-        GL.glUniform1f(self._faces_floor_y, self.config.floor.ground_height)
+        GL.glUniform1f(self._faces_floor_y, floor.ground_height)
         GL.glUniform1i(self._faces_object_has_reflection, has_reflection)
 
         # ---------- Edges program
@@ -891,27 +910,77 @@ class CanvasBase(QtOpenGLWidgets.QOpenGLWidget):
 
     @_debug.logfunc
     @_check_types.do
-    def _draw_scene(self, obj_data):
-        GL.glUseProgram(self._faces_program)
+    def _draw_scene(self, slots):
+        start = time.perf_counter()
 
-        removed_objects = []
+        removed_slots = []
         objects_in_view = []
 
-        for row in obj_data:
+        scene = self._scene
+        objs = []
+
+        lods = self._select_lods(slots)
+        triangles = 0
+        full_triangles = 0
+
+        # culled slots -> live objects, in the culler's draw order; a slot
+        # whose object has been collected is freed once the frame is done
+        for index, slot in enumerate(slots.tolist()):
+            obj = scene.ref(slot)()
+
+            if obj is None:
+                removed_slots.append(slot)
+                continue
+
+            objs.append(obj)
+
+            view_obj = self._get_view_object(obj)
+            if view_obj is None:
+                continue
+
+            view_obj.lod = 0 if lods is None else int(lods[index])
+
+            vbo = view_obj._vbo  # NOQA
+            if isinstance(vbo, _vbo.VBOHandlerBase):
+                full_triangles += vbo.triangle_count
+                triangles += vbo.level(view_obj.lod).triangle_count
+
+        batcher = self._instance_batcher
+
+        if self._instancing_enabled():
+            # Instanced groups go first: the selected translucent object's
+            # deferred passes below have to see every opaque object's depth.
             try:
-                ref_address = row[-1]
-                obj_ref = ctypes.cast(ref_address, ctypes.py_object).value
-                obj = obj_ref()
+                objs, grouped = batcher.collect(objs, self._get_view_object)
+                batcher.flush(self._faces_program,
+                              self._edges_program,
+                              self._vertices_program)
 
-                if obj is None:
-                    try:
-                        self._object_refs.remove(obj_ref)
-                    except ValueError:
-                        pass
+                objects_in_view.extend(grouped)
+            except Exception as err:  # NOQA
+                _logger.traceback(err, 'instanced render error')
+        else:
+            batcher.stats.update(groups=0, instances=0, draw_calls=0)
 
-                    removed_objects.append(row)
-                    continue
+        # Static labels next, out of a few shared layers; always collected
+        # so every object's texts_batched flag matches what gets drawn.
+        text_batcher = self._text_batcher
+
+        try:
+            objs, batched = text_batcher.collect(
+                objs, self._get_view_object, self._text_batching_enabled())
+            text_batcher.flush(self._faces_program,
+                               self._edges_program,
+                               self._vertices_program)
+
+            objects_in_view.extend(batched)
+        except Exception as err:  # NOQA
+            _logger.traceback(err, 'text layer render error')
 
+        GL.glUseProgram(self._faces_program)
+
+        for obj in objs:
+            try:
                 objects_in_view.append(obj)
 
                 # A selected, translucent object is deferred to a later
@@ -994,8 +1063,8 @@ class CanvasBase(QtOpenGLWidgets.QOpenGLWidget):
                     GL.glUseProgram(self._faces_program)
 
                     # Restore reflection uniform and colour mask before floor render.
-                    has_reflection = int(self.config.floor.reflections.enable and
-                                         self.config.floor.enable_floor_lock)
+                    floor = self.frame_config.floor
+                    has_reflection = int(floor.reflections.enable and floor.enable_floor_lock)
 
                     GL.glUniform1i(self._faces_object_has_reflection, has_reflection)
 
@@ -1005,22 +1074,53 @@ class CanvasBase(QtOpenGLWidgets.QOpenGLWidget):
         GL.glUseProgram(0)
         self._objects_in_view = objects_in_view
 
-        for row in removed_objects:
-            try:
-                for container in self._object_data:
-                    try:
-                        container.remove(row)
-                        break
-                    except ValueError:
-                        continue
+        stats = self.frame_stats
+        stats.update(batcher.stats)
+        stats.update(text_batcher.stats)
+        stats['objects'] = len(objects_in_view)
+        stats['triangles'] = triangles
+        stats['full_triangles'] = full_triangles
+        stats['cull_ms'] = scene.stats['cull_ms']
+        stats['draw_ms'] = (time.perf_counter() - start) * 1000.0
 
-            except Exception as err:  # NOQA
-                _logger.traceback(err, 'object render removal error')
+        for slot in removed_slots:
+            scene.remove(slot)
 
     @staticmethod
     def _get_view_object(obj):
         raise NotImplementedError
 
+    @_check_types.do
+    def _instancing_enabled(self) -> bool:
+        return False
+
+    @_check_types.do
+    def _text_batching_enabled(self) -> bool:
+        return bool(getattr(self.frame_config.renderer, 'text_batching', False))
+
+    @_check_types.do
+    def _lod_settings(self) -> tuple[float, list[float], float] | None:
+        """``(pixel_scale, screen_sizes, hysteresis)`` for
+        :meth:`SceneBuffer.select_lod`, or ``None`` to draw everything at
+        full detail."""
+        return None
+
+    @_check_types.do
+    def _select_lods(self, slots) -> np.ndarray | None:
+        settings = self._lod_settings()
+        if settings is None:
+            return None
+
+        pixel_scale, screen_sizes, hysteresis = settings
+
+        try:
+            return self._scene.select_lod(
+                slots, self.camera.position.as_numpy, pixel_scale,
+                np.asarray(screen_sizes, dtype=np.float32), hysteresis)
+        except Exception as err:  # NOQA
+            _logger.traceback(err, 'LOD selection error')
+            return None
+
     def _set_view(self):
         raise NotImplementedError
 
@@ -1045,10 +1145,26 @@ class CanvasBase(QtOpenGLWidgets.QOpenGLWidget):
         # extra clear there, not a behavior change.
         GL.glClear(GL.GL_COLOR_BUFFER_BIT | GL.GL_DEPTH_BUFFER_BIT)
 
+        # the same object every frame until a setting is written
+        self.frame_config = self.config.snapshot()
+
         self.camera.set()
         self._set_view()
         self._set_shader_programs()
 
+        # next few chunks of any model meshes still on their way to the GPU;
+        # objects whose mesh isn't complete yet skip their draw
+        streamer = _vbo.MESH_STREAMER
+        try:
+            if streamer.pump():
+                # keep frames coming until every queued mesh is in
+                QtCore.QTimer.singleShot(0, self.Refresh)
+        except Exception as err:  # NOQA
+            _logger.traceback(err, 'mesh streaming error')
+
+        self.frame_stats['stream_ms'] = streamer.stats['last_ms']
+        self.frame_stats['stream_pending'] = streamer.pending
+
         # ---------- Faces program rendering
         try:
             self._scene_light.render(self._faces_program)
@@ -1056,15 +1172,15 @@ class CanvasBase(QtOpenGLWidgets.QOpenGLWidget):
             _logger.traceback(err, 'scene light error')
 
         try:
-            objs = _culling.cull(
-                self._object_data, self.camera.frustum_normals,
-                self.camera.frustum_distances, self.camera.position.as_numpy)
+            slots = self._scene.cull(
+                self.camera.frustum_normals, self.camera.frustum_distances,
+                self.camera.position.as_numpy)
         except Exception as err:  # NOQA
             _logger.traceback(err, 'culling error')
             return
 
         self._render_floor_before()
-        self._draw_scene(objs)
+        self._draw_scene(slots)
         self._render_floor_after()
 
     # ------------------------------------------------------------------
@@ -153,6 +153,13 @@ class MouseHandlerBase:
                 self.on_aux1_up(event)
             elif btn == QtCore.Qt.MouseButton.XButton2:
                 self.on_aux2_up(event)
+
+            # end of a drag (or click) -- write everything it changed now
+            # instead of waiting for the write-behind timer
+            project_db = getattr(self.canvas.mainframe, 'project_db', None)
+            if project_db is not None:
+                project_db.flush()
+
             return False
 
         if t == QtCore.QEvent.Type.MouseButtonDblClick:
@@ -239,88 +246,87 @@ class MouseHandlerBase:
         :returns: Return value. UNKNOWN details.
         :rtype: UNKNOWN
         """
+        # called for every mouse move of a drag -- read the input settings
+        # off one snapshot instead of through the ConfigDB metaclass
+        config = self.config.snapshot()
 
         if (
-            self.config.truck_pedestal.mouse is not None and
-            self.config.truck_pedestal.mouse & code
+            config.truck_pedestal.mouse is not None and
+            config.truck_pedestal.mouse & code
         ):
 
             def _wrapper(dx, dy):
-
-                if self.config.truck_pedestal.mouse & MOUSE_SWAP_AXIS:
+                if config.truck_pedestal.mouse & MOUSE_SWAP_AXIS:
                     dy, dx = dx, dy
 
-                if self.config.truck_pedestal.mouse & MOUSE_REVERSE_X_AXIS:
+                if config.truck_pedestal.mouse & MOUSE_REVERSE_X_AXIS:
                     dx = -dx
 
-                if self.config.truck_pedestal.mouse & MOUSE_REVERSE_Y_AXIS:
+                if config.truck_pedestal.mouse & MOUSE_REVERSE_Y_AXIS:
                     dy = -dy
 
-                sens = self.config.truck_pedestal.sensitivity
+                sens = config.truck_pedestal.sensitivity
                 self.canvas.camera.TruckPedestal(
-                    dx * sens, dy * sens, self.config.truck_pedestal.speed)
+                    dx * sens, dy * sens, config.truck_pedestal.speed)
 
             return _wrapper
 
         if (
-            self.config.rotate.mouse is not None and
-            self.config.rotate.mouse & code
+            config.rotate.mouse is not None and
+            config.rotate.mouse & code
         ):
 
             def _wrapper(dx, dy):
-
-                if self.config.rotate.mouse & MOUSE_SWAP_AXIS:
+                if config.rotate.mouse & MOUSE_SWAP_AXIS:
                     dy, dx = dx, dy
 
-                if self.config.rotate.mouse & MOUSE_REVERSE_X_AXIS:
+                if config.rotate.mouse & MOUSE_REVERSE_X_AXIS:
                     dx = -dx
 
-                if self.config.rotate.mouse & MOUSE_REVERSE_Y_AXIS:
+                if config.rotate.mouse & MOUSE_REVERSE_Y_AXIS:
                     dy = -dy
 
-                sens = self.config.rotate.sensitivity
+                sens = config.rotate.sensitivity
                 self.canvas.camera.Rotate(dx * sens, dy * sens)
 
             return _wrapper
 
         if (
-            self.config.pan_tilt.mouse is not None and
-            self.config.pan_tilt.mouse & code
+            config.pan_tilt.mouse is not None and
+            config.pan_tilt.mouse & code
         ):
 
             def _wrapper(dx, dy):
-
-                if self.config.pan_tilt.mouse & MOUSE_SWAP_AXIS:
+                if config.pan_tilt.mouse & MOUSE_SWAP_AXIS:
                     dy, dx = dx, dy
 
-                if self.config.pan_tilt.mouse & MOUSE_REVERSE_X_AXIS:
+                if config.pan_tilt.mouse & MOUSE_REVERSE_X_AXIS:
                     dx = -dx
 
-                if self.config.pan_tilt.mouse & MOUSE_REVERSE_Y_AXIS:
+                if config.pan_tilt.mouse & MOUSE_REVERSE_Y_AXIS:
                     dy = -dy
 
-                sens = self.config.pan_tilt.sensitivity
+                sens = config.pan_tilt.sensitivity
                 self.canvas.camera.PanTilt(dx * sens, dy * sens)
 
             return _wrapper
 
         if (
-            self.config.dolly.mouse is not None and
-            self.config.dolly.mouse & code
+            config.dolly.mouse is not None and
+            config.dolly.mouse & code
         ):
             def _wrapper(dx, dy):
-
-                if self.config.dolly.mouse & MOUSE_SWAP_AXIS:
+                if config.dolly.mouse & MOUSE_SWAP_AXIS:
                     dy, dx = dx, dy
 
-                sens = self.config.dolly.sensitivity
+                sens = config.dolly.sensitivity
                 self.canvas.camera.Dolly(dx * sens)
 
             return _wrapper
 
         if (
-            self.config.reset.mouse is not None and
-            self.config.reset.mouse & code
+            config.reset.mouse is not None and
+            config.reset.mouse & code
         ):
 
             def _wrapper(_, __):
@@ -329,42 +335,41 @@ class MouseHandlerBase:
             return _wrapper
 
         if (
-            self.config.walk.mouse is not None and
-            self.config.walk.mouse & code
+            config.walk.mouse is not None and
+            config.walk.mouse & code
         ):
             def _wrapper(dx, dy):
                 if dy == 0.0:
                     self.canvas.PanTilt(dx * 6.0, 0.0)
                     return
 
-                if self.config.walk.mouse & MOUSE_SWAP_AXIS:
+                if config.walk.mouse & MOUSE_SWAP_AXIS:
                     dy, dx = dx, dy
 
                 look_dx = dx
-                if self.config.walk.mouse & MOUSE_REVERSE_X_AXIS:
+                if config.walk.mouse & MOUSE_REVERSE_X_AXIS:
                     dx = -dx
 
-                if self.config.walk.mouse & MOUSE_REVERSE_Y_AXIS:
+                if config.walk.mouse & MOUSE_REVERSE_Y_AXIS:
                     dy = -dy
 
-                sens = self.config.walk.sensitivity
+                sens = config.walk.sensitivity
                 self.canvas.camera.Walk(
-                    dx * sens, dy * sens, self.config.walk.speed)
+                    dx * sens, dy * sens, config.walk.speed)
 
                 self.canvas.PanTilt(look_dx * 2.0, 0.0)
 
             return _wrapper
 
         if (
-            self.config.zoom.mouse is not None and
-            self.config.zoom.mouse & code
+            config.zoom.mouse is not None and
+            config.zoom.mouse & code
         ):
             def _wrapper(dx, dy):
-
-                if self.config.zoom.mouse & MOUSE_SWAP_AXIS:
+                if config.zoom.mouse & MOUSE_SWAP_AXIS:
                     dy, dx = dx, dy
 
-                sens = self.config.zoom.sensitivity
+                sens = config.zoom.sensitivity
                 self.canvas.camera.Zoom(dx * sens)
 
             return _wrapper
@@ -751,7 +756,8 @@ class MouseHandlerBase:
 
         delta = 1.0 if evt.angleDelta().y() > 0 else -1.0
 
-        if self.config.walk.mouse is not None and self.config.walk.mouse & MOUSE_WHEEL:
+        walk_mouse = self.config.snapshot().walk.mouse
+        if walk_mouse is not None and walk_mouse & MOUSE_WHEEL:
             self._orient_to_mouse_on_focal_plane(_qt_pos(evt), delta)
 
         self._process_mouse(MOUSE_WHEEL)(delta, 0.0)
@@ -809,7 +815,7 @@ class MouseHandlerBase:
         if abs(yaw_delta) < _EPSILON and abs(pitch_delta) < _EPSILON:
             return
 
-        walk_cfg = self.config.walk
+        walk_cfg = self.config.snapshot().walk
         step_distance = abs(wheel_delta) * walk_cfg.sensitivity * walk_cfg.speed
         if step_distance < _EPSILON:
             return
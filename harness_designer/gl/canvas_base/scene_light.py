@@ -48,9 +48,10 @@ class SceneLight:
         """
 
         position = self.canvas.camera.position.as_numpy
-        ambient = np.array(self.config.ambient, dtype=np.float32)
-        diffuse = np.array(self.config.diffuse, dtype=np.float32)
-        specular = np.array(self.config.specular, dtype=np.float32)
+        config = self.config.snapshot()
+        ambient = np.array(config.ambient, dtype=np.float32)
+        diffuse = np.array(config.diffuse, dtype=np.float32)
+        specular = np.array(config.specular, dtype=np.float32)
 
         GL.glUseProgram(program)
         GL.glUniform3fv(self._lightPosition, 1, position)
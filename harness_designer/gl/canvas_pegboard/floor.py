@@ -133,7 +133,9 @@ class Floor(_floor_base.FloorBase):
     def render(self, program):
         """Draw the procedural floor in a single pass."""
 
-        if not self.config.enable or self._vao is None:
+        config = self.config.snapshot()
+
+        if not config.enable or self._vao is None:
             return
 
         size = self.canvas.size
@@ -184,7 +186,7 @@ class Floor(_floor_base.FloorBase):
                 self._loc_world_per_pixel, world_per_pixel)
 
             GL.glUniform4f(
-                self._loc_dot_color, *self.config.dot_color)
+                self._loc_dot_color, *config.dot_color)
 
             GL.glBindVertexArray(self._vao)
             GL.glDrawArrays(GL.GL_TRIANGLES, 0, 6)
@@ -3,75 +3,51 @@
 import numpy as np
 
 
-class CullingThreadPool:
-
-    def __init__(self, num_threads: int = 4):
-        ...
-
-    def cull(
-        self,
-        object_data_lists: list[
-            list[list[np.ndarray, np.ndarray, np.ndarray, np.ndarray, int]],
-            list[list[np.ndarray, np.ndarray, np.ndarray, np.ndarray, int]],
-            list[list[np.ndarray, np.ndarray, np.ndarray, np.ndarray, int]],
-            list[list[np.ndarray, np.ndarray, np.ndarray, np.ndarray, int]]
-        ],
-        frustum_normals: np.ndarray,
-        frustum_distances: np.ndarray,
-        camera_pos: np.ndarray
-    ):
-        """
-        View Culling
-
-        There is no reason to send objects to the GPU to be rendered if
-        the object is not in view. Culling is expensive to do in python code
-        and because we have the potential to deal with 10's of thousands of
-        objects we need to make sure the culling is done as fast as possible.
-        To achieve this the code is compiled using Cython. Using Cython allows
-        us to do several things and the bigges one of those is the ability
-        to execute the for loops in threads without using the GIL. This greatly
-        speeds up the culling which is what takes the most amount of time to do
-        when a frame is being rendered.
-
-        For sake of providing some numbers. 480 objects takes roughly
-        20 milliseconds to cull.
-
-
-        Args:
-            object_data_lists: List of 4 lists, each containing object rows:
-                [
-                    [  # Thread 0
-                        [aabb_min: shape=(3,), aabb_max: shape=(3,), pos: shape=(3,), is_opaque:shape=(1,), obj: int],
-                        ...
-                    ],
-                    [  # Thread 1
-                        [aabb_min: shape=(3,), aabb_max: shape=(3,), pos: shape=(3,), is_opaque:shape=(1,), obj: int],
-                        ...
-                    ],
-                    ...
-                ]
-            frustum_normals: Camera frustum normals shape=6, 3)
-            frustum_distances: Camera frustum distances shape=(6,)
-            camera_pos: Camera position shape=(3,)
-
-        Returns:
-            List of ORIGINAL row objects that passed culling, sorted:
-            [
-                [aabb_min, aabb_max, position, is_opaque, render_func],
-                ...
-            ]
-        """
-        ...
-
-    def shutdown(self):
-        """
-        Shutdown all worker threads gracefully.
-
-        Call this when app is closing.
-        Event ensures threads exit cleanly.
-        """
-        ...
-
-    def __del__(self):
-        """Auto-shutdown on cleanup."""
-        ...
+def cull_scene(
+    centers: np.ndarray,
+    extents: np.ndarray,
+    positions: np.ndarray,
+    flags: np.ndarray,
+    count: int,
+    frustum_normals: np.ndarray,
+    frustum_distances: np.ndarray,
+    camera_pos: np.ndarray,
+    out_index: np.ndarray,
+    out_key: np.ndarray
+) -> tuple[int, int]:
+    """
+    View Culling
+
+    There is no reason to send objects to the GPU to be rendered if
+    the object is not in view. Culling is expensive to do in python code
+    and because we have the potential to deal with 10's of thousands of
+    objects we need to make sure the culling is done as fast as possible.
+
+    The scene is held in a :class:`SceneBuffer` -- one contiguous array per
+    column, updated in place when an object moves -- so the whole test is a
+    single loop over flat memory that runs without the GIL. There is
+    nothing to unpack per object and no worker threads to hand work to.
+
+    For sake of providing some numbers. 10,000 objects take well under a
+    millisecond to cull (see ``benchmarks/scene_buffer.py``), where the old
+    per-object row lists took roughly 20 milliseconds for 480.
+
+    Args:
+        centers: AABB centers, shape=(capacity, 3), float32
+        extents: AABB half extents, shape=(capacity, 3), float32
+        positions: Object positions (for the draw order), shape=(capacity, 3), float32
+        flags: Slot flags (FLAG_ACTIVE | FLAG_OPAQUE), shape=(capacity,), uint8
+        count: Number of slots to test (the buffer's high-water mark)
+        frustum_normals: Camera frustum normals shape=(6, 3)
+        frustum_distances: Camera frustum distances shape=(6,)
+        camera_pos: Camera position shape=(3,)
+        out_index: Scratch output, shape=(>= count,), int32
+        out_key: Scratch output, shape=(>= count,), float32
+
+    Returns:
+        ``(opaque_count, transparent_count)`` -- the visible opaque slots
+        are ``out_index[:opaque_count]`` keyed by squared distance, the
+        visible transparent slots ``out_index[count - transparent_count:count]``
+        keyed by negated squared distance.
+    """
+    ...
@@ -1,306 +1,112 @@
-# culling_nogil.pyx
+# culling.pyx
 # cython: language_level=3
 # cython: boundscheck=False
 # cython: wraparound=False
+# cython: cdivision=True
 
 # © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
 
-import numpy as np
-cimport numpy as np
-from libc.stdlib cimport malloc, free
 from libc.math cimport fabsf
-import threading
-from queue import Queue, Empty
-import ctypes
 cimport cython
 
 
-# Fast AABB-frustum test (pure C, no GIL)
-cdef bint aabb_in_frustum_nogil(float* frustum_normals, float* frustum_distances,
-                                float* aabb_min, float* aabb_max) nogil:
-
-    """Test if AABB intersects frustum."""
-    cdef float cx, cy, cz, ex, ey, ez
-    cdef float s, r
-    cdef int i, idx
-
-    # Center
-    cx = (aabb_min[0] + aabb_max[0]) * <float>0.5
-    cy = (aabb_min[1] + aabb_max[1]) * <float>0.5
-    cz = (aabb_min[2] + aabb_max[2]) * <float>0.5
-
-    # Extents
-    ex = (aabb_max[0] - aabb_min[0]) * <float>0.5
-    ey = (aabb_max[1] - aabb_min[1]) * <float>0.5
-    ez = (aabb_max[2] - aabb_min[2]) * <float>0.5
-
-    # Test each frustum plane
-    for i in range(6):
-        idx = i * 3
-
-        s = (frustum_normals[idx + 0] * cx +
-             frustum_normals[idx + 1] * cy +
-             frustum_normals[idx + 2] * cz +
-             frustum_distances[i])
-
-        r = (fabsf(frustum_normals[idx + 0]) * ex +
-             fabsf(frustum_normals[idx + 1]) * ey +
-             fabsf(frustum_normals[idx + 2]) * ez)
-
-        if s + r < <float>0.0:
-            return False
-
-    return True
+# Slot flags -- must match FLAG_ACTIVE/FLAG_OPAQUE in scene_buffer.py
+cdef unsigned char _FLAG_ACTIVE = 0x01
+cdef unsigned char _FLAG_OPAQUE = 0x02
 
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def cull_batch(list object_rows, float[:, ::1] frustum_normals_2d,
-                      float[::1] frustum_distances, float[::1] camera_pos):
+def cull_scene(const float[:, ::1] centers, const float[:, ::1] extents,
+               const float[:, ::1] positions, const unsigned char[::1] flags,
+               Py_ssize_t count, const float[:, ::1] frustum_normals,
+               const float[::1] frustum_distances, const float[::1] camera_pos,
+               int[::1] out_index, float[::1] out_key):
     """
-    Python-facing function that unpacks object rows and calls nogil culling.
+    Frustum-test the first *count* slots of a :class:`SceneBuffer` in one
+    pass, entirely without the GIL.
+
+    Every array is one of the scene buffer's own contiguous columns, so
+    the loop reads straight through memory -- nothing is unpacked from
+    Python objects per object the way the old row lists had to be.
 
-    VOODOO MAGIC: Takes the raw list format from Canvas and unpacks it
-    with minimal GIL operations, then processes in pure C.
+    Visible opaque slots are written to the front of *out_index* (key:
+    squared camera distance), visible transparent slots to the back (key:
+    negated squared distance), so an ascending sort of each part gives
+    opaque front-to-back and transparent back-to-front.
 
-    Returns list of ORIGINAL row objects that are visible, sorted for rendering.
+    Returns ``(opaque_count, transparent_count)``: the opaque slots are
+    ``out_index[:opaque_count]``, the transparent ones
+    ``out_index[count - transparent_count:count]``.
     """
 
-    cdef int n = <int>len(object_rows)
+    cdef Py_ssize_t i, p
+    cdef Py_ssize_t front = 0
+    cdef Py_ssize_t back = count
+    cdef unsigned char flag
+    cdef bint visible
+    cdef float cx, cy, cz, ex, ey, ez
+    cdef float s, r, dx, dy, dz, dist_sq
 
-    if n == 0:
-        return []
+    cdef float normals[18]
+    cdef float abs_normals[18]
+    cdef float distances[6]
 
-    cdef int i, idx
-    cdef float* frustum_normals = &frustum_normals_2d[0, 0]
     cdef float cam_x = camera_pos[0]
     cdef float cam_y = camera_pos[1]
     cdef float cam_z = camera_pos[2]
 
-    # Allocate output arrays
-    cdef int* visible = <int*>malloc(n * sizeof(int))
-    cdef float* dist_sq = <float*>malloc(n * sizeof(float))
-    cdef int* is_opaque_arr = <int*>malloc(n * sizeof(int))
-
-    # Temporary storage for numpy array pointers
-    cdef float** aabb_mins = <float**>malloc(n * sizeof(float*))
-    cdef float** aabb_maxs = <float**>malloc(n * sizeof(float*))
-    cdef float** positions = <float**>malloc(n * sizeof(float*))
-
-    # Unpack object rows (WITH GIL - but minimal work)
-    cdef float[::1] aabb_min_view, aabb_max_view, pos_view
-    cdef object row, is_opaque_obj
-
-    for i in range(n):
-        row = object_rows[i]
-
-        # Extract numpy array views
-        aabb_min_view = row[0]  # numpy array (3,)
-        aabb_max_view = row[1]  # numpy array (3,)
-        pos_view = row[2]       # numpy array (3,)
-        is_opaque_obj = row[3]  # numpy array (1,) or int
-
-        # Get pointers to array data
-        aabb_mins[i] = &aabb_min_view[0]
-        aabb_maxs[i] = &aabb_max_view[0]
-        positions[i] = &pos_view[0]
-
-       # Extract is_opaque (handle both array and int)
-        if isinstance(is_opaque_obj, np.ndarray):
-            # It's a numpy array - extract the value
-            is_opaque_array = <np.ndarray>is_opaque_obj
-            is_opaque_arr[i] = <int>is_opaque_array.flat[0]
-        else:
-            # It's already an int
-            is_opaque_arr[i] = <int>is_opaque_obj
-
-    # CULLING WITH NO GIL!
-    cdef float dx, dy, dz
+    for p in range(6):
+        distances[p] = frustum_distances[p]
+        for i in range(3):
+            normals[p * 3 + i] = frustum_normals[p, i]
+            abs_normals[p * 3 + i] = fabsf(frustum_normals[p, i])
 
     with nogil:
-        for i in range(n):
-            # Frustum test
-            if aabb_in_frustum_nogil(frustum_normals, &frustum_distances[0],
-                                     aabb_mins[i], aabb_maxs[i]):
-                visible[i] = 1
-
-                # Distance calculation
-                dx = cam_x - positions[i][0]
-                dy = cam_y - positions[i][1]
-                dz = cam_z - positions[i][2]
-                dist_sq[i] = dx * dx + dy * dy + dz * dz
-            else:
-                visible[i] = 0
-                dist_sq[i] = <float>0.0
-
-    # Gather results (WITH GIL) - keep ORIGINAL row objects!
-    cdef list opaque = []
-    cdef list transparent = []
-
-    for i in range(n):
-        if visible[i]:
-            # Append tuple: (distance, original_row_object)
-            if is_opaque_arr[i]:
-                opaque.append((dist_sq[i], object_rows[i]))
-            else:
-                transparent.append((dist_sq[i], object_rows[i]))
-
-    # Sort: opaque front-to-back, transparent back-to-front
-    opaque = sorted(opaque, key=lambda x: x[0])
-    transparent = sorted(transparent, key=lambda x: x[0], reverse=True)
-
-    # Build final list of ORIGINAL row objects (sorted for rendering)
-    cdef list result_rows = []
-    for dist, row in opaque:
-        result_rows.append(row)  # Original row object!
-
-    for dist, row in transparent:
-        result_rows.append(row)  # Original row object!
-
-    # Cleanup
-    free(visible)
-    free(dist_sq)
-    free(is_opaque_arr)
-    free(aabb_mins)
-    free(aabb_maxs)
-    free(positions)
-
-    return result_rows
-
-
-# Worker thread - PERSISTENT with Event for graceful shutdown
-# Worker thread - CLEAN AND EFFICIENT
-class CullingWorker(threading.Thread):
-    """
-    Persistent worker thread with blocking Queue.
-
-    Uses Event for graceful shutdown on app exit.
-    Threads stay alive, block on Queue.get() with ZERO CPU usage.
-    """
-
-    def __init__(self, thread_num):
-        super().__init__(daemon=True, name=f"CullingWorker-{thread_num}")
-        self.thread_num = thread_num
+        for i in range(count):
+            flag = flags[i]
+            if not (flag & _FLAG_ACTIVE):
+                continue
 
-        # Queues for work/results
-        self.work_queue = Queue(maxsize=1)
-        self.result_queue = Queue(maxsize=1)
+            cx = centers[i, 0]
+            cy = centers[i, 1]
+            cz = centers[i, 2]
 
-        # Event for graceful shutdown
-        self._stop_event = threading.Event()
+            ex = extents[i, 0]
+            ey = extents[i, 1]
+            ez = extents[i, 2]
 
-        self.start()
+            visible = True
 
-    def run(self):
-        """Worker loop - blocks on Queue.get() with ZERO CPU usage."""
+            for p in range(6):
+                s = (normals[p * 3] * cx +
+                     normals[p * 3 + 1] * cy +
+                     normals[p * 3 + 2] * cz +
+                     distances[p])
 
-        while not self._stop_event.is_set():
-            try:
-                work = self.work_queue.get()
+                r = (abs_normals[p * 3] * ex +
+                     abs_normals[p * 3 + 1] * ey +
+                     abs_normals[p * 3 + 2] * ez)
 
-                if work is None:
+                if s + r < <float>0.0:
+                    visible = False
                     break
 
-                object_rows, normals, distances, camera_pos = work
-
-                # Call Cython function
-                results = cull_batch(
-                    object_rows, normals, distances, camera_pos
-                )
-
-                self.result_queue.put(results)
-
-            except Exception as e:
-                try:
-                    self.result_queue.put([])
-                except:
-                    pass
-
-
-    def cull(self, object_rows, frustum_normals, frustum_distances, camera_pos):
-        """
-        Submit work to this worker thread.
-
-        Wakes sleeping worker instantly when work is added to queue.
-        """
-
-        self.work_queue.put((object_rows, frustum_normals, frustum_distances, camera_pos))
-
-    def finish(self):
-        """
-        Get results from this worker thread.
-
-        Blocks until worker completes - efficient sleep!
-        """
-
-        return self.result_queue.get()
-
-    def stop(self):
-        """
-        Stop this worker thread gracefully.
+            if not visible:
+                continue
 
-        Sets Event and sends poison pill to wake and exit cleanly.
-        """
+            dx = cam_x - positions[i, 0]
+            dy = cam_y - positions[i, 1]
+            dz = cam_z - positions[i, 2]
+            dist_sq = dx * dx + dy * dy + dz * dz
 
-        self._stop_event.set()
-        self.work_queue.put(None)  # Poison pill wakes thread
-        self.join(timeout=1.0)
-
-
-# Thread pool
-class CullingThreadPool:
-    """
-    Thread pool with persistent workers.
-    """
-
-    def __init__(self, num_threads=10):
-        """
-        Create persistent worker threads.
-
-        Threads are created ONCE and reused for entire app lifetime.
-        """
-
-        self.workers = [CullingWorker(i) for i in range(num_threads)]
-        self._num_threads = num_threads
-
-    def cull(self, object_data_lists, normals, distances, camera_pos):
-        # Dispatch work to worker threads -- track which worker INDICES
-        # actually got a job, not just a count. Containers empty out
-        # unevenly as objects are added/removed (add_object/remove_object
-        # pick whichever container is currently smallest/holds the match),
-        # so the non-empty containers are not always a contiguous run
-        # starting at index 0. Gathering from range(num_jobs) instead of
-        # the real dispatched indices would call finish() on a worker that
-        # was never given work, blocking forever on its result_queue.get().
-        dispatched = []
-        for i, worker in enumerate(self.workers):
-            if i < len(object_data_lists) and object_data_lists[i]:
-                worker.cull(object_data_lists[i], normals, distances, camera_pos)
-                dispatched.append(i)
-
-        # Gather results
-        all_visible_rows = []
-        for i in dispatched:
-            visible_rows = self.workers[i].finish()
-            all_visible_rows.extend(visible_rows)
-
-        return all_visible_rows
-
-    def shutdown(self):
-        """
-        Shutdown all worker threads gracefully.
-
-        Call this when app is closing.
-        Event ensures threads exit cleanly.
-        """
-
-        for worker in self.workers:
-            worker.stop()
-
-    def __del__(self):
-        """Auto-shutdown on cleanup."""
+            if flag & _FLAG_OPAQUE:
+                out_index[front] = <int>i
+                out_key[front] = dist_sq
+                front += 1
+            else:
+                back -= 1
+                out_index[back] = <int>i
+                out_key[back] = -dist_sq
 
-        try:
-            self.shutdown()
-        except:
-            pass
\ No newline at end of file
+    return front, count - back
@@ -0,0 +1,355 @@
+# © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
+
+"""Persistent structure-of-arrays scene storage for view culling."""
+
+from typing import TYPE_CHECKING
+
+import time
+import weakref
+import numpy as np
+
+from ... import check_types as _check_types
+from . import culling as _culling
+
+
+if TYPE_CHECKING:
+    from ...objects import objectsvar as _objectsvar
+
+
+# Slot flags -- must match _FLAG_ACTIVE/_FLAG_OPAQUE in culling.pyx
+FLAG_ACTIVE = 0x01
+FLAG_OPAQUE = 0x02
+
+
+class SceneBuffer:
+    """
+    Every object a canvas draws, stored column-wise in contiguous arrays
+    for :func:`culling.cull_scene`.
+
+    The canvas used to keep its objects as ``[aabb_min, aabb_max, pos,
+    is_opaque, obj_address]`` rows spread over several Python lists and
+    hand all of them to the culler every frame, which then had to unpack
+    every row (with the GIL held) before it could test anything. Here each
+    object owns a *slot* -- a fixed row in the ``centers``/``extents``/
+    ``positions``/``flags`` columns -- for as long as it is in the scene,
+    and the culler runs straight over the columns.
+
+    A slot is filled in at the first :meth:`cull` after the object is added
+    and again only when the object reports a change: ``BaseVar`` calls :meth:`mark_dirty` for each
+    of its slots whenever its AABB is recomputed or its opacity changes,
+    and the dirty slots are copied out of the object's own arrays at the
+    start of the next :meth:`cull`. A drag that moves an object many times
+    between two frames costs one copy.
+
+    Removing an object clears its slot's flags and puts the slot on a free
+    list; the next :meth:`add` reuses it, so slots stay stable and the
+    columns never need compacting. The columns double in size when they
+    run out of room.
+
+    Each slot also remembers the level of detail it was last drawn at, so
+    :meth:`select_lod` can hold a level until the object is clearly past a
+    switch point.
+
+    ``stats`` holds the counters of the last :meth:`cull`: ``objects`` in
+    the buffer, ``visible`` after culling, ``synced`` (dirty slots copied)
+    and ``cull_ms``.
+    """
+
+    @_check_types.do
+    def __init__(self, capacity: int = 1024):
+        capacity = max(1, capacity)
+
+        self._centers = np.zeros((capacity, 3), dtype=np.float32)
+        self._extents = np.zeros((capacity, 3), dtype=np.float32)
+        self._positions = np.zeros((capacity, 3), dtype=np.float32)
+        self._flags = np.zeros(capacity, dtype=np.uint8)
+
+        # level of detail each slot was drawn at last, see select_lod
+        self._lods = np.zeros(capacity, dtype=np.uint8)
+
+        # culling output, reused every frame
+        self._out_index = np.zeros(capacity, dtype=np.int32)
+        self._out_key = np.zeros(capacity, dtype=np.float32)
+
+        # per slot: the object's weak reference, a weak reference to the
+        # view holding the slot's registration and the view's live arrays
+        # the slot is copied from -- (aabb, position, is_opaque)
+        self._refs: list[weakref.ref | None] = [None] * capacity
+        self._views: list[weakref.ref | None] = [None] * capacity
+        self._sources: list[tuple[np.ndarray, np.ndarray | None, np.ndarray] | None] = [None] * capacity
+
+        self._free: list[int] = []
+        self._dirty: set[int] = set()
+
+        # high-water mark: every slot ever used is below this
+        self._size = 0
+        self._count = 0
+
+        self.stats = dict(objects=0, visible=0, synced=0, cull_ms=0.0)
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    @_check_types.do
+    def capacity(self) -> int:
+        return len(self._flags)
+
+    @_check_types.do
+    def _grow(self) -> None:
+        capacity = self.capacity
+        new_capacity = capacity * 2
+
+        for name in ('_centers', '_extents', '_positions'):
+            old = getattr(self, name)
+            new = np.zeros((new_capacity, 3), dtype=np.float32)
+            new[:capacity] = old
+            setattr(self, name, new)
+
+        flags = np.zeros(new_capacity, dtype=np.uint8)
+        flags[:capacity] = self._flags
+        self._flags = flags
+
+        lods = np.zeros(new_capacity, dtype=np.uint8)
+        lods[:capacity] = self._lods
+        self._lods = lods
+
+        self._out_index = np.zeros(new_capacity, dtype=np.int32)
+        self._out_key = np.zeros(new_capacity, dtype=np.float32)
+
+        self._refs.extend([None] * capacity)
+        self._views.extend([None] * capacity)
+        self._sources.extend([None] * capacity)
+
+    @_check_types.do
+    def add(self, obj_ref: weakref.ref, view_obj: "_objectsvar.BaseVar") -> int:
+        """
+        Give an object a slot.
+
+        :param obj_ref: Weak reference to the scene object (what
+                        :meth:`ref` hands back for the slot).
+        :param view_obj: The object's view the slot mirrors -- its ``aabb``,
+                         ``numpy_position`` and ``is_opaque`` arrays. The
+                         slot is registered in ``view_obj.scene_slots`` so
+                         the object can mark it dirty.
+        :returns: The slot number.
+        :rtype: int
+        """
+        if self._free:
+            slot = self._free.pop()
+        else:
+            if self._size == self.capacity:
+                self._grow()
+
+            slot = self._size
+            self._size += 1
+
+        self._refs[slot] = obj_ref
+        self._views[slot] = weakref.ref(view_obj)
+        self._sources[slot] = (view_obj.aabb, view_obj.numpy_position, view_obj.is_opaque)
+        self._dirty.add(slot)
+        self._count += 1
+
+        view_obj.scene_slots.append((self, slot))
+        return slot
+
+    @_check_types.do
+    def _unregister(self, slot: int) -> None:
+        view_ref = self._views[slot]
+        view_obj = None if view_ref is None else view_ref()
+
+        if view_obj is not None:
+            try:
+                view_obj.scene_slots.remove((self, slot))
+            except ValueError:
+                pass
+
+    @_check_types.do
+    def remove(self, slot: int) -> None:
+        """
+        Free *slot*.
+
+        :param slot: Slot returned by :meth:`add`.
+        """
+        if self._refs[slot] is None:
+            return
+
+        self._unregister(slot)
+
+        self._flags[slot] = 0
+        self._lods[slot] = 0
+        self._refs[slot] = None
+        self._views[slot] = None
+        self._sources[slot] = None
+        self._dirty.discard(slot)
+        self._free.append(slot)
+        self._count -= 1
+
+    @_check_types.do
+    def mark_dirty(self, slot: int) -> None:
+        """Re-read *slot* from its object at the next :meth:`cull`."""
+        self._dirty.add(slot)
+
+    @_check_types.do
+    def ref(self, slot: int) -> weakref.ref | None:
+        """Return the weak reference stored for *slot*."""
+        return self._refs[slot]
+
+    @_check_types.do
+    def clear(self) -> None:
+        """Free every slot."""
+        for slot in range(self._size):
+            self._unregister(slot)
+
+        self._flags[:] = 0
+        self._lods[:] = 0
+        self._refs = [None] * self.capacity
+        self._views = [None] * self.capacity
+        self._sources = [None] * self.capacity
+        self._free = []
+        self._dirty = set()
+        self._size = 0
+        self._count = 0
+
+    @_check_types.do
+    def sync(self) -> int:
+        """Copy every dirty slot from its object's arrays.
+
+        Runs at the start of :meth:`cull`; the copies are gathered into
+        one array per column and written with a single indexed assignment
+        each.
+
+        :returns: The number of slots copied.
+        :rtype: int
+        """
+        dirty = self._dirty
+        if not dirty:
+            return 0
+
+        self._dirty = set()
+
+        all_sources = self._sources
+        slots = []
+        sources = []
+
+        for slot in dirty:
+            source = all_sources[slot]
+            if source is not None:
+                slots.append(slot)
+                sources.append(source)
+
+        if not slots:
+            return 0
+
+        aabbs = np.array([source[0] for source in sources], dtype=np.float32)
+        aabb_min = aabbs[:, 0]
+        aabb_max = aabbs[:, 1]
+
+        centers = (aabb_min + aabb_max) * 0.5
+
+        # objects without a position of their own sort by their AABB center
+        positions = np.array([centers[i] if source[1] is None else source[1]
+                              for i, source in enumerate(sources)], dtype=np.float32)
+
+        flags = np.array([FLAG_ACTIVE | FLAG_OPAQUE if source[2][0] else FLAG_ACTIVE
+                          for source in sources], dtype=np.uint8)
+
+        self._centers[slots] = centers
+        self._extents[slots] = (aabb_max - aabb_min) * 0.5
+        self._positions[slots] = positions
+        self._flags[slots] = flags
+
+        return len(slots)
+
+    @_check_types.do
+    def cull(self, frustum_normals: np.ndarray, frustum_distances: np.ndarray,
+             camera_pos: np.ndarray) -> np.ndarray:
+        """
+        Return the slots inside the view frustum, in draw order: opaque
+        objects front-to-back, then transparent objects back-to-front.
+
+        :param frustum_normals: Camera frustum normals, shape ``(6, 3)``.
+        :param frustum_distances: Camera frustum distances, shape ``(6,)``.
+        :param camera_pos: Camera position, shape ``(3,)``.
+        :returns: Slot numbers, ``int32``.
+        :rtype: numpy.ndarray
+        """
+        start = time.perf_counter()
+
+        synced = self.sync()
+        size = self._size
+
+        out_index = self._out_index
+        out_key = self._out_key
+
+        opaque_count, transparent_count = _culling.cull_scene(
+            self._centers, self._extents, self._positions, self._flags, size,
+            np.ascontiguousarray(frustum_normals, dtype=np.float32),
+            np.ascontiguousarray(frustum_distances, dtype=np.float32),
+            np.ascontiguousarray(camera_pos, dtype=np.float32),
+            out_index, out_key)
+
+        opaque = out_index[:opaque_count]
+        opaque = opaque[np.argsort(out_key[:opaque_count])]
+
+        transparent = out_index[size - transparent_count:size]
+        transparent = transparent[np.argsort(out_key[size - transparent_count:size])]
+
+        slots = np.concatenate((opaque, transparent))
+
+        stats = self.stats
+        stats['objects'] = self._count
+        stats['visible'] = len(slots)
+        stats['synced'] = synced
+        stats['cull_ms'] = (time.perf_counter() - start) * 1000.0
+
+        return slots
+
+    @_check_types.do
+    def select_lod(self, slots: np.ndarray, camera_pos: np.ndarray,
+                   pixel_scale: float, screen_sizes: np.ndarray,
+                   hysteresis: float) -> np.ndarray:
+        """
+        Pick a level of detail for each of *slots* from its projected size.
+
+        An object's size on screen is its bounding sphere diameter (the
+        diagonal of its AABB) over its distance from the camera, times
+        *pixel_scale* -- the viewport height over ``2 * tan(fov / 2)``, so
+        the result is in pixels. Level *n* is used below
+        ``screen_sizes[n - 1]``.
+
+        Without hysteresis an object sitting on a threshold flips between
+        two levels every time the camera moves a hair. A slot only goes to
+        a coarser level once it is ``hysteresis`` (a fraction) below the
+        threshold and only comes back once it is that far above it;
+        anywhere in between it keeps the level it was drawn at last frame.
+
+        :param slots: Slots from :meth:`cull`.
+        :param camera_pos: Camera position, shape ``(3,)``.
+        :param pixel_scale: Pixels per unit of size at distance 1.
+        :param screen_sizes: Switch sizes in pixels, largest first.
+        :param hysteresis: Dead band around each size, as a fraction.
+        :returns: The level per slot, ``uint8``, in the order of *slots*.
+        :rtype: numpy.ndarray
+        """
+        if not len(slots) or not len(screen_sizes):
+            return np.zeros(len(slots), dtype=np.uint8)
+
+        offsets = self._centers[slots] - camera_pos
+        distances = np.maximum(np.sqrt(np.einsum('ij,ij->i', offsets, offsets)), 1e-6)
+
+        extents = self._extents[slots]
+        diameters = 2.0 * np.sqrt(np.einsum('ij,ij->i', extents, extents))
+
+        sizes = (diameters / distances * pixel_scale)[:, None]
+        screen_sizes = np.asarray(screen_sizes, dtype=np.float32)[None, :]
+
+        # the coarsest level the object must be at and the finest it may
+        # be at; the previous level clamped into that range
+        coarsest = np.count_nonzero(sizes < screen_sizes * (1.0 - hysteresis), axis=1)
+        finest = np.count_nonzero(sizes < screen_sizes * (1.0 + hysteresis), axis=1)
+
+        lods = np.clip(self._lods[slots], coarsest, finest).astype(np.uint8)
+        self._lods[slots] = lods
+
+        return lods
@@ -0,0 +1,212 @@
+# © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
+
+"""Per-frame grouping of repeated meshes into instanced draw calls."""
+
+from typing import Callable, TYPE_CHECKING
+
+import numpy as np
+from OpenGL import GL
+from PySide6.QtGui import QOpenGLContext
+
+from .. import config as _config
+from .. import check_types as _check_types
+from . import vbo as _vbo
+
+
+if TYPE_CHECKING:
+    from ..objects import objectsvar as _objectsvar
+
+
+_debug_config = _config.Config.debug.rendering3d
+
+
+class InstanceBatcher:
+    """
+    Draw every culled object that shares a pooled mesh as one instanced
+    group per frame.
+
+    :meth:`collect` splits the culled objects into the ones that can be grouped
+    (``BaseVar.instance_key()`` returned a key) and the ones the canvas
+    still has to render one by one. :meth:`flush` then packs every group's
+    transforms (``vbo.FLOATS_PER_INSTANCE`` floats per object) into one
+    streamed buffer and issues one ``glDrawArraysInstanced`` per group and
+    pass, instead of three uniform uploads plus one ``glDrawArrays`` per
+    object.
+
+    A group of one is handed back to the per-object path -- there is
+    nothing to save and the per-object path is the reference behaviour.
+
+    ``stats`` holds the counters of the last flushed frame: ``groups``,
+    ``instances`` (objects drawn through a group) and ``draw_calls`` (the
+    instanced calls issued over all passes).
+    """
+
+    @_check_types.do
+    def __init__(self):
+        self._groups: dict[tuple, list["_objectsvar.BaseVar"]] = {}
+        self._buffers: dict[int, int] = {}
+        self._locations: dict[tuple[int, str], int] = {}
+        self.stats = dict(groups=0, instances=0, draw_calls=0)
+
+    @_check_types.do
+    def collect(self, objs: list, get_view_object: Callable) -> tuple[list, list]:
+        """
+        Split *objs* (the culled scene objects, in draw order) into
+        instanced groups and the rest.
+
+        :param objs: Culled objects, as in ``CanvasBase._draw_scene``.
+        :param get_view_object: The canvas's ``_get_view_object``.
+        :returns: ``(remaining_objects, grouped_objects)``.
+        :rtype: tuple[list, list]
+        """
+        groups = self._groups
+        groups.clear()
+
+        # the normals debug pass has no instanced counterpart
+        if _debug_config.draw_normals:
+            return list(objs), []
+
+        remaining = []
+        members_by_key: dict[tuple, list[tuple]] = {}
+
+        for obj in objs:
+            view_obj = get_view_object(obj)
+            key = view_obj.instance_key()
+
+            if key is None:
+                remaining.append(obj)
+                continue
+
+            members_by_key.setdefault(key, []).append((obj, view_obj))
+
+        grouped = []
+        for key, members in members_by_key.items():
+            if len(members) == 1:
+                remaining.append(members[0][0])
+                continue
+
+            groups[key] = [view_obj for _, view_obj in members]
+            grouped.extend(obj for obj, _ in members)
+
+        return remaining, grouped
+
+    @_check_types.do
+    def _location(self, program: int, name: str) -> int:
+        key = (program, name)
+
+        loc = self._locations.get(key, None)
+        if loc is None:
+            loc = GL.glGetUniformLocation(program, name)
+            self._locations[key] = loc
+
+        return loc
+
+    @_check_types.do
+    def _upload(self) -> tuple[int, list[tuple[int, int]]]:
+        """Pack every group's transforms into this context's instance buffer.
+
+        :returns: The buffer id and ``(byte_offset, count)`` per group, in
+                  group order.
+        """
+        values = []
+        ranges = []
+        offset = 0
+
+        for members in self._groups.values():
+            for obj in members:
+                values.extend(obj._position.as_float)  # NOQA
+                values.extend(obj._angle.as_quat_float)  # NOQA
+                values.extend(obj._scale.as_float)  # NOQA
+
+            ranges.append((offset, len(members)))
+            offset += len(members) * _vbo.INSTANCE_STRIDE_BYTES
+
+        data = np.array(values, dtype=np.float32)
+
+        ctx_id = id(QOpenGLContext.currentContext())
+        buffer_id = self._buffers.get(ctx_id, None)
+        if buffer_id is None:
+            buffer_id = int(GL.glGenBuffers(1))
+            self._buffers[ctx_id] = buffer_id
+
+        # orphan + refill: the driver hands back fresh storage instead of
+        # stalling on last frame's draws still reading the old contents.
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, buffer_id)
+        GL.glBufferData(GL.GL_ARRAY_BUFFER, data.nbytes, data, GL.GL_STREAM_DRAW)
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
+
+        return buffer_id, ranges
+
+    @_check_types.do
+    def _draw_pass(self, program: int, buffer_id: int, ranges: list[tuple[int, int]],
+                   material_func: Callable | None, with_normals: bool) -> int:
+        instance_loc = self._location(program, 'useInstanceTransform')
+        normal_loc = self._location(program, 'normalMode') if with_normals else None
+
+        GL.glUseProgram(program)
+        GL.glUniform1i(instance_loc, 1)
+
+        draw_calls = 0
+        for (offset, count), members in zip(ranges, self._groups.values()):
+            first = members[0]
+
+            if material_func is not None:
+                material_func(first).set(program)
+
+            first.lod_vbo.render_instanced(
+                normal_loc, first.smooth, buffer_id, offset, count)
+
+            draw_calls += 1
+
+        GL.glUniform1i(instance_loc, 0)
+        GL.glUseProgram(0)
+
+        return draw_calls
+
+    @_check_types.do
+    def flush(self, faces_program: int, edges_program: int, vertices_program: int):
+        """Draw every collected group, mirroring the passes of ``BaseVar.render``."""
+        stats = self.stats
+
+        if not self._groups:
+            stats.update(groups=0, instances=0, draw_calls=0)
+            return
+
+        buffer_id, ranges = self._upload()
+        draw_calls = 0
+
+        if _debug_config.draw_faces:
+            draw_calls += self._draw_pass(
+                faces_program, buffer_id, ranges, lambda obj: obj.material, True)
+
+        if _debug_config.draw_edges:
+            GL.glUseProgram(edges_program)
+            GL.glUniform1i(self._location(edges_program, 'renderMode'), 0)
+
+            draw_calls += self._draw_pass(
+                edges_program, buffer_id, ranges, lambda obj: obj._edge_material(), True)  # NOQA
+
+        if _debug_config.draw_vertices:
+            GL.glUseProgram(vertices_program)
+            GL.glUniform3f(self._location(vertices_program, 'vertexColor'),
+                           *_debug_config.vertices_color)
+
+            draw_calls += self._draw_pass(vertices_program, buffer_id, ranges, None, False)
+
+        stats.update(groups=len(self._groups),
+                     instances=sum(count for _, count in ranges),
+                     draw_calls=draw_calls)
+
+        self._groups.clear()
+
+    @_check_types.do
+    def release(self):
+        """Delete the instance buffer of the current context."""
+        ctx_id = id(QOpenGLContext.currentContext())
+
+        buffer_id = self._buffers.pop(ctx_id, None)
+        if buffer_id is not None:
+            try:
+                GL.glDeleteBuffers(1, [buffer_id])
+            except Exception:  # NOQA
+                pass
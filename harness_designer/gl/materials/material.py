@@ -83,6 +83,19 @@ class GLMaterial:
         """
         return self._color.rgba_scalar
 
+    @property
+    @_check_types.do
+    def batch_key(self) -> tuple:
+        """Return a hashable key that is equal for materials that set
+        identical shader uniforms.
+
+        Used to group objects into one instanced draw (see
+        ``gl/instancing.py``) -- two materials with the same key are
+        interchangeable for :meth:`set`.
+        """
+        return (type(self), self.ambient.tobytes(), self.diffuse.tobytes(),
+                self.specular.tobytes(), self.shininess, self.emissive.tobytes())
+
     @property
     @_check_types.do
     def is_opaque(self):
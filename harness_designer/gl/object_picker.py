@@ -136,59 +136,50 @@ def _ray_intersect_obb(orig, direc, obb, t0=0.0, t1=inf):
 
 
 @_check_types.do
-def _aabb_screen_bbox_and_depth(bboxes, camera: "_camera3d.Camera | _camera2d.Camera"):
+def _aabb_screen_bbox_and_depth(boxes, camera: "_camera3d.Camera | _camera2d.Camera"):
     """
-    Build a 2D screen bbox from projecting ALL 8 AABB corners.
+    Build a 2D screen bbox per box from projecting ALL 8 corners of each.
     This is necessary for stability across camera yaw/pitch.
-    """
-    screen_pts = []
-    depths = []
-    any_in_front = False
 
+    :param boxes: Box corners, shape ``(n, 8, 3)``.
+    :returns: Screen bboxes ``(minx, miny, maxx, maxy)`` shape ``(n, 4)``,
+              the depth metric per box (closest in-front corner if there
+              is one, else ``inf``) and a mask of the boxes with at least
+              one projectable corner.
+    """
     mv = camera.modelview
     pj = camera.projection
-    viewport = camera.viewport
+    vx, vy, vw, vh = camera.viewport
 
-    for corner in bboxes:
+    count = len(boxes)
+    corners = np.ones((count * 8, 4), dtype=np.float32)
+    corners[:, :3] = np.asarray(boxes, dtype=np.float32).reshape(-1, 3)
 
-        v = np.array([corner[0], corner[1], corner[2], 1.0], dtype=np.float32)
-        eye = mv.dot(v)
-        clip = pj.dot(eye)
+    # every corner of every box through MV and P in two matrix products
+    eye = corners @ mv.T
+    clip = eye @ pj.T
 
-        w = clip[3]
-        if np.isclose(w, 0.0):
-            continue
+    w = clip[:, 3]
+    valid = ~np.isclose(w, 0.0)
+    ndc = clip[:, :3] / np.where(valid, w, 1.0)[:, None]
 
-        ndc = clip[:3] / w
-        vx, vy, vw, vh = viewport
+    winx = vx + (ndc[:, 0] + 1.0) * vw * 0.5
+    winy = vh - (vy + (ndc[:, 1] + 1.0) * vh * 0.5)
 
-        winx = vx + (ndc[0] + 1.0) * vw * 0.5
-        winy = vy + (ndc[1] + 1.0) * vh * 0.5
-        winz = (ndc[2] + 1.0) * 0.5
+    valid = valid.reshape(count, 8)
+    winx = winx.reshape(count, 8)
+    winy = winy.reshape(count, 8)
 
-        winy = viewport[3] - winy
+    bboxes = np.stack((np.where(valid, winx, inf).min(axis=1),
+                       np.where(valid, winy, inf).min(axis=1),
+                       np.where(valid, winx, -inf).max(axis=1),
+                       np.where(valid, winy, -inf).max(axis=1)), axis=1)
 
-        screen_pts.append((winx, winy, winz))
+    # depth metric: closest in-front corner if possible
+    eye_z = eye[:, 2].reshape(count, 8)
+    depths = np.where(valid & (eye_z < 0), -eye_z, inf).min(axis=1)
 
-        eye_z = eye[2]
-        if eye_z < 0:
-            any_in_front = True
-            depths.append(-eye_z)
-        else:
-            depths.append(inf)
-
-        xs = [p[0] for p in screen_pts]
-        ys = [p[1] for p in screen_pts]
-
-        bbox2d = (min(xs), min(ys), max(xs), max(ys))
-
-        # depth metric: closest in-front corner if possible
-        if any_in_front:
-            depth_metric = float(min(d for d in depths if d != inf))
-        else:
-            depth_metric = float(min(depths))
-
-        yield bbox2d, depth_metric
+    return bboxes, depths, valid.any(axis=1)
 
 
 @_debug.logfunc
@@ -207,34 +198,75 @@ def _pick_candidates_at_mouse(mx, my, scene_objects,
     must state explicitly which view object it means to pick against, so
     a caller can never silently collect the wrong one (e.g. a 2D-plane
     editor accidentally picking against ``obj3d``).
-    Returns list of (depth_metric, object, bbox2d) sorted by depth (closest first)
-    """
 
-    mx_screen = mx
-    my_screen = my
+    This is the screen space path, for when the canvas's
+    :class:`gl.pick_bvh.PickBVH` can't answer (no ray, or *get_view*
+    isn't the canvas's own view); see :func:`find_object`.
+
+    Returns list of (depth_metric, object) sorted by depth (closest first)
+    """
+    objects = []
+    boxes = []
 
-    candidates = []
     for obj in scene_objects:
-        wrapped = get_view(obj)
-        if wrapped.obb is None:
+        obb = get_view(obj).obb
+        if obb is None:
             continue
 
-        for (minx, miny, maxx, maxy), depth in (
-            _aabb_screen_bbox_and_depth(wrapped.obb, camera)
-        ):
+        objects.append(obj)
+        boxes.append(obb)
+
+    if not objects:
+        return []
 
-            if (
-                minx - tol_pixels <= mx_screen <= maxx + tol_pixels and
-                miny - tol_pixels <= my_screen <= maxy + tol_pixels
-            ):
+    bboxes, depths, valid = _aabb_screen_bbox_and_depth(np.array(boxes, dtype=np.float32), camera)
 
-                candidates.append((depth, obj))
+    under_mouse = (
+        valid &
+        (bboxes[:, 0] - tol_pixels <= mx) & (mx <= bboxes[:, 2] + tol_pixels) &
+        (bboxes[:, 1] - tol_pixels <= my) & (my <= bboxes[:, 3] + tol_pixels)
+    )
 
+    candidates = [(float(depths[i]), objects[i]) for i in np.flatnonzero(under_mouse)]
     candidates.sort(key=lambda k: k[0])
 
     return candidates
 
 
+@_check_types.do
+def _mouse_ray(mx, my, camera: "_camera3d.Camera | _camera2d.Camera"):
+    """The world space ray under the mouse as ``(origin, direction)``, or
+    ``(None, None)`` if it can't be unprojected."""
+    pj = camera.projection
+    mv = camera.modelview
+    viewport = camera.viewport
+
+    # compute inv(P * MV)
+    mvp = pj.dot(mv)  # row-major
+    inv_mvp = np.linalg.inv(mvp)
+    vx, vy, vw, vh = viewport
+
+    # convert mouse to GL bottom-left origin:
+    wx = mx
+    wy = (vh - my)
+
+    # map to NDC
+    ndc_x = (2.0 * (wx - vx) / vw) - 1.0
+    ndc_y = (2.0 * (wy - vy) / vh) - 1.0
+
+    # near: z = -1 (OpenGL NDC), far z = +1
+    near_world = _unproject_from_ndc((ndc_x, ndc_y, -1.0), inv_mvp)
+    far_world = _unproject_from_ndc((ndc_x, ndc_y, 1.0), inv_mvp)
+    if near_world is None or far_world is None:
+        return None, None
+
+    origin = np.array(near_world, dtype=np.float32)
+    direc = np.array(far_world, dtype=np.float32) - origin
+    direc /= np.linalg.norm(direc)
+
+    return origin, direc
+
+
 @_debug.logfunc
 @_check_types.do
 def find_object(mouse_pos, scene_objects, camera: "_camera3d.Camera | _camera2d.Camera",
@@ -267,39 +299,28 @@ def find_object(mouse_pos, scene_objects, camera: "_camera3d.Camera | _camera2d.
     """
     mx, my = mouse_pos.as_float[:-1]
 
-    pj = camera.projection
-    mv = camera.modelview
-    viewport = camera.viewport
+    # Build ray once
+    origin, direc = _mouse_ray(mx, my, camera)
 
-    candidates = _pick_candidates_at_mouse(mx, my, scene_objects, camera, get_view=get_view)
+    # The canvas keeps every object's AABB in a BVH (gl.pick_bvh), so the
+    # candidates are just the objects whose AABB the ray passes through --
+    # the same set the screen space test below narrows down to once the
+    # exact tests have run, since hit_test_step3's triangles all sit
+    # inside the AABB. The screen space test is left for callers the
+    # index can't serve (see PickBVH.pick_candidates) and for when there
+    # is no ray.
+    candidates = None
 
-    if not candidates:
-        return None
+    index = getattr(getattr(camera, 'canvas', None), 'pick_bvh', None)
+    if index is not None and origin is not None:
+        candidates = index.pick_candidates(origin, direc, scene_objects, get_view)
 
-    # compute inv(P * MV)
-    mvp = pj.dot(mv)  # row-major
-    inv_mvp = np.linalg.inv(mvp)
-    vx, vy, vw, vh = viewport
-
-    # convert mouse to GL bottom-left origin:
-    wx = mx
-    wy = (vh - my)
-
-    # map to NDC
-    ndc_x = (2.0 * (wx - vx) / vw) - 1.0
-    ndc_y = (2.0 * (wy - vy) / vh) - 1.0
+    if candidates is None:
+        candidates = _pick_candidates_at_mouse(mx, my, scene_objects, camera, get_view=get_view)
 
-    # near: z = -1 (OpenGL NDC), far z = +1
-    near_world = _unproject_from_ndc((ndc_x, ndc_y, -1.0), inv_mvp)
-    far_world = _unproject_from_ndc((ndc_x, ndc_y, 1.0), inv_mvp)
-    if near_world is None or far_world is None:
-        origin = direc = None
-    else:
-        origin = np.array(near_world, dtype=np.float32)
-        direc = np.array(far_world, dtype=np.float32) - origin
-        direc /= np.linalg.norm(direc)
+    if not candidates:
+        return None
 
-    # Build ray once
     if origin is None:
         # fallback: just pick first candidate
         return candidates[0][1]
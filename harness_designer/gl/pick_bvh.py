@@ -0,0 +1,550 @@
+# © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
+
+"""Persistent bounding volume hierarchy over scene objects for mouse picking."""
+
+from typing import Callable
+
+import math
+import time
+import weakref
+import numpy as np
+
+from .. import check_types as _check_types
+
+
+# objects per leaf
+LEAF_SIZE = 8
+
+# objects added since the last build are tested one by one until there are
+# more than this many of them (or an eighth of the scene), then the tree is
+# rebuilt with them in it; the same goes for slots freed since the build
+_PENDING_LIMIT = 64
+
+# query tests the top of the tree down to the first level with at most this
+# many nodes in one go; walking those levels one by one costs more than
+# testing the nodes
+_TOP_NODES = 64
+
+# a refit that leaves the leaves this many times the surface area they had
+# when built (objects dragged far from their neighbours) rebuilds instead
+_REBUILD_AREA_RATIO = 2.0
+
+
+_PAIR = np.arange(2, dtype=np.int32)
+_LEAF_ROWS = np.arange(LEAF_SIZE, dtype=np.int32)
+
+
+@_check_types.do
+def _spread_bits(values: np.ndarray) -> np.ndarray:
+    # 10 bit integers -> every third bit of a 30 bit Morton code
+    values = values.astype(np.uint32)
+    values = (values | (values << 16)) & 0x030000FF
+    values = (values | (values << 8)) & 0x0300F00F
+    values = (values | (values << 4)) & 0x030C30C3
+    values = (values | (values << 2)) & 0x09249249
+    return values
+
+
+@_check_types.do
+def _surface_areas(boxes: np.ndarray) -> np.ndarray:
+    # half the surface area of each packed box, 0 for an empty one
+    extents = np.maximum(-boxes[:, 3:] - boxes[:, :3], 0.0)
+    return (extents[:, 0] * extents[:, 1] +
+            extents[:, 1] * extents[:, 2] +
+            extents[:, 2] * extents[:, 0])
+
+
+@_check_types.do
+def _ray_boxes(origin: np.ndarray, inv_direction: np.ndarray,
+               boxes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Slab test one ray against many packed boxes (see :class:`PickBVH`).
+
+    An empty box (all ``inf``: a freed slot, a node with nothing under it)
+    never hits. An axis the ray runs parallel to has an infinite inverse,
+    which gives ``-inf``/``inf`` slab distances when the origin is inside
+    the slab and a miss when it isn't. Run under
+    ``np.errstate(invalid='ignore')``.
+
+    :returns: Hit mask and the distance along the ray where each box is
+              entered (0 when the origin is inside it).
+    """
+    near = (boxes[:, :3] - origin) * inv_direction
+    far = (boxes[:, 3:] + origin) * -inv_direction
+
+    enter = np.minimum(near, far).max(axis=1)
+    leave = np.maximum(near, far).min(axis=1)
+
+    np.maximum(enter, 0.0, out=enter)
+    hit = (enter <= leave) & (boxes[:, 0] + boxes[:, 3] <= 0.0)
+
+    return hit, enter
+
+
+class PickBVH:
+    """
+    Every object a canvas can pick, indexed by its world space AABB.
+
+    ``gl.object_picker.find_object`` used to project all eight OBB corners
+    of every object in view to the screen on every hover, then ray test
+    whatever landed under the cursor. This keeps the AABBs in a binary tree
+    instead, so a pick walks down the few branches the mouse ray passes
+    through and only the objects at the bottom of those get the exact
+    OBB/mesh test.
+
+    Like :class:`gl.culling.SceneBuffer` each object owns a stable *slot*
+    in the ``boxes`` column, registered in its view's
+    ``scene_slots`` so ``BaseVar._mark_scene_dirty`` reports every AABB
+    change here as well; dirty slots are re-read at the next query.
+
+    The tree is a linear BVH: slots sorted along a Morton curve through
+    their centers, cut into leaves of :data:`LEAF_SIZE` and paired up
+    level by level into a complete binary tree, so each level is one array
+    and building and walking it are a handful of whole-array operations
+    per level rather than a loop over nodes. The few nodes at the top are
+    tested all at once instead of level by level (see :data:`_TOP_NODES`).
+
+    Every box -- slot, row or node -- is packed into 6 floats, the minimum
+    corner followed by the *negated* maximum corner, so merging boxes is
+    a single ``np.minimum`` over both halves and an empty box is all
+    ``inf``, which merges away for free.
+
+    A moved object refits only its own leaf and the leaf's ancestors; the
+    order is kept. Objects added since the last build are tested on their
+    own until there are enough of them to make a rebuild worth it, and a
+    freed slot is an empty box (it never hits) until another object takes
+    it over. A refit that loosens the leaves too much rebuilds.
+
+    ``stats`` holds the counters of the last query: ``objects`` in the
+    index, ``candidates`` it returned, ``synced`` (dirty slots copied),
+    ``rebuilt`` (bool) and ``query_ms``.
+    """
+
+    @_check_types.do
+    def __init__(self, get_view: Callable, capacity: int = 1024):
+        """
+        :param get_view: The canvas's own view lookup (``obj.obj3d``,
+                         ``obj.objschematic``, ...), used for every
+                         object added.
+        :param capacity: Initial number of slots.
+        """
+        capacity = max(1, capacity)
+
+        self._get_view = get_view
+
+        # packed (min x, y, z, -max x, y, z) per slot; empty is all inf
+        self._boxes = np.full((capacity, 6), np.inf, dtype=np.float32)
+
+        # per slot: the object's weak reference, a weak reference to the
+        # view the slot mirrors and that view's live aabb array
+        self._refs: list[weakref.ref | None] = [None] * capacity
+        self._views: list[weakref.ref | None] = [None] * capacity
+        self._sources: list[np.ndarray | None] = [None] * capacity
+
+        self._free: list[int] = []
+        self._dirty: set[int] = set()
+
+        # high-water mark: every slot ever used is below this
+        self._size = 0
+        self._count = 0
+
+        self._reset_tree()
+
+        # scene_objects list -> set, for the membership test in
+        # pick_candidates; callers pass the same list until the next frame
+        self._members_source: list | None = None
+        self._members_len = 0
+        self._members: set = set()
+
+        self.stats = dict(objects=0, candidates=0, synced=0, rebuilt=False, query_ms=0.0)
+
+    @_check_types.do
+    def _reset_tree(self) -> None:
+        # slots [0, _tree_size) are in the tree; _order lists them in leaf
+        # order and _rows is the inverse (slot -> row). The rows' boxes are
+        # copied into _row_boxes (padded to whole leaves), the node boxes of
+        # every level are in _levels, root first, leaves last.
+        self._order = np.zeros(0, dtype=np.int32)
+        self._rows = np.zeros(0, dtype=np.int32)
+        self._tree_size = 0
+        self._row_boxes = np.zeros((0, 6), dtype=np.float32)
+        self._levels: list[np.ndarray] = []
+
+        # first level walked by query and its nodes, see _TOP_NODES
+        self._top_level = 0
+        self._top_nodes = np.zeros(1, dtype=np.int32)
+
+        # leaves whose rows changed since the last refit
+        self._stale_leaves: list[np.ndarray] = []
+
+        self._leaf_areas = np.zeros(0, dtype=np.float32)
+        self._area = 0.0
+        self._built_area = 0.0
+        self._removed = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    @_check_types.do
+    def capacity(self) -> int:
+        return len(self._boxes)
+
+    @_check_types.do
+    def _grow(self) -> None:
+        capacity = self.capacity
+
+        boxes = np.full((capacity * 2, 6), np.inf, dtype=np.float32)
+        boxes[:capacity] = self._boxes
+        self._boxes = boxes
+
+        self._refs.extend([None] * capacity)
+        self._views.extend([None] * capacity)
+        self._sources.extend([None] * capacity)
+
+    @_check_types.do
+    def add(self, obj) -> int | None:
+        """
+        Give *obj* a slot.
+
+        :param obj: Scene object; its view (see ``get_view``) is what
+                    gets indexed and registered for dirty notifications.
+        :returns: The slot number, or ``None`` if *obj* has no view here.
+        :rtype: int | None
+        """
+        view_obj = self._get_view(obj)
+        if view_obj is None:
+            return None
+
+        if self._free:
+            slot = self._free.pop()
+        else:
+            if self._size == self.capacity:
+                self._grow()
+
+            slot = self._size
+            self._size += 1
+
+        self._refs[slot] = weakref.ref(obj)
+        self._views[slot] = weakref.ref(view_obj)
+        self._sources[slot] = view_obj.aabb
+        self._dirty.add(slot)
+        self._count += 1
+
+        view_obj.scene_slots.append((self, slot))
+        return slot
+
+    @_check_types.do
+    def _unregister(self, slot: int) -> None:
+        view_ref = self._views[slot]
+        view_obj = None if view_ref is None else view_ref()
+
+        if view_obj is not None:
+            try:
+                view_obj.scene_slots.remove((self, slot))
+            except ValueError:
+                pass
+
+    @_check_types.do
+    def remove(self, slot: int) -> None:
+        """
+        Free *slot*.
+
+        :param slot: Slot returned by :meth:`add`.
+        """
+        if self._refs[slot] is None:
+            return
+
+        self._unregister(slot)
+
+        self._refs[slot] = None
+        self._views[slot] = None
+        self._sources[slot] = None
+        self._dirty.discard(slot)
+        self._free.append(slot)
+        self._count -= 1
+        self._removed += 1
+
+        self._write(np.array([slot], dtype=np.int32),
+                    np.full((1, 6), np.inf, dtype=np.float32))
+
+    @_check_types.do
+    def mark_dirty(self, slot: int) -> None:
+        """Re-read *slot* from its object at the next query."""
+        self._dirty.add(slot)
+
+    @_check_types.do
+    def clear(self) -> None:
+        """Free every slot and drop the tree."""
+        for slot in range(self._size):
+            self._unregister(slot)
+
+        self._boxes[:] = np.inf
+        self._refs = [None] * self.capacity
+        self._views = [None] * self.capacity
+        self._sources = [None] * self.capacity
+        self._free = []
+        self._dirty = set()
+        self._size = 0
+        self._count = 0
+
+        self._reset_tree()
+
+        self._members_source = None
+        self._members_len = 0
+        self._members = set()
+
+    @_check_types.do
+    def _write(self, slots: np.ndarray, boxes: np.ndarray) -> None:
+        # new packed boxes for *slots*; the ones in the tree are copied to
+        # their rows and their leaves queued for the next refit
+        self._boxes[slots] = boxes
+
+        in_tree = slots < self._tree_size
+        if not in_tree.any():
+            return
+
+        rows = self._rows[slots[in_tree]]
+        self._row_boxes[rows] = boxes[in_tree]
+        self._stale_leaves.append(rows // LEAF_SIZE)
+
+    @_check_types.do
+    def _sync(self) -> int:
+        # copy every dirty slot from its view's aabb array; a view without
+        # one (legacy 2D objects have none) stays empty and never hits
+        dirty = self._dirty
+        if not dirty:
+            return 0
+
+        self._dirty = set()
+
+        all_sources = self._sources
+        slots = []
+        aabbs = []
+
+        for slot in dirty:
+            source = all_sources[slot]
+            if source is None:
+                continue
+
+            slots.append(slot)
+            aabbs.append(source)
+
+        if not slots:
+            return 0
+
+        aabbs = np.array(aabbs, dtype=np.float32)
+        boxes = np.concatenate((aabbs[:, 0], -aabbs[:, 1]), axis=1)
+        self._write(np.array(slots, dtype=np.int32), boxes)
+
+        return len(slots)
+
+    @_check_types.do
+    def _refit(self) -> None:
+        # recompute the stale leaves from their rows, then their ancestors
+        # one level at a time; a node listed twice is just written twice
+        if not self._stale_leaves:
+            return
+
+        nodes = np.concatenate(self._stale_leaves)
+        self._stale_leaves = []
+
+        level = len(self._levels) - 1
+
+        boxes = self._row_boxes.reshape(-1, LEAF_SIZE, 6)[nodes].min(axis=1)
+        self._levels[level][nodes] = boxes
+
+        areas = _surface_areas(boxes)
+        nodes, first = np.unique(nodes, return_index=True)
+        self._area += float(areas[first].sum() - self._leaf_areas[nodes].sum())
+        self._leaf_areas[nodes] = areas[first]
+
+        while level:
+            children = self._levels[level].reshape(-1, 2, 6)
+
+            nodes >>= 1
+            level -= 1
+
+            self._levels[level][nodes] = children[nodes].min(axis=1)
+
+    @_check_types.do
+    def _build(self) -> None:
+        size = self._size
+        boxes = self._boxes[:size]
+
+        valid = boxes[:, 0] + boxes[:, 3] <= 0.0
+        codes = np.full(size, 0xFFFFFFFF, dtype=np.uint32)
+
+        if valid.any():
+            centers = (boxes[valid, :3] - boxes[valid, 3:]) * 0.5
+            low = centers.min(axis=0)
+            span = np.maximum(centers.max(axis=0) - low, 1e-6)
+            cells = ((centers - low) / span * 1023.0).astype(np.uint32)
+
+            codes[valid] = ((_spread_bits(cells[:, 0]) << 2) |
+                            (_spread_bits(cells[:, 1]) << 1) |
+                            _spread_bits(cells[:, 2]))
+
+        # empty slots sort to the end, where they fill up the last leaves
+        order = np.argsort(codes, kind='stable').astype(np.int32)
+
+        rows = np.empty(size, dtype=np.int32)
+        rows[order] = np.arange(size, dtype=np.int32)
+
+        depth = math.ceil(math.log2(max(1, math.ceil(size / LEAF_SIZE))))
+        leaf_count = 1 << depth
+
+        row_boxes = np.full((leaf_count * LEAF_SIZE, 6), np.inf, dtype=np.float32)
+        row_boxes[:size] = boxes[order]
+
+        level = row_boxes.reshape(leaf_count, LEAF_SIZE, 6).min(axis=1)
+
+        self._leaf_areas = _surface_areas(level)
+        self._area = self._built_area = float(self._leaf_areas.sum())
+
+        levels = [level]
+        while len(level) > 1:
+            level = level.reshape(-1, 2, 6).min(axis=1)
+            levels.insert(0, level)
+
+        self._levels = levels
+
+        # the deepest level still small enough to test whole
+        self._top_level = min(depth, int(math.log2(_TOP_NODES)))
+        self._top_nodes = np.arange(1 << self._top_level, dtype=np.int32)
+
+        self._order = order
+        self._rows = rows
+        self._tree_size = size
+        self._row_boxes = row_boxes
+        self._stale_leaves = []
+        self._removed = 0
+
+    @_check_types.do
+    def _update(self) -> tuple[int, bool]:
+        synced = self._sync()
+
+        limit = max(_PENDING_LIMIT, self._count // 8)
+        rebuild = (
+            not self._levels or
+            self._size - self._tree_size > limit or
+            self._removed > limit
+        )
+
+        if not rebuild:
+            self._refit()
+            rebuild = self._area > self._built_area * _REBUILD_AREA_RATIO + 1e-6
+
+        if rebuild and self._size:
+            self._build()
+
+        return synced, rebuild
+
+    @_check_types.do
+    def query(self, origin: np.ndarray, direction: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Every slot whose AABB the ray from *origin* along *direction*
+        passes through, nearest entry first.
+
+        :returns: The slots (``int32``) and the ray distance at which each
+                  box is entered.
+        :rtype: tuple[numpy.ndarray, numpy.ndarray]
+        """
+        start = time.perf_counter()
+
+        synced, rebuilt = self._update()
+
+        origin = np.asarray(origin, dtype=np.float32)
+        found = []
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            inv_direction = 1.0 / np.asarray(direction, dtype=np.float32)
+
+            if self._tree_size:
+                levels = self._levels
+                last = len(levels) - 1
+                nodes = self._top_nodes
+
+                for level in range(self._top_level, last + 1):
+                    hit, _ = _ray_boxes(origin, inv_direction, levels[level][nodes])
+                    nodes = nodes[hit]
+
+                    if not len(nodes):
+                        break
+
+                    if level < last:
+                        nodes = (nodes[:, None] * 2 + _PAIR).ravel()
+
+                if len(nodes):
+                    rows = (nodes[:, None] * LEAF_SIZE + _LEAF_ROWS).ravel()
+                    found.append(self._order[rows[rows < self._tree_size]])
+
+            # added since the last build, not in the tree yet
+            if self._size > self._tree_size:
+                found.append(np.arange(self._tree_size, self._size, dtype=np.int32))
+
+            if found:
+                slots = np.concatenate(found)
+                hit, enter = _ray_boxes(origin, inv_direction, self._boxes[slots])
+                slots = slots[hit]
+                enter = enter[hit]
+
+                order = np.argsort(enter, kind='stable')
+                slots = slots[order]
+                enter = enter[order]
+            else:
+                slots = np.zeros(0, dtype=np.int32)
+                enter = np.zeros(0, dtype=np.float32)
+
+        stats = self.stats
+        stats['objects'] = self._count
+        stats['candidates'] = len(slots)
+        stats['synced'] = synced
+        stats['rebuilt'] = rebuilt
+        stats['query_ms'] = (time.perf_counter() - start) * 1000.0
+
+        return slots, enter
+
+    @_check_types.do
+    def pick_candidates(self, origin: np.ndarray, direction: np.ndarray,
+                        scene_objects, get_view: Callable) -> list | None:
+        """
+        The objects of *scene_objects* whose AABB the ray hits, as
+        ``(distance, object)`` nearest first -- the candidate list
+        ``gl.object_picker.find_object`` runs its exact tests on.
+
+        :param scene_objects: The objects the caller is picking among;
+                              anything else the ray hits is left out.
+        :param get_view: The caller's view lookup. If it doesn't hand back
+                         the view this index was built from (a caller
+                         picking against another editor's views) the index
+                         can't answer and ``None`` is returned.
+        :rtype: list | None
+        """
+        if not isinstance(scene_objects, list):
+            scene_objects = list(scene_objects)
+
+        if not scene_objects:
+            return []
+
+        first = scene_objects[0]
+        if get_view(first) is not self._get_view(first):
+            return None
+
+        if scene_objects is not self._members_source or len(scene_objects) != self._members_len:
+            self._members_source = scene_objects
+            self._members_len = len(scene_objects)
+            self._members = set(scene_objects)
+
+        members = self._members
+        refs = self._refs
+        candidates = []
+
+        for slot, distance in zip(*self.query(origin, direction)):
+            obj_ref = refs[slot]
+            obj = None if obj_ref is None else obj_ref()
+
+            if obj is not None and obj in members:
+                candidates.append((float(distance), obj))
+
+        return candidates
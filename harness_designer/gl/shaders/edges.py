@@ -11,6 +11,7 @@ VERTEX_SHADER = """
 
 layout(location = 0) in vec3 in_vertexLocal;
 layout(location = 1) in vec3 in_smoothNormalLocal;
+// Unused, see gl.shaders.faces.
 layout(location = 2) in vec3 in_faceNormalLocal;
 
 uniform mat4 projection;
@@ -18,6 +19,12 @@ uniform mat4 view;
 uniform vec3 objectPosition;
 uniform vec4 objectRotation;
 uniform vec3 objectScale;
+
+// See gl.shaders.faces' identical instance attributes.
+layout(location = 3) in vec3 in_instancePosition;
+layout(location = 4) in vec4 in_instanceRotation;
+layout(location = 5) in vec3 in_instanceScale;
+uniform int useInstanceTransform;
 uniform int normalMode;
 
 // See gl.shaders.faces' identical uniforms -- WireStripe.render_segment
@@ -56,19 +63,24 @@ mat3 quaternionToMatrix(vec4 q) {
 }
 
 void main() {
+    bool instanced = useInstanceTransform == 1;
+    vec3 transformPosition = instanced ? in_instancePosition : objectPosition;
+    vec4 transformRotation = instanced ? in_instanceRotation : objectRotation;
+    vec3 transformScale = instanced ? in_instanceScale : objectScale;
+
     // See gl.shaders.faces' identical vertex shader for the full
     // explanation -- same stripe-geometry special case duplicated here.
-    vec3 effectiveScale = stripeClipStop > 0.0 ? vec3(objectScale.xy, 1.0) : objectScale;
+    vec3 effectiveScale = stripeClipStop > 0.0 ? vec3(transformScale.xy, 1.0) : transformScale;
 
     vec3 scaledVertex = stripeClipStop > 0.0
-        ? vec3(in_vertexLocal.xy * objectScale.xy, in_vertexLocal.z - stripeClipStart)
+        ? vec3(in_vertexLocal.xy * transformScale.xy, in_vertexLocal.z - stripeClipStart)
         : in_vertexLocal * effectiveScale;
-    mat3 rotationMatrix = quaternionToMatrix(objectRotation);
+    mat3 rotationMatrix = quaternionToMatrix(transformRotation);
     vec3 rotatedVertex = rotationMatrix * scaledVertex;
-    vec3 worldPosition = rotatedVertex + objectPosition;
+    vec3 worldPosition = rotatedVertex + transformPosition;
 
-    vec3 in_normalLocal = normalMode == 0 ? in_smoothNormalLocal : in_faceNormalLocal;
-    vec3 scaledNormal = in_normalLocal / effectiveScale;
+    // smooth normal only -- flat normals are derived in the geometry shader
+    vec3 scaledNormal = in_smoothNormalLocal / effectiveScale;
     vec3 worldNormal = rotationMatrix * scaledNormal;
 
     gl_Position = projection * view * vec4(worldPosition, 1.0);
@@ -94,6 +106,16 @@ uniform mat4 projection;
 uniform mat4 view;
 uniform int renderMode;      // 0 = edges, 1 = normals
 uniform float normalLength;
+uniform int normalMode;
+
+// See gl.shaders.faces' identical geometry shader function.
+vec3 flatNormal() {
+    vec3 faceNormal = cross(fragPositionWorld[1] - fragPositionWorld[0],
+                            fragPositionWorld[2] - fragPositionWorld[0]);
+    float faceNormalLength = length(faceNormal);
+
+    return faceNormalLength > 0.0 ? faceNormal / faceNormalLength : vec3(0.0);
+}
 
 void emitEdges() {
     // Emit three edges of the triangle as line segments
@@ -113,8 +135,11 @@ void emitEdges() {
 }
 
 void emitNormals() {
+    vec3 faceNormal = flatNormal();
+
     for (int i = 0; i < 3; i++) {
-        vec3 normalEnd = fragPositionWorld[i] + fragNormalWorld[i] * normalLength;
+        vec3 normal = normalMode == 0 ? fragNormalWorld[i] : faceNormal;
+        vec3 normalEnd = fragPositionWorld[i] + normal * normalLength;
 
         gl_Position = gl_in[i].gl_Position;
         fragLocalZGeom = fragLocalZ[i];
@@ -11,6 +11,9 @@ VERTEX_SHADER = """
 
 layout(location = 0) in vec3 in_vertexLocal;
 layout(location = 1) in vec3 in_smoothNormalLocal;
+// Still bound for triangle-soup meshes, but no longer read: flat shading
+// derives the face normal per triangle in the geometry shader, which also
+// works for indexed meshes (shared vertices carry no face normal).
 layout(location = 2) in vec3 in_faceNormalLocal;
 
 uniform mat4 projection;
@@ -18,6 +21,15 @@ uniform mat4 view;
 uniform vec3 objectPosition;
 uniform vec4 objectRotation;
 uniform vec3 objectScale;
+
+// Instanced draws (gl/instancing.py) read the transform from per-instance
+// attributes 3/4/5 instead of the three uniforms above. The flag is only
+// ever 1 for the duration of an instanced flush and reset to 0 right
+// after, so every ordinary single-object draw keeps using the uniforms.
+layout(location = 3) in vec3 in_instancePosition;
+layout(location = 4) in vec4 in_instanceRotation;
+layout(location = 5) in vec3 in_instanceScale;
+uniform int useInstanceTransform;
 uniform int normalMode;
 
 // <= 0.0 means "not a stripe, no clipping". Only WireStripe.render() ever
@@ -63,7 +75,12 @@ mat3 quaternionToMatrix(vec4 q) {
 }
 
 void main() {
-    vec3 effectiveScale = stripeClipStop > 0.0 ? vec3(objectScale.xy, 1.0) : objectScale;
+    bool instanced = useInstanceTransform == 1;
+    vec3 transformPosition = instanced ? in_instancePosition : objectPosition;
+    vec4 transformRotation = instanced ? in_instanceRotation : objectRotation;
+    vec3 transformScale = instanced ? in_instanceScale : objectScale;
+
+    vec3 effectiveScale = stripeClipStop > 0.0 ? vec3(transformScale.xy, 1.0) : transformScale;
 
     // Stripe geometry: X/Y (the radial helix pattern) stay driven by the
     // raw local vertex, which already encodes the correct phase at
@@ -73,14 +90,14 @@ void main() {
     // window renders at this segment's actual position instead of
     // wherever its raw Z happens to be in the shared mesh.
     vec3 scaledVertex = stripeClipStop > 0.0
-        ? vec3(in_vertexLocal.xy * objectScale.xy, in_vertexLocal.z - stripeClipStart)
+        ? vec3(in_vertexLocal.xy * transformScale.xy, in_vertexLocal.z - stripeClipStart)
         : in_vertexLocal * effectiveScale;
-    mat3 rotationMatrix = quaternionToMatrix(objectRotation);
+    mat3 rotationMatrix = quaternionToMatrix(transformRotation);
     vec3 rotatedVertex = rotationMatrix * scaledVertex;
-    vec3 worldPosition = rotatedVertex + objectPosition;
+    vec3 worldPosition = rotatedVertex + transformPosition;
 
-    vec3 in_normalLocal = normalMode == 0 ? in_smoothNormalLocal : in_faceNormalLocal;
-    vec3 scaledNormal = in_normalLocal / effectiveScale;
+    // smooth normal only -- flat normals are derived in the geometry shader
+    vec3 scaledNormal = in_smoothNormalLocal / effectiveScale;
     vec3 worldNormal = rotationMatrix * scaledNormal;
 
     gl_Position = projection * view * vec4(worldPosition, 1.0);
@@ -109,13 +126,33 @@ uniform mat4 projection;
 uniform mat4 view;
 uniform float floorY;
 uniform int objectHasReflection;
+uniform int normalMode;
+
+// normalMode 1 (flat): one normal for the whole triangle, from its world
+// positions. Same direction as the rotated/scaled local face normal the
+// triangle-soup format used to carry; zero for a degenerate triangle.
+vec3 flatNormal() {
+    vec3 faceNormal = cross(fragPositionWorld[1] - fragPositionWorld[0],
+                            fragPositionWorld[2] - fragPositionWorld[0]);
+    float faceNormalLength = length(faceNormal);
+
+    return faceNormalLength > 0.0 ? faceNormal / faceNormalLength : vec3(0.0);
+}
 
 void main() {
+    vec3 normals[3];
+    if (normalMode == 0) {
+        normals = vec3[3](fragNormalWorld[0], fragNormalWorld[1], fragNormalWorld[2]);
+    } else {
+        vec3 faceNormal = flatNormal();
+        normals = vec3[3](faceNormal, faceNormal, faceNormal);
+    }
+
     // Emit the original triangle
     for (int i = 0; i < 3; i++) {
         gl_Position = gl_in[i].gl_Position;
         fragPositionGeom = fragPositionWorld[i];
-        fragNormalGeom = fragNormalWorld[i];
+        fragNormalGeom = normals[i];
         fragLocalZGeom = fragLocalZ[i];
         isReflection = 0.0;
         EmitVertex();
@@ -128,7 +165,7 @@ void main() {
             vec3 reflectedPos = fragPositionWorld[i];
             reflectedPos.y = 2.0 * floorY - reflectedPos.y;
 
-            vec3 reflectedNormal = fragNormalWorld[i];
+            vec3 reflectedNormal = normals[i];
             reflectedNormal.y = -reflectedNormal.y;
 
             gl_Position = projection * view * vec4(reflectedPos, 1.0);
@@ -17,6 +17,12 @@ uniform vec3 objectPosition;
 uniform vec4 objectRotation;
 uniform vec3 objectScale;
 
+// See gl.shaders.faces' identical instance attributes.
+layout(location = 3) in vec3 in_instancePosition;
+layout(location = 4) in vec4 in_instanceRotation;
+layout(location = 5) in vec3 in_instanceScale;
+uniform int useInstanceTransform;
+
 // See gl.shaders.faces' identical uniforms -- WireStripe.render_segment
 // (objects.objects_3d.wire) sets these on this program too (not just
 // faces_program) so the shared stripe helix mesh's debug vertex
@@ -53,16 +59,21 @@ mat3 quaternionToMatrix(vec4 q) {
 }
 
 void main() {
+    bool instanced = useInstanceTransform == 1;
+    vec3 transformPosition = instanced ? in_instancePosition : objectPosition;
+    vec4 transformRotation = instanced ? in_instanceRotation : objectRotation;
+    vec3 transformScale = instanced ? in_instanceScale : objectScale;
+
     // See gl.shaders.faces' identical vertex shader for the full
     // explanation -- same stripe-geometry special case duplicated here.
-    vec3 effectiveScale = stripeClipStop > 0.0 ? vec3(objectScale.xy, 1.0) : objectScale;
+    vec3 effectiveScale = stripeClipStop > 0.0 ? vec3(transformScale.xy, 1.0) : transformScale;
 
     vec3 scaledVertex = stripeClipStop > 0.0
-        ? vec3(in_vertexLocal.xy * objectScale.xy, in_vertexLocal.z - stripeClipStart)
+        ? vec3(in_vertexLocal.xy * transformScale.xy, in_vertexLocal.z - stripeClipStart)
         : in_vertexLocal * effectiveScale;
-    mat3 rotationMatrix = quaternionToMatrix(objectRotation);
+    mat3 rotationMatrix = quaternionToMatrix(transformRotation);
     vec3 rotatedVertex = rotationMatrix * scaledVertex;
-    vec3 worldPosition = rotatedVertex + objectPosition;
+    vec3 worldPosition = rotatedVertex + transformPosition;
 
     gl_Position = projection * view * vec4(worldPosition, 1.0);
     fragPositionWorld = worldPosition;
@@ -0,0 +1,398 @@
+# © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
+
+"""Per-frame merging of static Text labels into a few world-space layers."""
+
+from typing import Callable, TYPE_CHECKING
+import weakref
+
+import numpy as np
+from OpenGL import GL
+from PySide6.QtGui import QOpenGLContext
+
+from .. import config as _config
+from .. import check_types as _check_types
+from ..geometry import angle as _angle
+from ..geometry import point as _point
+from . import vbo as _vbo
+
+
+if TYPE_CHECKING:
+    from ..shapes import text as _text
+
+
+_debug_config = _config.Config.debug.rendering3d
+
+
+class TextLayer:
+    """
+    Every batched label that shares one material and shading mode, baked
+    into world space in one indexed buffer and drawn with one call per pass.
+
+    A label is baked -- its merged mesh (``Text.mesh_arrays``) scaled,
+    rotated and moved by the transform its owner would have rendered it
+    with -- the first time it shows up and again only when that transform
+    or the ``Text`` itself changes; the baked rows are kept per member, so
+    a label that scrolls out of view and back costs nothing to re-add.
+
+    :meth:`update` then only touches the GPU when something changed:
+    when the members are the ones already in the buffer, in the same
+    order, and only their transforms changed, just the moved labels'
+    ranges are re-sent (a housing drag rewrites its own cavities, nothing
+    else); any other change re-packs the kept rows into a fresh buffer.
+
+    ``stats`` holds the counters of the last update: ``labels``,
+    ``baked`` (labels re-baked) and ``uploaded`` (bytes sent).
+    """
+
+    @_check_types.do
+    def __init__(self):
+        # member key -> (text weakref, transform signature, positions,
+        # normals, indices); see update
+        self._baked: dict[tuple, tuple] = {}
+
+        # member keys in buffer order, and their (first vertex, count)
+        self._order: list[tuple] = []
+        self._ranges: dict[tuple, tuple[int, int]] = {}
+
+        self._packed: np.ndarray | None = None
+        self._vertex_count = 0
+        self.vbo: _vbo.NonPooledVBOHandler | None = None
+
+        # the baked rows are already in world space
+        self._origin = _point.Point(0.0, 0.0, 0.0)
+        self._identity = _angle.Angle()
+        self._unit = _point.Point(1.0, 1.0, 1.0)
+
+        self.stats = dict(labels=0, baked=0, uploaded=0)
+
+    @staticmethod
+    @_check_types.do
+    def _bake(text: "_text.Text", position: _point.Point, angle: _angle.Angle,
+              scale: _point.Point) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """*text*'s merged mesh moved into world space -- the same
+        transform the faces/edges shaders apply to it per draw."""
+        positions, normals, indices = text.mesh_arrays
+        render_angle, render_scale = text.placement(angle, scale)
+
+        factors = np.array(render_scale.as_float, dtype=np.float32)
+
+        world = positions * factors
+        world @= render_angle
+        world += position.as_numpy
+
+        # inverse scale for the normals, as the shaders do; a flattened
+        # axis keeps its normal component instead of dividing by zero
+        world_normals = normals / np.where(factors == 0.0, 1.0, factors)
+        world_normals @= render_angle
+
+        lengths = np.linalg.norm(world_normals, axis=1, keepdims=True)
+        world_normals /= np.maximum(lengths, 1e-6)
+
+        return (world.astype(np.float32, copy=False),
+                world_normals.astype(np.float32, copy=False), indices)
+
+    @_check_types.do
+    def update(self, members: list):
+        """
+        Bring the buffer up to date with this frame's *members*.
+
+        :param members: ``(key, text, position, angle, scale)`` per label,
+                        in draw order; *key* identifies the label across
+                        frames (owner and index, see ``TextBatcher``).
+        """
+        baked = self._baked
+        moved = []
+        replaced = False
+
+        for key, text, position, angle, scale in members:
+            signature = position.as_float + angle.as_quat_float + scale.as_float
+
+            entry = baked.get(key, None)
+            if entry is not None and entry[0]() is text:
+                if entry[1] == signature:
+                    continue
+
+                moved.append(key)
+            else:
+                # a new label, or a new Text (other string, other
+                # triangles) for an old one
+                replaced = True
+
+            baked[key] = (weakref.ref(text), signature) + self._bake(text, position, angle, scale)
+
+        order = [member[0] for member in members]
+        self.stats.update(labels=len(order), baked=len(moved) + int(replaced), uploaded=0)
+
+        if not replaced and order == self._order and self.vbo is not None:
+            self._rewrite(moved)
+        else:
+            self._repack(order)
+
+    @_check_types.do
+    def _rewrite(self, changed: list):
+        """Re-send just the *changed* members' vertex ranges."""
+        packed = self._packed
+        if packed is None:
+            # every member is blank (spaces only); nothing to re-send
+            return
+
+        normals_offset = self._vertex_count * 3
+        uploaded = 0
+
+        for key in changed:
+            start, count = self._ranges[key]
+            _, _, positions, normals, _ = self._baked[key]
+
+            begin = start * 3
+            end = begin + count * 3
+
+            packed[begin:end] = positions.ravel()
+            packed[normals_offset + begin:normals_offset + end] = normals.ravel()
+
+            self.vbo.write(begin, packed[begin:end])
+            self.vbo.write(normals_offset + begin, packed[normals_offset + begin:normals_offset + end])
+            uploaded += count * 6 * 4
+
+        self.stats['uploaded'] = uploaded
+
+    @_check_types.do
+    def _repack(self, order: list):
+        """Pack every member's kept rows into a new buffer, in *order*."""
+        baked = self._baked
+
+        positions = []
+        normals = []
+        indices = []
+        ranges = {}
+        base = 0
+
+        for key in order:
+            _, _, member_positions, member_normals, member_indices = baked[key]
+
+            positions.append(member_positions)
+            normals.append(member_normals)
+            indices.append(member_indices + base)
+
+            ranges[key] = (base, len(member_positions))
+            base += len(member_positions)
+
+        self._order = order
+        self._ranges = ranges
+        self._vertex_count = base
+
+        # labels whose Text is gone (deleted, renamed) can't come back
+        for key in [key for key, entry in baked.items() if entry[0]() is None]:
+            del baked[key]
+
+        if not base:
+            self._packed = None
+            return
+
+        packed = np.concatenate((np.concatenate(positions).ravel(),
+                                 np.concatenate(normals).ravel()))
+        element_array = np.concatenate(indices).astype(np.uint32)
+
+        if self.vbo is None:
+            self.vbo = _vbo.NonPooledVBOHandler(packed, base, indices=element_array)
+        else:
+            self.vbo.update(packed, base, element_array)
+
+        self._packed = packed
+        self.stats['uploaded'] = packed.nbytes + element_array.nbytes
+
+    @_check_types.do
+    def render(self, pos_loc, rot_loc, scale_loc, normal_loc, smooth: bool) -> bool:
+        """Draw the whole layer; ``False`` if it has nothing to draw."""
+        if self.vbo is None or not self._vertex_count:
+            return False
+
+        self.vbo.render(pos_loc, rot_loc, scale_loc, normal_loc,
+                        self._origin, self._identity, self._unit, smooth)
+        return True
+
+    @_check_types.do
+    def release(self):
+        if self.vbo is not None:
+            self.vbo.release()
+
+
+class TextBatcher:
+    """
+    Draw every culled object's Text labels out of a few shared layers.
+
+    :meth:`collect` asks each culled object for its labels
+    (``BaseVar.text_placements()``) and files them into one
+    :class:`TextLayer` per material and shading mode. An object that is
+    nothing but labels (``BaseVar._text_only``) leaves the per-object loop
+    altogether; any other one stays in it with ``texts_batched`` set, and
+    its render() leaves its labels out. :meth:`flush` then brings every
+    layer up to date and draws each with one call per pass, mirroring the
+    passes of ``BaseVar.render``.
+
+    A schematic is nearly all static text -- a cavity name per slot, a
+    name and bracket per terminal, a corner label per housing -- so the
+    layers barely change from frame to frame, and the labels cost a
+    handful of draws instead of one (or, before labels were merged, one
+    per glyph) per label.
+
+    ``stats`` holds the counters of the last flushed frame:
+    ``text_layers``, ``text_labels``, ``text_draw_calls``,
+    ``text_baked`` (labels re-baked) and ``text_uploaded`` (bytes sent).
+    """
+
+    @_check_types.do
+    def __init__(self):
+        self._layers: dict[tuple, TextLayer] = {}
+        # layer key -> (material, first view object, members) this frame
+        self._frame: dict[tuple, tuple] = {}
+        self._locations: dict[tuple[int, str], int] = {}
+        self.stats = dict(text_layers=0, text_labels=0, text_draw_calls=0,
+                          text_baked=0, text_uploaded=0)
+
+    @_check_types.do
+    def collect(self, objs: list, get_view_object: Callable,
+                enabled: bool = True) -> tuple[list, list]:
+        """
+        Split *objs* (the culled scene objects, in draw order) into the
+        ones drawn entirely from text layers and the rest.
+
+        Always called, so every object's ``texts_batched`` flag is
+        current -- with *enabled* ``False`` (or the normals debug pass on,
+        which has no layer counterpart) nothing is batched.
+
+        :returns: ``(remaining_objects, batched_objects)``.
+        :rtype: tuple[list, list]
+        """
+        frame = self._frame
+        frame.clear()
+
+        enabled = enabled and not _debug_config.draw_normals
+
+        remaining = []
+        batched = []
+
+        for obj in objs:
+            view_obj = get_view_object(obj)
+            placements = view_obj.text_placements() if enabled else None
+
+            if not placements:
+                view_obj.texts_batched = False
+                remaining.append(obj)
+                continue
+
+            view_obj.texts_batched = True
+            smooth = bool(view_obj.smooth)
+            owner = id(view_obj)
+
+            for index, (text, position, angle, scale, material) in enumerate(placements):
+                key = (material.batch_key, smooth)
+
+                entry = frame.get(key, None)
+                if entry is None:
+                    entry = frame[key] = (material, view_obj, [])
+
+                entry[2].append(((owner, index), text, position, angle, scale))
+
+            if view_obj._text_only:  # NOQA
+                batched.append(obj)
+            else:
+                remaining.append(obj)
+
+        return remaining, batched
+
+    @_check_types.do
+    def _location(self, program: int, name: str) -> int:
+        key = (program, name)
+
+        loc = self._locations.get(key, None)
+        if loc is None:
+            loc = GL.glGetUniformLocation(program, name)
+            self._locations[key] = loc
+
+        return loc
+
+    @_check_types.do
+    def _draw_pass(self, program: int, layers: list, material_func: Callable | None,
+                   with_normals: bool) -> int:
+        pos_loc = self._location(program, 'objectPosition')
+        rot_loc = self._location(program, 'objectRotation')
+        scale_loc = self._location(program, 'objectScale')
+        normal_loc = self._location(program, 'normalMode') if with_normals else None
+
+        GL.glUseProgram(program)
+
+        draw_calls = 0
+        for layer, material, first, smooth in layers:
+            if material_func is not None:
+                material_func(material, first).set(program)
+
+            if layer.render(pos_loc, rot_loc, scale_loc, normal_loc, smooth):
+                draw_calls += 1
+
+        GL.glUseProgram(0)
+
+        return draw_calls
+
+    @_check_types.do
+    def flush(self, faces_program: int, edges_program: int, vertices_program: int):
+        """Update and draw every layer collected this frame."""
+        stats = self.stats
+        frame = self._frame
+
+        if not frame:
+            stats.update(text_layers=0, text_labels=0, text_draw_calls=0,
+                         text_baked=0, text_uploaded=0)
+            return
+
+        layers = []
+        labels = baked = uploaded = 0
+
+        for key, (material, first, members) in frame.items():
+            layer = self._layers.get(key, None)
+            if layer is None:
+                layer = self._layers[key] = TextLayer()
+
+            layer.update(members)
+
+            labels += layer.stats['labels']
+            baked += layer.stats['baked']
+            uploaded += layer.stats['uploaded']
+
+            layers.append((layer, material, first, key[1]))
+
+        draw_calls = 0
+
+        if _debug_config.draw_faces:
+            draw_calls += self._draw_pass(
+                faces_program, layers, lambda material, _: material, True)
+
+        if _debug_config.draw_edges:
+            GL.glUseProgram(edges_program)
+            GL.glUniform1i(self._location(edges_program, 'renderMode'), 0)
+
+            draw_calls += self._draw_pass(
+                edges_program, layers, lambda _, first: first._edge_material(), True)  # NOQA
+
+        if _debug_config.draw_vertices:
+            GL.glUseProgram(vertices_program)
+            GL.glUniform3f(self._location(vertices_program, 'vertexColor'),
+                           *_debug_config.vertices_color)
+
+            draw_calls += self._draw_pass(vertices_program, layers, None, False)
+
+        stats.update(text_layers=len(layers), text_labels=labels,
+                     text_draw_calls=draw_calls, text_baked=baked,
+                     text_uploaded=uploaded)
+
+        frame.clear()
+
+    @_check_types.do
+    def release(self):
+        """Release every layer's buffer in the current context."""
+        if QOpenGLContext.currentContext() is None:
+            return
+
+        for layer in self._layers.values():
+            layer.release()
+
+        self._layers.clear()
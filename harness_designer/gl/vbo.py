@@ -1,7 +1,9 @@
 # © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
 
+import collections
 import ctypes
 import threading
+import time
 import weakref
 from dataclasses import dataclass
 
@@ -17,7 +19,8 @@ from ..geometry import angle as _angle
 from .. import check_types as _check_types
 
 
-# Maximum triangle-soup vertices managed in the imported-model arena.
+# Arena capacity in triangle-soup vertex slots (VERTEX_STRIDE_BYTES each).
+# An indexed mesh occupies just enough slots for its vertex and element data.
 MODEL_ARENA_CAPACITY_VERTICES = 4000000
 # Compaction threshold: rebuild arena when free-space fragmentation reaches this ratio.
 MODEL_ARENA_FRAGMENTATION_THRESHOLD = 0.35
@@ -32,6 +35,31 @@ _FLOAT_SIZE = np.dtype(np.float32).itemsize
 FLOATS_PER_VERTEX = 9
 VERTEX_STRIDE_BYTES = FLOATS_PER_VERTEX * _FLOAT_SIZE
 
+# Indexed meshes (utils.compute_indexed_normals) store
+# [positions | smooth normals] per unique vertex, followed in the same GPU
+# buffer by a uint32 element array. They carry no face normal block -- the
+# faces/edges geometry shaders derive flat normals per triangle.
+INDEXED_FLOATS_PER_VERTEX = 6
+_INDEX_SIZE = np.dtype(np.uint32).itemsize
+
+# Per-instance transform record used by instanced draws (see gl/instancing.py):
+# [position xyz | rotation quat wxyz | scale xyz] -> attribute locations 3/4/5.
+FLOATS_PER_INSTANCE = 10
+INSTANCE_STRIDE_BYTES = FLOATS_PER_INSTANCE * _FLOAT_SIZE
+_INSTANCE_ATTRIBUTES = ((3, 3, 0), (4, 4, 3 * _FLOAT_SIZE), (5, 3, 7 * _FLOAT_SIZE))
+
+# Streaming uploads of model files (see MeshStreamer): bytes per chunk,
+# chunks in the staging ring and the time a frame spends on uploads before
+# the rest waits for the next one (at least one chunk is always uploaded).
+STREAM_CHUNK_BYTES = 256 * 1024
+STREAM_STAGING_CHUNKS = 16
+STREAM_FRAME_BUDGET_MS = 4.0
+# chunks cover whole xyz rows, see MeshSource.read
+_STREAM_CHUNK_FLOATS = STREAM_CHUNK_BYTES // _FLOAT_SIZE // 3 * 3
+# How long a chunk of the staging ring may still be in use by the GPU
+# before it is written anyway.
+_STREAM_FENCE_TIMEOUT_NS = 1000000000
+
 Config = _config.Config
 
 
@@ -39,6 +67,8 @@ Config = _config.Config
 class _ArenaAllocation:
     start: int
     count: int
+    # slots the same mesh would need as triangle soup (0 = it is soup)
+    soup_count: int = 0
 
 
 class _MeshArena:
@@ -85,8 +115,14 @@ class _MeshArena:
 
         return any(count >= needed for _, count in self._free_ranges)
 
+    @staticmethod
+    @_check_types.do
+    def slots_for(float_count: int) -> int:
+        """Number of vertex slots needed to hold *float_count* floats."""
+        return -(-int(float_count) // FLOATS_PER_VERTEX)
+
     @_check_types.do
-    def allocate(self, key: str, vertex_count: int) -> _ArenaAllocation:
+    def allocate(self, key: str, vertex_count: int, soup_count: int = 0) -> _ArenaAllocation:
         if key in self._allocations:
             return self._allocations[key]
 
@@ -98,7 +134,7 @@ class _MeshArena:
             if count < needed:
                 continue
 
-            alloc = _ArenaAllocation(start=start, count=needed)
+            alloc = _ArenaAllocation(start=start, count=needed, soup_count=int(soup_count))
             self._allocations[key] = alloc
 
             if count == needed:
@@ -143,7 +179,7 @@ class _MeshArena:
     def upload(self, key: str, data: np.ndarray):
         alloc = self._allocations[key]
 
-        if len(data) != alloc.count * FLOATS_PER_VERTEX:
+        if self.slots_for(len(data)) != alloc.count:
             raise ValueError('packed array length does not match the allocation: '
                              f'expected {alloc.count * FLOATS_PER_VERTEX} floats, '
                              f'got {len(data)}')
@@ -155,6 +191,37 @@ class _MeshArena:
 
         GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
 
+    @_check_types.do
+    def write(self, key: str, float_offset: int, data: np.ndarray):
+        """Write *data* into *key*'s allocation starting *float_offset*
+        floats in -- one chunk of a streamed upload."""
+        alloc = self._allocations[key]
+
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self._buffer)
+
+        GL.glBufferSubData(GL.GL_ARRAY_BUFFER,
+                           alloc.start * VERTEX_STRIDE_BYTES + float_offset * _FLOAT_SIZE,
+                           data.nbytes, data)
+
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
+
+    @_check_types.do
+    def copy_in(self, key: str, float_offset: int, src_buffer: int,
+                src_offset: int, nbytes: int):
+        """GPU copy *nbytes* from *src_buffer* into *key*'s allocation
+        starting *float_offset* floats in."""
+        alloc = self._allocations[key]
+
+        GL.glBindBuffer(GL.GL_COPY_READ_BUFFER, src_buffer)
+        GL.glBindBuffer(GL.GL_COPY_WRITE_BUFFER, self._buffer)
+
+        GL.glCopyBufferSubData(GL.GL_COPY_READ_BUFFER, GL.GL_COPY_WRITE_BUFFER, src_offset,
+                               alloc.start * VERTEX_STRIDE_BYTES + float_offset * _FLOAT_SIZE,
+                               nbytes)
+
+        GL.glBindBuffer(GL.GL_COPY_READ_BUFFER, 0)
+        GL.glBindBuffer(GL.GL_COPY_WRITE_BUFFER, 0)
+
     @property
     @_check_types.do
     def fragmentation(self) -> float:
@@ -186,9 +253,21 @@ class _MeshArena:
 
         return max(count for _, count in self._free_ranges)
 
+    @_check_types.do
+    def model_savings(self) -> dict[str, tuple[int, int]]:
+        """Return ``{key: (soup_bytes, used_bytes)}`` for every indexed
+        allocation -- what the mesh would occupy as triangle soup versus
+        what its vertex and element data actually occupy."""
+        return {key: (alloc.soup_count * VERTEX_STRIDE_BYTES,
+                      alloc.count * VERTEX_STRIDE_BYTES)
+                for key, alloc in self._allocations.items() if alloc.soup_count}
+
     @_check_types.do
     def debug_metrics(self) -> dict:
         free_ranges = list(self._free_ranges)
+        savings = self.model_savings()
+
+        saved_bytes = sum(soup - used for soup, used in savings.values())
 
         return dict(buffer_id=self._buffer,
                     capacity_vertices=self.capacity_vertices,
@@ -198,7 +277,10 @@ class _MeshArena:
                     free_range_count=len(free_ranges),
                     largest_free_range=self.largest_free_range,
                     fragmentation=self.fragmentation,
-                    free_ranges=free_ranges)
+                    free_ranges=free_ranges,
+                    indexed_count=len(savings),
+                    saved_bytes=saved_bytes,
+                    model_savings=savings)
 
     @_check_types.do
     def should_compact(self, threshold: float = MODEL_ARENA_FRAGMENTATION_THRESHOLD,
@@ -245,7 +327,8 @@ class _MeshArena:
                 self._buffer, new_buffer, alloc.start, cursor, alloc.count)
 
             self._allocations[key] = (
-                _ArenaAllocation(start=cursor, count=alloc.count))
+                _ArenaAllocation(start=cursor, count=alloc.count,
+                                 soup_count=alloc.soup_count))
 
             cursor += alloc.count
 
@@ -263,6 +346,352 @@ class _MeshArena:
         return True
 
 
+class MeshSource:
+    """
+    A converted model's packed file, memory mapped, plus the model
+    transform to apply to it on the way to the GPU.
+
+    ``Base3D._set_model`` used to ``np.load`` the whole ``.npy``, rotate and
+    offset all of it and hand the result to the VBO, which concatenated it
+    with the element array before one ``glBufferSubData`` -- two full host
+    copies of the mesh and one big upload, all on the GUI thread the
+    moment the part first appeared. A source is read in chunks instead:
+    :meth:`read` transforms just the rows one chunk covers, straight out of
+    the mapping, into whatever buffer the chunk is going to (see
+    :class:`MeshStreamer`). The mapping itself is file backed -- pages the
+    OS can drop again -- not a copy.
+
+    The payload a source reads is the one :meth:`VBOHandlerBase._payload`
+    builds: the packed blocks, then the element array bit-cast to floats.
+    """
+
+    @_check_types.do
+    def __init__(self, data_path: str, indices: np.ndarray | None = None,
+                 angle: _angle.Angle | None = None,
+                 position: _point.Point | None = None):
+        """
+        :param data_path: The model's packed ``.npy`` file.
+        :param indices: Its element array (``Model3D.indices``, memory
+                        mapped), ``None`` for triangle soup.
+        :param angle: Rotation applied to every block, as ``Base3D`` does.
+        :param position: Offset applied to the position block.
+        """
+        self.path = data_path
+        self.packed = np.load(data_path, mmap_mode='r')
+        self.indices = indices
+        self.angle = angle
+
+        if position is None:
+            self.position = None
+        else:
+            self.position = np.array(position.as_float, dtype=np.float32)
+
+        floats_per_vertex = FLOATS_PER_VERTEX if indices is None else INDEXED_FLOATS_PER_VERTEX
+        self.count = len(self.packed) // floats_per_vertex
+
+    @property
+    @_check_types.do
+    def float_count(self) -> int:
+        """Length of the payload in floats."""
+        if self.indices is None:
+            return len(self.packed)
+
+        return len(self.packed) + len(self.indices)
+
+    @_check_types.do
+    def read(self, start: int, out: np.ndarray):
+        """
+        Fill *out* with the payload floats from *start* on.
+
+        *start* must be a multiple of 3 so the chunk covers whole rows of
+        the packed blocks.
+        """
+        stop = start + len(out)
+        packed_len = len(self.packed)
+
+        if start < packed_len:
+            end = min(stop, packed_len)
+            rows = np.array(self.packed[start:end], dtype=np.float32).reshape(-1, 3)
+
+            if self.angle is not None:
+                rows @= self.angle
+
+            if self.position is not None:
+                # rows of this chunk that are still in the position block
+                position_rows = self.count - start // 3
+                if position_rows > 0:
+                    rows[:position_rows] += self.position
+
+            out[:end - start] = rows.reshape(-1)
+
+        if stop > packed_len:
+            first = max(start, packed_len)
+            out[first - start:].view(np.uint32)[:] = self.indices[first - packed_len:stop - packed_len]
+
+    @_check_types.do
+    def materialize(self) -> np.ndarray:
+        """The whole transformed packed array, for CPU-side readers (mesh
+        picking, the exporter) that ask a streamed handler for its data."""
+        data = np.empty(len(self.packed), dtype=np.float32)
+
+        for start in range(0, len(data), _STREAM_CHUNK_FLOATS):
+            self.read(start, data[start:start + _STREAM_CHUNK_FLOATS])
+
+        return data
+
+
+@_check_types.do
+def _has_buffer_storage() -> bool:
+    # glBufferStorage is core in 4.4 and ARB_buffer_storage before that;
+    # the application asks for a 3.3 context, so it may well be missing
+    if not bool(GL.glBufferStorage):
+        return False
+
+    try:
+        version = (int(GL.glGetIntegerv(GL.GL_MAJOR_VERSION)),
+                   int(GL.glGetIntegerv(GL.GL_MINOR_VERSION)))
+
+        if version >= (4, 4):
+            return True
+
+        for index in range(int(GL.glGetIntegerv(GL.GL_NUM_EXTENSIONS))):
+            name = GL.glGetStringi(GL.GL_EXTENSIONS, index)
+            if name == b'GL_ARB_buffer_storage':
+                return True
+
+    except Exception:  # NOQA
+        pass
+
+    return False
+
+
+class _StagingRing:
+    """
+    A persistently mapped buffer cut into :data:`STREAM_STAGING_CHUNKS`
+    slots that chunks are written into from the CPU and GPU-copied out of.
+
+    Every slot gets a fence after its copy is issued; a slot is only
+    written again once its fence has signalled, so the ring never stalls
+    the driver the way ``glBufferSubData`` into a buffer the GPU is still
+    reading does.
+    """
+
+    @_check_types.do
+    def __init__(self, chunk_bytes: int, chunks: int):
+        self.chunk_bytes = chunk_bytes
+        self.chunks = chunks
+
+        size = chunk_bytes * chunks
+        flags = GL.GL_MAP_WRITE_BIT | GL.GL_MAP_PERSISTENT_BIT | GL.GL_MAP_COHERENT_BIT
+
+        self.buffer = int(GL.glGenBuffers(1))
+        GL.glBindBuffer(GL.GL_COPY_READ_BUFFER, self.buffer)
+        GL.glBufferStorage(GL.GL_COPY_READ_BUFFER, size, None, flags)
+
+        address = ctypes.cast(GL.glMapBufferRange(GL.GL_COPY_READ_BUFFER, 0, size, flags),
+                              ctypes.c_void_p).value
+
+        GL.glBindBuffer(GL.GL_COPY_READ_BUFFER, 0)
+
+        if not address:
+            GL.glDeleteBuffers(1, [self.buffer])
+            raise RuntimeError('unable to map the streaming staging buffer')
+
+        self._mapped = np.ctypeslib.as_array(
+            (ctypes.c_float * (size // _FLOAT_SIZE)).from_address(address))
+
+        self._fences = [None] * chunks
+        self._next = 0
+
+        # times a slot was still in flight when its turn came round
+        self.waits = 0
+
+    @_check_types.do
+    def slot(self) -> tuple[int, np.ndarray]:
+        """Take the next slot once the GPU is done with it.
+
+        :returns: ``(byte_offset, mapped float view of the slot)``.
+        """
+        index = self._next
+        self._next = (index + 1) % self.chunks
+
+        fence = self._fences[index]
+        if fence is not None:
+            result = GL.glClientWaitSync(fence, GL.GL_SYNC_FLUSH_COMMANDS_BIT,
+                                         _STREAM_FENCE_TIMEOUT_NS)
+            if result not in (GL.GL_ALREADY_SIGNALED, GL.GL_CONDITION_SATISFIED):
+                self.waits += 1
+
+            GL.glDeleteSync(fence)
+            self._fences[index] = None
+
+        offset = index * self.chunk_bytes
+        start = offset // _FLOAT_SIZE
+
+        return offset, self._mapped[start:start + self.chunk_bytes // _FLOAT_SIZE]
+
+    @_check_types.do
+    def fence(self, offset: int):
+        """Fence the slot at *offset* after its copy has been issued."""
+        self._fences[offset // self.chunk_bytes] = GL.glFenceSync(
+            GL.GL_SYNC_GPU_COMMANDS_COMPLETE, 0)
+
+
+@dataclass
+class _StreamJob:
+    key: str
+    handler: weakref.ref
+    source: MeshSource
+    # floats of the payload uploaded so far
+    offset: int = 0
+
+
+class MeshStreamer:
+    """
+    Uploads model meshes into the arena a few chunks per frame.
+
+    A :class:`PooledVBOHandler` created from a :class:`MeshSource` gets its
+    arena allocation straight away but isn't drawn (``is_resident`` is
+    ``False``) until every chunk of it has been written; :meth:`pump`, run
+    by the canvas at the start of every frame, uploads chunks of the queued
+    meshes, oldest first, for up to :data:`STREAM_FRAME_BUDGET_MS`. A large housing that used to be one multi-hundred-millisecond
+    upload in the frame it appeared in is spread over as many frames as it
+    takes, and the host never holds more of it than one chunk.
+
+    With ``glBufferStorage`` available the chunks go through a persistently
+    mapped staging ring (:class:`_StagingRing`) and a GPU copy into the
+    arena; without it (the application only asks for GL 3.3) every chunk
+    is a ``glBufferSubData`` of one reused scratch array.
+
+    ``stats``: ``pending`` meshes, ``queued``/``completed`` totals,
+    ``chunks``/``bytes`` uploaded, ``last_ms``/``max_ms`` spent in one
+    :meth:`pump`, ``staging_waits`` and ``persistent`` (whether the
+    staging ring is in use).
+    """
+
+    @_check_types.do
+    def __init__(self, staging_chunks: int = STREAM_STAGING_CHUNKS):
+        self._chunk_floats = _STREAM_CHUNK_FLOATS
+        self._staging_chunks = staging_chunks
+
+        self._jobs: collections.deque[_StreamJob] = collections.deque()
+        self._staging: _StagingRing | None = None
+        self._scratch: np.ndarray | None = None
+        self._staging_checked = False
+
+        self.stats = dict(pending=0, queued=0, completed=0, chunks=0, bytes=0,
+                          last_ms=0.0, max_ms=0.0, staging_waits=0, persistent=False)
+
+    @property
+    @_check_types.do
+    def pending(self) -> int:
+        return len(self._jobs)
+
+    @_check_types.do
+    def queue(self, handler: "PooledVBOHandler", source: MeshSource):
+        self._jobs.append(_StreamJob(handler.id, weakref.ref(handler), source))
+        self.stats['queued'] += 1
+        self.stats['pending'] = len(self._jobs)
+
+    @_check_types.do
+    def cancel(self, key: str):
+        """Drop the queued upload of *key*, if there is one."""
+        self._jobs = collections.deque(job for job in self._jobs if job.key != key)
+        self.stats['pending'] = len(self._jobs)
+
+    @_check_types.do
+    def _chunk_writer(self):
+        if not self._staging_checked:
+            self._staging_checked = True
+
+            if _has_buffer_storage():
+                try:
+                    self._staging = _StagingRing(self._chunk_floats * _FLOAT_SIZE,
+                                                 self._staging_chunks)
+                except Exception as err:  # NOQA
+                    _logger.traceback(err, 'streaming staging buffer unavailable')
+
+            if self._staging is None:
+                self._scratch = np.empty(self._chunk_floats, dtype=np.float32)
+
+            self.stats['persistent'] = self._staging is not None
+
+        return self._staging
+
+    @_check_types.do
+    def _upload_chunk(self, job: _StreamJob, arena: _MeshArena, float_count: int):
+        staging = self._chunk_writer()
+
+        if staging is None:
+            chunk = self._scratch[:float_count]
+            job.source.read(job.offset, chunk)
+            arena.write(job.key, job.offset, chunk)
+        else:
+            offset, view = staging.slot()
+            job.source.read(job.offset, view[:float_count])
+            arena.copy_in(job.key, job.offset, staging.buffer, offset,
+                          float_count * _FLOAT_SIZE)
+            staging.fence(offset)
+
+    @_check_types.do
+    def pump(self, budget_ms: float = STREAM_FRAME_BUDGET_MS) -> bool:
+        """
+        Upload chunks of the queued meshes until *budget_ms* is used up.
+        Needs a current context.
+
+        :returns: ``True`` while uploads are still queued -- the caller
+                  should schedule another frame.
+        :rtype: bool
+        """
+        if not self._jobs:
+            self.stats['last_ms'] = 0.0
+            return False
+
+        start = time.perf_counter()
+        deadline = start + budget_ms / 1000.0
+        stats = self.stats
+        uploaded = False
+
+        while self._jobs and (not uploaded or time.perf_counter() < deadline):
+            job = self._jobs[0]
+            handler = job.handler()
+            arena = None if handler is None else handler._model_arena  # NOQA
+
+            if arena is None or arena.get_allocation(job.key) is None:
+                # released or evicted before it was ever drawn
+                self._jobs.popleft()
+                continue
+
+            float_count = min(self._chunk_floats, job.source.float_count - job.offset)
+
+            self._upload_chunk(job, arena, float_count)
+
+            job.offset += float_count
+            uploaded = True
+
+            stats['chunks'] += 1
+            stats['bytes'] += float_count * _FLOAT_SIZE
+
+            if job.offset >= job.source.float_count:
+                self._jobs.popleft()
+                handler._streaming = False  # NOQA
+                stats['completed'] += 1
+
+        elapsed = (time.perf_counter() - start) * 1000.0
+
+        stats['pending'] = len(self._jobs)
+        stats['last_ms'] = elapsed
+        stats['max_ms'] = max(stats['max_ms'], elapsed)
+
+        if self._staging is not None:
+            stats['staging_waits'] = self._staging.waits
+
+        return bool(self._jobs)
+
+
+MESH_STREAMER = MeshStreamer()
+
+
 VBO_TYPE_PRIMITIVE = 0
 VBO_TYPE_MODEL = 1
 
@@ -310,14 +739,17 @@ class VBOSingleton(type):
                  aabb: np.ndarray | None = None,
                  obb: np.ndarray | None = None,
                  *, endpoint: _point.Point | None = None,
-                 arena_kind: int = VBO_TYPE_MODEL) -> "PooledVBOHandler":
+                 arena_kind: int = VBO_TYPE_MODEL,
+                 indices: np.ndarray | None = None,
+                 source: MeshSource | None = None) -> "PooledVBOHandler":
 
         with cls._instances_lock:
             if arena_kind == VBO_TYPE_PRIMITIVE:
                 if id_ not in cls._primitives:
                     instance = super().__call__(
                         id_, data, count, aabb, obb,
-                        endpoint=endpoint, arena_kind=arena_kind)
+                        endpoint=endpoint, arena_kind=arena_kind,
+                        indices=indices)
 
                     cls._primitives[id_] = instance
                 else:
@@ -326,7 +758,8 @@ class VBOSingleton(type):
             elif id_ not in cls._instances or cls._instances[id_]() is None:
                 instance = super().__call__(
                         id_, data, count, aabb, obb,
-                        endpoint=endpoint, arena_kind=arena_kind)
+                        endpoint=endpoint, arena_kind=arena_kind,
+                        indices=indices, source=source)
 
                 cls._instances[id_] = weakref.ref(instance, cls._remove_ref)
 
@@ -343,7 +776,8 @@ class VBOHandlerBase:
                  count: int = 0,
                  aabb: np.ndarray | None = None,
                  obb: np.ndarray | None = None,
-                 *, endpoint: _point.Point | None = None):
+                 *, endpoint: _point.Point | None = None,
+                 indices: np.ndarray | None = None):
         _ = self.ctx
 
         if data is None:
@@ -354,8 +788,15 @@ class VBOHandlerBase:
         self.endpoint = endpoint
 
         self._vaos: dict[int, int] = {}
+        self._instanced_vaos: dict[int, int] = {}
         self._data = data
-        self._vert_count = self._normalize_vertex_count(count, len(data))
+        self._set_indices(indices)
+        self._vert_count = self._normalize_vertex_count(
+            count, len(data), self._indices is not None)
+
+        # byte offset of the element array in the bound buffer, set
+        # whenever a VAO is (re)built
+        self._element_offset = 0
 
         if aabb is None:
             self.local_aabb = self._compute_local_aabb()
@@ -367,12 +808,23 @@ class VBOHandlerBase:
         else:
             self.local_obb = np.asarray(obb, dtype=np.float32).reshape(8, 3)
 
+    @_check_types.do
+    def _set_indices(self, indices: np.ndarray | None):
+        if indices is None:
+            self._indices = None
+        else:
+            self._indices = np.ascontiguousarray(indices, dtype=np.uint32)
+
+        # lazily expanded triangle-soup blocks, see _expanded_blocks
+        self._expanded = None
+
     @_check_types.do
     def _compute_local_aabb(self):
         # Bounding volumes are calculated once when a model is converted
         # and stored in the database; only primitives (and legacy rows
         # without stored bounds) compute them from the mesh here.
-        p1, p2 = _utils.compute_aabb(self.vertices.reshape(-1, 3))
+        positions = np.asarray(self._data[:self._vert_count * 3])
+        p1, p2 = _utils.compute_aabb(positions.reshape(-1, 3))
 
         local_aabb = np.array([p1.as_numpy, p2.as_numpy], dtype=np.float32)
         return local_aabb
@@ -389,18 +841,20 @@ class VBOHandlerBase:
 
     @staticmethod
     @_check_types.do
-    def _normalize_vertex_count(count: int, array_len: int) -> int:
-        if array_len % FLOATS_PER_VERTEX != 0:
+    def _normalize_vertex_count(count: int, array_len: int, indexed: bool = False) -> int:
+        floats_per_vertex = INDEXED_FLOATS_PER_VERTEX if indexed else FLOATS_PER_VERTEX
+
+        if array_len % floats_per_vertex != 0:
             raise ValueError('packed array length must be divisible by '
-                             f'{FLOATS_PER_VERTEX}')
+                             f'{floats_per_vertex}')
 
-        vert_count = array_len // FLOATS_PER_VERTEX
+        vert_count = array_len // floats_per_vertex
 
         count = int(count)
         # Tolerate legacy counts expressed as float counts (count * 9) or
         # flattened position counts (count * 3).
         if count > 0 and count not in (
-            vert_count, vert_count * 3, vert_count * FLOATS_PER_VERTEX
+            vert_count, vert_count * 3, vert_count * floats_per_vertex
         ):
             raise ValueError(f'vertex count {count} does not match the '
                              f'packed array ({vert_count} vertices)')
@@ -425,6 +879,18 @@ class VBOHandlerBase:
     def is_dirty(self):
         return False
 
+    @property
+    @_check_types.do
+    def is_resident(self) -> bool:
+        """Whether the whole mesh is on the GPU and can be drawn."""
+        return True
+
+    @property
+    @_check_types.do
+    def is_acquired(self) -> bool:
+        """Whether any context still holds a VAO for this mesh."""
+        return bool(self._vaos) or bool(self._instanced_vaos)
+
     @_check_types.do
     def _attribute_offsets(self) -> tuple[int, int, int, int]:
         raise NotImplementedError
@@ -439,7 +905,11 @@ class VBOHandlerBase:
         for vao in self._vaos.values():
             self._release_vao(vao)
 
+        for vao in self._instanced_vaos.values():
+            self._release_vao(vao)
+
         self._vaos.clear()
+        self._instanced_vaos.clear()
 
     @property
     @_check_types.do
@@ -459,6 +929,10 @@ class VBOHandlerBase:
         if vao is not None:
             self._release_vao(vao)
 
+        vao = self._instanced_vaos.pop(ctx_id, None)
+        if vao is not None:
+            self._release_vao(vao)
+
     @staticmethod
     @_check_types.do
     def _release_vao(vao):
@@ -499,24 +973,90 @@ class VBOHandlerBase:
     def data(self):
         return self._data
 
+    @property
+    @_check_types.do
+    def is_indexed(self) -> bool:
+        return self._indices is not None
+
+    @property
+    @_check_types.do
+    def indices(self) -> np.ndarray | None:
+        return self._indices
+
+    @_check_types.do
+    def _payload(self) -> np.ndarray:
+        """Float32 array uploaded to the GPU: the packed vertex blocks, plus
+        the element array (bit-cast) right after them for an indexed mesh."""
+        if self._indices is None:
+            return self._data
+
+        return np.concatenate((np.asarray(self._data, dtype=np.float32),
+                               self._indices.view(np.float32)))
+
+    @_check_types.do
+    def _expanded_blocks(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if self._expanded is None:
+            self._expanded = _utils.expand_indexed(
+                self._data, self._vert_count, self._indices)
+
+        return self._expanded
+
+    # vertices/smooth_normals/face_normals always return triangle-soup
+    # blocks (one row per triangle corner) -- the mesh pickers and the
+    # exporter index them per triangle. An indexed mesh expands on first
+    # use and keeps the result.
+
     @property
     @_check_types.do
     def vertices(self):
+        if self._indices is not None:
+            return self._expanded_blocks()[0]
+
         return self._data[:self._vert_count * 3]
 
     @property
     @_check_types.do
     def smooth_normals(self):
+        if self._indices is not None:
+            return self._expanded_blocks()[1]
+
         return self._data[self._vert_count * 3:self._vert_count * 6]
 
     @property
     @_check_types.do
     def face_normals(self):
+        if self._indices is not None:
+            return self._expanded_blocks()[2]
+
         return self._data[self._vert_count * 6:]
 
+    @_check_types.do
+    def read_rows(self, block: int, start: int, stop: int) -> np.ndarray:
+        """
+        Rows *start* to *stop* of one packed block as an (n, 3) float32
+        array, for readers that walk a mesh in chunks (the scene exporter).
+
+        Unlike :attr:`vertices` and friends this never expands an indexed
+        mesh: rows are stored vertices, and *block* is 0 for positions, 1
+        for smooth normals and 2 for face normals (triangle soup only).
+        """
+        n = self._vert_count
+        return np.asarray(self._data[(block * n + start) * 3:(block * n + stop) * 3],
+                          dtype=np.float32).reshape(-1, 3)
+
     @property
     @_check_types.do
     def vertex_count(self) -> int:
+        """Number of vertices drawn (triangle corners)."""
+        if self._indices is not None:
+            return len(self._indices)
+
+        return self._vert_count
+
+    @property
+    @_check_types.do
+    def stored_vertex_count(self) -> int:
+        """Number of vertices actually stored (unique ones for an indexed mesh)."""
         return self._vert_count
 
     @property
@@ -524,6 +1064,22 @@ class VBOHandlerBase:
     def faces(self):
         return None
 
+    @property
+    @_check_types.do
+    def triangle_count(self) -> int:
+        """Number of triangles one draw of this mesh submits."""
+        return self.vertex_count // 3
+
+    @_check_types.do
+    def level(self, lod: int) -> "VBOHandlerBase":
+        """Return the handler to draw at level of detail *lod*.
+
+        Only pooled model meshes carry a LOD chain (see
+        :meth:`PooledVBOHandler.load_lods`); everything else is its own
+        level at any distance.
+        """
+        return self
+
     @_check_types.do
     def render(self, pos_loc, rot_loc, scale_loc, normal_loc,
                position: _point.Point, angle: "_angle.Angle", scale: _point.Point,
@@ -534,13 +1090,17 @@ class VBOHandlerBase:
         _render_geometry, which used to set these same uniforms itself
         before calling a bare ``self._vbo.render()``) so every VBO
         handler owns its own uniform-setting -- a compound handler
-        (shapes/text.py's Text, one draw call per glyph rather than
-        one mesh) needs different per-glyph position/rotation/scale
-        values than the single set a real mesh VBO uses as-is, and can
-        only compute those itself, glyph by glyph, if ``render()`` is
-        the one place that both knows the transform *and* issues the
-        draw call -- see Text's own ``render()`` docstring.
+        (shapes/text.py's Text, whose merged label mesh is laid out at
+        font size 1) needs a different rotation/scale than the single
+        set a real mesh VBO uses as-is, and can only derive it itself
+        if ``render()`` is the one place that both knows the transform
+        *and* issues the draw call -- see Text's own ``render()``
+        docstring.
         """
+        if not self.is_resident:
+            # still streaming in, see MeshStreamer
+            return
+
         ctx = self.ctx
         ctx_id = id(ctx)
         if ctx_id not in self._vaos:
@@ -550,7 +1110,7 @@ class VBOHandlerBase:
             GL.glUniform1i(normal_loc, int(smooth))
 
         GL.glUniform3f(pos_loc, *position.as_float)
-        GL.glUniform4f(rot_loc, *[float(str(v)) for v in angle.as_quat_numpy.tolist()])
+        GL.glUniform4f(rot_loc, *angle.as_quat_numpy.tolist())
         GL.glUniform3f(scale_loc, *scale.as_float)
 
         # Attribute offsets (including the arena allocation base) are baked
@@ -559,9 +1119,81 @@ class VBOHandlerBase:
         # a re-acquire with fresh offsets.
         vao = self._vaos[ctx_id]
         GL.glBindVertexArray(vao)
-        GL.glDrawArrays(GL.GL_TRIANGLES, 0, self._vert_count)
+        self._draw()
+        GL.glBindVertexArray(0)
+
+    @_check_types.do
+    def _draw(self, instance_count: int = 0):
+        """Issue the draw call for the bound VAO."""
+        if self._indices is not None:
+            offset = ctypes.c_void_p(self._element_offset)
+            index_count = len(self._indices)
+
+            if instance_count:
+                GL.glDrawElementsInstanced(GL.GL_TRIANGLES, index_count,
+                                           GL.GL_UNSIGNED_INT, offset, instance_count)
+            else:
+                GL.glDrawElements(GL.GL_TRIANGLES, index_count,
+                                  GL.GL_UNSIGNED_INT, offset)
+
+        elif instance_count:
+            GL.glDrawArraysInstanced(GL.GL_TRIANGLES, 0, self._vert_count, instance_count)
+        else:
+            GL.glDrawArrays(GL.GL_TRIANGLES, 0, self._vert_count)
+
+    @_check_types.do
+    def render_instanced(self, normal_loc, smooth: bool, instance_buffer: int,
+                         instance_offset: int, instance_count: int):
+        """Draw *instance_count* copies of this mesh in one call.
+
+        The per-instance transforms are ``FLOATS_PER_INSTANCE`` float records
+        already uploaded to *instance_buffer* starting at byte
+        *instance_offset* (see gl/instancing.py). The caller has the shader's
+        ``useInstanceTransform`` uniform set, so ``objectPosition``/
+        ``objectRotation``/``objectScale`` are ignored for this draw.
+
+        The instance attribute pointers are re-specified on every call
+        because every group shares one per-frame instance buffer at a
+        different offset; the mesh attributes are baked into the VAO the
+        same way :meth:`acquire` bakes them.
+        """
+        ctx_id = id(self.ctx)
+
+        vao = self._instanced_vaos.get(ctx_id, None)
+        if vao is None:
+            vao = self._acquire_instanced(ctx_id)
+
+        if normal_loc is not None:
+            GL.glUniform1i(normal_loc, int(smooth))
+
+        GL.glBindVertexArray(vao)
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, instance_buffer)
+
+        for location, size, offset in _INSTANCE_ATTRIBUTES:
+            GL.glVertexAttribPointer(location, size, GL.GL_FLOAT, GL.GL_FALSE,
+                                     INSTANCE_STRIDE_BYTES,
+                                     ctypes.c_void_p(instance_offset + offset))
+
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
+        self._draw(instance_count)
         GL.glBindVertexArray(0)
 
+    @_check_types.do
+    def _acquire_instanced(self, ctx_id: int) -> int:
+        vao = GL.glGenVertexArrays(1)
+        GL.glBindVertexArray(vao)
+
+        self._bind_mesh_attributes()
+
+        for location, _, _ in _INSTANCE_ATTRIBUTES:
+            GL.glEnableVertexAttribArray(location)
+            GL.glVertexAttribDivisor(location, 1)
+
+        GL.glBindVertexArray(0)
+
+        self._instanced_vaos[ctx_id] = vao
+        return vao
+
     @_check_types.do
     def acquire(self):
         ctx = self.ctx
@@ -570,11 +1202,25 @@ class VBOHandlerBase:
         if ctx_id in self._vaos:
             return
 
-        (buffer_id, pos_offset, smooth_offset, face_offset) = self._attribute_offsets()
-
         vao = GL.glGenVertexArrays(1)
         GL.glBindVertexArray(vao)
 
+        self._bind_mesh_attributes()
+
+        GL.glBindVertexArray(0)
+
+        self._vaos[ctx_id] = vao
+
+    @_check_types.do
+    def _bind_mesh_attributes(self):
+        """Point attributes 0/1/2 of the bound VAO at this mesh's blocks.
+
+        For an indexed mesh the block after the smooth normals is the
+        element array: it is bound as the VAO's element buffer instead and
+        attribute 2 stays disabled (the shaders derive flat normals).
+        """
+        (buffer_id, pos_offset, smooth_offset, face_offset) = self._attribute_offsets()
+
         GL.glBindBuffer(GL.GL_ARRAY_BUFFER, buffer_id)
 
         GL.glEnableVertexAttribArray(0)
@@ -585,14 +1231,17 @@ class VBOHandlerBase:
         GL.glVertexAttribPointer(1, 3, GL.GL_FLOAT, GL.GL_FALSE, 0,
                                  ctypes.c_void_p(smooth_offset))
 
-        GL.glEnableVertexAttribArray(2)
-        GL.glVertexAttribPointer(2, 3, GL.GL_FLOAT, GL.GL_FALSE, 0,
-                                 ctypes.c_void_p(face_offset))
+        if self._indices is not None:
+            GL.glDisableVertexAttribArray(2)
+            # element buffer binding is VAO state -- never unbind it here
+            GL.glBindBuffer(GL.GL_ELEMENT_ARRAY_BUFFER, buffer_id)
+            self._element_offset = face_offset
+        else:
+            GL.glEnableVertexAttribArray(2)
+            GL.glVertexAttribPointer(2, 3, GL.GL_FLOAT, GL.GL_FALSE, 0,
+                                     ctypes.c_void_p(face_offset))
 
         GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
-        GL.glBindVertexArray(0)
-
-        self._vaos[ctx_id] = vao
 
 
 class NonPooledVBOHandler(VBOHandlerBase):
@@ -601,10 +1250,11 @@ class NonPooledVBOHandler(VBOHandlerBase):
                  count: int = 0,
                  aabb: np.ndarray | None = None,
                  obb: np.ndarray | None = None,
-                 *, endpoint: _point.Point | None = None):
+                 *, endpoint: _point.Point | None = None,
+                 indices: np.ndarray | None = None):
 
-        super().__init__(data, count, aabb, obb, endpoint=endpoint)
-        self._vbo = self._create_vbo(self._data)
+        super().__init__(data, count, aabb, obb, endpoint=endpoint, indices=indices)
+        self._vbo = self._create_vbo(self._payload())
         self._dirty_vaos = {}
 
     @_check_types.do
@@ -619,7 +1269,10 @@ class NonPooledVBOHandler(VBOHandlerBase):
 
     @_check_types.do
     def _attribute_offsets(self) -> tuple[int, int, int, int]:
-        """Return (buffer id, position/smooth/face byte offsets)."""
+        """Return (buffer id, position/smooth/face byte offsets).
+
+        The third offset is the element array for an indexed mesh.
+        """
         count = self._vert_count
         buffer_id = self._vbo
         base = 0
@@ -659,11 +1312,14 @@ class NonPooledVBOHandler(VBOHandlerBase):
         return vbo
 
     @_check_types.do
-    def update(self, data: np.ndarray, count: int) -> None:
+    def update(self, data: np.ndarray, count: int,
+               indices: np.ndarray | None = None) -> None:
         self._data = data
-        self._vert_count = self._normalize_vertex_count(count, len(data))
+        self._set_indices(indices)
+        self._vert_count = self._normalize_vertex_count(
+            count, len(data), self._indices is not None)
 
-        self._create_vbo(data, self._vbo)
+        self._create_vbo(self._payload(), self._vbo)
 
         for ctx_id in list(self._dirty_vaos.keys())[:]:
             self._dirty_vaos[ctx_id] = True
@@ -671,6 +1327,19 @@ class NonPooledVBOHandler(VBOHandlerBase):
         self.local_aabb = self._compute_local_aabb()
         self.local_obb = self._compute_local_obb()
 
+    @_check_types.do
+    def write(self, float_offset: int, data: np.ndarray):
+        """Re-send *data* to the buffer *float_offset* floats in.
+
+        For a caller that edits ``data`` in place and only needs the
+        changed range on the GPU (see gl/text_batching.py) -- the layout
+        and vertex count stay what the last :meth:`update` set.
+        """
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self._vbo)
+        GL.glBufferSubData(GL.GL_ARRAY_BUFFER, float_offset * _FLOAT_SIZE,
+                           data.nbytes, data)
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
+
     @_check_types.do
     def _rebuild(self):
         ctx = self.ctx
@@ -682,28 +1351,10 @@ class NonPooledVBOHandler(VBOHandlerBase):
         if not self._dirty_vaos[ctx_id]:
             return
 
-        (buffer_id, pos_offset,
-         smooth_offset, face_offset) = self._attribute_offsets()
-
         vao = self._vaos[ctx_id]
 
         GL.glBindVertexArray(vao)
-
-        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, buffer_id)
-
-        GL.glEnableVertexAttribArray(0)
-        GL.glVertexAttribPointer(0, 3, GL.GL_FLOAT, GL.GL_FALSE, 0,
-                                 ctypes.c_void_p(pos_offset))
-
-        GL.glEnableVertexAttribArray(1)
-        GL.glVertexAttribPointer(1, 3, GL.GL_FLOAT, GL.GL_FALSE, 0,
-                                 ctypes.c_void_p(smooth_offset))
-
-        GL.glEnableVertexAttribArray(2)
-        GL.glVertexAttribPointer(2, 3, GL.GL_FLOAT, GL.GL_FALSE, 0,
-                                 ctypes.c_void_p(face_offset))
-
-        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
+        self._bind_mesh_attributes()
         GL.glBindVertexArray(0)
 
         self._dirty_vaos[ctx_id] = False
@@ -734,23 +1385,186 @@ class PooledVBOHandler(VBOHandlerBase, metaclass=VBOSingleton):
                  aabb: np.ndarray | None = None,
                  obb: np.ndarray | None = None,
                  *, endpoint: _point.Point | None = None,
-                 arena_kind: int = VBO_TYPE_MODEL):
+                 arena_kind: int = VBO_TYPE_MODEL,
+                 indices: np.ndarray | None = None,
+                 source: MeshSource | None = None):
+
+        # A handler created from a MeshSource never gets the packed array:
+        # the mesh goes to the GPU in chunks (MESH_STREAMER) and a host copy
+        # is only built if something reads the data back (see _data).
+        self._source = source
+        self._host_data = None
+        self._streaming = False
 
-        super().__init__(data, count, aabb, obb, endpoint=endpoint)
+        if source is not None:
+            data = source.packed
+            indices = source.indices
+            count = source.count
+
+        super().__init__(data, count, aabb, obb, endpoint=endpoint, indices=indices)
 
         self.id = id_
         self._arena_kind = arena_kind
 
         self._model_arena: _MeshArena | None = None
 
+        # Coarser levels of this mesh, level 1 first -- each one is its own
+        # pooled handler in the model arena (id ``<id>.lod<n>``). Held here
+        # so they live exactly as long as the full mesh does.
+        self.lods: list["PooledVBOHandler"] = []
+
+        if source is not None and self._arena_kind == VBO_TYPE_MODEL:
+            self._payload_nbytes = source.float_count * _FLOAT_SIZE
+
+            self._model_arena = self._allocate_model_arena(
+                self.id, _MeshArena.slots_for(source.float_count), self._soup_count())
+
+            self._streaming = True
+            MESH_STREAMER.queue(self, source)
+
+            self._debug_print_indexed_upload(self._model_arena)
+            return
+
+        payload = self._payload()
+        self._payload_nbytes = payload.nbytes
+
         if self._arena_kind == VBO_TYPE_MODEL:
-            arena = self._allocate_model_arena(self.id, self._vert_count)
+            arena = self._allocate_model_arena(
+                self.id, _MeshArena.slots_for(len(payload)), self._soup_count())
 
-            arena.upload(self.id, self._data)
+            arena.upload(self.id, payload)
 
             self._model_arena = arena
+            self._debug_print_indexed_upload(arena)
         else:
-            self._vbo = self._create_vbo(self._data)
+            self._vbo = self._create_vbo(payload)
+
+    @property
+    @_check_types.do
+    def _data(self) -> np.ndarray | None:
+        data = self._host_data
+
+        if data is None and self._source is not None:
+            # first CPU-side read of a streamed mesh (mesh picking, the
+            # exporter) -- built once and kept, like _expanded_blocks
+            data = self._host_data = self._source.materialize()
+
+        return data
+
+    @_data.setter
+    @_check_types.do
+    def _data(self, value: np.ndarray | None):
+        # while a source is attached the host copy only ever comes from it
+        if self._source is None:
+            self._host_data = value
+
+    @property
+    @_check_types.do
+    def is_resident(self) -> bool:
+        return not self._streaming
+
+    @_check_types.do
+    def read_rows(self, block: int, start: int, stop: int) -> np.ndarray:
+        # straight out of the source when nothing has built the host copy,
+        # so a chunked reader doesn't make one as a side effect
+        if self._host_data is not None or self._source is None:
+            return super().read_rows(block, start, stop)
+
+        n = self._vert_count
+        rows = np.empty((stop - start) * 3, dtype=np.float32)
+        self._source.read((block * n + start) * 3, rows)
+        return rows.reshape(-1, 3)
+
+    @_check_types.do
+    def level(self, lod: int) -> "PooledVBOHandler":
+        """Return the handler for level of detail *lod*, clamped to the
+        coarsest level this mesh has (level 0 is this handler)."""
+        if lod <= 0 or not self.lods:
+            return self
+
+        level = self.lods[min(lod, len(self.lods)) - 1]
+
+        if not level.is_resident:
+            # not streamed in yet, the full mesh stands in for it
+            return self
+
+        return level
+
+    @_check_types.do
+    def load_lods(self, paths: list[tuple[str, str]],
+                  angle: _angle.Angle | None = None,
+                  position: _point.Point | None = None):
+        """Load the coarser levels of this mesh into the model arena.
+
+        *paths* are the ``(packed, element array)`` files of levels 1..n
+        (``Model3D.lod_paths``). The levels go through the same model
+        transform the full mesh does (see ``Base3D._set_model``), are
+        streamed in the same way (:class:`MeshStreamer`) and share its
+        bounding boxes -- a simplified mesh never sticks out of the
+        original far enough to matter for culling or picking, and one box
+        keeps the level switch from moving anything but triangles.
+
+        A level whose id is already registered (another handler for the
+        same model loaded it first) is reused as-is.
+
+        :param paths: Level files, level 1 first.
+        :param angle: Model rotation applied to positions and normals.
+        :param position: Model offset applied to positions.
+        """
+        lods = []
+
+        for level, (packed_path, indices_path) in enumerate(paths, 1):
+            lod_id = f'{self.id}.lod{level}'
+
+            if lod_id in PooledVBOHandler:
+                lods.append(PooledVBOHandler(lod_id))
+                continue
+
+            try:
+                source = MeshSource(packed_path, np.load(indices_path, mmap_mode='r'),
+                                    angle, position)
+            except (OSError, ValueError) as err:
+                # a half written or deleted level just ends the chain early
+                _logger.traceback(err, f'unable to load LOD {level} of {self.id}')
+                break
+
+            lods.append(PooledVBOHandler(
+                lod_id, aabb=self.local_aabb, obb=self.local_obb,
+                arena_kind=VBO_TYPE_MODEL, source=source))
+
+        self.lods = lods
+
+    @property
+    @_check_types.do
+    def lod_triangle_counts(self) -> list[int]:
+        """Triangles per level, level 0 first."""
+        return [self.triangle_count] + [lod.triangle_count for lod in self.lods]
+
+    @_check_types.do
+    def _soup_count(self) -> int:
+        """Arena slots this mesh would take as triangle soup (0 if it is)."""
+        if self._indices is None:
+            return 0
+
+        return len(self._indices)
+
+    @_check_types.do
+    def _debug_print_indexed_upload(self, arena: _MeshArena):
+        if self._indices is None or not self._is_vbo_debug_enabled():
+            return
+
+        soup_bytes, used_bytes = arena.model_savings()[self.id]
+
+        lines = ['[VBO] uploaded indexed model',
+                 f'  allocation_key: {self.id}',
+                 f'  unique_vertices: {self._vert_count}',
+                 f'  indices: {len(self._indices)}',
+                 f'  soup_bytes: {soup_bytes}',
+                 f'  used_bytes: {used_bytes}',
+                 f'  saved_bytes: {soup_bytes - used_bytes} '
+                 f'({(soup_bytes - used_bytes) / float(soup_bytes):.1%})']
+
+        self._log_debug('\n'.join(lines))
 
     @staticmethod
     @_check_types.do
@@ -764,7 +1578,13 @@ class PooledVBOHandler(VBOHandlerBase, metaclass=VBOSingleton):
                f"  free_range_count: {metrics['free_range_count']}",
                f"  largest_free_range: {metrics['largest_free_range']}",
                f"  fragmentation: {metrics['fragmentation']:.4f}",
-               f"  free_ranges: {metrics['free_ranges']}"]
+               f"  free_ranges: {metrics['free_ranges']}",
+               f"  indexed_count: {metrics['indexed_count']}",
+               f"  saved_bytes: {metrics['saved_bytes']}"]
+
+        for key, (soup_bytes, used_bytes) in metrics['model_savings'].items():
+            res.append(f"    {key}: {used_bytes} of {soup_bytes} soup bytes "
+                       f"({(soup_bytes - used_bytes) / float(soup_bytes):.1%} saved)")
 
         return '\n'.join(res)
 
@@ -801,7 +1621,8 @@ class PooledVBOHandler(VBOHandlerBase, metaclass=VBOSingleton):
 
     @classmethod
     @_check_types.do
-    def _allocate_model_arena(cls, key: str, vertex_count: int) -> _MeshArena:
+    def _allocate_model_arena(cls, key: str, vertex_count: int,
+                              soup_count: int = 0) -> _MeshArena:
         needed = int(vertex_count)
         if needed <= 0:
             raise ValueError('vertex_count must be > 0')
@@ -812,7 +1633,7 @@ class PooledVBOHandler(VBOHandlerBase, metaclass=VBOSingleton):
 
         for arena in cls._model_arenas:
             if arena.can_fit(needed):
-                arena.allocate(key, needed)
+                arena.allocate(key, needed, soup_count)
                 return arena
 
         for arena in cls._model_arenas:
@@ -823,7 +1644,7 @@ class PooledVBOHandler(VBOHandlerBase, metaclass=VBOSingleton):
                     after = arena.debug_metrics()
                     cls._debug_print_compaction(before, after)
 
-                    arena.allocate(key, needed)
+                    arena.allocate(key, needed, soup_count)
                     cls._clear_model_vaos_for_arena(arena)
 
                     return arena
@@ -844,7 +1665,7 @@ class PooledVBOHandler(VBOHandlerBase, metaclass=VBOSingleton):
 
             cls._log_debug('\n'.join(msg))
 
-        arena.allocate(key, needed)
+        arena.allocate(key, needed, soup_count)
         return arena
 
     @classmethod
@@ -862,7 +1683,10 @@ class PooledVBOHandler(VBOHandlerBase, metaclass=VBOSingleton):
 
     @_check_types.do
     def _attribute_offsets(self) -> tuple[int, int, int, int]:
-        """Return (buffer id, position/smooth/face byte offsets)."""
+        """Return (buffer id, position/smooth/face byte offsets).
+
+        The third offset is the element array for an indexed mesh.
+        """
         count = self._vert_count
 
         if self._arena_kind == VBO_TYPE_MODEL:
@@ -885,8 +1709,9 @@ class PooledVBOHandler(VBOHandlerBase, metaclass=VBOSingleton):
         return int(buffer_id), int(base), int(base + block_size), int(base + 2 * block_size)
 
     @_check_types.do
-    def update(self, data: np.ndarray, count: int):
-        new_vert_count = self._normalize_vertex_count(count, len(data))
+    def update(self, data: np.ndarray, count: int,
+               indices: np.ndarray | None = None):
+        new_vert_count = self._normalize_vertex_count(count, len(data), indices is not None)
 
         if self._arena_kind == VBO_TYPE_MODEL:
             arena = self._model_arena
@@ -898,25 +1723,51 @@ class PooledVBOHandler(VBOHandlerBase, metaclass=VBOSingleton):
             if alloc is None:
                 raise RuntimeError('model arena allocation is missing')
 
-            if new_vert_count != alloc.count:
+            # replaced wholesale, whatever was still streaming is stale
+            MESH_STREAMER.cancel(self.id)
+            self._streaming = False
+            self._source = None
+
+            self._data = data
+            self._set_indices(indices)
+            self._vert_count = new_vert_count
+
+            # the levels were simplified from the old geometry
+            self.lods = []
+
+            payload = self._payload()
+            self._payload_nbytes = payload.nbytes
+            slots = _MeshArena.slots_for(len(payload))
+
+            if slots != alloc.count:
                 # Vertex count changed — free old slot and re-allocate.
                 arena.free(self.id)
-                arena = self._allocate_model_arena(self.id, new_vert_count)
+                arena = self._allocate_model_arena(self.id, slots, self._soup_count())
                 self._model_arena = arena
                 self._clear_vaos()
+            else:
+                alloc.soup_count = self._soup_count()
+                # same slots, but the block offsets inside them (and whether
+                # there is an element array) can still differ
+                self._clear_vaos()
 
-            self._data = data
-            self._vert_count = new_vert_count
-            arena.upload(self.id, data)
+            arena.upload(self.id, payload)
             self.local_aabb = self._compute_local_aabb()
             self.local_obb = self._compute_local_obb()
             return
 
+        old_nbytes = self._payload_nbytes
         old_vert_count = self._vert_count
+        was_indexed = self._indices is not None
+
         self._data = data
+        self._set_indices(indices)
         self._vert_count = new_vert_count
 
-        if new_vert_count > old_vert_count:
+        payload = self._payload()
+        self._payload_nbytes = payload.nbytes
+
+        if payload.nbytes > old_nbytes or was_indexed != (indices is not None):
             # This buffer was allocated GL_STATIC_DRAW at exactly the old
             # vertex count -- no headroom to grow into. glBufferSubData
             # writing past that allocated size is invalid, so a growth
@@ -925,13 +1776,17 @@ class PooledVBOHandler(VBOHandlerBase, metaclass=VBOSingleton):
             # old buffer id, so they must be cleared and re-acquired
             # against the new one.
             self._release_vbo(self._vbo)
-            self._vbo = self._create_vbo(data)
+            self._vbo = self._create_vbo(payload)
             self._clear_vaos()
         else:
             GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self._vbo)
-            GL.glBufferSubData(GL.GL_ARRAY_BUFFER, 0, data.nbytes, data)
+            GL.glBufferSubData(GL.GL_ARRAY_BUFFER, 0, payload.nbytes, payload)
             GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
 
+            if self._vert_count != old_vert_count:
+                # the block offsets depend on the vertex count
+                self._clear_vaos()
+
         self.local_aabb = self._compute_local_aabb()
         self.local_obb = self._compute_local_obb()
 
@@ -981,6 +1836,7 @@ class PooledVBOHandler(VBOHandlerBase, metaclass=VBOSingleton):
         Safe to call even if the key is not present.
         """
         cls.release_model_allocation(key)
+        MESH_STREAMER.cancel(key)
         with VBOSingleton._instances_lock:  # NOQA
             ref = VBOSingleton._instances.pop(key, None)  # NOQA
         if ref is not None:
@@ -989,6 +1845,11 @@ class PooledVBOHandler(VBOHandlerBase, metaclass=VBOSingleton):
                 instance._clear_vaos()  # NOQA
                 instance._model_arena = None  # NOQA
 
+                for lod in instance.lods:
+                    cls.evict(lod.id)
+
+                instance.lods = []
+
     @_check_types.do
     def release(self):
         super().release()
@@ -1036,15 +1897,25 @@ def create_model_vbo(model):
     if data_path is None:
         return None
 
-    packed = np.load(data_path, mmap_mode='r')
+    # None for models converted before the indexed format
+    indices = getattr(model, 'indices', None)
 
     if uuid in PooledVBOHandler:
+        packed = np.load(data_path, mmap_mode='r')
+
         vbo = PooledVBOHandler(uuid)
-        if len(packed) != len(vbo.data):
-            vbo.update(packed, len(packed))
+
+        # compared by size, not against vbo.data -- that would build the
+        # host copy of a streamed mesh just to measure it
+        floats_per_vertex = INDEXED_FLOATS_PER_VERTEX if vbo.is_indexed else FLOATS_PER_VERTEX
+        if (len(packed) != vbo.stored_vertex_count * floats_per_vertex or
+                (indices is None) == vbo.is_indexed):
+            vbo.update(packed, len(packed), indices)
         return vbo
 
-    return PooledVBOHandler(uuid, packed, len(packed),
+    # streamed in over the next frames, see MeshStreamer
+    return PooledVBOHandler(uuid,
                             aabb=getattr(model, 'aabb', None),
                             obb=getattr(model, 'obb', None),
-                            arena_kind=VBO_TYPE_MODEL)
+                            arena_kind=VBO_TYPE_MODEL,
+                            source=MeshSource(data_path, indices))
@@ -43,41 +43,33 @@ _BRANCH_NO_FIT = _materials.Plastic(_color.Color(1.0, 0.4, 0.0, 1.0))
 # ---------------------------------------------------------------------------
 
 @_check_types.do
-def _repoint_all_references(ptables, old_point_id: int, new_point_id: int) -> None:
+def _repoint_all_references(ptables, old_point_id: bytes, new_point_id: bytes) -> None:
     """
     Replace every reference to *old_point_id* with *new_point_id* across all project tables.
-    """
 
-    from ..database.project_db.cleanup import _POINT3D_REFS
+    The rows to change come straight from the topology index (see
+    ``database.project_db.topology``) and every change goes through the
+    owning table's ``update`` -- one per row, however many of its columns
+    referenced the point -- so the entry caches and the index itself stay
+    current.
+    """
+    topology = ptables.topology
 
-    con = ptables.pjt_wires_table._con
-    for table_name, col in _POINT3D_REFS:
-        con.execute(
-            f'UPDATE {table_name} SET {col} = ? WHERE {col} = ?;',
-            (new_point_id, old_point_id))
+    changes = {}
+    for table_name, column, row_id in topology.references(old_point_id):
+        changes.setdefault((table_name, row_id), {})[column] = new_point_id
 
-    con.commit()
+    for (table_name, row_id), values in changes.items():
+        topology.table(table_name).update(row_id, **values)
 
 
 @_check_types.do
-def _delete_point_if_orphaned(ptables, point_id: int) -> None:
+def _delete_point_if_orphaned(ptables, point_id: bytes) -> None:
     """
     Delete *point_id* from pjt_points3d if nothing references it.
     """
-
-    from ..database.project_db.cleanup import _POINT3D_REFS
-
-    con = ptables.pjt_wires_table._con
-    for table_name, col in _POINT3D_REFS:
-        rows = con.execute(
-            f'SELECT id FROM {table_name} WHERE {col} = ? LIMIT 1;',
-            (point_id,)).fetchall()
-
-        if rows:
-            return
-
-    con.execute('DELETE FROM pjt_points3d WHERE id = ?;', (point_id,))
-    con.commit()
+    if not ptables.topology.is_referenced(point_id):
+        ptables.pjt_points3d_table.delete(point_id)
 
 
 @_check_types.do
@@ -104,54 +96,7 @@ def _walk_bundle_chain(bundle_db_obj, ptables) -> list:
     Returns an ordered list of Point IDs:
         [end_A_id, layout_id, ..., end_B_id]
     """
-    @_check_types.do
-    def _has_layout(point_id):
-        return bool(ptables.pjt_bundle_layouts_table.select(
-            'id', position3d_id=point_id))
-
-    @_check_types.do
-    def _next_section(current_id, from_point_id, visited):
-        rows = (ptables.pjt_bundles_table.select(
-            'id', start_point3d_id=from_point_id) +
-                ptables.pjt_bundles_table.select(
-                    'id', stop_point3d_id=from_point_id))
-
-        for row in rows:
-            bid = row[0]
-            if bid != current_id and bid not in visited:
-                return bid
-
-        return None
-
-    @_check_types.do
-    def _walk_direction(start_section_id, leaving_point_id):
-        pts, current_id, current_pt = [], start_section_id, leaving_point_id
-        visited = {start_section_id}
-        while True:
-            pts.append(current_pt)
-            if not _has_layout(current_pt):
-                break
-
-            next_id = _next_section(current_id, current_pt, visited)
-            if next_id is None:
-                break
-
-            visited.add(next_id)
-            next_db = ptables.pjt_bundles_table[next_id]
-            next_start = next_db.start_position3d_id
-            next_stop = next_db.stop_position3d_id
-            current_pt = next_stop if next_start == current_pt else next_start
-            current_id = next_id
-
-        return pts
-
-    section_id = bundle_db_obj.db_id
-    start_id = bundle_db_obj.start_position3d_id
-    stop_id = bundle_db_obj.stop_position3d_id
-    toward_start = _walk_direction(section_id, start_id)
-    toward_stop = _walk_direction(section_id, stop_id)
-
-    return list(reversed(toward_start)) + toward_stop
+    return ptables.topology.bundle_chain(bundle_db_obj.db_id)
 
 
 # ---------------------------------------------------------------------------
@@ -4,11 +4,14 @@
 
 import platform
 from .. import config as _config
+import collections
+import csv
 import datetime
 import io
 import re
 import sys
 import threading
+import time
 import typing
 import zipfile
 import os
@@ -92,6 +95,79 @@ _ARCHIVE_RE = re.compile(
     rf'^({_TS_PATTERN}) - ({_TS_PATTERN})(?:-\d+)?\.archive$')
 
 
+# Entries the worker formats and writes in one go. Bigger blocks amortise
+# the formatter and the write better but let the file overshoot
+# max_logfile_size by more before it rotates.
+_BLOCK_SIZE = 1024
+
+# Matches the date_format the per-entry DataFrame.to_csv() used to write
+# with, so files written before and after read back the same.
+_TIMESPEC = 'microseconds'
+
+
+class _ColumnBlock:
+    """A block of log entries held as three preallocated columns.
+
+    The worker thread copies each queued entry's fields into the next slot
+    and, once the block is full (or the queue runs dry), formats the whole
+    block to CSV in one pass and clears it for reuse. Nothing is allocated
+    per entry beyond what the entry itself already holds.
+    """
+
+    __slots__ = ('timestamps', 'levels', 'messages', 'count')
+
+    def __init__(self, capacity=_BLOCK_SIZE):
+        self.timestamps = [None] * capacity
+        self.levels = [None] * capacity
+        self.messages = [None] * capacity
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def append(self, log_entry):
+        """Copy one :func:`build_message` dict into the block.
+
+        :returns: ``True`` once the block is full.
+        :rtype: bool
+        """
+        i = self.count
+        self.timestamps[i] = log_entry.get('timestamp')
+        self.levels[i] = log_entry.get('level')
+        self.messages[i] = log_entry.get('message')
+        self.count = i + 1
+        return self.count == len(self.timestamps)
+
+    def columns(self):
+        """The filled part of each column, in ``timestamp, level, message``
+        order."""
+        n = self.count
+        return self.timestamps[:n], self.levels[:n], self.messages[:n]
+
+    def clear(self):
+        """Empty the block, dropping its references to the messages."""
+        n = self.count
+        self.timestamps[:n] = self.levels[:n] = self.messages[:n] = [None] * n
+        self.count = 0
+
+    def to_csv(self):
+        """Format the block as CSV rows, no header.
+
+        :mod:`csv` is what pandas' own ``to_csv`` writes through, so quoting
+        is identical to the one-row DataFrames this replaces; only the
+        timestamp is formatted here instead of by pandas.
+        """
+        timestamps, levels, messages = self.columns()
+        timestamps = [ts.isoformat(timespec=_TIMESPEC)
+                      if isinstance(ts, datetime.datetime) else ts
+                      for ts in timestamps]
+
+        buf = io.StringIO()
+        csv.writer(buf, lineterminator='\n').writerows(
+            zip(timestamps, levels, messages))
+        return buf.getvalue()
+
+
 def _parse_ts(text):
     """Parse a filename timestamp field back into a ``datetime``.
 
@@ -122,18 +198,24 @@ class LogHandler(threading.Thread):
     """Write structured log entries to rotating CSV log files.
 
     Writing runs entirely on this object's own thread. write() just
-    appends the entry to a plain list and releases a semaphore - it never
-    touches pandas, the CSV file, or blocks on anything, so callers never
-    stall on log I/O. run() (this thread's body) is the only code that
-    ever pops from that list and does the actual work, so there's nothing
-    to lock between one call to write() and another.
+    appends the entry to a deque and sets an event - it never touches
+    pandas, the CSV file, or blocks on anything, so callers never stall on
+    log I/O. run() (this thread's body) is the only code that ever pops
+    from that deque and does the actual work, so there's nothing to lock
+    between one call to write() and another.
+
+    The work is done in blocks, not per entry: run() drains the queue into
+    a :class:`_ColumnBlock`, formats and writes each full (or final) block
+    with one CSV pass, and collects what it wrote for the bound callback,
+    which gets it as one DataFrame at most every
+    ``Config.viewer_update_ms`` - however many entries that is.
     """
 
     def _fake_callback(self, _=None):
         """Placeholder callback invoked when no external callback is bound.
 
-        :param _: A DataFrame for a new entry, or a RotationEvent for a
-            rotation.
+        :param _: A DataFrame of newly written entries, or a RotationEvent
+            for a rotation.
         :type _: pandas.DataFrame | RotationEvent | None
         :returns: ``None``.
         :rtype: None
@@ -146,18 +228,24 @@ class LogHandler(threading.Thread):
 
         self._callback = self._fake_callback
 
-        # FIFO work queue for the worker thread: append()/pop(0) are each
-        # a single atomic operation under the GIL, and there's exactly one
-        # consumer (run(), on this thread), so nothing else needs to guard
-        # access to this list.
-        self._queue = []
-        # Starts at 0 so run()'s first acquire() blocks immediately;
-        # write()/flush() each call release() exactly once per item they
-        # add, which is always valid on a Semaphore (unlike a Lock, it has
-        # no "already unlocked" error state to race into).
-        self._signal = threading.Semaphore(0)
+        # FIFO work queue for the worker thread: append()/popleft() are
+        # each a single atomic operation on a deque, and there's exactly
+        # one consumer (run(), on this thread), so nothing else needs to
+        # guard access to it.
+        self._queue = collections.deque()
+        # Set by write()/flush() after they add an item. run() clears it
+        # *before* draining the queue, so an item added mid-drain either
+        # gets drained in this pass or sets it again for the next one.
+        self._wake = threading.Event()
         self._exit_event = threading.Event()
 
+        self._block = _ColumnBlock()
+
+        # Written entries not yet handed to the callback, as columns, and
+        # when the callback last got any (see _deliver()).
+        self._undelivered = ([], [], [])
+        self._last_delivery = 0.0
+
         if not os.path.exists(Config.save_path):
             os.makedirs(Config.save_path)
 
@@ -231,8 +319,10 @@ class LogHandler(threading.Thread):
         """Bind a callback invoked (via CallAfter, on the main thread) after
         writes and file rotation events.
 
-        :param callback: Callable receiving either the written entry's
-            DataFrame, or - on rotation - a RotationEvent.
+        :param callback: Callable receiving either a DataFrame of the
+            entries written since it was last called (at most every
+            ``Config.viewer_update_ms``), or - on rotation - a
+            RotationEvent.
         :type callback: collections.abc.Callable
         :returns: ``None``.
         :rtype: None
@@ -374,55 +464,108 @@ class LogHandler(threading.Thread):
             return
 
         self._queue.append(log_entry)
-        self._signal.release()
+        self._wake.set()
 
     def run(self):
         """Worker thread body: the only code that writes/rotates log files."""
-        while not self._exit_event.is_set():
-            self._signal.acquire()
-
-            while self._queue:
-                item = self._queue.pop(0)
+        queue = self._queue
+        block = self._block
+
+        while True:
+            # Undelivered entries put a deadline on the wait so they reach
+            # the callback even if nothing else is logged for a while.
+            self._wake.wait(self._delivery_timeout())
+            self._wake.clear()
+            exiting = self._exit_event.is_set()
+
+            while queue:
+                item = queue.popleft()
                 if isinstance(item, threading.Event):
-                    # A flush()/stop() barrier: flush what's been written so
-                    # far *before* releasing the caller waiting on it - that
-                    # ordering is the guarantee flush() makes.
+                    # A flush()/stop() barrier: write and flush what's been
+                    # queued so far *before* releasing the caller waiting on
+                    # it - that ordering is the guarantee flush() makes.
+                    self._write_entries()
                     self._flush_file()
                     item.set()
-                else:
-                    self._process_entry(item)
+                elif block.append(item):
+                    self._write_entries()
 
-            # Queue's empty: one flush for however many entries were just
-            # batched through in this pass, instead of one per entry.
+            # Queue's empty: one write and one flush for however many
+            # entries were just batched through in this pass.
+            self._write_entries()
             self._flush_file()
+            self._deliver(force=exiting)
+
+            if exiting:
+                break
 
     def _flush_file(self):
         if self._logfile is not None:
             self._logfile.flush()
 
-    def _process_entry(self, log_entry: dict):
-        """Write one entry to the CSV file and rotate if it's now too big."""
-        try:
-            df = pd.DataFrame([log_entry])
+    def _delivery_timeout(self):
+        """Seconds until the undelivered entries are due, ``None`` if there
+        aren't any."""
+        if not self._undelivered[0]:
+            return None
+
+        due = self._last_delivery + Config.viewer_update_ms / 1000.0
+        return max(due - time.monotonic(), 0.0)
+
+    def _deliver(self, force=False):
+        """Hand the entries written since the last delivery to the callback
+        as one DataFrame, unless the last delivery was less than
+        ``Config.viewer_update_ms`` ago.
+
+        :param force: Deliver regardless of the interval - before a
+            RotationEvent, so the entries still arrive ahead of it.
+        :type force: bool
+        """
+        timestamps, levels, messages = self._undelivered
+        if not timestamps:
+            return
+
+        now = time.monotonic()
+        if not force and now - self._last_delivery < Config.viewer_update_ms / 1000.0:
+            return
+
+        # built from plain datetimes, so 'timestamp' is datetime64 from
+        # the start - see build_message()
+        df = pd.DataFrame({'timestamp': timestamps, 'level': levels,
+                           'message': messages})
+
+        self._undelivered = ([], [], [])
+        self._last_delivery = now
+
+        # Deferred: this module is imported synchronously as part of
+        # harness_designer.app's own module-level `from . import
+        # logger`, so `..app` isn't fully loaded yet at that point. By
+        # the time a write actually happens, it is.
+        from .. import app as _app
+        _app.CallAfter(self._callback, df)
+
+    def _write_entries(self):
+        """Write the current block to the CSV file and rotate if it's now
+        too big."""
+        block = self._block
+        if not len(block):
+            return
 
-            # date_format matches datetime.isoformat() so the on-disk
-            # format is unchanged now that 'timestamp' is a real
-            # datetime64 column instead of a pre-stringified one.
-            data = df.to_csv(header=False, index=False, encoding='utf-8',
-                             lineterminator='\n',
-                             date_format='%Y-%m-%dT%H:%M:%S.%f')
+        try:
+            data = block.to_csv()
 
             self._logfile.write(data)
             self._current_size += len(data.encode('utf-8'))
 
-            # Deferred: this module is imported synchronously as part of
-            # harness_designer.app's own module-level `from . import
-            # logger`, so `..app` isn't fully loaded yet at that point. By
-            # the time a write actually happens, it is.
-            from .. import app as _app
-            _app.CallAfter(self._callback, df)
+            if self._callback is not self._fake_callback:
+                for column, values in zip(self._undelivered, block.columns()):
+                    column.extend(values)
 
             if self._current_size >= Config.max_logfile_size:
+                # everything written to the file that's closing goes out
+                # before the rotation does
+                self._deliver(force=True)
+
                 closed_path = self._close_current_file()
 
                 archive_path = None
@@ -431,9 +574,10 @@ class LogHandler(threading.Thread):
 
                 self._open_next_file()
 
-                # A RotationEvent (as opposed to write()'s DataFrame) tells
-                # the viewer this is a rotation, and where the file it
-                # might currently be showing now lives.
+                # A RotationEvent (as opposed to a DataFrame of entries)
+                # tells the viewer this is a rotation, and where the file
+                # it might currently be showing now lives.
+                from .. import app as _app
                 _app.CallAfter(
                     self._callback, RotationEvent(closed_path, archive_path))
 
@@ -449,6 +593,9 @@ class LogHandler(threading.Thread):
                 except Exception:  # NOQA
                     pass
 
+        finally:
+            block.clear()
+
     def stop(self):
         """Drain the queue, stop the worker thread, and close the file.
 
@@ -456,7 +603,7 @@ class LogHandler(threading.Thread):
         """
         self.flush()
         self._exit_event.set()
-        self._signal.release()
+        self._wake.set()
         self.join()
 
         if self._logfile is not None:
@@ -477,7 +624,7 @@ class LogHandler(threading.Thread):
         """
         barrier = threading.Event()
         self._queue.append(barrier)
-        self._signal.release()
+        self._wake.set()
         barrier.wait()
 
         if self._logfile is not None:
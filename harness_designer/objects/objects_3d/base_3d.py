@@ -2,7 +2,6 @@
 
 from typing import TYPE_CHECKING
 
-import numpy as np
 from OpenGL import GL
 
 from ... import color as _color
@@ -14,6 +13,7 @@ from ...gl import materials as _materials
 from ...gl import vbo as _vbo
 from ...shapes import text as _text
 from .. import objectsvar as _objectsvar
+from .. import project_loader as _project_loader
 
 from ... import debug as _debug
 from ... import check_types as _check_types
@@ -54,6 +54,11 @@ class Base3D(_objectsvar.BaseVar):
     # ray hit and pure nearest-hit picking could never select the handle.
     _pick_priority: int = 0
 
+    # Plain single-mesh objects may be drawn through an instanced group
+    # (see BaseVar.instance_key). Subclasses whose render() does more than
+    # the generic passes (per-segment transforms, overlays) opt back out.
+    _instanced: bool = True
+
     # Local-canvas mouse position that opened this object's context menu,
     # stashed by mainframe.py's _on_obj_right_click_3d right before it
     # calls get_context_menu() -- a plain instance attribute rather than a
@@ -142,27 +147,41 @@ class Base3D(_objectsvar.BaseVar):
             if uuid in _vbo.PooledVBOHandler:
                 vbo = _vbo.PooledVBOHandler(uuid)
             else:
-                packed = np.load(model.data_path).reshape(-1, 3)
-
                 angle = model.angle3d
                 position = model.position3d
-                count = model.vertex_count
-
-                obb = model.obb
-                aabb = model.aabb
-
-                obb @= angle
-                aabb @= angle
-
-                obb += position
-                aabb += position
-
-                packed @= angle
-                packed[:count] += position
 
-                packed = packed.reshape(-1)
+                # During a project load the bounding boxes were already
+                # transformed on a worker thread (which also had the OS
+                # read the file ahead) -- see project_loader.ModelPrefetch.
+                prepared = _project_loader.MODEL_PREFETCH.take(uuid)
+
+                if prepared is not None:
+                    aabb, obb = prepared
+                else:
+                    obb = model.obb
+                    aabb = model.aabb
+
+                    obb @= angle
+                    aabb @= angle
+
+                    obb += position
+                    aabb += position
+
+                # The packed geometry itself is never loaded here: the
+                # source memory maps it and the rotation/offset is applied
+                # chunk by chunk as it streams into the arena over the next
+                # frames (gl.vbo.MeshStreamer).
+                source = _vbo.MeshSource(model.data_path, model.indices, angle, position)
+                vbo = _vbo.PooledVBOHandler(uuid, aabb=aabb, obb=obb, source=source)
+
+            if not vbo.lods:
+                # the coarser levels the canvas switches to when the part
+                # is small on screen (see CanvasBase._select_lods); models
+                # converted before the LOD chain existed have none
+                lod_paths = model.lod_paths
+                if lod_paths:
+                    vbo.load_lods(lod_paths, model.angle3d, model.position3d)
 
-                vbo = _vbo.PooledVBOHandler(uuid, packed, count, aabb=aabb, obb=obb)
             vbo.acquire()
 
             self._vbo = vbo
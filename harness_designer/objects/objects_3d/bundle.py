@@ -17,6 +17,7 @@ from ... import config as _config
 from ...gl import materials as _materials
 from . import mixins as _mixins
 from ... import utils as _utils
+from ... import app_mixins as _app_mixins
 from ... import check_types as _check_types
 
 
@@ -33,6 +34,9 @@ class Bundle(_base_3d.Base3D, _mixins.WireTypeMixin):
 
     UNKNOWN details are inferred from the class name and surrounding code.
     """
+    # render() draws one transform per sub-segment
+    _instanced = False
+
     parent: "_bundle.Bundle" = None
     db_obj: "_pjt_bundle.PJTBundle" = None
 
@@ -237,6 +241,7 @@ class Bundle(_base_3d.Base3D, _mixins.WireTypeMixin):
         self._compute_obb()
         self._compute_aabb()
 
+    @_app_mixins.coalesce
     @_check_types.do
     def _update_position(self, _: _point.Point):
         """Recompute geometry immediately, not deferred to the next render
@@ -296,6 +301,8 @@ class Bundle(_base_3d.Base3D, _mixins.WireTypeMixin):
     @_check_types.do
     def _compute_aabb(self):
         """See _compute_obb -- same union-of-segments envelope."""
+        self._mark_scene_dirty()
+
         if self._vbo is None:
             return
 
@@ -87,6 +87,9 @@ class Housing(_base_3d.Base3D):
 
     UNKNOWN details are inferred from the class name and surrounding code.
     """
+    # render() adds cavity markers and terminal overlays on top of the mesh
+    _instanced = False
+
     parent: "_housing.Housing" = None
     db_obj: "_pjt_housing.PJTHousing" = None
 
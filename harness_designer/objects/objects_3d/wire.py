@@ -20,6 +20,7 @@ from ... import color as _color
 from ... import config as _config
 from ... import utils as _utils
 from . import mixins as _mixins
+from ... import app_mixins as _app_mixins
 from ... import check_types as _check_types
 
 if TYPE_CHECKING:
@@ -42,6 +43,9 @@ class Wire(_base_3d.Base3D, _mixins.WireTypeMixin):
 
     UNKNOWN details are inferred from the class name and surrounding code.
     """
+    # render() draws one transform per sub-segment
+    _instanced = False
+
     parent: "_wire.Wire" = None
     db_obj: "_pjt_wire.PJTWire" = None
 
@@ -325,6 +329,7 @@ class Wire(_base_3d.Base3D, _mixins.WireTypeMixin):
         self._compute_obb()
         self._compute_aabb()
 
+    @_app_mixins.coalesce
     @_check_types.do
     def _update_position(self, _: _point.Point):
         """Recompute geometry immediately, not deferred to the next
@@ -387,6 +392,8 @@ class Wire(_base_3d.Base3D, _mixins.WireTypeMixin):
     @_check_types.do
     def _compute_aabb(self):
         """See _compute_obb -- same union-of-segments envelope."""
+        self._mark_scene_dirty()
+
         if self._vbo is None:
             return
 
@@ -652,6 +659,8 @@ class WireStripe(_base_3d.Base3D):
 
     UNKNOWN details are inferred from the class name and surrounding code.
     """
+    # drawn per segment through render_segment with clip uniforms
+    _instanced = False
 
     @_check_types.do
     def __init__(self, parent: "_wire.Wire", wire: Wire, color: _color.Color, scale: _point.Point,
@@ -12,6 +12,7 @@ from ...geometry import angle as _angle
 from ...gl import materials as _materials
 from ...shapes import cylinder as _cylinder
 from ... import utils as _utils
+from ... import app_mixins as _app_mixins
 from ... import check_types as _check_types
 from ... import config as _config
 
@@ -288,6 +289,7 @@ class Bundle(_base_pegboard.BasePegboard):
         self._compute_obb()
         self._compute_aabb()
 
+    @_app_mixins.coalesce
     @_check_types.do
     def _update_position(self, _: "_point.Point | None"):
         """Recompute geometry immediately, not deferred to the next
@@ -323,6 +325,8 @@ class Bundle(_base_pegboard.BasePegboard):
     @_check_types.do
     def _compute_aabb(self):
         """See :meth:`_compute_obb` -- same union-of-segments envelope."""
+        self._mark_scene_dirty()
+
         if self._vbo is None:
             return
 
@@ -69,6 +69,11 @@ class Cavity(_base_schematic.BaseSchematic):
     # (see _build_vbo), never a real mesh VBO.
     _vbo: "_text.Text | None" = None
 
+    # nothing but the label, so the canvas can draw it from a text layer
+    # and skip render() altogether (see gl/text_batching.py)
+    _text_batched = True
+    _text_only = True
+
     @_check_types.do
     def __init__(self, parent: "_cavity.Cavity",
                  db_obj: "_pjt_cavity.PJTCavity"):
@@ -199,15 +204,28 @@ class Cavity(_base_schematic.BaseSchematic):
             return
 
         real_position = self._position
-
-        local_offset = _point.Point(*self._local_text_corners()[3].tolist())
-        self._position = self._position + (local_offset @ self._angle)
+        self._position = self._label_position()
 
         try:
             super().render(faces_program, edges_program, vertices_program)
         finally:
             self._position = real_position
 
+    @_check_types.do
+    def _label_position(self) -> _point.Point:
+        """The label's own RIGHT/BOTTOM anchor in world space -- where
+        :meth:`render` draws it (see that method's docstring)."""
+        local_offset = _point.Point(*self._local_text_corners()[3].tolist())
+        return self._position + (local_offset @ self._angle)
+
+    @_check_types.do
+    def _text_placements(self) -> list:
+        # the same anchor render() shifts to
+        if self._vbo is None:
+            return []
+
+        return [(self._vbo, self._label_position(), self._angle, self._scale, self.material)]
+
     @_check_types.do
     def _local_text_corners(self) -> np.ndarray:
         """This cavity's own rendered text bounds, as 4 corners in
@@ -246,6 +264,8 @@ class Cavity(_base_schematic.BaseSchematic):
     @_check_types.do
     def _compute_aabb(self):
         """Same corners as :meth:`_compute_obb` -- see its docstring."""
+        self._mark_scene_dirty()
+
         if self._vbo is None:
             return
 
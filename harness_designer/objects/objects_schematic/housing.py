@@ -99,6 +99,10 @@ class Housing(_base_schematic.BaseSchematic):
     _parent: "_housing.Housing" = None
     db_obj: "_pjt_housing.PJTHousing"
 
+    # The corner label may come from a text layer (see
+    # gl/text_batching.py); render() still draws the rectangle.
+    _text_batched = True
+
     @_check_types.do
     def __init__(self, parent: "_housing.Housing",
                  db_obj: "_pjt_housing.PJTHousing"):
@@ -479,12 +483,18 @@ class Housing(_base_schematic.BaseSchematic):
         cavity names and terminal brackets/names are each drawn
         independently by their own ``objects_schematic/cavity.py``'s
         ``Cavity``/``objects_schematic/terminal.py``'s ``Terminal``.
+        The corner label is left out while the canvas is drawing it
+        from a text layer instead (``texts_batched``, see
+        gl/text_batching.py).
         """
         super().render(faces_program, edges_program, vertices_program)
 
         if not self.is_visible or self._position is None or not self._corner_label_lines:
             return
 
+        if self.texts_batched:
+            return
+
         real_vbo, real_material, real_selected_material, real_angle, real_scale, real_position = (
             self._vbo, self._material, self._selected_material,
             self._angle, self._scale, self._position)
@@ -505,24 +515,46 @@ class Housing(_base_schematic.BaseSchematic):
         self._angle = _angle.Angle()
         self._scale = _point.Point(1.0, 1.0, 1.0)
 
+        for line, position in self._corner_label_positions():
+            self._vbo = line
+            self._position = position
+
+            super().render(faces_program, edges_program, vertices_program)
+
+        self._vbo, self._material, self._selected_material, self._angle, self._scale, self._position = (
+            real_vbo, real_material, real_selected_material,
+            real_angle, real_scale, real_position)
+
+    @_check_types.do
+    def _corner_label_positions(self) -> list:
+        """``(text, world position)`` per corner label line, stacked up
+        from the rotated corner anchor (see :meth:`render`)."""
         local_x, local_z = self._corner_label_local
         wx, wy, wz = self._world_offset(local_x, local_z)
-        anchor = _point.Point(real_position.x + wx, wy, real_position.z + wz)
+        anchor = _point.Point(self._position.x + wx, wy, self._position.z + wz)
 
         line_height = Config.object_sizes.housing.font_size * _CORNER_LABEL_LINE_HEIGHT_SCALE
         line_count = len(self._corner_label_lines)
 
+        positions = []
         for i, line in enumerate(self._corner_label_lines):
             z_offset = (line_count - 1 - i) * line_height
+            positions.append(
+                (line, _point.Point(anchor.x - line.width, anchor.y, anchor.z + z_offset)))
 
-            self._vbo = line
-            self._position = _point.Point(anchor.x - line.width, anchor.y, anchor.z + z_offset)
+        return positions
 
-            super().render(faces_program, edges_program, vertices_program)
+    @_check_types.do
+    def _text_placements(self) -> list:
+        # upright, unit scale and always the label colour -- see render()
+        if not self._corner_label_lines:
+            return []
 
-        self._vbo, self._material, self._selected_material, self._angle, self._scale, self._position = (
-            real_vbo, real_material, real_selected_material,
-            real_angle, real_scale, real_position)
+        identity_angle = _angle.Angle()
+        unit_scale = _point.Point(1.0, 1.0, 1.0)
+
+        return [(line, position, identity_angle, unit_scale, self._corner_label_material)
+                for line, position in self._corner_label_positions()]
 
     @_check_types.do
     def _world_offset(self, local_x: float, local_z: float) -> tuple[float, float, float]:
@@ -45,6 +45,11 @@ class Note(_base_schematic.BaseSchematic):
     # (see __init__), never a real mesh VBO.
     _vbo: "_text.Text | None" = None
 
+    # nothing but the label, so the canvas can draw it from a text layer
+    # and skip render() altogether (see gl/text_batching.py)
+    _text_batched = True
+    _text_only = True
+
     @_check_types.do
     def __init__(self, parent: "_note.Note", db_obj: "_pjt_note.PJTNote"):
         """Initialise the :class:`Note` instance.
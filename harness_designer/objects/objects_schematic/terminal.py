@@ -82,6 +82,10 @@ class Terminal(_base_schematic.BaseSchematic):
     _parent: "_terminal.Terminal" = None
     db_obj: "_pjt_terminal.PJTTerminal"
 
+    # The name line(s) and bracket may come from a text layer (see
+    # gl/text_batching.py); render() still draws the wire-stub cylinder.
+    _text_batched = True
+
     @_check_types.do
     def __init__(self, parent: "_terminal.Terminal",
                  db_obj: "_pjt_terminal.PJTTerminal"):
@@ -347,6 +351,8 @@ class Terminal(_base_schematic.BaseSchematic):
     @_check_types.do
     def _compute_aabb(self):
         """Same bounds as :meth:`_compute_obb` -- see its docstring."""
+        self._mark_scene_dirty()
+
         if not self._name_lines:
             return
 
@@ -397,7 +403,9 @@ class Terminal(_base_schematic.BaseSchematic):
         (``Text`` tracks no position/angle of its own -- see
         ``Text.render()``'s own docstring), so those (not just
         ``self._vbo``) get swapped and restored around the name/bracket
-        passes too -- same as the cylinder pass already does.
+        passes too -- same as the cylinder pass already does. Both are
+        left out while the canvas is drawing them from a text layer
+        instead (``texts_batched``, see gl/text_batching.py).
         """
         if not self.is_visible:
             return
@@ -406,20 +414,13 @@ class Terminal(_base_schematic.BaseSchematic):
             self._vbo, self._angle, self._scale, self._position)
         identity_angle = _angle.Angle()
 
-        for line, (local_x, local_z) in zip(self._name_lines, self._name_local_positions):
-            self._vbo = line
-            self._angle = identity_angle
-            self._scale = real_scale
-            self._position = self._local_to_world(local_x, local_z)
-            super().render(faces_program, edges_program, vertices_program)
-
-        if hasattr(self, '_bracket'):
-            bracket_x, bracket_z = self._bracket_local_position
-            self._vbo = self._bracket
-            self._angle = identity_angle
-            self._scale = real_scale
-            self._position = self._local_to_world(bracket_x, bracket_z)
-            super().render(faces_program, edges_program, vertices_program)
+        if not self.texts_batched:
+            for text, position in self._label_positions():
+                self._vbo = text
+                self._angle = identity_angle
+                self._scale = real_scale
+                self._position = position
+                super().render(faces_program, edges_program, vertices_program)
 
         self._angle, self._scale, self._position = real_angle, real_scale, real_position
 
@@ -450,6 +451,31 @@ class Terminal(_base_schematic.BaseSchematic):
 
         self._vbo = real_vbo
 
+    @_check_types.do
+    def _label_positions(self) -> list:
+        """``(text, world position)`` for every name line and the "("
+        bracket, in draw order -- each drawn upright (identity angle),
+        only its anchor following the housing (see
+        :meth:`_local_to_world`)."""
+        positions = [
+            (line, self._local_to_world(local_x, local_z))
+            for line, (local_x, local_z) in zip(self._name_lines, self._name_local_positions)
+        ]
+
+        if hasattr(self, '_bracket'):
+            bracket_x, bracket_z = self._bracket_local_position
+            positions.append((self._bracket, self._local_to_world(bracket_x, bracket_z)))
+
+        return positions
+
+    @_check_types.do
+    def _text_placements(self) -> list:
+        identity_angle = _angle.Angle()
+        material = self.material
+
+        return [(text, position, identity_angle, self._scale, material)
+                for text, position in self._label_positions()]
+
     @_check_types.do
     def _rebuild(self, _entry=None):
         """Rebuild everything (see :meth:`_rebuild_geometry`) from this
@@ -16,6 +16,7 @@ from ...gl import materials as _materials
 from ... import utils as _utils
 from ...shapes import cylinder as _cylinder
 from ...shapes import helix as _helix
+from ... import app_mixins as _app_mixins
 from ... import check_types as _check_types
 
 
@@ -278,6 +279,8 @@ class Wire(_base_schematic.BaseSchematic):
     @_check_types.do
     def _compute_aabb(self):
         """See _compute_obb -- same union-of-segments envelope."""
+        self._mark_scene_dirty()
+
         if self._vbo is None:
             return
 
@@ -291,6 +294,7 @@ class Wire(_base_schematic.BaseSchematic):
             for j in range(3):
                 self._aabb[i][j] = aabb[i][j]
 
+    @_app_mixins.coalesce
     @_check_types.do
     def _update_position(self, _position: _point.Point):
         """Recompute geometry immediately whenever any endpoint or
@@ -50,6 +50,12 @@ class BaseVar:
         self._is_selected = False
         self._is_visible = False
 
+        # (SceneBuffer, slot) of every canvas scene this view is culled in
+        # and (PickBVH, slot) of every picking index it is in -- filled in
+        # by gl.culling.SceneBuffer.add/gl.pick_bvh.PickBVH.add, see
+        # _mark_scene_dirty
+        self.scene_slots: list = []
+
         self.parent = parent
         self.db_obj = db_obj
         self._vbo = vbo
@@ -140,6 +146,14 @@ class BaseVar:
         objects.wire.Wire.set_selected)."""
         return self._selected_material
 
+    @property
+    @_check_types.do
+    def unselected_material(self) -> _materials.GLMaterial | None:
+        """The material this object was created with -- what it shows when
+        nothing selects or identifies it. The scene exporter writes this
+        rather than the selection tint."""
+        return self._unselected_material
+
     @property
     @_check_types.do
     def vbo(self):
@@ -172,8 +186,21 @@ class BaseVar:
         local_obb @= self._angle
         self._obb = local_obb + self._position
 
+    @_check_types.do
+    def _mark_scene_dirty(self):
+        # The culler works on its own copy of this view's AABB, position
+        # and opacity (see gl.culling.SceneBuffer), the picking index on
+        # its own copy of the AABB (gl.pick_bvh.PickBVH); every change to
+        # one of them has to be reported here. The copy is taken at the
+        # next cull or pick, so calling this before the arrays are updated
+        # is fine.
+        for scene, slot in self.scene_slots:
+            scene.mark_dirty(slot)
+
     @_check_types.do
     def _compute_aabb(self):
+        self._mark_scene_dirty()
+
         if self._vbo is None:
             return
 
@@ -389,6 +416,8 @@ class BaseVar:
         else:
             self._is_opaque[0] = int(self._material.is_opaque)
 
+        self._mark_scene_dirty()
+
     @_check_types.do
     def _update_position(self, position: _point.Point):
         """
@@ -580,6 +609,8 @@ class BaseVar:
         else:
             self._is_opaque[0] = int(self._material.is_opaque)
 
+        self._mark_scene_dirty()
+
         self._is_selected = flag
 
     @_check_types.do
@@ -779,13 +810,127 @@ class BaseVar:
         if self._vbo is None:
             return
 
-        self._vbo.render(
+        self.lod_vbo.render(
             pos_loc, rot_loc, scale_loc, normal_loc,
             self._position, self._angle, self._scale, self.smooth)
 
+    # Level of detail the canvas picked for this object this frame (see
+    # CanvasBase._select_lods); 0 is the full mesh.
+    lod: int = 0
+
+    @property
+    @_check_types.do
+    def lod_vbo(self):
+        """The handler that actually gets drawn: ``_vbo`` at :attr:`lod`."""
+        vbo = self._vbo
+
+        if self.lod and isinstance(vbo, _vbo_base.PooledVBOHandler):
+            return vbo.level(self.lod)
+
+        return vbo
+
     def _render_selected(self):
         pass
 
+    # Whether render() for this class is exactly the generic faces/edges/
+    # vertices passes below and nothing else, so the canvas may draw it
+    # through an instanced group instead (see instance_key). Off here;
+    # Base3D turns it on and classes that add their own per-segment or
+    # overlay drawing turn it back off.
+    _instanced = False
+
+    @_check_types.do
+    def instance_key(self) -> tuple | None:
+        """Return the group key this object can be instanced under, or
+        ``None`` if it has to go through its own render().
+
+        Objects with the same key share one mesh (same pooled VBO id), one
+        material and one shading mode, so a whole group renders with one
+        ``glDrawArraysInstanced`` per pass -- see ``gl/instancing.py``.
+        Selected and translucent objects are never instanced: both rely on
+        the canvas's per-object draw order.
+        """
+        if not self._instanced or self._is_selected:
+            return None
+
+        vbo = self._vbo
+        if (not isinstance(vbo, _vbo_base.PooledVBOHandler) or vbo.is_dirty or
+                not vbo.is_resident):
+            return None
+
+        if not self.is_visible or not self.is_opaque:
+            return None
+
+        # not ``None in (...)``: that compares with ==, which Angle does not
+        # accept None for
+        if self._position is None or self._angle is None or self._scale is None:
+            return None
+
+        # keyed on the level actually drawn, so near and far copies of the
+        # same part land in different groups
+        return self.lod_vbo.id, self.material.batch_key, bool(self.smooth)
+
+    # Whether this object's shapes/text.py Text labels may be drawn out of
+    # a canvas-wide text layer (see gl/text_batching.py) instead of by its
+    # own render(), and whether those labels are all render() draws -- an
+    # object that is nothing but labels then skips render() altogether.
+    # Off here; the schematic/peg-board label objects turn them on.
+    _text_batched = False
+    _text_only = False
+
+    # Set by the canvas every frame (see gl/text_batching.TextBatcher):
+    # True while this object's labels are being drawn from a text layer,
+    # so a render() that draws more than labels leaves them out.
+    texts_batched: bool = False
+
+    @_check_types.do
+    def text_placements(self) -> list | None:
+        """Return ``(text, position, angle, scale, material)`` for every
+        Text label render() would draw, or ``None`` if the labels have to
+        go through this object's own render() this frame.
+
+        Selected and translucent objects always draw their own, for the
+        same draw-order reasons as :meth:`instance_key`.
+        """
+        if not self._text_batched or self._is_selected:
+            return None
+
+        if not self.is_visible or not self.is_opaque:
+            return None
+
+        # see instance_key
+        if self._position is None or self._angle is None or self._scale is None:
+            return None
+
+        return self._text_placements()
+
+    @_check_types.do
+    def _text_placements(self) -> list:
+        # an object whose _vbo is its label, drawn at its own transform
+        if self._vbo is None:
+            return []
+
+        return [(self._vbo, self._position, self._angle, self._scale, self.material)]
+
+    @_check_types.do
+    def _edge_material(self) -> _materials.GLMaterial:
+        """Material for the debug edge pass, contrasted against this
+        object's own color."""
+        material_color = self.material.diffuse[:3]  # Get RGB
+
+        # Calculate perceived brightness using standard luminance formula
+        # Human eye perceives green more than red, and red more than blue
+        luminance = (0.299 * material_color[0] +
+                     0.587 * material_color[1] +
+                     0.114 * material_color[2])
+
+        if luminance < _debug_config.edge_luminance_threshold:
+            e_color = _debug_config.edge_color_dark[:] + [1.0]
+        else:
+            e_color = _debug_config.edge_color_light[:] + [1.0]
+
+        return _materials.Metallic(_color.Color(*e_color))
+
     @_check_types.do
     def render(self, faces_program, edges_program, vertices_program):
         """
@@ -826,22 +971,9 @@ class BaseVar:
             GL.glUseProgram(0)
 
         if _debug_config.draw_edges:
-            material_color = self.material.diffuse[:3]  # Get RGB
-
-            # Calculate perceived brightness using standard luminance formula
-            # Human eye perceives green more than red, and red more than blue
-            luminance = (0.299 * material_color[0] +
-                         0.587 * material_color[1] +
-                         0.114 * material_color[2])
-
-            if luminance < _debug_config.edge_luminance_threshold:
-                e_color = _debug_config.edge_color_dark[:] + [1.0]
-            else:
-                e_color = _debug_config.edge_color_light[:] + [1.0]
-
             GL.glUseProgram(edges_program)
 
-            material = _materials.Metallic(_color.Color(*e_color))
+            material = self._edge_material()
 
             material.set(edges_program)
 
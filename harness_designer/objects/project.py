@@ -25,6 +25,7 @@ from .objects_3d.wire import _HELIX_OVERSHOOT_MM  # NOQA
 from . import wire_layout as _wire_layout
 from . import wire_marker as _wire_marker
 from . import wire_service_loop as _wire_service_loop
+from . import project_loader as _project_loader
 from .. import config as _config
 from .. import logger as _logger
 from ..shapes import helix as _helix
@@ -178,7 +179,8 @@ class Project:
                 aabb @= angle
                 obb @= angle
 
-                vbo = _vbo_handler.PooledVBOHandler(uuid, packed, v_count, aabb, obb)
+                vbo = _vbo_handler.PooledVBOHandler(uuid, packed, v_count, aabb, obb,
+                                                    indices=model3d.indices)
 
         self._model = _project_model.ProjectModel(self.mainframe, project_obj, vbo)
 
@@ -208,213 +210,268 @@ class Project:
         self.project_name = project_name
         self.ptables = ptables = mainframe.project_db
         ptables.load(project_id)
-        mainframe.object_browser.reset()
 
-        project_obj = mainframe.project_db.projects_table[project_id]
-        model = project_obj.model
-        self._model = None
-
-        if model is not None:
-            model.load('project', project_id, self._set_model)
-
-        from ..database.project_db.cleanup import ProjectCleanup
-
-        self.cleanup = ProjectCleanup(self)
-
-        self._boots = {}
-        self._bundles = {}
-        self._bundle_layouts = {}
-        self._covers = {}
-        self._cpa_locks = {}
-        self._housings = {}
-        self._notes = {}
-        self._seals = {}
-        self._splices = {}
-        self._terminals = {}
-        self._tpa_locks = {}
-        self._transitions = {}
-        self._wires = {}
-        self._wire_markers = {}
-        self._wire_service_loops = {}
-        self._wire_layouts = {}
-        self._circuits = {}
-        self._cavities = {}
-
-        self._obj_count = mainframe.project_db.projects_table.get_object_count(project_id)
-
-        mainframe.start_progress('Loading Project...', self._obj_count)
-
-        # Every state an object might reflexively read via mainframe.project
-        # during its own construction below (db_obj, ptables, the container
-        # dicts) is already set at this point -- assign it now, before any
-        # object loads, instead of waiting for this constructor to return.
-        # Objects loaded further down (e.g. Wire, whose stripe-VBO seeding
-        # reads mainframe.project.db_obj.wire_stripe_max_length) run inside
-        # this same call stack, and mainframe.project's getter re-enters
-        # _open_project() -- re-showing the open-project dialog -- for as
-        # long as it's still None.
-        mainframe.project = self
-
-        count = 0
-
-        # Build the shared wire-stripe helix mesh at the project's last
-        # known max wire-segment length *before* any Wire loads, so it
-        # never needs to grow (and re-upload its VBO) more than once per
-        # session even if this project has hundreds of wires -- see
-        # shapes.helix.create_vbo and objects_3d.wire.WireStripe. Padded by
-        # the same _HELIX_OVERSHOOT_MM headroom WireStripe._ensure_stripe_capacity
-        # builds in when it grows the mesh mid-session -- otherwise the
-        # very first live drag/preview after loading would immediately
-        # trigger a regrow. VBO creation requires an acquired GL context,
-        # same as every other VBO-creating call site (e.g. Wire.__init__).
-        # with mainframe.editor3d.context:
-        #     # we have to store the VBO in a variable this way it doesn't get GC'd
-        #     # If we store it as a variable name that goes unusedCython may throw a
-        #     # a warning for it.
-        #     _ = _helix.create_vbo(db_obj.wire_stripe_max_length + _HELIX_OVERSHOOT_MM)
-
-        @_check_types.do
-        def _load_objects(table_, label, obj_cls, container,
-                          cur_count, max_count):
-            # helper function for loading a project
-            # note: the object browser tree is populated by
-            # mainframe.add_object -- every wrapper's __init__ calls it
-            # unconditionally (project_load or not), so there is no
-            # separate add-to-browser step here.
-
-            for db_obj_ in table_:
-                cur_count += 1
-                if cur_count < max_count:
-                    mainframe.set_progress(cur_count, f'Loading {label}...')
-                else:
-                    mainframe.set_progress(max_count - 1, f'Loading {label}...')
-
-                gui_obj = obj_cls(mainframe, db_obj_, project_load=True)
-                container[db_obj_.db_id] = gui_obj
-
-                _logger.info(f'{label} Loaded - db_id: {db_obj_.db_id}')
-
-            return cur_count
-
-        start_time = time.time()
-        count = _load_objects(
-            ptables.pjt_notes_table, 'Note',
-            _note.Note, self._notes,
-            count, self._obj_count)
-
-        count = _load_objects(
-            ptables.pjt_circuits_table, 'Circuit',
-            _circuit.Circuit, self._circuits,
-            count, self._obj_count)
-
-        # Loaded before housings: a housing whose model is already cached
-        # from a prior session runs its Model3D.load() callback (_set_model,
-        # ending in match_cavity_surfaces()) synchronously, during its own
-        # construction below -- match_cavity_surfaces() needs this housing's
-        # cavities to already exist (Cavity.get_object() resolving to real
-        # wrapper objects) or it leaves every cavity's surf_idx/
-        # wire_surf_idx unset, permanently unclickable for the rest of the
-        # session (it's a one-shot callback, never reruns on its own).
-        # Cavity construction has no dependency on the housing wrapper
-        # existing yet -- it only reads its own pjt_cavities row, whose
-        # position3d/angle3d/obb/aabb were already fully computed and
-        # persisted at insert time.
-        count = _load_objects(
-            ptables.pjt_cavities_table, 'Cavity',
-            _cavity.Cavity, self._cavities,
-            count, self._obj_count)
-
-        count = _load_objects(
-            ptables.pjt_housings_table, 'Housing',
-            _housing.Housing, self._housings,
-            count, self._obj_count)
-
-        count = _load_objects(
-            ptables.pjt_covers_table, 'Cover',
-            _cover.Cover, self._covers,
-            count, self._obj_count)
-
-        count = _load_objects(
-            ptables.pjt_cpa_locks_table, 'CPA Lock',
-            _cpa_lock.CPALock, self._cpa_locks,
-            count, self._obj_count)
-
-        count = _load_objects(
-            ptables.pjt_tpa_locks_table, 'TPA Lock',
-            _tpa_lock.TPALock, self._tpa_locks,
-            count, self._obj_count)
-
-        count = _load_objects(
-            ptables.pjt_boots_table, 'Boot',
-            _boot.Boot, self._boots,
-            count, self._obj_count)
-
-        count = _load_objects(
-            ptables.pjt_terminals_table, 'Terminal',
-            _terminal.Terminal, self._terminals,
-            count, self._obj_count)
-
-        count = _load_objects(
-            ptables.pjt_seals_table, 'Seal',
-            _seal.Seal, self._seals,
-            count, self._obj_count)
-
-        count = _load_objects(
-            ptables.pjt_wires_table, 'Wire',
-            _wire.Wire, self._wires,
-            count, self._obj_count)
-
-        count = _load_objects(
-            ptables.pjt_wire_service_loops_table, 'Wire Service Loop',
-            _wire_service_loop.WireServiceLoop, self._wire_service_loops,
-            count, self._obj_count)
-
-        count = _load_objects(
-            ptables.pjt_wire_markers_table, 'Wire Marker',
-            _wire_marker.WireMarker, self._wire_markers,
-            count, self._obj_count)
-
-        count = _load_objects(
-            ptables.pjt_wire_layouts_table, 'Wire Layout',
-            _wire_layout.WireLayout, self._wire_layouts,
-            count, self._obj_count)
-
-        count = _load_objects(
-            ptables.pjt_splices_table, 'Splice',
-            _splice.Splice, self._splices,
-            count, self._obj_count)
-
-        # Terminal/Wire/WireServiceLoop/Splice all exist by now -- rebuild
-        # the in-memory sibling graph between them from persisted point-id
-        # matches (set_sibling/add_wire's own bookkeeping is weakrefs only,
-        # nothing DB-persisted -- see objects.wire.Wire.set_sibling).
-        _reconcile_wire_sibling_graph(self)
-
-        count = _load_objects(
-            ptables.pjt_bundles_table, 'Bundle',
-            _bundle.Bundle, self._bundles,
-            count, self._obj_count)
-
-        count = _load_objects(
-            ptables.pjt_bundle_layouts_table, 'Bundle Layout',
-            _bundle_layout.BundleLayout, self._bundle_layouts,
-            count, self._obj_count)
-
-        count = _load_objects(
-            ptables.pjt_transitions_table, 'Transition',
-            _transition.Transition, self._transitions,
-            count, self._obj_count)
-
-        # Bundle/Transition both exist by now -- rebuild the in-memory
-        # sibling graph between them from persisted point-id matches
-        # (see _reconcile_wire_sibling_graph above for why this is a
-        # from-scratch rebuild rather than something reload can skip).
-        _reconcile_bundle_sibling_graph(self)
-
-        stop_time = time.time()
+        # One range SELECT per pjt_* table up front, instead of one SELECT
+        # per property per object while the objects below are built -- see
+        # PJTTableBase.preload. Released when the load ends, whether or not
+        # every object made it.
+        ptables.preload(project_id)
+        try:
+            # Start reading and transforming every catalog model the project
+            # places on worker threads now, in the order the stages below
+            # construct them (housings first), so Base3D._set_model finds them
+            # ready instead of doing that work itself on this thread -- see
+            # project_loader.ModelPrefetch. Only the VBO uploads and the
+            # wrapper construction stay on this thread.
+            _project_loader.MODEL_PREFETCH.start()
+            prefetched = _project_loader.prefetch_models([
+                ptables.pjt_housings_table,
+                ptables.pjt_covers_table,
+                ptables.pjt_cpa_locks_table,
+                ptables.pjt_tpa_locks_table,
+                ptables.pjt_boots_table,
+                ptables.pjt_terminals_table,
+                ptables.pjt_seals_table,
+                ptables.pjt_splices_table
+            ])
+            _logger.info(f'project load: {prefetched} models queued for prefetch')
+
+            # every object below adds its row to the browser (see
+            # mainframe.add_object); they are shown together in one model
+            # reset at the end instead of one insert each
+            mainframe.object_browser.reset()
+            mainframe.object_browser.begin_load()
+
+            project_obj = mainframe.project_db.projects_table[project_id]
+            model = project_obj.model
+            self._model = None
+
+            if model is not None:
+                model.load('project', project_id, self._set_model)
+
+            from ..database.project_db.cleanup import ProjectCleanup
+
+            self.cleanup = ProjectCleanup(self)
+
+            self._boots = {}
+            self._bundles = {}
+            self._bundle_layouts = {}
+            self._covers = {}
+            self._cpa_locks = {}
+            self._housings = {}
+            self._notes = {}
+            self._seals = {}
+            self._splices = {}
+            self._terminals = {}
+            self._tpa_locks = {}
+            self._transitions = {}
+            self._wires = {}
+            self._wire_markers = {}
+            self._wire_service_loops = {}
+            self._wire_layouts = {}
+            self._circuits = {}
+            self._cavities = {}
+
+            self._obj_count = mainframe.project_db.projects_table.get_object_count(project_id)
+
+            mainframe.start_progress('Loading Project...', self._obj_count)
+
+            # Every state an object might reflexively read via mainframe.project
+            # during its own construction below (db_obj, ptables, the container
+            # dicts) is already set at this point -- assign it now, before any
+            # object loads, instead of waiting for this constructor to return.
+            # Objects loaded further down (e.g. Wire, whose stripe-VBO seeding
+            # reads mainframe.project.db_obj.wire_stripe_max_length) run inside
+            # this same call stack, and mainframe.project's getter re-enters
+            # _open_project() -- re-showing the open-project dialog -- for as
+            # long as it's still None.
+            mainframe.project = self
+
+            count = 0
+
+            # Build the shared wire-stripe helix mesh at the project's last
+            # known max wire-segment length *before* any Wire loads, so it
+            # never needs to grow (and re-upload its VBO) more than once per
+            # session even if this project has hundreds of wires -- see
+            # shapes.helix.create_vbo and objects_3d.wire.WireStripe. Padded by
+            # the same _HELIX_OVERSHOOT_MM headroom WireStripe._ensure_stripe_capacity
+            # builds in when it grows the mesh mid-session -- otherwise the
+            # very first live drag/preview after loading would immediately
+            # trigger a regrow. VBO creation requires an acquired GL context,
+            # same as every other VBO-creating call site (e.g. Wire.__init__).
+            # with mainframe.editor3d.context:
+            #     # we have to store the VBO in a variable this way it doesn't get GC'd
+            #     # If we store it as a variable name that goes unusedCython may throw a
+            #     # a warning for it.
+            #     _ = _helix.create_vbo(db_obj.wire_stripe_max_length + _HELIX_OVERSHOOT_MM)
+
+            # label -> (object count, seconds), logged once loading is done
+            load_times = {}
+
+            @_check_types.do
+            def _load_objects(table_, label, obj_cls, container,
+                              cur_count, max_count):
+                # helper function for loading a project
+                # note: the object browser tree is populated by
+                # mainframe.add_object -- every wrapper's __init__ calls it
+                # unconditionally (project_load or not), so there is no
+                # separate add-to-browser step here.
+                #
+                # Objects are built in time slices (see project_loader.
+                # TimeSlicer): the 3D editor repaints and the event queue is
+                # pumped between slices and once more when this stage ends, so
+                # each stage -- housings before anything that attaches to
+                # them -- is on screen while the later stages still load.
+                table_start = time.perf_counter()
+                start_count = cur_count
+
+                with _project_loader.TimeSlicer(mainframe, max_count) as slicer:
+                    for db_obj_ in table_:
+                        cur_count += 1
+
+                        gui_obj = obj_cls(mainframe, db_obj_, project_load=True)
+                        container[db_obj_.db_id] = gui_obj
+
+                        _logger.info(f'{label} Loaded - db_id: {db_obj_.db_id}')
+
+                        slicer.tick(cur_count, f'Loading {label}...')
+
+                load_times[label] = (cur_count - start_count, time.perf_counter() - table_start)
+
+                return cur_count
+
+            start_time = time.time()
+            count = _load_objects(
+                ptables.pjt_notes_table, 'Note',
+                _note.Note, self._notes,
+                count, self._obj_count)
+
+            count = _load_objects(
+                ptables.pjt_circuits_table, 'Circuit',
+                _circuit.Circuit, self._circuits,
+                count, self._obj_count)
+
+            # Loaded before housings: a housing whose model is already cached
+            # from a prior session runs its Model3D.load() callback (_set_model,
+            # ending in match_cavity_surfaces()) synchronously, during its own
+            # construction below -- match_cavity_surfaces() needs this housing's
+            # cavities to already exist (Cavity.get_object() resolving to real
+            # wrapper objects) or it leaves every cavity's surf_idx/
+            # wire_surf_idx unset, permanently unclickable for the rest of the
+            # session (it's a one-shot callback, never reruns on its own).
+            # Cavity construction has no dependency on the housing wrapper
+            # existing yet -- it only reads its own pjt_cavities row, whose
+            # position3d/angle3d/obb/aabb were already fully computed and
+            # persisted at insert time.
+            count = _load_objects(
+                ptables.pjt_cavities_table, 'Cavity',
+                _cavity.Cavity, self._cavities,
+                count, self._obj_count)
+
+            count = _load_objects(
+                ptables.pjt_housings_table, 'Housing',
+                _housing.Housing, self._housings,
+                count, self._obj_count)
+
+            count = _load_objects(
+                ptables.pjt_covers_table, 'Cover',
+                _cover.Cover, self._covers,
+                count, self._obj_count)
+
+            count = _load_objects(
+                ptables.pjt_cpa_locks_table, 'CPA Lock',
+                _cpa_lock.CPALock, self._cpa_locks,
+                count, self._obj_count)
+
+            count = _load_objects(
+                ptables.pjt_tpa_locks_table, 'TPA Lock',
+                _tpa_lock.TPALock, self._tpa_locks,
+                count, self._obj_count)
+
+            count = _load_objects(
+                ptables.pjt_boots_table, 'Boot',
+                _boot.Boot, self._boots,
+                count, self._obj_count)
+
+            count = _load_objects(
+                ptables.pjt_terminals_table, 'Terminal',
+                _terminal.Terminal, self._terminals,
+                count, self._obj_count)
+
+            count = _load_objects(
+                ptables.pjt_seals_table, 'Seal',
+                _seal.Seal, self._seals,
+                count, self._obj_count)
+
+            count = _load_objects(
+                ptables.pjt_wires_table, 'Wire',
+                _wire.Wire, self._wires,
+                count, self._obj_count)
+
+            count = _load_objects(
+                ptables.pjt_wire_service_loops_table, 'Wire Service Loop',
+                _wire_service_loop.WireServiceLoop, self._wire_service_loops,
+                count, self._obj_count)
+
+            count = _load_objects(
+                ptables.pjt_wire_markers_table, 'Wire Marker',
+                _wire_marker.WireMarker, self._wire_markers,
+                count, self._obj_count)
+
+            count = _load_objects(
+                ptables.pjt_wire_layouts_table, 'Wire Layout',
+                _wire_layout.WireLayout, self._wire_layouts,
+                count, self._obj_count)
+
+            count = _load_objects(
+                ptables.pjt_splices_table, 'Splice',
+                _splice.Splice, self._splices,
+                count, self._obj_count)
+
+            # Terminal/Wire/WireServiceLoop/Splice all exist by now -- rebuild
+            # the in-memory sibling graph between them from persisted point-id
+            # matches (set_sibling/add_wire's own bookkeeping is weakrefs only,
+            # nothing DB-persisted -- see objects.wire.Wire.set_sibling).
+            _reconcile_wire_sibling_graph(self)
+
+            count = _load_objects(
+                ptables.pjt_bundles_table, 'Bundle',
+                _bundle.Bundle, self._bundles,
+                count, self._obj_count)
+
+            count = _load_objects(
+                ptables.pjt_bundle_layouts_table, 'Bundle Layout',
+                _bundle_layout.BundleLayout, self._bundle_layouts,
+                count, self._obj_count)
+
+            count = _load_objects(
+                ptables.pjt_transitions_table, 'Transition',
+                _transition.Transition, self._transitions,
+                count, self._obj_count)
+
+            # Bundle/Transition both exist by now -- rebuild the in-memory
+            # sibling graph between them from persisted point-id matches
+            # (see _reconcile_wire_sibling_graph above for why this is a
+            # from-scratch rebuild rather than something reload can skip).
+            _reconcile_bundle_sibling_graph(self)
+
+            stop_time = time.time()
+        finally:
+            # also when an object fails to load -- the browser must not keep
+            # holding back the rows of objects added later, the held rows
+            # must not answer reads for the rest of the session, and the
+            # prefetch workers must not keep running
+            mainframe.object_browser.end_load()
+            ptables.release_preload()
+            _project_loader.MODEL_PREFETCH.finish()
 
         duration = (stop_time - start_time)
         _logger.info('Project Load Time:', round(duration, 2), 'secs')
+
+        for label, (obj_count, obj_duration) in sorted(
+                load_times.items(), key=lambda item: item[1][1], reverse=True):
+
+            _logger.info(f'    {label}: {obj_count} objects, {round(obj_duration * 1000.0, 2)} ms')
         mainframe.set_progress(self._obj_count, 'DONE!')
 
         if self._obj_count != count:
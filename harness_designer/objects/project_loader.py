@@ -0,0 +1,268 @@
+# © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
+
+"""Staging helpers for opening a project (see :class:`.project.Project`)."""
+
+from typing import TYPE_CHECKING
+
+import os
+import time
+import threading
+import concurrent.futures
+import numpy as np
+
+from .. import config as _config
+from .. import logger as _logger
+from .. import check_types as _check_types
+
+
+if TYPE_CHECKING:
+    from .. import ui as _ui
+    from ..database.global_db import model3d as _model3d
+    from ..database.project_db import pjt_bases as _pjt_bases
+
+
+Config = _config.Config.project
+
+
+_READAHEAD_SIZE = 1024 * 1024
+
+
+@_check_types.do
+def _read_ahead(path: str) -> None:
+    # Get the file into the OS page cache without keeping any of it: the
+    # GUI thread later memory maps it and streams it to the GPU
+    # (gl.vbo.MeshStreamer), and those reads should hit memory, not disk.
+    with open(path, 'rb', buffering=0) as f:
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+            return
+
+        chunk = bytearray(_READAHEAD_SIZE)
+        while f.readinto(chunk):
+            pass
+
+
+@_check_types.do
+def _prepare_model(data_path: str, indices_path: str | None, angle, position: np.ndarray,
+                   aabb: np.ndarray, obb: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # Worker-thread half of Base3D._set_model's "not pooled yet" branch --
+    # the same bounding box transforms, just off the GUI thread, plus a
+    # read-ahead of the files. Every database read was done by
+    # ModelPrefetch.submit.
+    _read_ahead(data_path)
+
+    if indices_path is not None:
+        _read_ahead(indices_path)
+
+    obb @= angle
+    aabb @= angle
+
+    obb += position
+    aabb += position
+
+    return aabb, obb
+
+
+class ModelPrefetch:
+    """
+    Read ahead the files of every model a project uses on a small thread
+    pool while the GUI thread builds the project's objects.
+
+    This used to load and transform every model's whole packed array here,
+    which had every mesh of the project in memory at once by the time the
+    objects picked them up -- the peak of a project open. The geometry now
+    streams from a memory map into the arena (``gl.vbo.MeshStreamer``), so
+    all that is left to do ahead of time is to get the files into the OS
+    page cache and transform the bounding boxes. :meth:`submit` starts that
+    for every model up front (the database reads on the calling thread,
+    the rest on the pool) and ``Base3D._set_model`` picks the boxes up with
+    :meth:`take`.
+
+    Anything not prefetched (models still converting, a failed read, a
+    model first used after the load) goes through ``_set_model``'s own
+    synchronous path as before.
+    """
+
+    @_check_types.do
+    def __init__(self):
+        self._executor: concurrent.futures.ThreadPoolExecutor | None = None
+        self._futures: dict[str, concurrent.futures.Future] = {}
+        self._lock = threading.Lock()
+
+    @_check_types.do
+    def start(self) -> None:
+        """Create the worker pool (``Config.project.load_workers`` threads,
+        ``0`` meaning one per CPU)."""
+        workers = Config.load_workers
+        if workers <= 0:
+            workers = os.cpu_count() or 1
+
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix='project_load')
+
+    @_check_types.do
+    def submit(self, model: "_model3d.Model3D") -> bool:
+        """Queue *model* for loading, unless it's already queued, already
+        pooled or not converted yet.
+
+        :param model: The model a project object is about to load.
+        :type model: :class:`_model3d.Model3D`
+        :returns: ``True`` when the model was queued.
+        :rtype: bool
+        """
+        from ..gl import vbo as _vbo
+
+        if self._executor is None:
+            return False
+
+        uuid = model.uuid
+        if uuid is None or uuid in self._futures or uuid in _vbo.PooledVBOHandler:
+            return False
+
+        data_path = model.data_path
+        aabb = model.aabb
+        obb = model.obb
+
+        if data_path is None or aabb is None or obb is None:
+            return False
+
+        position = np.array(model.position3d.as_float, dtype=np.float32)
+
+        future = self._executor.submit(
+            _prepare_model, data_path, model.indices_path, model.angle3d, position, aabb, obb)
+
+        with self._lock:
+            self._futures[uuid] = future
+
+        return True
+
+    @_check_types.do
+    def take(self, uuid: str) -> tuple[np.ndarray, np.ndarray] | None:
+        """Return ``(aabb, obb)`` prepared for *uuid*, waiting for the
+        worker if it hasn't finished yet.
+
+        :returns: The prepared arrays, or ``None`` when *uuid* wasn't
+            prefetched (or its worker failed) -- the caller prepares the
+            model itself.
+        :rtype: tuple[numpy.ndarray, numpy.ndarray] | None
+        """
+        with self._lock:
+            future = self._futures.pop(uuid, None)
+
+        if future is None:
+            return None
+
+        try:
+            return future.result()
+        except Exception as err:  # NOQA
+            _logger.traceback(err, msg=f'model prefetch failed: {uuid}')
+            return None
+
+    @_check_types.do
+    def finish(self) -> None:
+        """Drop every result nobody claimed and shut the pool down."""
+        with self._lock:
+            futures = list(self._futures.values())
+            self._futures.clear()
+
+        for future in futures:
+            future.cancel()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+MODEL_PREFETCH = ModelPrefetch()
+
+
+class TimeSlicer:
+    """
+    Run a project-loading stage in time slices on the GUI thread.
+
+    While a slice runs, the 3D editor's ``Refresh()`` is suppressed (the
+    editor's own ``with editor3d:`` counter), so constructing an object
+    doesn't queue a repaint of the whole scene each time. Every
+    ``Config.project.load_slice_ms`` milliseconds :meth:`tick` ends the
+    slice: the editor is refreshed once, the progress bar updated and the
+    event queue pumped, so everything loaded so far is on screen before
+    the next slice starts. Leaving the ``with`` block ends the final slice
+    the same way -- a stage's objects (e.g. every housing) are always
+    shown before the next stage begins.
+    """
+
+    @_check_types.do
+    def __init__(self, mainframe: "_ui.MainFrame", max_count: int):
+        self._mainframe = mainframe
+        self._max_count = max_count
+        self._slice = Config.load_slice_ms / 1000.0
+        self._deadline = 0.0
+        self._count = 0
+        self._label = ''
+        self.slices = 0
+
+    @_check_types.do
+    def __enter__(self) -> "TimeSlicer":
+        self._mainframe.editor3d.__enter__()
+        self._deadline = time.perf_counter() + self._slice
+        return self
+
+    @_check_types.do
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._mainframe.editor3d.__exit__(exc_type, exc_val, exc_tb)
+        self._present()
+
+    @_check_types.do
+    def tick(self, count: int, label: str) -> None:
+        """Record progress and end the slice once its time is up.
+
+        :param count: Objects loaded so far.
+        :type count: int
+        :param label: Progress bar message.
+        :type label: str
+        """
+        self._count = count
+        self._label = label
+
+        if time.perf_counter() < self._deadline:
+            return
+
+        self._mainframe.editor3d.__exit__(None, None, None)
+        self._present()
+        self._mainframe.editor3d.__enter__()
+
+        self._deadline = time.perf_counter() + self._slice
+
+    @_check_types.do
+    def _present(self) -> None:
+        self.slices += 1
+        self._mainframe.editor3d.Refresh()
+
+        # set_progress pumps the event queue; never hand it the maximum
+        # here, which would hide the bar before the load is finished
+        self._mainframe.set_progress(max(0, min(self._count, self._max_count - 1)), self._label)
+
+
+@_check_types.do
+def prefetch_models(tables: list["_pjt_bases.PJTTableBase"]) -> int:
+    """Queue the model of every row in *tables* with :data:`MODEL_PREFETCH`,
+    in table order.
+
+    :param tables: Tables whose entries have a catalog ``part`` with a
+        ``model3d`` (housings, covers, terminals, ...).
+    :returns: The number of models queued.
+    :rtype: int
+    """
+    queued = 0
+
+    for table in tables:
+        for entry in table:
+            part = entry.part
+            if part is None:
+                continue
+
+            model = getattr(part, 'model3d', None)
+            if model is not None and MODEL_PREFETCH.submit(model):
+                queued += 1
+
+    return queued
@@ -5,12 +5,13 @@ from typing import TYPE_CHECKING, Union
 import multiprocessing
 import queue
 import os
-import json
 import threading
 import time
 import traceback
 
+from .. import logger as _logger
 from .. import resources as _resources
+from . import worker_pool as _worker_pool
 
 if TYPE_CHECKING:
     from . import manager as _manager
@@ -31,7 +32,7 @@ def _process_worker(in_queue: multiprocessing.Queue,
     :type in_queue: multiprocessing.Queue
     :param out_queue: Queue used to send progress messages back to the parent.
     :type out_queue: multiprocessing.Queue
-    :param exit_event: Process event used to coordinate startup and shutdown.
+    :param exit_event: Process event used to signal shutdown.
     :type exit_event: multiprocessing.Event
     :param print_lock: Lock used when printing diagnostics.
     :type print_lock: multiprocessing.Lock
@@ -39,33 +40,21 @@ def _process_worker(in_queue: multiprocessing.Queue,
     :returns: ``None``.
     :rtype: None
     """
-    from . import manager
+    from . import worker_pool
     from .. import config as _config
 
-    exit_event.set()  # signal parent: alive
-
-    while exit_event.is_set():
-        pass  # wait for parent to clear
-
-    while in_queue.empty():
-        pass
-
-    ppid = in_queue.get_nowait()
-
-    # Regenerate service ID from inherited stealth environment variables
-    cred_manager = manager.CredManager(print_lock, pid=ppid)
-
-    credentials = cred_manager.retrieve_credentials(print_lock)
-    if credentials is None:
-        out_queue.put(json.dumps({'log': 'IMAGE DOWNLOADER: error collecting credentials'}))
+    result = worker_pool.child_handshake(in_queue, out_queue, print_lock, 'IMAGE DOWNLOADER')
+    if result is None:
         return
 
+    _, credentials = result
+
     from . import db_broker
 
     connector = db_broker.connect_to_database(credentials)
 
     if connector is None:
-        out_queue.put(json.dumps({'log': 'IMAGE DOWNLOADER: unknown database type'}))
+        out_queue.put({'log': 'IMAGE DOWNLOADER: unknown database type'})
         return
 
     heartbeat_interval = _config.Config.resources.heartbeat_interval
@@ -206,56 +195,36 @@ def _process_worker(in_queue: multiprocessing.Queue,
     connector.close()
 
 
-class ProcessWorker:
+class ProcessWorker(_worker_pool.Worker):
+
+    name = 'image'
 
     def __init__(self, manager: "_manager.ProcessManager",
                  print_lock: multiprocessing.Lock):
 
-        self.manager = manager
-        self.exit_event = multiprocessing.Event()
-        self.in_queue = multiprocessing.Queue()
-        self.out_queue = multiprocessing.Queue()
-        self.queue = {}
+        _worker_pool.Worker.__init__(self, manager, print_lock, _process_worker)
 
-        self.queue_lock = threading.Lock()
-        self.running: dict = None
+        self.queue = {}
+        # re-entrant, update_depth() reads queue_depth while add() holds it
+        self.queue_lock = threading.RLock()
 
         from .. import app
 
         self.app = app
 
-        self.process = multiprocessing.Process(
-            target=_process_worker,
-            args=(self.out_queue, self.in_queue, self.exit_event, print_lock))
-
-        self.process.daemon = True
-
-    def start(self):
-        """
-        Start the image child process.
-
-        :returns: ``None``.
-        :rtype: None
-        :raises RuntimeError: Raised when the connector or worker enters an unexpected state.
-        """
-
-        self.process.start()
-        self.exit_event.wait(timeout=10.0)
-        if not self.exit_event.is_set():
-            raise RuntimeError('image process_worker failed to start within 10 seconds')
-
-        self.exit_event.clear()
-
-        self.out_queue.put(os.getpid())
+    @property
+    def queue_depth(self):
+        with self.queue_lock:
+            return sum(len(items) for items in self.queue.values()) + int(self.job is not None)
 
     @property
     def has_pending(self):
         with self.queue_lock:
-            return bool(len(list(self.queue.keys()))) or self.running is not None
+            return bool(self.queue) or self.job is not None
 
     def send(self):
         with self.queue_lock:
-            if self.running is None:
+            if self.job is None:
                 priorities = list(self.queue.keys())
 
                 if not priorities:
@@ -267,8 +236,6 @@ class ProcessWorker:
 
                 item = priority_queue.pop(0)
 
-                self.running = item
-
                 if not priority_queue:
                     del self.queue[priority]
 
@@ -277,7 +244,7 @@ class ProcessWorker:
                 del message['resource_obj']
                 message['id'] = item['db_obj'].db_id
 
-                self.out_queue.put(message)
+                self.assign(item, message)
 
     def add(self, priority: int, obj_type: int,
             db_obj: Union["_image.Image", "_datasheet.Datasheet", "_cad.CAD"],
@@ -340,18 +307,17 @@ class ProcessWorker:
                 }
             )
 
-    def recv(self):  # NOQA
+            self.update_depth()
 
-        if not self.in_queue.empty():
-            message = self.in_queue.get_nowait()
+    def recv(self):  # NOQA
+        message = _worker_pool.Worker.recv(self)
 
-            if 'ping' in message:
-                # Heartbeat keep-alive -- see _process_worker. Answered
-                # unconditionally, whether or not a job is running.
-                self.out_queue.put({'pong': True})
+        if message is not None:
+            if 'log' in message:
+                _logger.info(message['log'])
                 return
 
-            resource_state = self.running['resource_obj']
+            resource_state = self.job['resource_obj']
 
             if 'err_no' in message:
                 if message['err_no'] in (-500, -100, -600, -20):
@@ -364,8 +330,7 @@ class ProcessWorker:
                     db_obj.set_progress(-1)
                     rs.set_error(**msg)
 
-                self.app.CallAfter(_do, resource_state, self.running['db_obj'], message)
-                self.running = None
+                self.app.CallAfter(_do, resource_state, self.finish()['db_obj'], message)
 
             else:
                 if message['step'] == 5:
@@ -374,28 +339,13 @@ class ProcessWorker:
                         rs.delete()
                         db_obj.download_complete()
 
-                    self.app.CallAfter(_do, resource_state, self.running['db_obj'])
-                    self.running = None
+                    self.app.CallAfter(_do, resource_state, self.finish()['db_obj'])
                 else:
                     def _do(rs, db_obj, step):
                         db_obj.set_progress(step)
                         rs.update_progress(step)
 
-                    self.app.CallAfter(_do, resource_state, self.running['db_obj'], message['step'])
+                    self.app.CallAfter(_do, resource_state, self.job['db_obj'], message['step'])
 
     def reset(self):
         pass
-
-    def stop(self):
-        """
-        Signal the worker child processes to stop.
-
-        :returns: ``None``.
-        :rtype: None
-        """
-        self.exit_event.set()
-        self.out_queue.put(None)
-
-        self.process.join(5.0)
-        if self.process.is_alive():
-            print('image process is stuck')
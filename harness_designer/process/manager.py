@@ -314,10 +314,17 @@ class ProcessManager(threading.Thread):
 
         from . import image_process
         from . import model_process
+        from . import worker_pool
 
-        self._image_process = image_process.ProcessWorker(self, self._print_lock)
-        self._model_processes = [model_process.ProcessWorker(self, self._print_lock)]
-        self._model_processes_running = [None]
+        # one image worker, and one model worker per concurrent conversion.
+        # The first model worker is the primary, it stays up for the life
+        # of the application; the rest exit after sitting idle.
+        self._image_pool = worker_pool.WorkerPool(
+            self, self._print_lock, image_process.ProcessWorker, 1)
+        self._model_pool = worker_pool.WorkerPool(
+            self, self._print_lock, model_process.ProcessWorker, self._core_count)
+
+        self._image_process = None
         self._model_progress = {}
 
         threading.Thread.__init__(self, name='process_monitor_thread')
@@ -330,8 +337,8 @@ class ProcessManager(threading.Thread):
         :rtype: None
         :raises RuntimeError: Raised when the connector or worker enters an unexpected state.
         """
-        self._image_process.start()
-        self._model_processes[0].start(True)
+        self._image_process = self._image_pool.spawn()
+        self._model_pool.spawn(is_primary=True)
 
         threading.Thread.start(self)
 
@@ -447,8 +454,7 @@ class ProcessManager(threading.Thread):
 
             # --- Model process messages ---
             with self._model_lock:
-                offset = 0
-                for i, process in enumerate(self._model_processes[:]):
+                for process in self._model_pool:
                     message = process.recv()
 
                     if message is None:
@@ -457,9 +463,7 @@ class ProcessManager(threading.Thread):
                     got_message = True
 
                     if 'exit_loop' in message:
-                        self._model_processes.remove(process)
-                        self._model_processes_running.pop(i - offset)
-                        offset += 1
+                        self._model_pool.remove(process)
                         continue
 
                     if 'log' in message:
@@ -472,9 +476,8 @@ class ProcessManager(threading.Thread):
                         _logger.info(f'MODEL PROCESS MESSAGE: {message}')
 
                         # Persist blocking error to resource_state.
-                        model_db, resource_db = self._model_processes_running[i - offset]
+                        model_db, resource_db = process.finish()
                         job_id = resource_db.db_id
-                        self._model_processes_running[i - offset] = None
 
                         is_primary = message['is_primary']
 
@@ -519,21 +522,16 @@ class ProcessManager(threading.Thread):
                             _app.CallAfter(_do)
 
                         if is_primary:
-                            from . import model_process
-
-                            self._model_processes[i - offset] = model_process.ProcessWorker(self, self._print_lock)
-                            self._model_processes[i - offset].start(True)
+                            self._model_pool.replace(process, is_primary=True)
                         else:
-                            self._model_processes.remove(process)
-                            self._model_processes_running.pop(i - offset)
-                            offset += 1
+                            self._model_pool.remove(process)
 
                         continue
 
                     if 'err_no' in message:
                         _logger.info(f'MODEL PROCESS MESSAGE: {message}')
 
-                        model_db, resource_db = self._model_processes_running[i - offset]
+                        model_db, resource_db = process.job
                         job_id = resource_db.db_id
 
                         if 'step' not in message:
@@ -557,7 +555,7 @@ class ProcessManager(threading.Thread):
 
                         _app.CallAfter(_do, message, resource_db)
                         self._model_process_active -= 1
-                        self._model_processes_running[i - offset] = None
+                        process.finish()
 
                         if job_id in self._model_progress:
                             del self._model_progress[job_id]
@@ -580,7 +578,7 @@ class ProcessManager(threading.Thread):
 
                     step = message['step']
 
-                    model_db, resource_db = self._model_processes_running[i - offset]
+                    model_db, resource_db = process.job
                     job_id = resource_db.db_id
                     start_progress = False
 
@@ -608,7 +606,7 @@ class ProcessManager(threading.Thread):
                         curr_progresses.remove(job_id)
                         del self._model_progress[job_id]
 
-                        self._model_processes_running[i - offset] = None
+                        process.finish()
                         self._model_process_active -= 1
 
                         if self._model_process_active:
@@ -654,18 +652,10 @@ class ProcessManager(threading.Thread):
         }
 
         with self._model_lock:
-            for i, process in enumerate(self._model_processes[:]):
+            process = self._model_pool.idle()
 
-                if not process.is_alive():
-                    continue
-
-                if self._model_processes_running[i] is None:
-                    self._model_process_active += 1
-                    process.send(message)
-                    self._model_processes_running[i] = (model_db, resource_db)
-                    break
-            else:
-                if len(self._model_processes) == self._core_count:
+            if process is None:
+                if self._model_pool.is_full:
                     from ..ui.dialogs import error as _error
 
                     dlg = _error.ErrorDialog(
@@ -677,19 +667,70 @@ class ProcessManager(threading.Thread):
                     dlg.exec()
                     return
 
-                from . import model_process
+                process = self._model_pool.spawn(is_primary=False)
 
-                self._model_process_active += 1
-                process = model_process.ProcessWorker(self, self._print_lock)
-                process.start(False)
-
-                process.send(message)
-                self._model_processes.append(process)
-                self._model_processes_running.append((model_db, resource_db))
+            self._model_process_active += 1
+            process.assign((model_db, resource_db), message)
 
             self.wait_duration = 1
             self._wait_event.set()
 
+    def preconvert_models(self, model_ids: list[int] | None = None,
+                          progress=None, done=None):
+        """
+        Convert every model that hasn't been converted yet, in the
+        background, with a process per core but one.
+
+        See :func:`.model_batch.convert_catalog`. The batch runs in its own
+        thread next to (not through) the model workers; *progress* and
+        *done* are called on the GUI thread with the running totals, which
+        include ``models_per_min``.
+
+        :param model_ids: Limit the batch to these models.
+        :param progress: ``progress(stats)`` after every model.
+        :param done: ``done(stats)`` when the batch has finished.
+
+        :returns: The batch thread.
+        :rtype: threading.Thread
+        """
+        from harness_designer import app as _app
+        from . import model_batch
+
+        def _progress(stats):
+            if progress is not None:
+                _app.CallAfter(progress, dc(stats))
+
+        def _run():
+            try:
+                stats = model_batch.convert_catalog(model_ids, progress=_progress)
+            except Exception as err:  # NOQA
+                _logger.traceback(err, 'model batch conversion failed')
+                return
+
+            _logger.info(f'model batch conversion: {stats["converted"]} of '
+                         f'{stats["total"]} converted ({stats["cached"]} from cache), '
+                         f'{stats["failed"]} failed, '
+                         f'{stats["models_per_min"]:.1f} models/min')
+
+            if done is not None:
+                _app.CallAfter(done, stats)
+
+        thread = threading.Thread(target=_run, name='model_batch_thread', daemon=True)
+        thread.start()
+
+        return thread
+
+    @property
+    def worker_stats(self) -> dict:
+        """
+        Per-pool and per-worker metrics: startup latency, queue depth, jobs
+        finished and busy time. See :attr:`.worker_pool.WorkerPool.stats`.
+        """
+        with self._model_lock:
+            model = self._model_pool.stats
+
+        return dict(image=self._image_pool.stats, model=model)
+
     @property
     def is_stopped(self):
         return not self.is_alive()
@@ -701,9 +742,7 @@ class ProcessManager(threading.Thread):
         :rtype: None
         """
 
-        self._image_process.stop()
-
-        for process in self._model_processes[:]:
-            process.stop()
+        self._image_pool.stop()
+        self._model_pool.stop()
 
         self._exit_event.set()
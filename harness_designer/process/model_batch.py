@@ -0,0 +1,197 @@
+# © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
+
+"""Batch pre-conversion of every model in the catalog that hasn't been converted yet."""
+
+from typing import Callable
+
+import concurrent.futures
+import os
+import time
+
+
+# per process connector, opened by _init_worker
+_connector = None
+
+
+def _connect(ppid: int):
+    from . import manager
+    from . import db_broker
+
+    # Regenerate service ID from inherited stealth environment variables
+    cred_manager = manager.CredManager(None, pid=ppid)
+    credentials = cred_manager.retrieve_credentials(None)
+
+    if credentials is None:
+        raise RuntimeError('no database credentials stored for this session')
+
+    connector = db_broker.connect_to_database(credentials)
+    if connector is None:
+        raise RuntimeError('database connection error')
+
+    return connector
+
+
+def _init_worker(ppid: int):
+    global _connector
+
+    _connector = _connect(ppid)
+
+
+def _convert(model_id: int, model_dir: str) -> tuple[int, str | None, bool, dict | None, float]:
+    """
+    Convert one model in a pool process.
+
+    :returns: ``(model_id, uuid, from_cache, error, seconds)``; ``error`` is
+              the ``err_*`` fields of a failed conversion.
+    """
+    from . import model_process
+
+    start = time.perf_counter()
+
+    try:
+        file_id, cached = model_process.convert_model(_connector, model_id, model_dir)
+    except model_process.ConversionError as err:
+        error = {}
+        err.update(error)
+        return model_id, None, False, error, time.perf_counter() - start
+    except Exception as err:  # NOQA
+        error = dict(err_no=-10000, err_msg=str(err) or 'Unknown Error', allow_retry=False)
+        return model_id, None, False, error, time.perf_counter() - start
+
+    return model_id, file_id, cached, None, time.perf_counter() - start
+
+
+def pending_models(connector) -> list[tuple[int, tuple]]:
+    """
+    Every model that has a source but no converted mesh yet.
+
+    :returns: ``[(id, group), ...]`` where *group* is the source path plus
+              the simplification settings; models sharing a group produce
+              the same mesh.
+    :rtype: list[tuple[int, tuple]]
+    """
+    connector.execute('SELECT id, path, simplify, target_count, aggressiveness, '
+                      'update_rate, iterations FROM models3d '
+                      'WHERE uuid IS NULL AND path IS NOT NULL AND path != "";')
+
+    return [(row[0], tuple(row[1:])) for row in connector.fetchall()]
+
+
+def convert_catalog(model_ids: list[int] | None = None, workers: int | None = None,
+                    progress: Callable[[dict], None] | None = None) -> dict:
+    """
+    Convert every model that hasn't been converted, in a pool of processes.
+
+    Meant for an unattended run over a whole catalog (overnight, after an
+    import) so nobody waits on a conversion the first time a part is placed.
+    Call it from a thread other than the GUI thread; it blocks until the
+    batch is done.
+
+    Each pool process opens its own database connection from the session
+    credentials (the same way the model worker does, see
+    :class:`.manager.CredManager`) and runs
+    :func:`.model_process.convert_model`, so the numeric stages of different
+    models run in parallel instead of taking turns on one interpreter.
+
+    Models that share a source path and simplification settings are the
+    same mesh. Only the first of each group is submitted up front; the rest
+    are held back until it finishes and then come straight out of the
+    content-addressed cache (:class:`.model_cache.ModelCache`) instead of
+    being converted side by side. Sources that are byte-identical under
+    different paths are caught by the cache as well, just not ordered.
+
+    :param model_ids: Convert only these (those of them still pending);
+                      ``None`` converts everything pending.
+    :type model_ids: list[int] | None
+    :param workers: Pool size, default one less than the core count so the
+                    application stays usable.
+    :type workers: int | None
+    :param progress: Called after every model with the running totals (the
+                     same dict this returns). Called from the calling thread.
+    :type progress: callable
+
+    :returns: ``total``, ``converted``, ``cached`` (converted from the
+              cache), ``failed``, ``errors`` (``{model_id: err fields}``),
+              ``seconds``, ``models_per_min`` and ``mean_model_s``.
+    :rtype: dict
+    """
+    ppid = os.getpid()
+    connector = _connect(ppid)
+
+    try:
+        connector.execute('SELECT value FROM settings WHERE name="model_path";')
+        model_dir = connector.fetchall()[0][0]
+
+        pending = pending_models(connector)
+    finally:
+        connector.close()
+
+    if model_ids is not None:
+        wanted = set(model_ids)
+        pending = [item for item in pending if item[0] in wanted]
+
+    leaders = []
+    followers = {}
+
+    for model_id, group in pending:
+        if group in followers:
+            followers[group].append(model_id)
+        else:
+            followers[group] = []
+            leaders.append((model_id, group))
+
+    if workers is None:
+        workers = max(1, (os.cpu_count() or 2) - 1)
+
+    stats = dict(total=len(pending), converted=0, cached=0, failed=0, errors={},
+                 seconds=0.0, models_per_min=0.0, mean_model_s=0.0)
+
+    if not pending:
+        return stats
+
+    model_seconds = 0.0
+    start = time.perf_counter()
+
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(workers, len(leaders)),
+            initializer=_init_worker, initargs=(ppid,)) as executor:
+
+        running = {}
+
+        for model_id, group in leaders:
+            running[executor.submit(_convert, model_id, model_dir)] = group
+
+        while running:
+            done, _ = concurrent.futures.wait(
+                running, return_when=concurrent.futures.FIRST_COMPLETED)
+
+            for future in done:
+                group = running.pop(future)
+                model_id, file_id, cached, error, seconds = future.result()
+
+                model_seconds += seconds
+
+                if error is None:
+                    stats['converted'] += 1
+                    stats['cached'] += int(cached)
+                else:
+                    stats['failed'] += 1
+                    stats['errors'][model_id] = error
+
+                if group is not None:
+                    # the leader's mesh is in the cache now (or it failed
+                    # and the rest will fail the same way on their own)
+                    for follower_id in followers.pop(group, []):
+                        running[executor.submit(_convert, follower_id, model_dir)] = None
+
+                finished = stats['converted'] + stats['failed']
+                elapsed = time.perf_counter() - start
+
+                stats['seconds'] = elapsed
+                stats['models_per_min'] = finished / elapsed * 60.0 if elapsed else 0.0
+                stats['mean_model_s'] = model_seconds / finished
+
+                if progress is not None:
+                    progress(stats)
+
+    return stats
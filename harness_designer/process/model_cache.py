@@ -0,0 +1,174 @@
+# © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
+
+"""Content-addressed cache of converted (packed, indexed) model meshes."""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid as _uuid
+
+import numpy as np
+
+
+# Bump when the packed layout or anything upstream of it (centering,
+# simplification, normal generation) changes, so stale entries stop matching.
+CACHE_VERSION = 2
+
+_READ_SIZE = 1024 * 1024
+
+
+class ModelCache:
+    """
+    Converted meshes keyed by what they were converted from.
+
+    The same source file turns up under many part numbers -- one terminal
+    STEP shared by a whole family, a housing reused across colours -- and
+    every one of those used to be tessellated, simplified and normal'd from
+    scratch. The key here is a SHA-256 of the source bytes plus the
+    simplification settings that shape the output, so a second model with
+    the same file and settings gets the first one's result straight off
+    disk.
+
+    An entry is three files under ``<model_dir>/cache/<key[:2]>/``:
+    ``<key>.json`` (vertex count, aabb, obb, number of LOD levels),
+    ``<key>.idx.npy`` (element array) and ``<key>.npy`` (packed geometry),
+    plus a ``<key>.lod<n>.idx.npy``/``<key>.lod<n>.npy`` pair per level of
+    detail. They are written metadata first, then the LOD levels, then the
+    element array and the ``.npy`` last, each through a temporary file and
+    ``os.replace``; the ``.npy`` is what marks the entry complete -- the
+    same convention as the per-model files (see ``Model3D.data_path``). Two processes converting the
+    same source at the same time just both write it; the last replace wins
+    and both are identical.
+
+    A model never points at the cache files directly. :meth:`link` gives it
+    its own ``<uuid>.npy`` / ``<uuid>.idx.npy`` (and LOD files) as hard links where the
+    filesystem allows it (a copy otherwise), so deleting a model's files
+    never touches the cache or any other model sharing the entry.
+    """
+
+    def __init__(self, model_dir: str):
+        """
+        :param model_dir: The ``model_path`` setting; converted models live
+                          in its two character subdirectories.
+        :type model_dir: str
+        """
+        self.model_dir = model_dir
+        self.directory = os.path.join(model_dir, 'cache')
+
+        self.stats = dict(hits=0, misses=0, stores=0, hash_ms=0.0)
+
+    def key(self, source_path: str, simplify: bool, target_count, aggressiveness,
+            update_rate, iterations) -> str:
+        """
+        Hash the source file and the settings that affect the output.
+
+        The simplification settings only go into the key when simplification
+        is on; an unsimplified model is the same whatever they are set to.
+
+        :returns: The cache key (hex digest).
+        :rtype: str
+        """
+        start = time.perf_counter()
+
+        digest = hashlib.sha256()
+        digest.update(f'v{CACHE_VERSION}|'.encode('utf-8'))
+
+        if simplify:
+            digest.update(f'{target_count}|{aggressiveness}|{update_rate}|{iterations}|'.encode('utf-8'))
+        else:
+            digest.update(b'-|')
+
+        with open(source_path, 'rb') as f:
+            while True:
+                chunk = f.read(_READ_SIZE)
+                if not chunk:
+                    break
+
+                digest.update(chunk)
+
+        self.stats['hash_ms'] += (time.perf_counter() - start) * 1000.0
+
+        return digest.hexdigest()
+
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.directory, key[:2], key + suffix)
+
+    def get(self, key: str) -> dict | None:
+        """
+        :returns: The entry's metadata (``vertex_count``, ``aabb``,
+                  ``obb``), or ``None`` if there is no complete entry.
+        :rtype: dict | None
+        """
+        if not os.path.exists(self._path(key, '.npy')):
+            self.stats['misses'] += 1
+            return None
+
+        try:
+            with open(self._path(key, '.json'), 'r') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            self.stats['misses'] += 1
+            return None
+
+        self.stats['hits'] += 1
+
+        return meta
+
+    def put(self, key: str, packed: np.ndarray, indices: np.ndarray,
+            vertex_count: int, aabb: list, obb: list,
+            lods: list[tuple[np.ndarray, np.ndarray]] = ()):
+        """Store a converted mesh and its LOD levels under *key*."""
+        directory = os.path.join(self.directory, key[:2])
+        os.makedirs(directory, exist_ok=True)
+
+        tmp = f'.{_uuid.uuid4().hex}.tmp'
+
+        path = self._path(key, '.json')
+        with open(path + tmp, 'w') as f:
+            json.dump(dict(vertex_count=int(vertex_count), aabb=aabb,
+                           obb=obb, lods=len(lods)), f)
+        os.replace(path + tmp, path)
+
+        files = []
+        for level, (lod_packed, lod_indices) in enumerate(lods, 1):
+            files.append((f'.lod{level}.idx.npy', lod_indices))
+            files.append((f'.lod{level}.npy', lod_packed))
+
+        files.append(('.idx.npy', indices))
+        files.append(('.npy', packed))
+
+        for suffix, array in files:
+            path = self._path(key, suffix)
+
+            # np.save appends .npy to anything that doesn't end with it
+            with open(path + tmp, 'wb') as f:
+                np.save(f, array)
+
+            os.replace(path + tmp, path)
+
+        self.stats['stores'] += 1
+
+    def link(self, key: str, file_id: str, lod_count: int = 0):
+        """
+        Give model *file_id* its own copy of the entry, LOD levels and
+        element array first (the ``.npy`` marks the conversion as finished).
+        """
+        directory = os.path.join(self.model_dir, file_id[:2])
+        os.makedirs(directory, exist_ok=True)
+
+        suffixes = []
+        for level in range(1, lod_count + 1):
+            suffixes.extend((f'.lod{level}.idx.npy', f'.lod{level}.npy'))
+
+        suffixes.extend(('.idx.npy', '.npy'))
+
+        for suffix in suffixes:
+            src = self._path(key, suffix)
+            dst = os.path.join(directory, file_id + suffix)
+
+            try:
+                os.link(src, dst)
+            except OSError:
+                shutil.copyfile(src, dst)
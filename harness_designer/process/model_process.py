@@ -1,6 +1,6 @@
 # © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 import multiprocessing
 import os
@@ -24,6 +24,8 @@ from OCP.TopoDS import TopoDS
 
 from .. import utils as _utils
 from .. import resources as _resources
+from . import model_cache as _model_cache
+from . import worker_pool as _worker_pool
 
 import pyassimp  # NOQA
 
@@ -286,206 +288,266 @@ def _reduce_triangles(
     return vertices, faces
 
 
-class ThreadWorker(threading.Thread):
+# Level of detail chain stored next to every converted model: the triangle
+# count of levels 1, 2, ... as a fraction of the full mesh (level 0). The
+# 3D editor draws an object with a coarser level once it is only a few
+# pixels across (see SceneBuffer.select_lod).
+LOD_RATIOS = (0.25, 0.0625)
+# Meshes smaller than this are drawn at full detail at any distance.
+LOD_MIN_TRIANGLES = 2000
 
-    def __init__(self, db_broker, credentials, message, out_queue):
-        self.db_broker = db_broker
-        self.credentials = credentials
-        self.message = message
-        self.out_queue = out_queue
 
-        threading.Thread.__init__(self)
-        self.daemon = True
-        self.result = None
-        self.exception = None
+def _build_lods(vertices: np.ndarray, faces: np.ndarray) -> list[tuple[np.ndarray, np.ndarray]]:
+    """
+    Simplify the (already centered and, if asked for, simplified) mesh into
+    the coarser levels of :data:`LOD_RATIOS`.
 
-    def run(self):
-        connector = None
+    Each level is simplified from the one before it with pyfqmr's default
+    settings -- the per-model simplification columns only shape level 0.
+    The chain stops early when a level would drop below a couple hundred
+    triangles or the simplifier can't get it meaningfully smaller.
 
-        try:
-            connector = self.db_broker.connect_to_database(self.credentials)
-            if connector is None:
-                raise RuntimeError('database connection error')
+    :returns: ``[(packed, indices), ...]`` per level, in the layout of
+              :func:`utils.compute_indexed_normals`.
+    :rtype: list[tuple[numpy.ndarray, numpy.ndarray]]
+    """
+    lods = []
+    face_count = len(faces)
 
-            message = self.message
+    if face_count < LOD_MIN_TRIANGLES:
+        return lods
 
-            model_id = message['id']
-            model_dir = message['path']
+    for ratio in LOD_RATIOS:
+        target = int(face_count * ratio)
+        if target < LOD_MIN_TRIANGLES // 8:
+            break
 
-            message['step'] = 1
+        prev_count = len(faces)
+        vertices, faces = _reduce_triangles(vertices, faces, target, 7.0, 5, 100)
 
-            self.out_queue.put(message)
+        if len(faces) == 0 or len(faces) > prev_count * 0.8:
+            break
 
-            connector.execute(f'SELECT target_count, aggressiveness, '
-                              f'update_rate, iterations, simplify, '
-                              f'path FROM models3d WHERE id=?;', (model_id,))
+        packed, _, indices = _utils.compute_indexed_normals(vertices, faces)
+        lods.append((packed, indices))
 
-            model_data = connector.fetchall()
+    return lods
 
-            if not model_data:
-                message['err_msg'] = 'invalid database row'
-                message['err_no'] = -10001
-                message['allow_retry'] = False,
 
-                self.out_queue.put(message)
-                connector.close()
-                return
+class ConversionError(ModelException):
+    """
+    A model that can't be converted, carrying the ``err_*`` fields the
+    parent stores on the model's resource state.
+    """
 
-            message['step'] = 2
-            self.out_queue.put(message)
+    def __init__(self, err_no: int, err_msg: str, allow_retry: bool, **extra):
+        ModelException.__init__(self, err_msg)
+        self.err_no = err_no
+        self.err_msg = err_msg
+        self.allow_retry = allow_retry
+        self.extra = extra
 
-            (target_count, aggressiveness, update_rate,
-             iterations, simplify, path) = model_data[0]
+    def update(self, message: dict):
+        """Write the error fields into a progress *message*."""
+        message['err_no'] = self.err_no
+        message['err_msg'] = self.err_msg
+        message['allow_retry'] = self.allow_retry
+        message.update(self.extra)
 
-            if not path:
-                message['err_msg'] = 'invalid model url/path'
-                message['err_no'] = -10002
-                message['allow_retry'] = True
 
-                self.out_queue.put(message)
-                connector.close()
-                return
-
-            message['step'] = 3
-            self.out_queue.put(message)
-
-            try:
-                file_path = _resources.collect_resource(
-                    connector, _resources.RESOURCE_TYPE_MODEL, path)
-            except _resources.RequestsError as err:
-                message['err_no'] = err.code
-                message['err_msg'] = err.__msg__
-                tb = traceback.format_exception(err)
-                message['traceback'] = ''.join(tb)
-                message['allow_retry'] = True
-                self.out_queue.put(message)
-                connector.close()
+def convert_model(connector, model_id: int, model_dir: str,
+                  report: Callable[[int], None] = None) -> tuple[str, bool]:
+    """
+    Download (or copy) one model's source file, convert it to the packed
+    indexed format and point its ``models3d`` row at the result.
+
+    *report* is called with every step number as it's reached, ``1`` through
+    ``11`` (``6`` only when the model is simplified, ``6`` to ``8`` not at
+    all when the mesh came from the cache).
+
+    The source bytes and the simplification settings are hashed first (see
+    :class:`.model_cache.ModelCache`); a model whose source has already been
+    converted with the same settings -- under another part number, or by an
+    earlier batch -- skips loading, simplification and normal generation and
+    gets the cached mesh linked in under its own uuid.
+
+    :param connector: Open connector from :func:`.db_broker.connect_to_database`.
+    :param model_id: ``models3d`` row id.
+    :type model_id: int
+    :param model_dir: The ``model_path`` setting.
+    :type model_dir: str
+    :param report: Progress callback.
+
+    :returns: The new uuid of the model's files and whether they came out
+              of the cache.
+    :rtype: tuple[str, bool]
+    :raises ConversionError: Raised when the model can't be converted.
+    """
+    if report is None:
+        def report(_):
+            pass
 
-                return
-            # catchall for all other resource exceptions
-            except _resources.ResourceException as err:
-                message['err_no'] = err.code  # NOQA
-                message['err_msg'] = err.__msg__
-                message['err_path'] = err.path  # NOQA
-                tb = traceback.format_exception(err)
-                message['traceback'] = ''.join(tb)
-                message['allow_retry'] = False
-                self.out_queue.put(message)
-                connector.close()
+    report(1)
 
-                return
-            except Exception as err:
-                tb = traceback.format_exception(err)
-                message['traceback'] = ''.join(tb)
-                message['allow_retry'] = False
-                self.out_queue.put(message)
-                self.out_queue.put(message)
-                connector.close()
+    connector.execute(f'SELECT target_count, aggressiveness, '
+                      f'update_rate, iterations, simplify, '
+                      f'path FROM models3d WHERE id=?;', (model_id,))
 
-                return
+    model_data = connector.fetchall()
 
-            if file_path is None:
-                message['err_no'] = -10003
-                message['err_msg'] = f'This should not occur "models3d" ({model_id})'
-                message['allow_retry'] = False
-                self.out_queue.put(message)
-                self.out_queue.put(message)
-                connector.close()
+    if not model_data:
+        raise ConversionError(-10001, 'invalid database row', False)
 
-                return
+    report(2)
 
-            message['step'] = 4
-            self.out_queue.put(message)
+    (target_count, aggressiveness, update_rate,
+     iterations, simplify, path) = model_data[0]
 
-            model_path, file_type_id = file_path
+    if not path:
+        raise ConversionError(-10002, 'invalid model url/path', True)
 
-            connector.execute(
-                f'SELECT extension FROM file_types WHERE id=?;', (file_type_id,))
+    report(3)
 
-            rows = connector.fetchall()
+    try:
+        file_path = _resources.collect_resource(
+            connector, _resources.RESOURCE_TYPE_MODEL, path)
+    except _resources.RequestsError as err:
+        tb = traceback.format_exception(err)
+        raise ConversionError(err.code, err.__msg__, True,
+                              traceback=''.join(tb)) from err
+    # catchall for all other resource exceptions
+    except _resources.ResourceException as err:
+        tb = traceback.format_exception(err)
+        raise ConversionError(err.code, err.__msg__, False, err_path=err.path,  # NOQA
+                              traceback=''.join(tb)) from err
+    except Exception as err:
+        tb = traceback.format_exception(err)
+        raise ConversionError(-10000, str(err) or 'Unknown Error', False,
+                              traceback=''.join(tb)) from err
 
-            if not rows:
-                message['err_msg'] = 'unsupported file type'
-                message['err_no'] = -10004
-                message['allow_retry'] = False
-                self.out_queue.put(message)
-                connector.close()
-                return
+    if file_path is None:
+        raise ConversionError(-10003, f'This should not occur "models3d" ({model_id})', False)
 
-            ext = rows[0][0]
+    report(4)
 
-            message['step'] = 5
-            self.out_queue.put(message)
+    model_path, file_type_id = file_path
 
-            if not os.path.exists(model_path):
-                message['err_msg'] = f'file does not exist ("{model_path}")'
-                message['err_no'] = -10005
-                message['allow_retry'] = False
+    connector.execute(
+        f'SELECT extension FROM file_types WHERE id=?;', (file_type_id,))
 
-                self.out_queue.put(message)
-                connector.close()
-                return
+    if not connector.fetchall():
+        raise ConversionError(-10004, 'unsupported file type', False)
 
-            vertices, faces = _load(model_path)
+    report(5)
 
-            vertices = _center_model(vertices)
+    if not os.path.exists(model_path):
+        raise ConversionError(-10005, f'file does not exist ("{model_path}")', False)
 
-            if simplify:
-                message['step'] = 6
-                self.out_queue.put(message)
+    cache = _model_cache.ModelCache(model_dir)
+    key = cache.key(model_path, simplify, target_count,
+                    aggressiveness, update_rate, iterations)
 
-                vertices, faces = _reduce_triangles(
-                    vertices, faces, target_count, aggressiveness, iterations
-                )
+    uuid = str(_uuid.uuid4())
+    meta = cache.get(key)
 
-            message['step'] = 7
-            self.out_queue.put(message)
+    if meta is None:
+        vertices, faces = _load(model_path)
 
-            packed, vertex_count = _utils.compute_normals(vertices, faces)
+        vertices = _center_model(vertices)
 
-            message['step'] = 8
-            self.out_queue.put(message)
+        if simplify:
+            report(6)
 
-            # The packed array is saved as a plain uncompressed .npy file.
-            # The parent opens the file as a numpy memory map and streams
-            # it straight into the GPU vertex buffer.
-            unpacked_verts = packed[:vertex_count * 3].reshape(-1, 3)
-            aabb1, aabb2 = _utils.compute_aabb(unpacked_verts)
-            aabb = np.array([aabb1.as_float, aabb2.as_float], dtype=np.float32)
-            aabb = [[float(str(item2)) for item2 in item1] for item1 in aabb.tolist()]
-            obb = _utils.compute_obb(aabb1,  aabb2)
-            obb = [[float(str(item2)) for item2 in item1] for item1 in obb.tolist()]
+            vertices, faces = _reduce_triangles(
+                vertices, faces, target_count, aggressiveness, iterations
+            )
+
+        report(7)
+
+        packed, vertex_count, indices = _utils.compute_indexed_normals(vertices, faces)
+        lods = _build_lods(vertices, faces)
+
+        report(8)
+
+        # The packed array (unique vertices: positions | smooth normals)
+        # is saved as a plain uncompressed .npy file and its element
+        # array next to it as <uuid>.idx.npy. The parent opens both as
+        # numpy memory maps and streams them straight into the GPU
+        # buffer. Face normals are not stored; the shaders derive them.
+        unpacked_verts = packed[:vertex_count * 3].reshape(-1, 3)
+        aabb1, aabb2 = _utils.compute_aabb(unpacked_verts)
+        aabb = np.array([aabb1.as_float, aabb2.as_float], dtype=np.float32)
+        aabb = [[float(str(item2)) for item2 in item1] for item1 in aabb.tolist()]
+        obb = _utils.compute_obb(aabb1,  aabb2)
+        obb = [[float(str(item2)) for item2 in item1] for item1 in obb.tolist()]
+
+        cache.put(key, packed, indices, vertex_count, aabb, obb, lods)
+        lod_count = len(lods)
+    else:
+        vertex_count = meta['vertex_count']
+        aabb = meta['aabb']
+        obb = meta['obb']
+        lod_count = meta.get('lods', 0)
 
-            uuid = str(_uuid.uuid4())
+    # LOD levels and element array first: Model3D.data_path treats the
+    # .npy as the "conversion finished" marker
+    cache.link(key, uuid, lod_count)
 
-            directory = os.path.join(model_dir, uuid[:2])
-            os.makedirs(directory, exist_ok=True)
+    report(9)
 
-            np.save(os.path.join(directory, f'{uuid}.npy'), packed)
+    # Only DB writes permitted from child: uuid, file_type_id and
+    # the model metadata (vertex_count, aabb, obb).
+    connector.execute('UPDATE models3d SET file_type_id=?, uuid=?, '
+                      'vertex_count=?, aabb=?, obb=? WHERE id=?;',
+                      (file_type_id, uuid, vertex_count, str(aabb), str(obb), model_id))
 
-            message['step'] = 9
-            self.out_queue.put(message)
+    connector.commit()
 
-            # Only DB writes permitted from child: uuid, file_type_id and
-            # the model metadata (vertex_count, aabb, obb).
-            connector.execute('UPDATE models3d SET file_type_id=?, uuid=?, '
-                              'vertex_count=?, aabb=?, obb=? WHERE id=?;',
-                              (file_type_id, uuid, vertex_count, str(aabb), str(obb), model_id))
+    report(10)
+
+    os.remove(model_path)
+
+    # Step 11: final success; parent updates resource_state.
+    report(11)
+
+    return uuid, meta is not None
+
+
+class ThreadWorker(threading.Thread):
+
+    def __init__(self, db_broker, credentials, message, out_queue):
+        self.db_broker = db_broker
+        self.credentials = credentials
+        self.message = message
+        self.out_queue = out_queue
 
-            connector.commit()
+        threading.Thread.__init__(self)
+        self.daemon = True
+        self.result = None
+        self.exception = None
 
-            message['step'] = 10
-            self.out_queue.put(message)
+    def _report(self, step):
+        self.message['step'] = step
+        # a copy, the queue pickles in its feeder thread and the next step
+        # would otherwise overwrite this one before it goes out
+        self.out_queue.put(dict(self.message))
 
-            os.remove(model_path)
+    def run(self):
+        connector = None
 
-            # Step 10: final success; parent updates resource_state.
-            message['step'] = 11
-            self.out_queue.put(message)
+        try:
+            connector = self.db_broker.connect_to_database(self.credentials)
+            if connector is None:
+                raise RuntimeError('database connection error')
 
-            connector.close()
+            self.result = convert_model(connector, self.message['id'],
+                                        self.message['path'], self._report)
+        except ConversionError as err:
+            err.update(self.message)
+            self.out_queue.put(self.message)
         except Exception as err:  # NOQA
             self.exception = err
+        finally:
             if connector is not None:
                 connector.close()
 
@@ -500,7 +562,7 @@ def _process_worker(in_queue: multiprocessing.Queue, out_queue: multiprocessing.
     :type in_queue: multiprocessing.Queue
     :param out_queue: Queue used to send notifications back to the monitor thread.
     :type out_queue: multiprocessing.Queue
-    :param exit_event: Process event used to coordinate startup and shutdown.
+    :param exit_event: Process event used to signal shutdown.
     :type exit_event: multiprocessing.Event
     :param print_lock: Lock used when printing diagnostics.
     :type print_lock: multiprocessing.Lock
@@ -508,31 +570,15 @@ def _process_worker(in_queue: multiprocessing.Queue, out_queue: multiprocessing.
     :returns: ``None``.
     :rtype: None
     """
-    exit_event.set()  # signal parent: alive and handle duplication succeeded
-
-    while exit_event.is_set():
-        pass  # wait for parent to clear
+    from . import worker_pool
 
-    while in_queue.empty():
-        pass
-
-    ppid = in_queue.get_nowait()
-
-    while in_queue.empty():
-        pass
-
-    is_primary = in_queue.get_nowait()
-
-    from . import manager
-
-    # Regenerate service ID from inherited stealth environment variables
-    cred_manager = manager.CredManager(print_lock, pid=ppid)
-
-    credentials = cred_manager.retrieve_credentials(print_lock)
-    if credentials is None:
-        out_queue.put({'log': 'MODEL DOWNLOADER: error collecting credentials'})
+    result = worker_pool.child_handshake(in_queue, out_queue, print_lock, 'MODEL DOWNLOADER')
+    if result is None:
         return
 
+    handshake, credentials = result
+    is_primary = handshake['is_primary']
+
     from . import db_broker
     from .. import config as _config
 
@@ -592,18 +638,10 @@ def _process_worker(in_queue: multiprocessing.Queue, out_queue: multiprocessing.
         timeout = _config.Config.resources.model_watchdog_timeout
 
         thread = ThreadWorker(db_broker, credentials, message, out_queue)
-        start_time = time.time()
-
         thread.start()
 
-        stop_time = time.time()
-        while stop_time - start_time <= timeout:
-            if thread.is_alive():
-                exit_event.wait(0.1)
-            else:
-                break
-
-            stop_time = time.time()
+        # blocks until the conversion finishes or the watchdog runs out
+        thread.join(timeout)
 
         if thread.exception is not None:
             # Unhandled exception: pass error info to parent for DB update.
@@ -616,7 +654,7 @@ def _process_worker(in_queue: multiprocessing.Queue, out_queue: multiprocessing.
             out_queue.put(message)
             continue
 
-        if stop_time - start_time > timeout:
+        if thread.is_alive():
             # Watchdog timeout: parent will persist as a blocking issue.
             message['watchdog_restart'] = True
             message['is_primary'] = is_primary
@@ -630,83 +668,30 @@ def _process_worker(in_queue: multiprocessing.Queue, out_queue: multiprocessing.
     out_queue.put(message)
 
 
-class ProcessWorker:
+class ProcessWorker(_worker_pool.Worker):
+
+    name = 'model'
 
     def __init__(self, manager: "_manager.ProcessManager",
                  print_lock: multiprocessing.Lock):
 
-        self.manager = manager
-        self.exit_event = multiprocessing.Event()
-        self.in_queue = multiprocessing.Queue()
-        self.out_queue = multiprocessing.Queue()
-
-        self.process = multiprocessing.Process(
-            target=_process_worker,
-            args=(self.out_queue, self.in_queue, self.exit_event, print_lock))
-
-        self.process.daemon = True
-
-    def start(self, is_primary):
-        """
-        Start the model child process.
-
-        :returns: ``None``.
-        :rtype: None
-        :raises RuntimeError: Raised when the connector or worker enters an unexpected state.
-        """
-
-        self.process.start()
-        self.exit_event.wait(timeout=10.0)
-        if not self.exit_event.is_set():
-            raise RuntimeError('image process_worker failed to start within 10 seconds')
-
-        self.exit_event.clear()
-
-        self.out_queue.put(os.getpid())
-        self.out_queue.put(is_primary)
-
-    def is_alive(self):
-        return self.process.is_alive()
-
-    def send(self, message):
-        """Queue an image identifier for background resource collection.
-
-        :param message: message to send.
-        :type message: UNKNOWN
-
-        :returns: ``None``.
-        :rtype: None
-        """
-        self.out_queue.put(message)
-
-    def recv(self):  # NOQA
-        if not self.in_queue.empty():
-            message = self.in_queue.get_nowait()
-
-            if message is not None and 'ping' in message:
-                # Heartbeat keep-alive -- see _process_worker. The parent's
-                # only job here is to echo it back immediately; it never
-                # initiates one itself.
-                self.out_queue.put({'pong': True})
-                return None
-
-            return message
+        _worker_pool.Worker.__init__(self, manager, print_lock, _process_worker)
 
     def reset(self):
         pass
 
-    def stop(self):
+    def stop(self, timeout: float = None):
         """
-        Signal the worker child processes to stop.
+        Signal the worker child process to stop.
+
+        A conversion that is running is given until its watchdog runs out.
 
         :returns: ``None``.
         :rtype: None
         """
-        self.exit_event.set()
-        self.out_queue.put(None)
+        if timeout is None:
+            from .. import config as _config
 
-        from .. import config as _config
+            timeout = _config.Config.resources.model_watchdog_timeout + 3.0
 
-        self.process.join(_config.Config.resources.model_watchdog_timeout + 3.0)
-        if self.process.is_alive():
-            print('model process is stuck')
+        _worker_pool.Worker.stop(self, timeout)
@@ -0,0 +1,373 @@
+# © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
+
+"""Spawn handshake, bookkeeping and metrics shared by the model and image workers."""
+
+from typing import TYPE_CHECKING, Callable
+
+import multiprocessing
+import os
+import queue
+import time
+
+
+if TYPE_CHECKING:
+    from . import manager as _manager
+
+
+# How long either side of the spawn handshake waits for the other before
+# giving up. The parent waits this long for the child to report in, the
+# child waits this long for the parent's reply.
+HANDSHAKE_TIMEOUT = 10.0
+
+
+def child_handshake(in_queue: multiprocessing.Queue,
+                    out_queue: multiprocessing.Queue,
+                    print_lock: multiprocessing.Lock, name: str):
+    """
+    Child side of the spawn handshake.
+
+    The child used to raise ``exit_event`` to say it was alive and then spin
+    on ``exit_event.is_set()`` and ``in_queue.empty()`` until the parent
+    cleared it and queued its pid -- a full core per worker burned for as
+    long as the parent took to get around to it. Both waits are now blocking
+    reads with a timeout: the child posts ``{'ready': pid}`` and sleeps in
+    ``in_queue.get`` until the parent's handshake message arrives.
+    ``exit_event`` is left to mean one thing only, shutdown.
+
+    The handshake message carries the parent's pid (used to regenerate the
+    keyring service id, see :class:`.manager.CredManager`) plus whatever
+    keyword arguments the parent passed to :meth:`Worker.start`.
+
+    :param in_queue: Parent -> child queue.
+    :type in_queue: multiprocessing.Queue
+    :param out_queue: Child -> parent queue.
+    :type out_queue: multiprocessing.Queue
+    :param print_lock: Lock used when printing diagnostics.
+    :type print_lock: multiprocessing.Lock
+    :param name: Prefix for log messages sent back to the parent.
+    :type name: str
+
+    :returns: ``(handshake, credentials)``, or ``None`` if the parent never
+              answered or no credentials are stored for this session.
+    :rtype: tuple[dict, dict] | None
+    """
+    out_queue.put({'ready': os.getpid()})
+
+    try:
+        handshake = in_queue.get(timeout=HANDSHAKE_TIMEOUT)
+    except queue.Empty:
+        # parent is gone or hung, nobody is left to report to
+        return None
+
+    if not isinstance(handshake, dict) or 'ppid' not in handshake:
+        # a stop request that overtook the handshake
+        return None
+
+    from . import manager
+
+    # Regenerate service ID from inherited stealth environment variables
+    cred_manager = manager.CredManager(print_lock, pid=handshake['ppid'])
+
+    credentials = cred_manager.retrieve_credentials(print_lock)
+    if credentials is None:
+        out_queue.put({'log': f'{name}: error collecting credentials'})
+        return None
+
+    return handshake, credentials
+
+
+class Worker:
+    """
+    Parent side of one worker subprocess.
+
+    Owns the two queues, the shutdown event and the process, runs the spawn
+    handshake and keeps the per-worker metrics in :attr:`stats`:
+
+    * ``startup_ms`` -- ``Process.start()`` until the child reported in.
+    * ``queue_depth`` -- jobs handed to this worker that haven't finished,
+      including anything queued on the parent side (see
+      :attr:`queue_depth`).
+    * ``jobs`` -- jobs finished.
+    * ``busy_ms`` -- total time spent between :meth:`assign` and
+      :meth:`finish`.
+    * ``pings`` -- heartbeat pings answered.
+
+    The queues are named from the parent's point of view: :attr:`in_queue`
+    is what the child writes to, :attr:`out_queue` is what it reads.
+    """
+
+    name = 'worker'
+
+    def __init__(self, manager: "_manager.ProcessManager",
+                 print_lock: multiprocessing.Lock, target: Callable):
+
+        self.manager = manager
+        self.exit_event = multiprocessing.Event()
+        self.in_queue = multiprocessing.Queue()
+        self.out_queue = multiprocessing.Queue()
+
+        # whatever the owner wants to remember about the running job
+        self.job = None
+        self._busy_start = None
+
+        self.stats = dict(startup_ms=0.0, queue_depth=0, jobs=0, busy_ms=0.0, pings=0)
+
+        self.process = multiprocessing.Process(
+            target=target,
+            args=(self.out_queue, self.in_queue, self.exit_event, print_lock))
+
+        self.process.daemon = True
+
+    def start(self, **handshake):
+        """
+        Start the child process and run the spawn handshake.
+
+        :param handshake: Extra values handed to the child along with the
+                          parent pid.
+
+        :returns: ``None``.
+        :rtype: None
+        :raises RuntimeError: Raised when the child doesn't report in within
+                              :data:`HANDSHAKE_TIMEOUT` seconds.
+        """
+        start = time.perf_counter()
+
+        self.process.start()
+
+        try:
+            message = self.in_queue.get(timeout=HANDSHAKE_TIMEOUT)
+        except queue.Empty:
+            message = None
+
+        if not isinstance(message, dict) or 'ready' not in message:
+            self.process.kill()
+            raise RuntimeError(f'{self.name} process_worker failed to start '
+                               f'within {HANDSHAKE_TIMEOUT} seconds')
+
+        self.stats['startup_ms'] = (time.perf_counter() - start) * 1000.0
+
+        handshake['ppid'] = os.getpid()
+        self.out_queue.put(handshake)
+
+    def is_alive(self):
+        return self.process.is_alive()
+
+    @property
+    def is_idle(self):
+        return self.job is None and self.process.is_alive()
+
+    @property
+    def queue_depth(self):
+        return int(self.job is not None)
+
+    def update_depth(self):
+        self.stats['queue_depth'] = self.queue_depth
+
+    def assign(self, job, message):
+        """
+        Hand a job to the child.
+
+        :param job: Kept in :attr:`job` until :meth:`finish`.
+        :param message: Sent to the child.
+
+        :returns: ``None``.
+        :rtype: None
+        """
+        self.job = job
+        self._busy_start = time.perf_counter()
+        self.out_queue.put(message)
+        self.update_depth()
+
+    def finish(self):
+        """
+        Mark the running job as done.
+
+        :returns: The job passed to :meth:`assign`.
+        """
+        job = self.job
+        self.job = None
+
+        if self._busy_start is not None:
+            self.stats['busy_ms'] += (time.perf_counter() - self._busy_start) * 1000.0
+            self.stats['jobs'] += 1
+            self._busy_start = None
+
+        self.update_depth()
+
+        return job
+
+    def recv(self):
+        """
+        Read one message from the child without blocking.
+
+        Heartbeat pings are answered here and never returned.
+
+        :returns: The message, or ``None`` if there wasn't one.
+        :rtype: dict | None
+        """
+        try:
+            message = self.in_queue.get_nowait()
+        except queue.Empty:
+            return None
+
+        if message is not None and 'ping' in message:
+            # Heartbeat keep-alive -- the parent's only job here is to echo
+            # it back immediately; it never initiates one itself.
+            self.out_queue.put({'pong': True})
+            self.stats['pings'] += 1
+            return None
+
+        return message
+
+    def stop(self, timeout: float = 5.0):
+        """
+        Signal the worker child process to stop.
+
+        :param timeout: How long to wait for the child to exit.
+        :type timeout: float
+
+        :returns: ``None``.
+        :rtype: None
+        """
+        self.exit_event.set()
+        self.out_queue.put(None)
+
+        self.process.join(timeout)
+        if self.process.is_alive():
+            print(f'{self.name} process is stuck')
+
+
+class WorkerPool:
+    """
+    A set of :class:`Worker` processes of one kind.
+
+    The model workers grow one process per concurrent conversion up to
+    ``max_workers``; the image worker is a pool of one. Both are spawned,
+    handed out, replaced and stopped through here, and :attr:`stats` rolls
+    the per-worker metrics up for the whole pool.
+
+    Not locked -- the owner serializes access (see
+    ``ProcessManager._model_lock``).
+    """
+
+    def __init__(self, manager: "_manager.ProcessManager",
+                 print_lock: multiprocessing.Lock, factory: Callable,
+                 max_workers: int):
+        """
+        :param manager: Passed to every worker.
+        :param print_lock: Passed to every worker.
+        :param factory: ``factory(manager, print_lock)`` -> unstarted
+                        :class:`Worker`.
+        :param max_workers: Upper bound on live workers.
+        :type max_workers: int
+        """
+        self.manager = manager
+        self._print_lock = print_lock
+        self._factory = factory
+        self.max_workers = max_workers
+        self.workers: list[Worker] = []
+
+        self._spawned = 0
+        self._startup_ms = 0.0
+
+        # totals carried over from workers that have left the pool
+        self._retired_jobs = 0
+        self._retired_busy_ms = 0.0
+
+    def __iter__(self):
+        # a copy, workers are removed and replaced while iterating
+        return iter(self.workers[:])
+
+    def __len__(self):
+        return len(self.workers)
+
+    @property
+    def is_full(self):
+        return len(self.workers) >= self.max_workers
+
+    def _create(self, handshake):
+        worker = self._factory(self.manager, self._print_lock)
+        worker.start(**handshake)
+
+        self._spawned += 1
+        self._startup_ms += worker.stats['startup_ms']
+
+        return worker
+
+    def _retire(self, worker):
+        worker.finish()
+        self._retired_jobs += worker.stats['jobs']
+        self._retired_busy_ms += worker.stats['busy_ms']
+
+    def spawn(self, **handshake) -> Worker:
+        """
+        Start a new worker and add it to the pool.
+
+        :param handshake: Passed to :meth:`Worker.start`.
+
+        :returns: The started worker.
+        :rtype: Worker
+        """
+        worker = self._create(handshake)
+        self.workers.append(worker)
+
+        return worker
+
+    def replace(self, worker: Worker, **handshake) -> Worker:
+        """
+        Start a new worker in the place of *worker*, which is dropped from
+        the pool without being stopped (it has already exited or is about to).
+
+        :returns: The new worker.
+        :rtype: Worker
+        """
+        new_worker = self._create(handshake)
+        self.workers[self.workers.index(worker)] = new_worker
+        self._retire(worker)
+
+        return new_worker
+
+    def remove(self, worker: Worker):
+        if worker in self.workers:
+            self.workers.remove(worker)
+            self._retire(worker)
+
+    def idle(self) -> Worker | None:
+        """The first live worker with nothing running, if any."""
+        for worker in self.workers:
+            if worker.is_idle:
+                return worker
+
+        return None
+
+    @property
+    def active(self) -> int:
+        """The number of workers with a job running."""
+        return sum(1 for worker in self.workers if worker.job is not None)
+
+    @property
+    def stats(self) -> dict:
+        """
+        Pool totals plus a copy of every live worker's :attr:`Worker.stats`.
+        ``startup_ms`` is the mean over every worker spawned so far, and
+        ``jobs``/``busy_ms`` include workers that have since exited.
+        """
+        workers = []
+        for worker in self.workers:
+            worker.update_depth()
+            workers.append(dict(worker.stats, pid=worker.process.pid))
+
+        return dict(
+            spawned=self._spawned,
+            live=len(workers),
+            active=self.active,
+            startup_ms=self._startup_ms / self._spawned if self._spawned else 0.0,
+            queue_depth=sum(item['queue_depth'] for item in workers),
+            jobs=self._retired_jobs + sum(item['jobs'] for item in workers),
+            busy_ms=self._retired_busy_ms + sum(item['busy_ms'] for item in workers),
+            workers=workers)
+
+    def stop(self, timeout: float = 5.0):
+        """Stop every worker in the pool."""
+        for worker in self.workers[:]:
+            worker.stop(timeout)
@@ -0,0 +1,620 @@
+# © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
+
+"""Two-level acceleration structure for the ray tracer: a cached BVH per mesh
+and a BVH over the placed objects."""
+
+import itertools
+import math
+import os
+import threading
+import time
+import weakref
+import numpy as np
+
+from ..gl import pick_bvh as _pick_bvh
+from . import bvh_processor as _bvh_processor
+from .. import check_types as _check_types
+
+
+# Scene.build used to transform every object into world space and build a
+# BVH over each one from scratch on every render, then splice the trees
+# together with a Python loop over every node. A render after moving one
+# housing redid all of that for every object in view, and objects sharing a
+# model got a tree each.
+#
+# Here the work is split in two levels, the way hardware ray tracing APIs
+# split it:
+#
+# * a BLAS (bottom level) is the BVH over one mesh in its own object space.
+#   It depends on nothing but the mesh, so there is one per mesh handler,
+#   built once and kept for as long as the handler lives (BLASCache). All
+#   the BLAS a render uses are packed into one set of arrays (_Pool), which
+#   is kept as long as the same meshes are in view -- the renderer keeps
+#   its device copy for as long as that too.
+#
+# * the TLAS (top level) is a BVH over the placed objects (Instance): the
+#   world space box of each object's BLAS root. It is a linear BVH like
+#   gl.pick_bvh.PickBVH and is refit, not rebuilt, while the objects are the
+#   same ones as last time -- only the leaves that moved and their
+#   ancestors are recomputed.
+#
+# The kernel walks the TLAS and, at each leaf, moves the ray into the
+# object's space and walks its BLAS (see kernel.cl traverse_bvh).
+
+# instances per TLAS leaf; a leaf hit walks the BLAS of every instance in
+# it, so the tree goes all the way down to single instances
+LEAF_SIZE = 1
+
+# a refit that leaves the TLAS leaves this many times the surface area they
+# had when built rebuilds instead, see PickBVH
+_REBUILD_AREA_RATIO = 2.0
+
+# an empty TLAS node (padding up to a complete tree, the lone node of an
+# empty scene) goes to the kernel as a point past any distance it tests
+# against, so no ray ever enters it
+_EMPTY_BOUND = 3.0e38
+
+# floats per instance in the transform array: the object -> world matrix
+# then the world -> object one, each 3 rows of 4 with the translation last
+TRANSFORM_SIZE = 24
+
+# which corner of a box takes the maximum on each axis
+_CORNERS = np.array([[(i >> axis) & 1 for axis in range(3)] for i in range(8)], dtype=bool)
+
+_pool_versions = itertools.count(1)
+
+
+class Instance:
+    """
+    One placed object: the mesh it draws, where and with what material.
+
+    :param key: Identifies the object from one render to the next; the
+                TLAS is refit rather than rebuilt while the same keys come
+                back in the same order.
+    :param vbo: The object's mesh handler (``obj3d.vbo``).
+    :param position: World position, (3,).
+    :param rotation: (3,3) rotation in the row-vector convention the GL
+                     side uses - ``v @ rotation`` rotates ``v``.
+    :param scale: Per-axis scale, (3,), applied before the rotation.
+    :param material: The material's ``cl_array`` row.
+    """
+
+    @_check_types.do
+    def __init__(self, key: int, vbo, position: np.ndarray, rotation: np.ndarray,
+                 scale: np.ndarray, material: np.ndarray):
+        self.key = key
+        self.vbo = vbo
+
+        rotation = np.asarray(rotation, dtype=np.float64).reshape(3, 3)
+        scale = np.asarray(scale, dtype=np.float64).reshape(3)
+
+        # column-vector form: world = to_world[:, :3] @ v + to_world[:, 3]
+        to_world = np.empty((3, 4), dtype=np.float64)
+        to_world[:, :3] = rotation.T * scale
+        to_world[:, 3] = np.asarray(position, dtype=np.float64).reshape(3)
+
+        to_object = np.empty((3, 4), dtype=np.float64)
+        to_object[:, :3] = np.linalg.inv(to_world[:, :3])
+        to_object[:, 3] = -to_object[:, :3] @ to_world[:, 3]
+
+        self.to_world = to_world
+        self.transform = np.concatenate((to_world.ravel(), to_object.ravel())).astype(np.float32)
+        self.material = np.asarray(material, dtype=np.float32)
+
+
+class BLAS:
+    """
+    The BVH over one mesh, in the mesh's own space.
+
+    ``bounds``, ``structure`` and ``indices`` are what
+    :class:`bvh_fast.FastBVHBuilder` builds - 6 floats and 4 ints per node,
+    the root first, and the mesh's face numbers in leaf order.
+    """
+
+    @_check_types.do
+    def __init__(self, vbo):
+        # the handler's bounds array is replaced whenever its mesh is
+        # (VBOHandlerBase.update), which is what BLASCache checks
+        self.source = vbo.local_aabb
+        self.vertices, self.faces = self.mesh_arrays(vbo)
+
+        self.bounds = None
+        self.structure = None
+        self.indices = None
+        self.build_ms = 0.0
+
+    @staticmethod
+    @_check_types.do
+    def mesh_arrays(vbo) -> tuple[np.ndarray, np.ndarray]:
+        """
+        The stored positions of *vbo*, (n,3) float32, and its triangles as
+        (m,3) int32 rows into them. An indexed mesh is not expanded.
+        """
+        count = vbo.stored_vertex_count
+        vertices = np.ascontiguousarray(vbo.read_rows(0, 0, count), dtype=np.float32)
+
+        if vbo.is_indexed:
+            faces = vbo.indices.astype(np.int32).reshape(-1, 3)
+        else:
+            faces = np.arange(count - count % 3, dtype=np.int32).reshape(-1, 3)
+
+        return vertices, faces
+
+    @property
+    @_check_types.do
+    def node_count(self) -> int:
+        return len(self.structure) // 4
+
+    @property
+    @_check_types.do
+    def root_box(self) -> np.ndarray:
+        """Object space (min x, y, z, max x, y, z) of the whole mesh."""
+        return self.bounds[:6]
+
+
+class BLASCache:
+    """
+    One :class:`BLAS` per mesh handler, built the first time a render uses
+    the handler and dropped with it.
+
+    New ones are built on a :class:`bvh_processor.ThreadedBVHProcessor`
+    that is started on first use and kept for the next render.
+    """
+
+    @_check_types.do
+    def __init__(self):
+        self._entries = weakref.WeakKeyDictionary()
+        self._processor = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @_check_types.do
+    def get(self, vbos: list) -> tuple[list[BLAS], int]:
+        """
+        The BLAS of each handler in *vbos*, building the missing ones.
+
+        :returns: The BLAS, in the order of *vbos*, and how many of them
+                  had to be built.
+        :rtype: tuple[list[BLAS], int]
+        """
+        entries = self._entries
+        found = []
+        missing = []
+
+        for vbo in vbos:
+            blas = entries.get(vbo)
+
+            if blas is None or blas.source is not vbo.local_aabb:
+                blas = BLAS(vbo)
+                entries[vbo] = blas
+                missing.append(blas)
+
+            found.append(blas)
+
+        if missing:
+            try:
+                self._build(missing)
+            except:  # NOQA
+                for vbo, blas in zip(vbos, found):
+                    if blas.structure is None:
+                        entries.pop(vbo, None)
+                raise
+
+        return found, len(missing)
+
+    @_check_types.do
+    def _build(self, blases: list[BLAS]) -> None:
+        if self._processor is None:
+            self._processor = _bvh_processor.ThreadedBVHProcessor(
+                num_threads=max(1, (os.cpu_count() or 2) - 1))
+
+            self._processor.start()
+
+        # object space in, object space out: with no transform the
+        # processor only computes centroids and builds
+        identity = np.eye(3, dtype=np.float32)
+        origin = np.zeros(3, dtype=np.float32)
+        no_normals = np.zeros((0, 3), dtype=np.float32)
+
+        object_data = [
+            _bvh_processor.ObjectData(
+                object_id=i, vertices=blas.vertices, faces=blas.faces,
+                normals=no_normals, position=origin, rotation=identity,
+                material_id=i)
+            for i, blas in enumerate(blases)
+        ]
+
+        results = self._processor.process_objects(object_data)
+
+        if len(results) != len(blases):
+            raise RuntimeError(
+                f'BVH build failed for {len(blases) - len(results)} '
+                f'of {len(blases)} meshes')
+
+        for result in results:
+            blas = blases[result.object_id]
+            blas.bounds = result.bvh_bounds
+            blas.structure = result.bvh_structure
+            blas.indices = result.bvh_indices
+            blas.build_ms = result.processing_time
+
+    @_check_types.do
+    def clear(self) -> None:
+        """Drop every BLAS and stop the build threads."""
+        self._entries = weakref.WeakKeyDictionary()
+
+        if self._processor is not None:
+            self._processor.shutdown()
+            self._processor = None
+
+
+class _Pool:
+    """
+    A list of BLAS packed into the single set of arrays the kernel reads:
+    child nodes, leaf ranges, face numbers and vertex numbers all offset to
+    where each BLAS landed. ``roots[i]`` is the node the i-th BLAS starts
+    at. Each array is offset as a whole, never per node.
+
+    ``version`` is unique to the pool, so a device copy can be kept and
+    checked against it.
+    """
+
+    @_check_types.do
+    def __init__(self, blases: list[BLAS]):
+        # held, so the key's ids can't be reused while the pool exists
+        self.blases = blases
+        self.key = tuple(id(blas) for blas in blases)
+        self.version = next(_pool_versions)
+
+        if not blases:
+            self.roots = np.zeros(0, dtype=np.int32)
+            self.vertices = np.zeros((1, 3), dtype=np.float32)
+            self.faces = np.zeros((1, 3), dtype=np.int32)
+            self.bounds = np.zeros(6, dtype=np.float32)
+            self.structure = np.array([-1, -1, 0, 0], dtype=np.int32)
+            self.indices = np.zeros(1, dtype=np.int32)
+            return
+
+        def offsets(counts):
+            return np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.int32)
+
+        vertex_offsets = offsets([len(blas.vertices) for blas in blases])
+        face_offsets = offsets([len(blas.faces) for blas in blases])
+        node_offsets = offsets([blas.node_count for blas in blases])
+        index_offsets = offsets([len(blas.indices) for blas in blases])
+
+        structures = []
+        for blas, node_offset, index_offset in zip(blases, node_offsets, index_offsets):
+            structure = blas.structure.reshape(-1, 4).copy()
+
+            children = structure[:, :2]
+            children[children != -1] += node_offset
+
+            first_prim = structure[:, 2]
+            first_prim[first_prim != -1] += index_offset
+
+            structures.append(structure.ravel())
+
+        self.roots = node_offsets
+        self.vertices = np.concatenate([blas.vertices for blas in blases])
+        self.faces = np.concatenate(
+            [blas.faces + offset for blas, offset in zip(blases, vertex_offsets)])
+        self.bounds = np.concatenate([blas.bounds for blas in blases])
+        self.structure = np.concatenate(structures)
+        # the leaves list face numbers, so they move with the faces
+        self.indices = np.concatenate(
+            [blas.indices + offset for blas, offset in zip(blases, face_offsets)]).astype(np.int32)
+
+
+@_check_types.do
+def _world_boxes(roots: np.ndarray, to_world: np.ndarray) -> np.ndarray:
+    # the 8 corners of each instance's BLAS root box moved into world space,
+    # boxed again and packed (min, -max) the way PickBVH packs boxes
+    corners = np.where(_CORNERS, roots[:, None, 3:], roots[:, None, :3])
+    world = np.einsum('nij,nkj->nki', to_world[:, :, :3], corners) + to_world[:, None, :, 3]
+
+    return np.concatenate((world.min(axis=1), -world.max(axis=1)), axis=1).astype(np.float32)
+
+
+class TLAS:
+    """
+    The BVH over the instances of a scene.
+
+    Built the way :class:`gl.pick_bvh.PickBVH` builds its tree: instances
+    sorted along a Morton curve through their box centers, cut into leaves
+    of :data:`LEAF_SIZE` and paired up level by level into a complete
+    binary tree. The levels, root first, are the tree in heap order - node
+    ``i`` has children ``2i+1`` and ``2i+2`` - written out in the node
+    format a BLAS uses (explicit children, leaf ranges into ``indices``),
+    so the kernel walks both with the same code.
+
+    :meth:`update` refits while the instances are the same ones as last
+    time, and rebuilds when they are not or the refit has loosened the
+    leaves too much.
+
+    ``bounds``, ``structure`` and ``indices`` are the kernel arrays;
+    ``indices`` lists instance numbers in leaf order.
+    """
+
+    @_check_types.do
+    def __init__(self):
+        self._keys = None
+        self._boxes = np.zeros((0, 6), dtype=np.float32)
+
+        self._rows = np.zeros(0, dtype=np.int32)
+        self._row_boxes = np.zeros((0, 6), dtype=np.float32)
+        self._levels: list[np.ndarray] = []
+
+        self._leaf_areas = np.zeros(0, dtype=np.float32)
+        self._area = 0.0
+        self._built_area = 0.0
+
+        self.bounds = None
+        self.structure = None
+        self.indices = None
+
+    @property
+    @_check_types.do
+    def node_count(self) -> int:
+        return len(self.structure) // 4
+
+    @_check_types.do
+    def update(self, keys: tuple, boxes: np.ndarray) -> str:
+        """
+        Bring the tree up to date with the world *boxes* of the instances
+        identified by *keys*.
+
+        :param keys: One key per instance, see :attr:`Instance.key`.
+        :param boxes: Packed (min, -max) world boxes, (n,6) float32.
+        :returns: ``'built'``, ``'refit'`` or ``'reused'`` (nothing moved).
+        :rtype: str
+        """
+        if keys != self._keys or self.structure is None:
+            self._build(keys, boxes)
+            return 'built'
+
+        changed = np.flatnonzero((boxes != self._boxes).any(axis=1))
+        if not len(changed):
+            return 'reused'
+
+        self._boxes = boxes
+        self._refit(changed)
+
+        if self._area > self._built_area * _REBUILD_AREA_RATIO + 1e-6:
+            self._build(keys, boxes)
+            return 'built'
+
+        self._export_bounds()
+        return 'refit'
+
+    @_check_types.do
+    def _build(self, keys: tuple, boxes: np.ndarray) -> None:
+        self._keys = keys
+        self._boxes = boxes
+        size = len(boxes)
+
+        codes = np.zeros(size, dtype=np.uint32)
+
+        if size:
+            centers = (boxes[:, :3] - boxes[:, 3:]) * 0.5
+            low = centers.min(axis=0)
+            span = np.maximum(centers.max(axis=0) - low, 1e-6)
+            cells = ((centers - low) / span * 1023.0).astype(np.uint32)
+
+            codes = ((_pick_bvh._spread_bits(cells[:, 0]) << 2) |  # NOQA
+                     (_pick_bvh._spread_bits(cells[:, 1]) << 1) |  # NOQA
+                     _pick_bvh._spread_bits(cells[:, 2]))  # NOQA
+
+        order = np.argsort(codes, kind='stable').astype(np.int32)
+
+        rows = np.empty(size, dtype=np.int32)
+        rows[order] = np.arange(size, dtype=np.int32)
+
+        depth = math.ceil(math.log2(max(1, math.ceil(size / LEAF_SIZE))))
+        leaf_count = 1 << depth
+
+        row_boxes = np.full((leaf_count * LEAF_SIZE, 6), np.inf, dtype=np.float32)
+        row_boxes[:size] = boxes[order]
+
+        level = row_boxes.reshape(leaf_count, LEAF_SIZE, 6).min(axis=1)
+
+        self._leaf_areas = _pick_bvh._surface_areas(level)  # NOQA
+        self._area = self._built_area = float(self._leaf_areas.sum())
+
+        levels = [level]
+        while len(level) > 1:
+            level = level.reshape(-1, 2, 6).min(axis=1)
+            levels.insert(0, level)
+
+        self._levels = levels
+        self._rows = rows
+        self._row_boxes = row_boxes
+
+        # heap order: the internal nodes, then the leaves
+        internal = leaf_count - 1
+        nodes = np.arange(internal, dtype=np.int32)
+        first = np.arange(leaf_count, dtype=np.int32) * LEAF_SIZE
+
+        structure = np.empty((internal + leaf_count, 4), dtype=np.int32)
+        structure[:internal, 0] = nodes * 2 + 1
+        structure[:internal, 1] = nodes * 2 + 2
+        structure[:internal, 2] = -1
+        structure[:internal, 3] = 0
+        structure[internal:, 0] = -1
+        structure[internal:, 1] = -1
+        structure[internal:, 2] = first
+        structure[internal:, 3] = np.clip(size - first, 0, LEAF_SIZE)
+
+        indices = np.zeros(leaf_count * LEAF_SIZE, dtype=np.int32)
+        indices[:size] = order
+
+        self.structure = structure.ravel()
+        self.indices = indices
+        self._export_bounds()
+
+    @_check_types.do
+    def _refit(self, changed: np.ndarray) -> None:
+        # the changed instances' rows, their leaves, then the leaves'
+        # ancestors one level at a time, as PickBVH._refit does
+        rows = self._rows[changed]
+        self._row_boxes[rows] = self._boxes[changed]
+
+        level = len(self._levels) - 1
+        nodes = np.unique(rows // LEAF_SIZE)
+
+        boxes = self._row_boxes.reshape(-1, LEAF_SIZE, 6)[nodes].min(axis=1)
+        self._levels[level][nodes] = boxes
+
+        areas = _pick_bvh._surface_areas(boxes)  # NOQA
+        self._area += float(areas.sum() - self._leaf_areas[nodes].sum())
+        self._leaf_areas[nodes] = areas
+
+        while level:
+            children = self._levels[level].reshape(-1, 2, 6)
+
+            nodes = np.unique(nodes >> 1)
+            level -= 1
+
+            self._levels[level][nodes] = children[nodes].min(axis=1)
+
+    @_check_types.do
+    def _export_bounds(self) -> None:
+        packed = np.concatenate(self._levels)
+
+        bounds = np.concatenate((packed[:, :3], -packed[:, 3:]), axis=1)
+        bounds[(bounds[:, :3] > bounds[:, 3:]).any(axis=1)] = _EMPTY_BOUND
+
+        self.bounds = np.ascontiguousarray(bounds.ravel(), dtype=np.float32)
+
+
+class SceneArrays:
+    """
+    Everything the kernel reads about the geometry of one render.
+
+    ``vertices``, ``faces``, ``bvh_bounds``, ``bvh_structure`` and
+    ``bvh_indices`` are the BLAS pool, the same arrays (and the same
+    ``pool_version``) for as long as the same meshes are in view.
+    ``tlas_*`` is the tree over the instances, ``instance_transforms``
+    holds :data:`TRANSFORM_SIZE` floats per instance and ``instance_info``
+    the node its BLAS starts at and its row in ``materials``.
+    ``lights`` is filled in by the scene, ``stats`` is a copy of the
+    building :class:`SceneAccel`'s.
+    """
+
+    @_check_types.do
+    def __init__(self, pool: _Pool, tlas: TLAS, instance_transforms: np.ndarray,
+                 instance_info: np.ndarray, materials: np.ndarray):
+        self.pool_version = pool.version
+        self.vertices = pool.vertices
+        self.faces = pool.faces
+        self.bvh_bounds = pool.bounds
+        self.bvh_structure = pool.structure
+        self.bvh_indices = pool.indices
+
+        self.tlas_bounds = tlas.bounds
+        self.tlas_structure = tlas.structure
+        self.tlas_indices = tlas.indices
+
+        self.instance_transforms = instance_transforms
+        self.instance_info = instance_info
+        self.materials = materials
+
+        self.lights = None
+
+        # SceneAccel.stats of the build that made these
+        self.stats = {}
+
+
+class SceneAccel:
+    """
+    The BLAS cache, BLAS pool and TLAS, kept from one render to the next.
+
+    ``stats`` holds the last :meth:`build`: ``instances``, ``meshes``,
+    ``blas_built`` and ``blas_ms``, ``pool`` (``'built'``/``'reused'``)
+    and ``pool_ms``, ``tlas`` (``'built'``/``'refit'``/``'reused'``) and
+    ``tlas_ms``, ``instance_ms`` (transforms, boxes and materials) and
+    ``build_ms``, the whole call.
+    """
+
+    @_check_types.do
+    def __init__(self):
+        self.blas_cache = BLASCache()
+        self.tlas = TLAS()
+        self._pool = None
+        self._lock = threading.Lock()
+
+        self.stats = dict(instances=0, meshes=0, blas_built=0, blas_ms=0.0,
+                          pool='built', pool_ms=0.0, tlas='built', tlas_ms=0.0,
+                          instance_ms=0.0, build_ms=0.0)
+
+    @_check_types.do
+    def build(self, instances: list[Instance]) -> SceneArrays:
+        """
+        The kernel arrays for *instances*, reusing whatever the last build
+        left that still applies.
+        """
+        with self._lock:
+            return self._build(instances)
+
+    @_check_types.do
+    def _build(self, instances: list[Instance]) -> SceneArrays:
+        stats = self.stats
+        start = time.perf_counter()
+
+        # each handler once, in the order it first shows up
+        vbos = list(dict.fromkeys(instance.vbo for instance in instances))
+        blases, built = self.blas_cache.get(vbos)
+
+        blas_done = time.perf_counter()
+
+        key = tuple(id(blas) for blas in blases)
+        if self._pool is None or self._pool.key != key:
+            self._pool = _Pool(blases)
+            stats['pool'] = 'built'
+        else:
+            stats['pool'] = 'reused'
+
+        pool = self._pool
+        pool_done = time.perf_counter()
+
+        count = len(instances)
+        slot = {vbo: i for i, vbo in enumerate(vbos)}
+        mesh = np.array([slot[instance.vbo] for instance in instances], dtype=np.int32)
+
+        if count:
+            transforms = np.array([instance.transform for instance in instances], dtype=np.float32)
+            to_world = np.array([instance.to_world for instance in instances], dtype=np.float64)
+            materials = np.array([instance.material for instance in instances], dtype=np.float32)
+
+            roots = np.array([blas.root_box for blas in blases], dtype=np.float64)[mesh]
+            boxes = _world_boxes(roots, to_world)
+
+            info = np.empty((count, 2), dtype=np.int32)
+            info[:, 0] = pool.roots[mesh]
+            info[:, 1] = np.arange(count, dtype=np.int32)
+        else:
+            # the kernel arguments can't be empty buffers
+            transforms = np.zeros((1, TRANSFORM_SIZE), dtype=np.float32)
+            materials = np.zeros((1, 12), dtype=np.float32)
+            boxes = np.zeros((0, 6), dtype=np.float32)
+            info = np.zeros((1, 2), dtype=np.int32)
+
+        instance_done = time.perf_counter()
+
+        stats['tlas'] = self.tlas.update(tuple(instance.key for instance in instances), boxes)
+
+        done = time.perf_counter()
+
+        stats['instances'] = count
+        stats['meshes'] = len(blases)
+        stats['blas_built'] = built
+        stats['blas_ms'] = (blas_done - start) * 1000.0
+        stats['pool_ms'] = (pool_done - blas_done) * 1000.0
+        stats['instance_ms'] = (instance_done - pool_done) * 1000.0
+        stats['tlas_ms'] = (done - instance_done) * 1000.0
+        stats['build_ms'] = (done - start) * 1000.0
+
+        arrays = SceneArrays(pool, self.tlas, transforms.ravel(), info.ravel(), materials)
+        arrays.stats = dict(stats)
+        return arrays
@@ -62,6 +62,9 @@ class RayTracingDialog(QDialog):
         self.cancelled = False
         self.current_image: QImage = None
 
+        # the running (or last) render, for its stage timings
+        self.renderer = None
+
         lay = QVBoxLayout(self)
 
         # Header widget (converted in Phase 2 dialogs)
@@ -164,8 +167,8 @@ class RayTracingDialog(QDialog):
             for obj in self._parent.editor3d.camera.objects_in_view:
                 scene.add_object(obj.obj3d)
 
-            renderer = _renderer.Renderer(scene, self.update_progress)
-            renderer.start()
+            self.renderer = _renderer.Renderer(scene, self.update_progress)
+            self.renderer.start()
 
         elif label == 'Cancel':
             self.cancelled = True
@@ -248,7 +251,15 @@ class RayTracingDialog(QDialog):
             self.image_label.setPixmap(pm)
 
         if progress >= 100:
-            self.status_text.setText("Render complete!")
+            if self.renderer is None:
+                self.status_text.setText("Render complete!")
+            else:
+                stats = self.renderer.stats
+                self.status_text.setText(
+                    f"Render complete! (build {stats['build_ms']:.0f} ms, "
+                    f"render {stats['render_ms']:.0f} ms)")
+                # the time of every stage
+                self.status_text.setToolTip(self.renderer.timing_text)
             self.mfb1.setText('Save')
             self.mfb1.setEnabled(True)
             self.mfb2.setText('Start')
@@ -153,16 +153,45 @@ bool intersect_triangle(
     return false;
 }
 
-// BVH traversal - closest hit
-bool traverse_bvh(
+// Instances: instance_transforms holds 24 floats per instance, the object ->
+// world matrix followed by the world -> object one, each 3 rows of 4 with
+// the translation last. instance_info holds 2 ints per instance, the node
+// its BLAS starts at in the bvh_* arrays and its row in materials.
+
+void transform_point(
+    __global const float* m,
+    float x, float y, float z,
+    float* out_x, float* out_y, float* out_z
+) {
+    *out_x = m[0] * x + m[1] * y + m[2] * z + m[3];
+    *out_y = m[4] * x + m[5] * y + m[6] * z + m[7];
+    *out_z = m[8] * x + m[9] * y + m[10] * z + m[11];
+}
+
+void transform_direction(
+    __global const float* m,
+    float x, float y, float z,
+    float* out_x, float* out_y, float* out_z
+) {
+    *out_x = m[0] * x + m[1] * y + m[2] * z;
+    *out_y = m[4] * x + m[5] * y + m[6] * z;
+    *out_z = m[8] * x + m[9] * y + m[10] * z;
+}
+
+// BLAS traversal - closest hit, in object space. The direction is the
+// world direction moved into object space and not normalized again, so a
+// hit distance here is the same distance along the world ray and the
+// closest hit so far (*t_io) still bounds the search.
+bool traverse_blas(
     __global const float* bvh_bounds,
     __global const int* bvh_structure,
     __global const int* bvh_indices,
     __global const float* vertices,
     __global const int* faces,
+    int root,
     float orig_x, float orig_y, float orig_z,
     float dir_x, float dir_y, float dir_z,
-    float* t_out,
+    float* t_io,
     int* face_out
 ) {
     float inv_dir_x = 1.0f / dir_x;
@@ -171,9 +200,9 @@ bool traverse_bvh(
 
     int stack[64];
     int stack_ptr = 0;
-    stack[stack_ptr++] = 0;  // Start with root
+    stack[stack_ptr++] = root;
 
-    float closest_t = 1e10f;
+    float closest_t = *t_io;
     int closest_face = -1;
 
     while (stack_ptr > 0) {
@@ -233,21 +262,112 @@ bool traverse_bvh(
     }
 
     if (closest_face != -1) {
+        *t_io = closest_t;
+        *face_out = closest_face;
+        return true;
+    }
+
+    return false;
+}
+
+// BVH traversal - closest hit. Walks the TLAS; at each leaf the ray is moved
+// into the space of every instance in it and that instance's BLAS is walked.
+bool traverse_bvh(
+    __global const float* tlas_bounds,
+    __global const int* tlas_structure,
+    __global const int* tlas_indices,
+    __global const float* instance_transforms,
+    __global const int* instance_info,
+    __global const float* bvh_bounds,
+    __global const int* bvh_structure,
+    __global const int* bvh_indices,
+    __global const float* vertices,
+    __global const int* faces,
+    float orig_x, float orig_y, float orig_z,
+    float dir_x, float dir_y, float dir_z,
+    float* t_out,
+    int* face_out,
+    int* instance_out
+) {
+    float inv_dir_x = 1.0f / dir_x;
+    float inv_dir_y = 1.0f / dir_y;
+    float inv_dir_z = 1.0f / dir_z;
+
+    int stack[64];
+    int stack_ptr = 0;
+    stack[stack_ptr++] = 0;  // Start with root
+
+    float closest_t = 1e10f;
+    int closest_face = -1;
+    int closest_instance = -1;
+
+    while (stack_ptr > 0) {
+        int node_idx = stack[--stack_ptr];
+
+        float min_x, min_y, min_z, max_x, max_y, max_z;
+        get_node_bounds(tlas_bounds, node_idx, &min_x, &min_y, &min_z, &max_x, &max_y, &max_z);
+
+        if (!intersect_aabb(orig_x, orig_y, orig_z,
+                           dir_x, dir_y, dir_z,
+                           inv_dir_x, inv_dir_y, inv_dir_z,
+                           min_x, min_y, min_z,
+                           max_x, max_y, max_z,
+                           closest_t)) {
+            continue;
+        }
+
+        int left_child, right_child, first_prim, prim_count;
+        get_node_structure(tlas_structure, node_idx, &left_child, &right_child, &first_prim, &prim_count);
+
+        // Leaf node - walk the BLAS of each instance
+        if (left_child == -1) {
+            for (int i = 0; i < prim_count; i++) {
+                int instance = tlas_indices[first_prim + i];
+                __global const float* to_object = instance_transforms + instance * 24 + 12;
+
+                float local_orig_x, local_orig_y, local_orig_z;
+                float local_dir_x, local_dir_y, local_dir_z;
+                transform_point(to_object, orig_x, orig_y, orig_z,
+                                &local_orig_x, &local_orig_y, &local_orig_z);
+                transform_direction(to_object, dir_x, dir_y, dir_z,
+                                    &local_dir_x, &local_dir_y, &local_dir_z);
+
+                if (traverse_blas(bvh_bounds, bvh_structure, bvh_indices, vertices, faces,
+                                  instance_info[instance * 2 + 0],
+                                  local_orig_x, local_orig_y, local_orig_z,
+                                  local_dir_x, local_dir_y, local_dir_z,
+                                  &closest_t, &closest_face)) {
+                    closest_instance = instance;
+                }
+            }
+        } else {
+            if (right_child != -1 && stack_ptr < 63) {
+                stack[stack_ptr++] = right_child;
+            }
+            if (left_child != -1 && stack_ptr < 63) {
+                stack[stack_ptr++] = left_child;
+            }
+        }
+    }
+
+    if (closest_instance != -1) {
         *t_out = closest_t;
         *face_out = closest_face;
+        *instance_out = closest_instance;
         return true;
     }
 
     return false;
 }
 
-// Shadow ray (any-hit)
-bool is_occluded(
+// Shadow ray (any-hit) against one BLAS, in object space
+bool is_occluded_blas(
     __global const float* bvh_bounds,
     __global const int* bvh_structure,
     __global const int* bvh_indices,
     __global const float* vertices,
     __global const int* faces,
+    int root,
     float orig_x, float orig_y, float orig_z,
     float dir_x, float dir_y, float dir_z,
     float max_dist
@@ -258,7 +378,7 @@ bool is_occluded(
 
     int stack[64];
     int stack_ptr = 0;
-    stack[stack_ptr++] = 0;
+    stack[stack_ptr++] = root;
 
     while (stack_ptr > 0) {
         int node_idx = stack[--stack_ptr];
@@ -315,8 +435,88 @@ bool is_occluded(
     return false;
 }
 
+// Shadow ray (any-hit) through the TLAS
+bool is_occluded(
+    __global const float* tlas_bounds,
+    __global const int* tlas_structure,
+    __global const int* tlas_indices,
+    __global const float* instance_transforms,
+    __global const int* instance_info,
+    __global const float* bvh_bounds,
+    __global const int* bvh_structure,
+    __global const int* bvh_indices,
+    __global const float* vertices,
+    __global const int* faces,
+    float orig_x, float orig_y, float orig_z,
+    float dir_x, float dir_y, float dir_z,
+    float max_dist
+) {
+    float inv_dir_x = 1.0f / dir_x;
+    float inv_dir_y = 1.0f / dir_y;
+    float inv_dir_z = 1.0f / dir_z;
+
+    int stack[64];
+    int stack_ptr = 0;
+    stack[stack_ptr++] = 0;
+
+    while (stack_ptr > 0) {
+        int node_idx = stack[--stack_ptr];
+
+        float min_x, min_y, min_z, max_x, max_y, max_z;
+        get_node_bounds(tlas_bounds, node_idx, &min_x, &min_y, &min_z, &max_x, &max_y, &max_z);
+
+        if (!intersect_aabb(orig_x, orig_y, orig_z,
+                           dir_x, dir_y, dir_z,
+                           inv_dir_x, inv_dir_y, inv_dir_z,
+                           min_x, min_y, min_z,
+                           max_x, max_y, max_z,
+                           max_dist)) {
+            continue;
+        }
+
+        int left_child, right_child, first_prim, prim_count;
+        get_node_structure(tlas_structure, node_idx, &left_child, &right_child, &first_prim, &prim_count);
+
+        if (left_child == -1) {
+            for (int i = 0; i < prim_count; i++) {
+                int instance = tlas_indices[first_prim + i];
+                __global const float* to_object = instance_transforms + instance * 24 + 12;
+
+                float local_orig_x, local_orig_y, local_orig_z;
+                float local_dir_x, local_dir_y, local_dir_z;
+                transform_point(to_object, orig_x, orig_y, orig_z,
+                                &local_orig_x, &local_orig_y, &local_orig_z);
+                transform_direction(to_object, dir_x, dir_y, dir_z,
+                                    &local_dir_x, &local_dir_y, &local_dir_z);
+
+                if (is_occluded_blas(bvh_bounds, bvh_structure, bvh_indices, vertices, faces,
+                                     instance_info[instance * 2 + 0],
+                                     local_orig_x, local_orig_y, local_orig_z,
+                                     local_dir_x, local_dir_y, local_dir_z,
+                                     max_dist)) {
+                    return true;
+                }
+            }
+        } else {
+            if (right_child != -1 && stack_ptr < 63) {
+                stack[stack_ptr++] = right_child;
+            }
+            if (left_child != -1 && stack_ptr < 63) {
+                stack[stack_ptr++] = left_child;
+            }
+        }
+    }
+
+    return false;
+}
+
 // Ambient occlusion
 float calculate_ao(
+    __global const float* tlas_bounds,
+    __global const int* tlas_structure,
+    __global const int* tlas_indices,
+    __global const float* instance_transforms,
+    __global const int* instance_info,
     __global const float* bvh_bounds,
     __global const int* bvh_structure,
     __global const int* bvh_indices,
@@ -369,7 +569,9 @@ float calculate_ao(
         float start_y = point_y + normal_y * 0.001f;
         float start_z = point_z + normal_z * 0.001f;
 
-        if (is_occluded(bvh_bounds, bvh_structure, bvh_indices, vertices, faces,
+        if (is_occluded(tlas_bounds, tlas_structure, tlas_indices,
+                       instance_transforms, instance_info,
+                       bvh_bounds, bvh_structure, bvh_indices, vertices, faces,
                        start_x, start_y, start_z,
                        dir_x, dir_y, dir_z,
                        radius)) {
@@ -383,11 +585,15 @@ float calculate_ao(
 __kernel void ray_trace_kernel(
     __global const float* vertices,
     __global const int* faces,
-    __global const int* object_ids,
+    __global const float* instance_transforms,
+    __global const int* instance_info,
     __global const Material* materials,
     int num_faces,
     __global const Light* lights,
     int num_lights,
+    __global const float* tlas_bounds,
+    __global const int* tlas_structure,
+    __global const int* tlas_indices,
     __global const float* bvh_bounds,
     __global const int* bvh_structure,
     __global const int* bvh_indices,
@@ -441,10 +647,13 @@ __kernel void ray_trace_kernel(
     // Traverse BVH
     float min_dist;
     int hit_face;
-    bool hit = traverse_bvh(bvh_bounds, bvh_structure, bvh_indices, vertices, faces,
+    int hit_instance;
+    bool hit = traverse_bvh(tlas_bounds, tlas_structure, tlas_indices,
+                           instance_transforms, instance_info,
+                           bvh_bounds, bvh_structure, bvh_indices, vertices, faces,
                            cam_x, cam_y, cam_z,
                            ray_dir_x, ray_dir_y, ray_dir_z,
-                           &min_dist, &hit_face);
+                           &min_dist, &hit_face, &hit_instance);
 
     int pixel_idx = ((y - start_y) * width + x) * 3;
 
@@ -472,25 +681,27 @@ __kernel void ray_trace_kernel(
     }
 
     // Hit something
-    int object_id = object_ids[hit_face];
-    Material mat = materials[object_id];
+    Material mat = materials[instance_info[hit_instance * 2 + 1]];
+
+    // Calculate hit point and normal, from the triangle moved into world
+    // space so the normal follows the instance's rotation and scale
+    __global const float* to_world = instance_transforms + hit_instance * 24;
 
-    // Calculate hit point and normal
     int idx0 = faces[hit_face * 3 + 0] * 3;
     int idx1 = faces[hit_face * 3 + 1] * 3;
     int idx2 = faces[hit_face * 3 + 2] * 3;
 
-    float v0_x = vertices[idx0 + 0];
-    float v0_y = vertices[idx0 + 1];
-    float v0_z = vertices[idx0 + 2];
+    float v0_x, v0_y, v0_z;
+    transform_point(to_world, vertices[idx0 + 0], vertices[idx0 + 1], vertices[idx0 + 2],
+                    &v0_x, &v0_y, &v0_z);
 
-    float v1_x = vertices[idx1 + 0];
-    float v1_y = vertices[idx1 + 1];
-    float v1_z = vertices[idx1 + 2];
+    float v1_x, v1_y, v1_z;
+    transform_point(to_world, vertices[idx1 + 0], vertices[idx1 + 1], vertices[idx1 + 2],
+                    &v1_x, &v1_y, &v1_z);
 
-    float v2_x = vertices[idx2 + 0];
-    float v2_y = vertices[idx2 + 1];
-    float v2_z = vertices[idx2 + 2];
+    float v2_x, v2_y, v2_z;
+    transform_point(to_world, vertices[idx2 + 0], vertices[idx2 + 1], vertices[idx2 + 2],
+                    &v2_x, &v2_y, &v2_z);
 
     float edge1_x = v1_x - v0_x;
     float edge1_y = v1_y - v0_y;
@@ -516,7 +727,9 @@ __kernel void ray_trace_kernel(
     // Ambient occlusion
     float ao = 1.0f;
     if (enable_ambient_occlusion) {
-        ao = calculate_ao(bvh_bounds, bvh_structure, bvh_indices, vertices, faces,
+        ao = calculate_ao(tlas_bounds, tlas_structure, tlas_indices,
+                         instance_transforms, instance_info,
+                         bvh_bounds, bvh_structure, bvh_indices, vertices, faces,
                          hit_x, hit_y, hit_z,
                          normal_x, normal_y, normal_z,
                          ao_radius,
@@ -547,7 +760,9 @@ __kernel void ray_trace_kernel(
             float shadow_orig_y = hit_y + normal_y * 0.001f;
             float shadow_orig_z = hit_z + normal_z * 0.001f;
 
-            in_shadow = is_occluded(bvh_bounds, bvh_structure, bvh_indices, vertices, faces,
+            in_shadow = is_occluded(tlas_bounds, tlas_structure, tlas_indices,
+                                   instance_transforms, instance_info,
+                                   bvh_bounds, bvh_structure, bvh_indices, vertices, faces,
                                    shadow_orig_x, shadow_orig_y, shadow_orig_z,
                                    light_dir_x, light_dir_y, light_dir_z,
                                    light_dist);
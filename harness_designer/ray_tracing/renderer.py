@@ -4,6 +4,7 @@
 """
 
 import os
+import time
 
 import pyopencl as cl
 import numpy as np
@@ -12,6 +13,7 @@ import threading
 
 from .. import config as _config
 from .. import gpu_mem as _gpu_mem
+from .. import logger as _logger
 from .. import check_types as _check_types
 
 
@@ -21,9 +23,40 @@ warnings.filterwarnings('ignore', category=cl.CompilerWarning)
 Config = _config.Config.ray_trace
 
 
+class _Device:
+    """
+    The OpenCL device, context, queue and compiled program, set up by the
+    first :class:`Renderer` and used by every one after it - each render
+    used to pick a device, create a context and compile the kernel again.
+
+    Also holds the device copy of the BLAS pool last uploaded (see
+    :class:`accel.SceneArrays`), which a render reuses while its
+    ``pool_version`` is the same, i.e. while the same meshes are in view.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.device = None
+        self.ctx = None
+        self.queue = None
+        self.program = None
+        self.pool_version = None
+        self.pool_buffers = None
+
+
+_DEVICE = _Device()
+
+
 class Renderer:
 
     """Compile the OpenCL kernel and execute chunked ray-tracing work for a prepared :class:`Scene`.
+
+    ``stats`` holds the time spent on each stage of the render, in ms:
+    ``init_ms`` and ``compile_ms`` (0 once the device is set up), the
+    scene's build stages (see :class:`accel.SceneAccel`) with ``build_ms``
+    the whole build, ``upload_ms`` (``pool_upload`` says whether the BLAS
+    pool was ``'uploaded'`` or ``'reused'``), and ``render_ms`` over all
+    ``chunks`` split into ``kernel_ms`` and ``readback_ms``.
     """
     @_check_types.do
     def __init__(self, scene, callback):
@@ -36,6 +69,10 @@ class Renderer:
         """
         self.scene = scene
         self.callback = callback
+        self.stats = dict(init_ms=0.0, compile_ms=0.0, build_ms=0.0, upload_ms=0.0,
+                          pool_upload='uploaded', render_ms=0.0, kernel_ms=0.0,
+                          readback_ms=0.0, chunks=0)
+
         self.ctx, self.queue, self.chunk_size = self.init_cl()
         self.program, self.kernel = self.compile_kernel()
 
@@ -44,9 +81,41 @@ class Renderer:
         # Initialize OpenCL
         """Initialize the OpenCL platform, command queue, and chunk sizing used by the renderer.
 
+        The device, context and queue are only set up once, see :class:`_Device`.
+
         :returns: A tuple containing the OpenCL context, command queue, and chunk size.
         :rtype: tuple
         """
+        with _DEVICE.lock:
+            if _DEVICE.ctx is None:
+                start = time.perf_counter()
+
+                device = self._find_device()
+                _DEVICE.device = device
+                _DEVICE.ctx = cl.Context([device])
+                _DEVICE.queue = cl.CommandQueue(_DEVICE.ctx)
+
+                self.stats['init_ms'] = (time.perf_counter() - start) * 1000.0
+
+            device = _DEVICE.device
+            ctx = _DEVICE.ctx
+            queue = _DEVICE.queue
+
+        # free memory changes from one render to the next
+        mem_manager = _gpu_mem.GPUMemoryManager(device)
+        mem_manager.detect()
+        chunk_size = mem_manager.get_chunk_size(self.scene.width, self.scene.height)
+
+        return ctx, queue, chunk_size
+
+    @staticmethod
+    @_check_types.do
+    def _find_device():
+        """Pick the first GPU device, or the first CPU device when there is none.
+
+        :returns: The OpenCL device to render on.
+        :rtype: pyopencl.Device
+        """
         platforms = cl.get_platforms()
         if not platforms:
             raise RuntimeError("No OpenCL platforms found")
@@ -71,31 +140,78 @@ class Renderer:
             else:
                 raise RuntimeError("No OpenCL devices found")
 
-        ctx = cl.Context([device])
-        queue = cl.CommandQueue(ctx)
-
-        mem_manager = _gpu_mem.GPUMemoryManager(device)
-        mem_manager.detect()
-        chunk_size = mem_manager.get_chunk_size(self.scene.width, self.scene.height)
-
-        return ctx, queue, chunk_size
+        return device
 
     @_check_types.do
     def compile_kernel(self):
         """Load and compile the OpenCL kernel used for ray tracing.
 
+        The program is only compiled once, see :class:`_Device`; the kernel
+        object is the renderer's own, its arguments are set per render.
+
         :returns: A tuple containing the compiled program and kernel objects.
         :rtype: tuple
         """
-        kernel_path = os.path.join(os.path.dirname(__file__), 'bvh_kernel.cl')
+        with _DEVICE.lock:
+            if _DEVICE.program is None:
+                start = time.perf_counter()
+
+                kernel_path = os.path.join(os.path.dirname(__file__), 'kernel.cl')
+
+                with open(kernel_path, 'r') as f:
+                    kernel_source = f.read()
 
-        with open(kernel_path, 'r') as f:
-            kernel_source = f.read()
+                _DEVICE.program = cl.Program(self.ctx, kernel_source).build()
+
+                self.stats['compile_ms'] = (time.perf_counter() - start) * 1000.0
+
+            program = _DEVICE.program
 
-        program = cl.Program(self.ctx, kernel_source).build()
         kernel = cl.Kernel(program, 'ray_trace_kernel')
         return program, kernel
 
+    @_check_types.do
+    def _pool_buffers(self, arrays) -> tuple:
+        """Return the device buffers of the scene's BLAS pool, uploading it if the device doesn't have it.
+
+        :param arrays: Arrays built by :meth:`Scene.build`.
+        :type arrays: accel.SceneArrays
+        :returns: The vertex, face, and BVH bounds/structure/indices buffers.
+        :rtype: tuple
+        """
+        with _DEVICE.lock:
+            if _DEVICE.pool_version == arrays.pool_version:
+                self.stats['pool_upload'] = 'reused'
+                return _DEVICE.pool_buffers
+
+            mf = cl.mem_flags
+            _DEVICE.pool_buffers = tuple(
+                cl.Buffer(self.ctx, mf.READ_ONLY | mf.COPY_HOST_PTR, hostbuf=array)
+                for array in (arrays.vertices, arrays.faces, arrays.bvh_bounds,
+                              arrays.bvh_structure, arrays.bvh_indices)
+            )
+            _DEVICE.pool_version = arrays.pool_version
+
+            self.stats['pool_upload'] = 'uploaded'
+            return _DEVICE.pool_buffers
+
+    @property
+    @_check_types.do
+    def timing_text(self) -> str:
+        """One line summary of ``stats``: where the time of the render went.
+
+        :rtype: str
+        """
+        stats = self.stats
+        return (
+            f"build {stats['build_ms']:.1f} ms "
+            f"(BLAS {stats.get('blas_built', 0)} built {stats.get('blas_ms', 0.0):.1f} ms, "
+            f"TLAS {stats.get('tlas', '-')} {stats.get('tlas_ms', 0.0):.1f} ms), "
+            f"upload {stats['upload_ms']:.1f} ms (BLAS pool {stats['pool_upload']}), "
+            f"render {stats['render_ms']:.1f} ms "
+            f"(kernel {stats['kernel_ms']:.1f} ms, readback {stats['readback_ms']:.1f} ms)"
+        )
+
     @_check_types.do
     def start(self):
         """Start the handler operation for the supplied mouse position.
@@ -110,23 +226,38 @@ class Renderer:
 
         :returns: The result of the operation. UNKNOWN exact semantics when not inferable from the current source.
         """
+        stats = self.stats
+
+        start = time.perf_counter()
+        arrays = self.scene.build()
+        stats.update(self.scene.stats)
+        stats['build_ms'] = (time.perf_counter() - start) * 1000.0
+
+        start = time.perf_counter()
+
+        # Upload geometry to GPU; the BLAS pool only when it changed
         (
-            vertices, faces, bvh_bounds, bvh_structure,
-            bvh_indices, object_ids, materials, lights
-        ) = self.scene.build()
+            vertices_buf, faces_buf, bvh_bounds_buf,
+            bvh_structure_buf, bvh_indices_buf
+        ) = self._pool_buffers(arrays)
+
+        lights = arrays.lights
+        num_lights = len(lights)
+        if not num_lights:
+            # the buffer can't be empty
+            lights = np.zeros((1, 7), dtype=np.float32)
 
-        # Upload geometry to GPU
         mf = cl.mem_flags
-        vertices_buf = cl.Buffer(self.ctx, mf.READ_ONLY | mf.COPY_HOST_PTR, hostbuf=vertices)
-        faces_buf = cl.Buffer(self.ctx, mf.READ_ONLY | mf.COPY_HOST_PTR, hostbuf=faces)
-        object_ids_buf = cl.Buffer(self.ctx, mf.READ_ONLY | mf.COPY_HOST_PTR, hostbuf=object_ids)
-        materials_buf = cl.Buffer(self.ctx, mf.READ_ONLY | mf.COPY_HOST_PTR, hostbuf=materials)
+        instance_transforms_buf = cl.Buffer(
+            self.ctx, mf.READ_ONLY | mf.COPY_HOST_PTR, hostbuf=arrays.instance_transforms)
+        instance_info_buf = cl.Buffer(self.ctx, mf.READ_ONLY | mf.COPY_HOST_PTR, hostbuf=arrays.instance_info)
+        materials_buf = cl.Buffer(self.ctx, mf.READ_ONLY | mf.COPY_HOST_PTR, hostbuf=arrays.materials)
         lights_buf = cl.Buffer(self.ctx, mf.READ_ONLY | mf.COPY_HOST_PTR, hostbuf=lights)
 
-        # Upload BVH (separate buffers for bounds and structure)
-        bvh_bounds_buf = cl.Buffer(self.ctx, mf.READ_ONLY | mf.COPY_HOST_PTR, hostbuf=bvh_bounds)
-        bvh_structure_buf = cl.Buffer(self.ctx, mf.READ_ONLY | mf.COPY_HOST_PTR, hostbuf=bvh_structure)
-        bvh_indices_buf = cl.Buffer(self.ctx, mf.READ_ONLY | mf.COPY_HOST_PTR, hostbuf=bvh_indices)
+        # Upload TLAS (same node layout as the BVH of each mesh)
+        tlas_bounds_buf = cl.Buffer(self.ctx, mf.READ_ONLY | mf.COPY_HOST_PTR, hostbuf=arrays.tlas_bounds)
+        tlas_structure_buf = cl.Buffer(self.ctx, mf.READ_ONLY | mf.COPY_HOST_PTR, hostbuf=arrays.tlas_structure)
+        tlas_indices_buf = cl.Buffer(self.ctx, mf.READ_ONLY | mf.COPY_HOST_PTR, hostbuf=arrays.tlas_indices)
 
         if self.scene.environment_map:
             env_array = np.array(self.scene.environment_map, dtype=np.uint8)
@@ -138,6 +269,8 @@ class Renderer:
             env_width = 1
             env_height = 1
 
+        stats['upload_ms'] = (time.perf_counter() - start) * 1000.0
+
         forward = self.scene.camera_target - self.scene.camera_origin
         forward = forward / np.linalg.norm(forward)
         right = np.cross(forward, self.scene.camera_up)
@@ -151,6 +284,8 @@ class Renderer:
         # full_image = np.zeros((self.scene.height, self.scene.width, 3), dtype=np.float32)
         num_chunks = (self.scene.height + self.chunk_size - 1) // self.chunk_size
 
+        render_start = time.perf_counter()
+
         for chunk_idx in range(num_chunks):
             start_y = chunk_idx * self.chunk_size
             end_y = min(start_y + self.chunk_size, self.scene.height)
@@ -164,11 +299,15 @@ class Renderer:
             self.kernel.set_args(
                 vertices_buf,
                 faces_buf,
-                object_ids_buf,
+                instance_transforms_buf,
+                instance_info_buf,
                 materials_buf,
-                np.int32(len(faces)),
+                np.int32(len(arrays.faces)),
                 lights_buf,
-                np.int32(len(lights)),
+                np.int32(num_lights),
+                tlas_bounds_buf,
+                tlas_structure_buf,
+                tlas_indices_buf,
                 bvh_bounds_buf,
                 bvh_structure_buf,
                 bvh_indices_buf,
@@ -216,20 +355,31 @@ class Renderer:
             )
 
             # Execute kernel
+            kernel_start = time.perf_counter()
             cl.enqueue_nd_range_kernel(
                 self.queue,
                 self.kernel,
                 (self.scene.width, chunk_height),
                 None
-            )
+            ).wait()
 
             # Copy result back to CPU
+            readback_start = time.perf_counter()
             cl.enqueue_copy(self.queue, chunk_image, chunk_buf).wait()
             # full_image[start_y:end_y] = chunk_image
+            done = time.perf_counter()
+
+            stats['kernel_ms'] += (readback_start - kernel_start) * 1000.0
+            stats['readback_ms'] += (done - readback_start) * 1000.0
+            stats['render_ms'] = (done - render_start) * 1000.0
+            stats['chunks'] = chunk_idx + 1
+
+            if chunk_idx == num_chunks - 1:
+                _logger.info(f"RENDERER: {self.timing_text}")
 
             # Call progress callback
             progress = ((chunk_idx + 1) / num_chunks) * 100
-            if not self.callback(start_y, end_y, (chunk_image * 255).astype(np.uint8), progress):
+            if not self.callback(start_y, (chunk_image * 255).astype(np.uint8), progress):
                 break
 
         # return (full_image * 255).astype(np.uint8)
@@ -5,12 +5,11 @@
 
 from typing import TYPE_CHECKING
 
-import os
 from PIL import Image
 import numpy as np
 
 from .. import config as _config
-from . import bvh_processor as _bvh_processor
+from . import accel as _accel
 from . import light as _light
 from .. import check_types as _check_types
 
@@ -21,6 +20,10 @@ if TYPE_CHECKING:
 
 Config = _config.Config.ray_trace
 
+# BLAS cache, BLAS pool and TLAS shared by every scene, so a render only
+# builds what changed since the last one (see accel)
+_ACCEL = _accel.SceneAccel()
+
 
 class Scene:
 
@@ -38,6 +41,7 @@ class Scene:
         :type camera: "_camera.Camera"
         """
         self.objects = []
+        self.instances = []
         self.environment_map = None
         self.width = width
         self.height = height
@@ -46,14 +50,34 @@ class Scene:
         self.camera_up = camera.up
         self.fov = camera.field_of_view
 
+        # timings of the last build, see build
+        self.stats = {}
+
     @_check_types.do
     def add_object(self, obj):
         """Add an object to the scene so it can be included in later rendering work.
 
-        :param obj: Object to inspect or add to the current operation.
+        The object's transform and material are read here, on the thread
+        adding it, so the build can run on another one. Objects without a
+        mesh are left out.
+
+        :param obj: 3D view of the object (``obj.obj3d``) to add.
         :type obj: object
         """
+        vbo = obj.vbo
+        if vbo is None or not vbo.triangle_count:
+            return
+
+        # rendered as it looks unselected, not in the selection tint
+        material = obj.material
+        if material is obj.selected_material:
+            material = obj.unselected_material
+
         self.objects.append(obj)
+        self.instances.append(_accel.Instance(
+            id(obj), vbo, obj.position.as_numpy,
+            np.eye(3, dtype=np.float32) @ obj.angle,
+            obj.scale.as_numpy, material.cl_array))
 
     @_check_types.do
     def load_environment_map(self, image_path):
@@ -86,100 +110,21 @@ class Scene:
         self.environment_map = img
 
     @_check_types.do
-    def build(self):
-        """Build flattened geometry, BVH, material, and lighting arrays for GPU rendering.
+    def build(self) -> _accel.SceneArrays:
+        """Build the geometry, two-level BVH, material, and lighting arrays for GPU rendering.
+
+        Only what changed since the last build is built again: the BVH of
+        a mesh is built once and kept (BLAS), and the tree over the objects
+        (TLAS) is refit when only their transforms changed. ``stats`` gets
+        the time spent on each stage, see :class:`accel.SceneAccel`.
 
-        :returns: The vertex, face, BVH, object-id, material, and light arrays required by the renderer.
-        :rtype: tuple
+        :returns: The arrays the kernel reads.
+        :rtype: accel.SceneArrays
         """
-        thread_count = os.cpu_count() - 1
-
-        processor = _bvh_processor.ThreadedBVHProcessor(num_threads=thread_count)
-        processor.start()
-
-        object_data_list = []
-        materials = []
-
-        for obj_id, obj in enumerate(self.objects):
-            obj_data = _bvh_processor.ObjectData(
-                object_id=obj_id,
-                vertices=obj.vertices.astype(np.float32),
-                faces=obj.faces.astype(np.int32),
-                normals=obj.normals.astype(np.float32),
-                position=obj.position.as_numpy,
-                rotation=obj.angle.as_quat_numpy,
-                material_id=obj_id
-            )
-
-            object_data_list.append(obj_data)
-            materials.append(obj.material.cl_array)
-
-        processed_objects = processor.process_objects(object_data_list)
-
-        all_vertices = []
-        all_faces = []
-        all_bvh_bounds = []
-        all_bvh_structure = []
-        all_bvh_indices = []
-        object_ids = []
-
-        vertex_offset = 0
-        bvh_node_offset = 0
-        bvh_index_offset = 0
-
-        for processed in processed_objects:
-            # Vertices
-            all_vertices.append(processed.vertices)
-
-            # Faces (adjust indices)
-            adjusted_faces = processed.faces + vertex_offset
-            all_faces.append(adjusted_faces)
-
-            # BVH (adjust indices and offsets)
-            all_bvh_bounds.append(processed.bvh_bounds)
-
-            # Adjust BVH structure node indices
-            structure = processed.bvh_structure.copy()
-            num_nodes = len(structure) // 4
-            for i in range(num_nodes):
-                left = structure[i * 4 + 0]
-                right = structure[i * 4 + 1]
-                first_prim = structure[i * 4 + 2]
-
-                # Adjust child indices (if not -1)
-                if left != -1:
-                    structure[i * 4 + 0] = left + bvh_node_offset
-                if right != -1:
-                    structure[i * 4 + 1] = right + bvh_node_offset
-
-                # Adjust primitive index
-                if first_prim != -1:
-                    structure[i * 4 + 2] = first_prim + bvh_index_offset
-
-            all_bvh_structure.append(structure)
-
-            # Adjust BVH indices
-            adjusted_indices = processed.bvh_indices + vertex_offset
-            all_bvh_indices.append(adjusted_indices)
-
-            # Object IDs
-            object_ids.extend([processed.material_id] * len(processed.faces))
-
-            # Update offsets
-            vertex_offset += len(processed.vertices)
-            bvh_node_offset += num_nodes
-            bvh_index_offset += len(processed.bvh_indices)
-
-        # Concatenate all arrays
-        vertices = np.vstack(all_vertices)
-        faces = np.vstack(all_faces)
-        bvh_bounds = np.concatenate(all_bvh_bounds)
-        bvh_structure = np.concatenate(all_bvh_structure)
-        bvh_indices = np.concatenate(all_bvh_indices)
-        object_ids = np.array(object_ids, dtype=np.int32)
-        materials = np.array(materials, dtype=np.float32)
-
-        lights = np.array(
+        arrays = _ACCEL.build(self.instances)
+        self.stats = arrays.stats
+
+        arrays.lights = np.array(
             [_light.Light(**light).to_array() for light in Config.lighting.lights], dtype=np.float32)
 
-        return vertices, faces, bvh_bounds, bvh_structure, bvh_indices, object_ids, materials, lights
+        return arrays
@@ -21,7 +21,7 @@ _vbo: _vbo_handler.PooledVBOHandler = None
 # changes -- a mismatch means the cache on disk was written by
 # different logic than what's running now, so it's discarded and
 # rebuilt rather than trusted.
-_MESH_CACHE_VERSION = 1
+_MESH_CACHE_VERSION = 2
 
 
 @_check_types.do
@@ -44,10 +44,10 @@ def create_vbo() -> _vbo_handler.PooledVBOHandler:
 
     cached = _mesh_cache.load('arrow', _MESH_CACHE_VERSION)
     if cached is not None:
-        packed, count, aabb, obb, _extra = cached
+        packed, count, aabb, obb, _extra, indices = cached
         _vbo = _vbo_handler.PooledVBOHandler(
             'move_arrow', packed, count, aabb=aabb, obb=obb,
-            arena_kind=_vbo_handler.VBO_TYPE_PRIMITIVE)
+            arena_kind=_vbo_handler.VBO_TYPE_PRIMITIVE, indices=indices)
         return _vbo
 
     edge = build123d.Edge.extrude(build123d.Vertex(2.0, 0.0, 0.0), (6.0, 0.0, 0.0))
@@ -80,7 +80,7 @@ def create_vbo() -> _vbo_handler.PooledVBOHandler:
     arrow = arrow.move(build123d.Location((2.5, 0.0, 0.0)))
 
     vertices, faces = _utils.convert_model_to_mesh(arrow)
-    packed, count = _utils.compute_normals(vertices, faces)
+    packed, count, indices = _utils.compute_indexed_normals(vertices, faces)
 
     unpacked_verts = packed[:count * 3].reshape(-1, 3)
     aabb1, aabb2 = _utils.compute_aabb(unpacked_verts)
@@ -89,8 +89,9 @@ def create_vbo() -> _vbo_handler.PooledVBOHandler:
 
     _vbo = _vbo_handler.PooledVBOHandler(
         'move_arrow', packed, count, aabb=aabb, obb=obb,
-        arena_kind=_vbo_handler.VBO_TYPE_PRIMITIVE)
+        arena_kind=_vbo_handler.VBO_TYPE_PRIMITIVE, indices=indices)
 
-    _mesh_cache.save('arrow', _MESH_CACHE_VERSION, packed, count, aabb, obb)
+    _mesh_cache.save('arrow', _MESH_CACHE_VERSION, packed, count, aabb, obb,
+                     indices=indices)
 
     return _vbo
@@ -25,7 +25,7 @@ _stripe_vbo: _vbo_handler.PooledVBOHandler = None
 # changes -- a mismatch means the cache on disk was written by
 # different logic than what's running now, so it's discarded and
 # rebuilt rather than trusted.
-_MESH_CACHE_VERSION = 1
+_MESH_CACHE_VERSION = 2
 
 # Visual tuning for the decorative twist stripe -- pitch kept in sync with
 # shapes.helix.PITCH_MM so straight wire segments and this part's stripe
@@ -181,12 +181,13 @@ def create_vbo():
 
     cached = _mesh_cache.load('cylinder_helix', _MESH_CACHE_VERSION)
     if cached is not None:
-        packed, count, aabb, obb, extra = cached
+        packed, count, aabb, obb, extra, indices = cached
         cn = _point.Point(*[float(v) for v in extra])
 
         _vbo = _vbo_handler.PooledVBOHandler(
             'cylinder_helix', packed, count, aabb=aabb, obb=obb,
-            arena_kind=_vbo_handler.VBO_TYPE_PRIMITIVE, endpoint=cn)
+            arena_kind=_vbo_handler.VBO_TYPE_PRIMITIVE, endpoint=cn,
+            indices=indices)
 
         return _vbo
 
@@ -262,7 +263,7 @@ def create_vbo():
 
     vertices, faces = _utils.convert_model_to_mesh(cyl)
 
-    packed, count = _utils.compute_normals(vertices, faces)
+    packed, count, indices = _utils.compute_indexed_normals(vertices, faces)
 
     unpacked_verts = packed[:count * 3].reshape(-1, 3)
     aabb1, aabb2 = _utils.compute_aabb(unpacked_verts)
@@ -271,10 +272,11 @@ def create_vbo():
 
     _vbo = _vbo_handler.PooledVBOHandler(
         'cylinder_helix', packed, count, aabb=aabb, obb=obb,
-        arena_kind=_vbo_handler.VBO_TYPE_PRIMITIVE, endpoint=cn)
+        arena_kind=_vbo_handler.VBO_TYPE_PRIMITIVE, endpoint=cn,
+        indices=indices)
 
     _mesh_cache.save('cylinder_helix', _MESH_CACHE_VERSION, packed, count,
-                     aabb, obb, extra=[cn.x, cn.y, cn.z])
+                     aabb, obb, extra=[cn.x, cn.y, cn.z], indices=indices)
 
     return _vbo
 
@@ -299,11 +301,11 @@ def create_stripe_vbo():
 
     cached = _mesh_cache.load('cylinder_helix_stripe', _MESH_CACHE_VERSION)
     if cached is not None:
-        packed, count, aabb, obb, _extra = cached
+        packed, count, aabb, obb, _extra, indices = cached
 
         _stripe_vbo = _vbo_handler.PooledVBOHandler(
             'stripe_cylinder_helix', packed, count, aabb=aabb, obb=obb,
-            arena_kind=_vbo_handler.VBO_TYPE_PRIMITIVE)
+            arena_kind=_vbo_handler.VBO_TYPE_PRIMITIVE, indices=indices)
 
         return _stripe_vbo
 
@@ -339,7 +341,7 @@ def create_stripe_vbo():
 
     vertices, faces = _utils.convert_model_to_mesh(stripe)
 
-    packed, count = _utils.compute_normals(vertices, faces)
+    packed, count, indices = _utils.compute_indexed_normals(vertices, faces)
 
     unpacked_verts = packed[:count * 3].reshape(-1, 3)
     aabb1, aabb2 = _utils.compute_aabb(unpacked_verts)
@@ -348,10 +350,10 @@ def create_stripe_vbo():
 
     _stripe_vbo = _vbo_handler.PooledVBOHandler(
         'stripe_cylinder_helix', packed, count, aabb=aabb, obb=obb,
-        arena_kind=_vbo_handler.VBO_TYPE_PRIMITIVE)
+        arena_kind=_vbo_handler.VBO_TYPE_PRIMITIVE, indices=indices)
 
     _mesh_cache.save('cylinder_helix_stripe', _MESH_CACHE_VERSION,
-                     packed, count, aabb, obb)
+                     packed, count, aabb, obb, indices=indices)
 
     return _stripe_vbo
 
@@ -9,7 +9,7 @@ fixed result to cache). Measured cost building these from scratch:
 ~35ms (arrow) to ~1.8s (cylinder_helix's stripe) -- real time paid on
 every single app launch, even though the result is identical every time
 (fixed geometry/tessellation parameters). This caches a mesh's already-
-tessellated (packed, count, aabb, obb) VBO-ready data to a single small
+tessellated (packed, count, aabb, obb[, indices]) VBO-ready data to a single small
 ``.npz`` file per cache name -- written once, after a cache miss; every
 later launch loads it back and skips the OCCT work entirely (VBO
 upload itself still happens fresh every launch -- that needs a live GL
@@ -37,7 +37,7 @@ def path(name: str) -> str:
 
 
 def load(name: str, version: int):
-    """Return ``(packed, count, aabb, obb, extra)`` cached on disk for
+    """Return ``(packed, count, aabb, obb, extra, indices)`` cached on disk for
     *name*, or ``None`` if there's no cache file yet, it's unreadable,
     or it was written by a different *version*.
 
@@ -46,6 +46,10 @@ def load(name: str, version: int):
     shapes/cylinder_helix.py uses it to remember ``create_vbo()``'s own
     extra connection-point coordinate, which isn't part of the mesh
     itself.
+
+    *indices* is the mesh's ``uint32`` element array when it was saved in
+    the indexed format (see utils.compute_indexed_normals), ``None`` for a
+    triangle-soup mesh.
     """
     cache_path = path(name)
     if not os.path.exists(cache_path):
@@ -57,17 +61,19 @@ def load(name: str, version: int):
                 return None
 
             extra = data['extra'] if 'extra' in data.files else None
+            indices = data['indices'] if 'indices' in data.files else None
 
             return (data['packed'], int(data['count'][0]),
-                    data['aabb'], data['obb'], extra)
+                    data['aabb'], data['obb'], extra, indices)
     except Exception:  # NOQA -- any read/format problem just means rebuild
         return None
 
 
 def save(name: str, version: int, packed: np.ndarray, count: int,
-         aabb: np.ndarray, obb: np.ndarray, extra=None) -> None:
+         aabb: np.ndarray, obb: np.ndarray, extra=None,
+         indices: np.ndarray | None = None) -> None:
     """Write *packed*/*count*/*aabb*/*obb* (plus optional small *extra*
-    float array) to disk for cache *name*, so the next app launch can
+    float array and the element array *indices* of an indexed mesh) to disk for cache *name*, so the next app launch can
     :func:`load` it back instead of rebuilding. Written to a temp file
     and moved into place with ``os.replace`` so a run interrupted
     mid-save never leaves a corrupt/partial cache file behind for the
@@ -84,6 +90,9 @@ def save(name: str, version: int, packed: np.ndarray, count: int,
     if extra is not None:
         arrays['extra'] = np.asarray(extra, dtype=np.float64)
 
+    if indices is not None:
+        arrays['indices'] = np.asarray(indices, dtype=np.uint32)
+
     cache_path = path(name)
     tmp_path = cache_path + '.tmp'
 
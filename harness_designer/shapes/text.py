@@ -1,7 +1,7 @@
 # © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
 
-"""A string of cached character glyphs (see shapes/glyph.py), rendered
-as one draw call per glyph.
+"""A string of cached character glyphs (see shapes/glyph.py), merged
+into one mesh per distinct string and rendered as one draw call.
 
 A ``Text`` owns no position/angle/scale of its own -- unlike a real
 mesh VBO's *data*, a glyph layout never moves on its own account, only
@@ -16,7 +16,9 @@ nothing to keep in sync between moves the way an explicit
 from typing import Callable
 
 import os
+import threading
 import time
+import weakref
 
 import build123d
 import numpy as np
@@ -496,6 +498,212 @@ def build_chars(mainframe, on_progress: Callable[[int, int], None] | None = None
         f'({tessellate_time:.3f}s in build123d/OCCT tessellation) -- {status}')
 
 
+def ensure_chars(chars: str, style: build123d.FontStyle = build123d.FontStyle.REGULAR) -> None:
+    """Build whatever of *chars* at *style* isn't built yet, under the
+    GL context that is current right now -- the part of
+    :func:`build_chars` a tool running without the main window needs
+    (see benchmarks/text_batching.py). Uses the disk glyph cache
+    where it has an entry, tessellates otherwise; never writes it.
+    """
+    global CHARACTER_HEIGHT
+
+    if style.value not in _FONT_METRICS:
+        _font_metrics(style.value)
+
+    cache = None
+
+    for char in ' ' + chars:
+        entry = _CHARS.setdefault(char, [None, None, None, None, None])
+        if entry[style.value] is not None:
+            continue
+
+        tessellated = None
+        if char not in (' ', '\n'):
+            if cache is None:
+                cache = _load_glyph_cache() or {}
+
+            tessellated = cache.get((char, style.value))
+            if tessellated is None:
+                tessellated = _tessellate_char(char, 1.0, style)
+
+        entry[style.value] = built = _build_char(char, 1.0, style, tessellated=tessellated)
+        CHARACTER_HEIGHT = max(CHARACTER_HEIGHT, built[1].y)
+
+
+# (char, style value) -> (positions, smooth_normals, indices) -- the
+# glyph's own triangle-soup VBO data welded into an indexed mesh, see
+# _glyph_mesh.
+_GLYPH_MESHES: dict[tuple[str, int], tuple] = {}
+
+
+def _glyph_mesh(char: str, style: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return *char*'s glyph at *style* as ``(positions, smooth_normals,
+    indices)``, positions/normals as ``(n, 3)`` float32 rows.
+
+    A glyph VBO is a triangle soup (every corner of every triangle
+    stored, see _tessellate_char); corners with bit-identical position
+    and smooth normal are welded here so a merged label (see
+    :class:`_LabelMesh`) stores each of them once. Face normals are
+    dropped -- the indexed draw path derives them in the geometry
+    shaders, same as an indexed model mesh (see gl/vbo.py).
+    """
+    key = (char, style)
+
+    mesh = _GLYPH_MESHES.get(key, None)
+    if mesh is None:
+        vbo = _CHARS[char][style][0]
+        count = vbo.stored_vertex_count
+        data = np.asarray(vbo.data, dtype=np.float32)
+
+        corners = np.concatenate((data[:count * 3].reshape(-1, 3),
+                                  data[count * 3:count * 6].reshape(-1, 3)), axis=1)
+
+        _, first_use, inverse = np.unique(
+            corners, axis=0, return_index=True, return_inverse=True)
+
+        # np.unique sorts lexicographically; renumber by first use so
+        # neighbouring triangles keep referencing neighbouring vertices
+        order = np.argsort(first_use, kind='stable')
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+
+        unique = corners[first_use[order]]
+        mesh = (np.ascontiguousarray(unique[:, :3]),
+                np.ascontiguousarray(unique[:, 3:]),
+                rank[inverse.ravel()].astype(np.uint32))
+
+        _GLYPH_MESHES[key] = mesh
+
+    return mesh
+
+
+class _LabelMesh:
+    """One string's glyphs merged into a single indexed mesh, in the
+    string's own local frame at font size 1.0 -- every glyph already
+    sitting at its own laid-out offset, so a whole label is one draw
+    call (the font size is applied through the scale uniform instead,
+    see :meth:`Text.placement`).
+
+    Shared by every :class:`Text` with the same string, style,
+    alignment and anchor (a terminal's name rebuilt at a new size on
+    every housing move reuses the mesh it already had, and a hundred
+    cavities named "1" share one), and looked up through
+    :data:`_LABEL_MESHES`. Both the merged arrays and the GPU buffer are
+    built on first use -- plenty of Texts are only ever constructed to
+    measure a width (see objects_schematic/housing.py) and never drawn.
+    """
+
+    def __init__(self, chars: list[str], style: int, offsets: list[_point.Point]):
+        self._chars = chars
+        self._style = style
+        self._offsets = offsets
+
+        self.users = 0
+
+        self._arrays = None
+        self.vbo: _vbo_handler.NonPooledVBOHandler | None = None
+
+    @property
+    def arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """``(positions, smooth_normals, indices)`` of the merged label."""
+        if self._arrays is None:
+            positions = []
+            normals = []
+            indices = []
+            base = 0
+
+            for char, offset in zip(self._chars, self._offsets):
+                glyph_positions, glyph_normals, glyph_indices = _glyph_mesh(char, self._style)
+
+                positions.append(glyph_positions + np.array(offset.as_float, dtype=np.float32))
+                normals.append(glyph_normals)
+                indices.append(glyph_indices + base)
+                base += len(glyph_positions)
+
+            if positions:
+                self._arrays = (np.concatenate(positions), np.concatenate(normals),
+                                np.concatenate(indices).astype(np.uint32))
+            else:
+                self._arrays = (np.zeros((0, 3), dtype=np.float32),
+                                np.zeros((0, 3), dtype=np.float32),
+                                np.zeros((0,), dtype=np.uint32))
+
+        return self._arrays
+
+    def acquire_vbo(self) -> _vbo_handler.NonPooledVBOHandler | None:
+        """The merged label's VBO, created under the current context on
+        first call -- ``None`` for a label with no ink (all spaces)."""
+        if self.vbo is None:
+            positions, normals, indices = self.arrays
+            if not len(indices):
+                return None
+
+            packed = np.concatenate((positions.ravel(), normals.ravel()))
+            self.vbo = _vbo_handler.NonPooledVBOHandler(
+                packed, len(positions), indices=indices)
+
+        return self.vbo
+
+
+# (text, style, h_align, center_anchor) -> the _LabelMesh every live Text
+# with that layout draws. Users are counted by Text.__init__ and dropped
+# by a weakref finalizer, which can run on whatever thread collected the
+# Text -- hence the lock (the same reasoning as gl/vbo.py's VBOSingleton).
+_LABEL_MESHES: dict[tuple, _LabelMesh] = {}
+_LABEL_MESHES_LOCK = threading.RLock()
+
+# VBOs of label meshes whose last Text is gone. Deleting a buffer needs a
+# current context, which a finalizer never has, so they wait here for the
+# next Text.render() (see _release_retired).
+_RETIRED_VBOS: list[_vbo_handler.NonPooledVBOHandler] = []
+
+
+def _retain_label_mesh(key: tuple, chars: list[str], style: int,
+                       offsets: list[_point.Point]) -> _LabelMesh:
+    with _LABEL_MESHES_LOCK:
+        mesh = _LABEL_MESHES.get(key, None)
+        if mesh is None:
+            mesh = _LABEL_MESHES[key] = _LabelMesh(chars, style, offsets)
+
+        mesh.users += 1
+
+    return mesh
+
+
+def _release_label_mesh(key: tuple) -> None:
+    with _LABEL_MESHES_LOCK:
+        mesh = _LABEL_MESHES.get(key, None)
+        if mesh is None:
+            return
+
+        mesh.users -= 1
+        if mesh.users > 0:
+            return
+
+        del _LABEL_MESHES[key]
+
+        if mesh.vbo is not None:
+            _RETIRED_VBOS.append(mesh.vbo)
+
+
+def _release_retired() -> None:
+    """Release retired label VBOs in the current context. One that is
+    still acquired in another context (its VAOs are per context) stays
+    queued until that context renders a Text too."""
+    if not _RETIRED_VBOS:
+        return
+
+    with _LABEL_MESHES_LOCK:
+        retired = _RETIRED_VBOS[:]
+        del _RETIRED_VBOS[:]
+
+    for vbo in retired:
+        vbo.release()
+
+    with _LABEL_MESHES_LOCK:
+        _RETIRED_VBOS.extend(vbo for vbo in retired if vbo.is_acquired)
+
+
 class Text:
     """*text* is composed from shapes/glyph.py's cached per-character
     glyphs at *style* (must already be built -- see
@@ -588,14 +796,14 @@ class Text:
         # single-line behavior).
         self._vbos = []
         self._locals = []
+        chars = []
 
-        # Per-glyph world position cache -- see render()'s own docstring
-        # for why. ``None`` means "never rendered yet" (always a miss).
-        self._cached_position: "_point.Point | None" = None
+        # Render rotation/scale cache -- see placement()'s own docstring
+        # for why. ``None`` means "never placed yet" (always a miss).
         self._cached_angle: "_angle.Angle | None" = None
         self._cached_scale: "_point.Point | None" = None
-        self._cached_glyph_scale: "_point.Point | None" = None
-        self._cached_world_positions: list = []
+        self._cached_render_angle: "_angle.Angle | None" = None
+        self._cached_render_scale: "_point.Point | None" = None
 
         lines = text.split('\n')
         line_count = len(lines)
@@ -644,6 +852,7 @@ class Text:
                 if vbo is not None:
                     self._vbos.append(vbo)
                     self._locals.append(_point.Point(line_x0 + cursor, line_y, 0.0))
+                    chars.append(char)
                     height = max(height, dims.y)
 
                 next_char = line[i + 1] if i != last else ''
@@ -674,6 +883,13 @@ class Text:
 
         self._compute_local_bounds()
 
+        # The whole layout above is in the font_size=1.0 basis, so the
+        # merged mesh only depends on what was laid out, never on *size*
+        # -- see _LabelMesh.
+        key = (text, style, h_align, bool(center_anchor))
+        self._mesh = _retain_label_mesh(key, chars, style, self._locals)
+        weakref.finalize(self, _release_label_mesh, key)
+
     def _compute_local_bounds(self) -> None:
         """Combine every placed glyph's own ``local_aabb`` (each glyph's
         cached VBO is a real VBO handler, so it already carries one --
@@ -768,78 +984,90 @@ class Text:
         vbo, dims, _center_y = self._entry(char)
         return vbo, dims
 
-    def render(self, pos_loc, rot_loc, scale_loc, normal_loc,
-               position: "_point.Point", angle: "_angle.Angle", scale: "_point.Point",
-               smooth: bool) -> None:
-        """Draw every character in this string as its own shared glyph
-        VBO, computing each glyph's own world position/rotation/scale
-        fresh from *position*/*angle*/*scale* -- this Text's owner's
-        own current transform, handed to every VBO's ``render()``
-        identically (see gl/vbo.py's ``VBOHandlerBase.render``) -- and
-        letting that glyph's own (real mesh) VBO set its own uniforms
-        and draw itself. A Text never sets a GL uniform directly, or
-        keeps any position/angle of its own between calls -- there is
-        nothing to keep in sync, since every render() call is already
-        given the truth fresh.
+    def placement(self, angle: "_angle.Angle",
+                  scale: "_point.Point") -> tuple["_angle.Angle", "_point.Point"]:
+        """Return the ``(rotation, scale)`` this Text's merged mesh is
+        drawn with for an owner at *angle*/*scale* -- the owner's own
+        position is used as-is.
 
         *local_tilt* (see __init__), if given, is composed with *angle*
         here -- always, every call -- rather than baked into a stored
         angle anywhere, so it can never leak into whatever persisted
-        angle the caller's own *angle* came from.
-
-        ``smooth`` is passed straight through to every glyph, same as
-        *pos_loc*/*rot_loc*/*scale_loc*/*normal_loc* -- purely forwarded
-        to whichever VBO handler actually owns setting that uniform,
-        same as every other parameter here.
-
-        Every glyph's own world position is expensive to re-derive (a
-        Point addition/rotation per glyph, times however many notes are
-        in the scene, every single frame) for something that's actually
-        constant almost every frame -- a note's own position/angle only
-        changes while it's actively ebing dragged/rotated. So the result
-        is cached (see __init__'s own ``_cached_*`` attributes) keyed on
-        a value-equality snapshot of *position*/*angle*/*scale* (not
-        identity -- *position* in particular is typically the same
-        live, mutable ``Point`` object call after call, so an identity
-        or reference check would never see it change); recomputed only
-        the first call, or the first call after any of the three
-        actually changes value.
-
-        No axis is mirrored here -- every glyph's own local X/Y/Z maps
-        straight into this Text's local frame (scaled by *size*/*scale*
-        and rotated by *angle*, nothing more). A caller whose own view
-        needs a different reading direction or orientation gets there
-        entirely through *local_tilt* (a real rotation -- see __init__)
-        composed with *angle*, never through a separate axis flip.
+        angle the caller's own *angle* came from. The font size rides
+        on the scale's X/Y (the merged mesh is laid out at font size
+        1.0, see _LabelMesh); Z -- the extrusion depth -- is never font
+        scaled, same as each glyph's own depth never was.
+
+        Composing the tilt is a quaternion product, for a result that
+        is constant almost every frame -- an owner's angle/scale only
+        change while it's actively being rotated/scaled. So the result
+        is cached keyed on a value-equality snapshot of *angle*/*scale*
+        (not identity -- both are typically the same live, mutable
+        object call after call, so an identity check would never see
+        them change).
         """
-        if self._local_tilt is not None:
-            angle = self._local_tilt + angle
-
         if (
-            self._cached_position is None or
-            position != self._cached_position or
+            self._cached_angle is None or
             angle != self._cached_angle or
             scale != self._cached_scale
         ):
-            self._cached_position = position.copy()
             self._cached_angle = angle.copy()
             self._cached_scale = scale.copy()
 
-            self._cached_glyph_scale = _point.Point(
+            if self._local_tilt is not None:
+                angle = self._local_tilt + angle
+
+            self._cached_render_angle = angle.copy()
+            self._cached_render_scale = _point.Point(
                 self._size * scale.x, self._size * scale.y, scale.z)
 
-            world_positions = []
-            for local in self._locals:
-                local_pos = _point.Point(
-                    local.x * self._size, local.y * self._size, local.z)
-                world_positions.append(position + (local_pos @ angle))
+        return self._cached_render_angle, self._cached_render_scale
+
+    @property
+    def mesh_arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """``(positions, smooth_normals, indices)`` of this Text's merged
+        mesh, in the frame :meth:`placement` transforms -- for drawing
+        many labels out of one buffer (see gl/text_batching.py)."""
+        return self._mesh.arrays
+
+    def render(self, pos_loc, rot_loc, scale_loc, normal_loc,
+               position: "_point.Point", angle: "_angle.Angle", scale: "_point.Point",
+               smooth: bool) -> None:
+        """Draw this whole string with one draw call, from the merged
+        mesh every Text with the same string/style/alignment shares (see
+        _LabelMesh), handing this Text's owner's own current transform
+        -- fresh, every call -- to that mesh's own ``render()`` (see
+        gl/vbo.py's ``VBOHandlerBase.render``) after :meth:`placement`
+        has folded the tilt and font size into it. A Text never sets a
+        GL uniform directly, or keeps any position of its own between
+        calls -- there is nothing to keep in sync, since every render()
+        call is already given the truth fresh.
+
+        The merged mesh is only rebuilt when the string itself changes
+        (which is a new Text); a move, rotate or resize only ever
+        changes the uniforms. It used to be one draw per glyph, each
+        with its own uniform uploads -- a schematic's worth of cavity
+        and terminal names ran to tens of thousands of draws a frame.
+
+        ``smooth`` is passed straight through, same as
+        *pos_loc*/*rot_loc*/*scale_loc*/*normal_loc* -- purely forwarded
+        to whichever VBO handler actually owns setting that uniform.
 
-            self._cached_world_positions = world_positions
+        No axis is mirrored here -- every glyph's own local X/Y/Z maps
+        straight into this Text's local frame (scaled by *size*/*scale*
+        and rotated by *angle*, nothing more). A caller whose own view
+        needs a different reading direction or orientation gets there
+        entirely through *local_tilt* (a real rotation -- see __init__)
+        composed with *angle*, never through a separate axis flip.
+        """
+        _release_retired()
 
-        glyph_scale = self._cached_glyph_scale
+        vbo = self._mesh.acquire_vbo()
+        if vbo is None:
+            return
 
-        for vbo, world_pos in zip(self._vbos, self._cached_world_positions):
-            vbo.render(pos_loc, rot_loc, scale_loc, normal_loc, world_pos, angle, glyph_scale, smooth)
+        angle, scale = self.placement(angle, scale)
+        vbo.render(pos_loc, rot_loc, scale_loc, normal_loc, position, angle, scale, smooth)
 
     # ------------------------------------------------------------------
     # VBOHandlerBase-compatible interface -- lets a Text stand in
@@ -895,11 +1123,11 @@ class Text:
         return ctx
 
     def acquire(self) -> None:
-        """No-op -- each character's own cached glyph VBO (see
-        build_chars()) manages its own GL acquisition lazily."""
+        """No-op -- the merged label mesh (see _LabelMesh) is created and
+        acquired lazily by its first render()."""
 
     def release(self) -> None:
-        """No-op -- a Text never owns a VBO of its own to release; its
-        character glyphs are globally shared/cached (see build_chars()),
-        and releasing them here would break every other Text instance
-        using the same letters."""
+        """No-op -- the merged label mesh is shared with every other Text
+        laid out the same way (see _LabelMesh); its VBO is released once
+        the last of them has been collected (see _release_retired), and
+        releasing it here would break the rest."""
@@ -8,6 +8,7 @@ from PySide6 import QtWidgets, QtCore, QtGui
 from . import dialog_base as _dialog_base
 from ..widgets import choice_ctrl as _choice_ctrl
 from ...exporter import exporter as _exporter
+from ...exporter import scene_exporter as _scene_exporter
 from ... import check_types as _check_types
 
 if TYPE_CHECKING:
@@ -116,18 +117,15 @@ class _FilePickerRow(QtWidgets.QWidget):
 # Background export worker
 # ---------------------------------------------------------------------------
 
-class _ExportWorker(QtCore.QThread):
+class _WorkerBase(QtCore.QThread):
     log_appended = QtCore.Signal(str)
     step_started = QtCore.Signal(str, int)   # (description, total_steps)
     step_progressed = QtCore.Signal(int)     # current step value
     export_finished = QtCore.Signal(bool, str)  # (success, error_message)
 
     @_check_types.do
-    def __init__(self, verts: np.ndarray, normals: np.ndarray,
-                 path: str, export_type: int):
+    def __init__(self, path: str, export_type: int):
         super().__init__()
-        self._verts = verts
-        self._normals = normals
         self._path = path
         self._export_type = export_type
         self._current_total = 0
@@ -143,6 +141,20 @@ class _ExportWorker(QtCore.QThread):
             self.step_started.emit(phase, total)
         self.step_progressed.emit(current)
 
+
+class _ExportWorker(_WorkerBase):
+    """Exports one flattened world-space mesh (OCP and pyassimp formats)."""
+
+    @_check_types.do
+    def __init__(self, verts: np.ndarray, normals: np.ndarray,
+                 path: str, export_type: int, part_sizes: list | None = None):
+        super().__init__(path, export_type)
+        self._verts = verts
+        self._normals = normals
+        # vertex count of each object in verts/normals - the OCP formats
+        # write one face per object and prepare them concurrently
+        self._part_sizes = part_sizes
+
     @_check_types.do
     def run(self):
         try:
@@ -158,7 +170,8 @@ class _ExportWorker(QtCore.QThread):
                 _exporter.export_ocp(
                     self._verts, self._normals,
                     self._path, fmt,
-                    progress_cb=self._progress_cb)
+                    progress_cb=self._progress_cb,
+                    part_sizes=self._part_sizes)
 
             elif export_type in _exporter.ASSIMP_FORMAT_IDS:
                 file_type = _exporter.ASSIMP_FORMAT_IDS[export_type]
@@ -180,6 +193,36 @@ class _ExportWorker(QtCore.QThread):
             self.export_finished.emit(False, str(exc))
 
 
+class _SceneExportWorker(_WorkerBase):
+    """Exports placed objects straight from their mesh handlers (glTF and
+    OBJ, see exporter/scene_exporter.py)."""
+
+    @_check_types.do
+    def __init__(self, parts: list, path: str, export_type: int):
+        super().__init__(path, export_type)
+        self._parts = parts
+
+    @_check_types.do
+    def run(self):
+        try:
+            fmt = _exporter.SCENE_FORMAT_STRINGS[self._export_type]
+            self.log_appended.emit(
+                f'Writing {fmt.upper()} scene  ({len(self._parts):,} objects)...')
+
+            stats = _scene_exporter.export_scene(
+                self._parts, self._path, fmt, progress_cb=self._progress_cb)
+
+            self.log_appended.emit(
+                f'  {stats["meshes"]:,} distinct meshes, '
+                f'{stats["triangles"]:,} triangles written '
+                f'({stats["placed_triangles"]:,} placed)')
+            self.log_appended.emit(f'Export complete → {self._path}')
+            self.export_finished.emit(True, '')
+
+        except Exception as exc:
+            self.export_finished.emit(False, str(exc))
+
+
 # ---------------------------------------------------------------------------
 # Export dialog
 # ---------------------------------------------------------------------------
@@ -193,7 +236,7 @@ class ExportDialog(_dialog_base.BaseDialog):
             parent, 'Export Models', size=(720, 560),
             button_ids=QtWidgets.QDialogButtonBox.StandardButton.Close)
 
-        self._worker: _ExportWorker | None = None
+        self._worker: _WorkerBase | None = None
 
         # ── Format dropdown ──────────────────────────────────────────────
         self._format_ctrl = _choice_ctrl.ChoiceCtrl(
@@ -285,6 +328,8 @@ class ExportDialog(_dialog_base.BaseDialog):
             self._log_line('ERROR: No output file selected.')
             return
 
+        export_type = self._selected_export_type()
+
         # ── Collect mesh data (main thread — fast numpy ops) ─────────────
         self._log.clear()
         self._log_line('=== Collecting mesh data ===')
@@ -294,8 +339,18 @@ class ExportDialog(_dialog_base.BaseDialog):
         QtWidgets.QApplication.processEvents()
 
         try:
-            all_verts, all_normals, obj_count, total_verts, total_tris = \
-                self._collect_mesh_data(project)
+            if export_type in _exporter.SCENE_FORMAT_STRINGS:
+                # no vertex is touched here: the worker streams each mesh
+                # from its handler, see _collect_scene
+                parts, obj_count, total_verts, total_tris = self._collect_scene(project)
+                worker_args = (parts,)
+                found = bool(parts)
+            else:
+                all_verts, all_normals, obj_count, total_verts, total_tris, part_sizes = \
+                    self._collect_mesh_data(project)
+                worker_args = (all_verts, all_normals)
+                found = all_verts is not None
+
         except Exception as exc:
             self._log_line(f'ERROR during collection: {exc}')
             QtWidgets.QApplication.restoreOverrideCursor()
@@ -304,7 +359,7 @@ class ExportDialog(_dialog_base.BaseDialog):
 
         QtWidgets.QApplication.restoreOverrideCursor()
 
-        if all_verts is None:
+        if not found:
             self._log_line('No visible objects with 3D models were found. Nothing to export.')
             self._export_btn.setEnabled(True)
             return
@@ -319,11 +374,14 @@ class ExportDialog(_dialog_base.BaseDialog):
         self._log_line(f'=== Exporting to {path} ===')
 
         # ── Hand off to worker thread ─────────────────────────────────────
-        export_type = self._selected_export_type()
         self._phase_label.setText('Starting...')
         self._progress.setValue(0)
 
-        self._worker = _ExportWorker(all_verts, all_normals, path, export_type)
+        if export_type in _exporter.SCENE_FORMAT_STRINGS:
+            self._worker = _SceneExportWorker(*worker_args, path, export_type)
+        else:
+            self._worker = _ExportWorker(*worker_args, path, export_type, part_sizes)
+
         self._worker.log_appended.connect(self._log_line)
         self._worker.step_started.connect(self._on_step_started)
         self._worker.step_progressed.connect(self._on_step_progressed)
@@ -356,20 +414,11 @@ class ExportDialog(_dialog_base.BaseDialog):
     # ------------------------------------------------------------------
 
     @_check_types.do
-    def _collect_mesh_data(self, project):
+    def _visible_objects(self, project):
         """
-        Walk all visible 3D objects, apply their world transforms, and
-        concatenate all vertices and normals into two (N,3) float32 arrays.
-
-        Returns (all_verts, all_normals, obj_count, total_verts, total_tris)
-        or (None, None, 0, 0, 0) when nothing visible was found.
+        Yield (collection_name, label, obj3d) for every visible 3D object
+        with a mesh, logging every object with a mesh as it goes.
         """
-        verts_list = []
-        normals_list = []
-        obj_count = 0
-        total_verts = 0
-        total_tris = 0
-
         for collection_name in _OBJECT_COLLECTIONS:
             collection = getattr(project, collection_name, [])
             for obj in collection:
@@ -391,41 +440,99 @@ class ExportDialog(_dialog_base.BaseDialog):
                     f'vertices={vertex_count:,}  '
                     f'triangles={triangle_count:,}')
 
-                if not is_visible:
-                    continue
+                if is_visible:
+                    yield collection_name, label, obj3d
+
+    @_check_types.do
+    def _collect_scene(self, project):
+        """
+        Describe every visible 3D object as a ScenePart: its mesh handler,
+        transform and material. Unlike _collect_mesh_data nothing is
+        transformed or copied - objects sharing a handler share it here
+        too, and the exporter streams each mesh from it.
+
+        Returns (parts, obj_count, total_verts, total_tris); the totals are
+        what the placed objects draw, instanced or not.
+        """
+        parts = []
+        total_verts = 0
+        total_tris = 0
+
+        # the rotation as a matrix, worked out the same way the flattened
+        # export applies it: rows of the identity rotated by the angle
+        identity = np.eye(3, dtype=np.float32)
+
+        for collection_name, label, obj3d in self._visible_objects(project):
+            material = obj3d.material
+            # exported as it looks unselected, not in the selection tint
+            if material is obj3d.selected_material:
+                material = obj3d.unselected_material
+
+            parts.append(_scene_exporter.ScenePart(
+                label, obj3d.vbo, bool(getattr(obj3d, 'smooth', False)),
+                obj3d.position.as_numpy, identity.copy() @ obj3d.angle,
+                obj3d.scale.as_numpy, material, collection_name))
+
+            total_verts += obj3d.vbo.vertex_count
+            total_tris += obj3d.vbo.triangle_count
+
+        return parts, len(parts), total_verts, total_tris
+
+    @_check_types.do
+    def _collect_mesh_data(self, project):
+        """
+        Walk all visible 3D objects, apply their world transforms, and
+        concatenate all vertices and normals into two (N,3) float32 arrays.
+
+        Returns (all_verts, all_normals, obj_count, total_verts, total_tris,
+        part_sizes) - part_sizes being the vertex count of each object, in
+        the order they were concatenated - or (None, None, 0, 0, 0, [])
+        when nothing visible was found.
+        """
+        verts_list = []
+        normals_list = []
+        part_sizes = []
+        obj_count = 0
+        total_verts = 0
+        total_tris = 0
+
+        for _, _, obj3d in self._visible_objects(project):
+            is_smooth = getattr(obj3d, 'smooth', False)
+            vertex_count = obj3d.vbo.vertex_count
 
-                # Raw arrays (local/model space)
-                verts_local = obj3d.vbo.vertices.reshape(-1, 3)
-                raw_normals = (obj3d.vbo.smooth_normals if is_smooth
-                               else obj3d.vbo.face_normals)
-                normals_local = raw_normals.reshape(-1, 3)
+            # Raw arrays (local/model space)
+            verts_local = obj3d.vbo.vertices.reshape(-1, 3)
+            raw_normals = (obj3d.vbo.smooth_normals if is_smooth
+                           else obj3d.vbo.face_normals)
+            normals_local = raw_normals.reshape(-1, 3)
 
-                # World transform: (v * scale) @ rotation + position
-                scale = obj3d.scale.as_numpy          # (3,)
-                angle = obj3d.angle                   # Angle — supports @
-                pos = obj3d.position.as_numpy         # (3,)
+            # World transform: (v * scale) @ rotation + position
+            scale = obj3d.scale.as_numpy          # (3,)
+            angle = obj3d.angle                   # Angle — supports @
+            pos = obj3d.position.as_numpy         # (3,)
 
-                verts_world = (verts_local * scale) @ angle + pos
+            verts_world = (verts_local * scale) @ angle + pos
 
-                # Normals rotate only (no translation, no scale)
-                normals_world = normals_local @ angle
-                norms_len = np.linalg.norm(normals_world, axis=1, keepdims=True)
-                np.maximum(norms_len, 1e-8, out=norms_len)
-                normals_world = normals_world / norms_len
+            # Normals rotate only (no translation, no scale)
+            normals_world = normals_local @ angle
+            norms_len = np.linalg.norm(normals_world, axis=1, keepdims=True)
+            np.maximum(norms_len, 1e-8, out=norms_len)
+            normals_world = normals_world / norms_len
 
-                verts_list.append(verts_world.astype(np.float32))
-                normals_list.append(normals_world.astype(np.float32))
+            verts_list.append(verts_world.astype(np.float32))
+            normals_list.append(normals_world.astype(np.float32))
+            part_sizes.append(len(verts_world))
 
-                obj_count += 1
-                total_verts += vertex_count
-                total_tris += triangle_count
+            obj_count += 1
+            total_verts += vertex_count
+            total_tris += vertex_count // 3
 
         if not verts_list:
-            return None, None, 0, 0, 0
+            return None, None, 0, 0, 0, []
 
         all_verts = np.concatenate(verts_list, axis=0)
         all_normals = np.concatenate(normals_list, axis=0)
-        return all_verts, all_normals, obj_count, total_verts, total_tris
+        return all_verts, all_normals, obj_count, total_verts, total_tris, part_sizes
 
     # ------------------------------------------------------------------
     # QDialog overrides
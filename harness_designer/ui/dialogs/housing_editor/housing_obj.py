@@ -119,7 +119,8 @@ class Housing3D(_base_3d.Base3D):
 
                     packed = packed.reshape(-1)
 
-                    vbo = _vbo.PooledVBOHandler(uuid, packed, count, aabb=aabb, obb=obb)
+                    vbo = _vbo.PooledVBOHandler(uuid, packed, count, aabb=aabb, obb=obb,
+                                                indices=model.indices)
 
             material = _materials.Plastic(
                 _color.Color(0.6, 0.6, 0.8, 0.6))
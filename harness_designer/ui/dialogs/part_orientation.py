@@ -176,7 +176,8 @@ class PartModel3D(_base_3d.Base3D):
 
                     packed = packed.reshape(-1)
 
-                    vbo = _vbo.PooledVBOHandler(uuid, packed, count, aabb=aabb, obb=obb)
+                    vbo = _vbo.PooledVBOHandler(uuid, packed, count, aabb=aabb, obb=obb,
+                                                indices=model_db.indices)
                 else:
                     vbo = None
 
@@ -989,9 +989,9 @@ class SearchDialog(_dialog_base.BaseDialog):
             return None
 
         try:
-            # get_obj_id's query matches against SQL's 1-indexed RowNum;
-            # self.results.selected is Qt's 0-indexed row.
-            return self.results.get_obj_id(sel + 1)
+            # self.results.selected is Qt's 0-indexed row, the same
+            # row index get_obj_id takes.
+            return self.results.get_obj_id(sel)
         except Exception:  # NOQA
             return None
 
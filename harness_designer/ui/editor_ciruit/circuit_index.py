@@ -0,0 +1,596 @@
+# © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
+
+"""Inverted indexes behind the circuit editor's incremental design-rule check."""
+
+from typing import Any as _Any, Callable as _Callable
+
+import time
+
+from . import design_rules as _design_rules
+from ... import check_types as _check_types
+
+
+_CIRCUITS = 'pjt_circuits'
+_WIRES = 'pjt_wires'
+_TERMINALS = 'pjt_terminals'
+_CAVITIES = 'pjt_cavities'
+_HOUSINGS = 'pjt_housings'
+_BUNDLES = 'pjt_bundles'
+_CONCENTRICS = 'pjt_concentrics'
+_LAYERS = 'pjt_concentric_layers'
+_CONCENTRIC_WIRES = 'pjt_concentric_wires'
+_POINTS3D = 'pjt_points3d'
+
+# the columns of each table a circuit's row is built from; a write that
+# touches none of them is ignored (None: any column counts)
+_WATCHED = {
+    _CIRCUITS: None,
+    _WIRES: frozenset(('circuit_id', 'part_id', 'start_point3d_id', 'stop_point3d_id')),
+    _TERMINALS: frozenset(('circuit_id', 'cavity_id', 'is_start', 'volts', 'load', 'voltage_drop')),
+    _CAVITIES: frozenset(('housing_id', 'name')),
+    _HOUSINGS: frozenset(('name', 'part_id')),
+    _BUNDLES: frozenset(('name',)),
+    _CONCENTRICS: frozenset(('bundle_id',)),
+    _LAYERS: frozenset(('concentric_id',)),
+    _CONCENTRIC_WIRES: frozenset(('wire_id', 'layer_id')),
+    _POINTS3D: None,
+}
+
+# writes queued without being applied before the queue is given up on and
+# the next apply asks for a full rebuild instead (a drag that moves a few
+# thousand points per frame would otherwise grow it without bound while
+# the editor is busy)
+_PENDING_LIMIT = 100000
+
+
+class _Link:
+    """
+    One foreign-key column held both ways: ``child -> parent`` and
+    ``parent -> {child, ...}``.
+    """
+
+    __slots__ = ('parents', 'children')
+
+    def __init__(self):
+        self.parents: dict[_Any, _Any] = {}
+        self.children: dict[_Any, set] = {}
+
+    def set(self, child, parent) -> None:
+        old = self.parents.get(child, None)
+        if old == parent:
+            return
+
+        if old is not None:
+            self._drop_child(old, child)
+
+        if parent is None:
+            self.parents.pop(child, None)
+        else:
+            self.parents[child] = parent
+            self.children.setdefault(parent, set()).add(child)
+
+    def drop(self, child) -> None:
+        old = self.parents.pop(child, None)
+        if old is not None:
+            self._drop_child(old, child)
+
+    def _drop_child(self, parent, child) -> None:
+        children = self.children.get(parent, None)
+        if children is None:
+            return
+
+        children.discard(child)
+        if not children:
+            del self.children[parent]
+
+    def parent(self, child):
+        return self.parents.get(child, None)
+
+    def children_of(self, parent) -> set:
+        return self.children.get(parent, ())
+
+    def clear(self) -> None:
+        self.parents.clear()
+        self.children.clear()
+
+
+class CircuitIndex:
+    """
+    Which circuit every row the circuit editor reads from belongs to.
+
+    A circuit's row in the editor is built from the circuit itself, its
+    terminals (and through them the cavity and housing names), its wires
+    and the bundles those wires are laid in. Finding the bundles meant
+    walking every wire of every bundle for every circuit, and any change
+    at all meant building every row and running the design rules on all
+    of them again.
+
+    This keeps each of those foreign keys in both directions (see
+    :class:`_Link`)::
+
+        wire -> circuit               terminal -> circuit, cavity
+        cavity -> housing             concentric wire -> wire, layer
+        layer -> concentric           concentric -> bundle
+
+    so "which bundles is this circuit in" and "which circuits does this
+    bundle carry" are dictionary walks whose cost is the number of rows
+    actually involved.
+
+    It is registered as a write observer on the project tables (see
+    :meth:`~harness_designer.database.project_db.pjt_bases.PJTTables.add_write_observer`).
+    Writes are only queued as they happen; :meth:`apply_pending` applies
+    them to the index and returns the circuits they touched, which are
+    the only ones whose rows need building and checking again. A wire's
+    part or a bundle's membership changing touches every circuit in the
+    bundle, since the split suggestions compare a wire against the others
+    laid with it. A 3D point moving touches the circuits of the wires
+    that end on it (found through the project's topology index) because
+    the wire lengths change.
+
+    The index is built from one range query per table by :meth:`build`,
+    which, like the rows, runs on the editor's worker thread;
+    :meth:`apply_pending` and the write queue belong to the GUI thread.
+
+    ``stats`` counts ``builds``, the ``circuits``, ``wires`` and
+    ``bundles`` held after the last build, ``build_ms``, the ``events``
+    queued, the ``touched`` circuits returned and ``apply_ms`` spent
+    applying them since.
+    """
+
+    # table -> ((column, link attribute), ...) for every column kept
+    _COLUMNS = {
+        _WIRES: (('circuit_id', '_wires'),),
+        _TERMINALS: (('circuit_id', '_terminals'), ('cavity_id', '_terminal_cavities')),
+        _CAVITIES: (('housing_id', '_cavities'),),
+        _CONCENTRIC_WIRES: (('wire_id', '_concentric_wires'), ('layer_id', '_wire_layers')),
+        _LAYERS: (('concentric_id', '_layers'),),
+        _CONCENTRICS: (('bundle_id', '_concentrics'),),
+    }
+
+    @_check_types.do
+    def __init__(self, db, on_pending: _Callable[[], None] | None = None):
+        """
+        :param db: The project tables (``PJTTables``).
+        :type db: UNKNOWN
+        :param on_pending: Called whenever a write is queued onto an empty
+            queue, from the thread that made the write.
+        :type on_pending: callable or ``None``
+        """
+        self.db = db
+        self._on_pending = on_pending
+
+        self._circuits: dict[_Any, None] = {}
+        self._wires = _Link()
+        self._terminals = _Link()
+        self._terminal_cavities = _Link()
+        self._cavities = _Link()
+        self._concentric_wires = _Link()
+        self._wire_layers = _Link()
+        self._layers = _Link()
+        self._concentrics = _Link()
+
+        # bundle id -> name, in table order; the order is what the rows
+        # list a circuit's bundles in
+        self._bundle_names: dict[_Any, str] = {}
+        self._bundle_order: dict[_Any, int] = {}
+        self._bundle_ids: dict[str, _Any] = {}
+
+        self._wire_ods: dict[_Any, float | None] = {}
+        self._bundle_ods: dict[_Any, list[float]] = {}
+
+        self._pending: list[tuple[str, _Any, dict | None]] = []
+        self._overflow = False
+        self._built = False
+
+        self.stats = dict(builds=0, circuits=0, wires=0, bundles=0, build_ms=0.0,
+                          events=0, touched=0, apply_ms=0.0)
+
+    @property
+    @_check_types.do
+    def built(self) -> bool:
+        return self._built
+
+    @_check_types.do
+    def clear(self) -> None:
+        """Forget everything -- the index has to be built again."""
+        self._circuits.clear()
+
+        for _, link in self._links():
+            link.clear()
+
+        self._bundle_names.clear()
+        self._bundle_order.clear()
+        self._bundle_ids.clear()
+        self._wire_ods.clear()
+        self._bundle_ods.clear()
+        self._built = False
+
+    @_check_types.do
+    def _links(self):
+        for columns in self._COLUMNS.values():
+            for column, attr in columns:
+                yield column, getattr(self, attr)
+
+    # -- building ------------------------------------------------------------
+
+    @_check_types.do
+    def build(self) -> None:
+        """(Re)build the index from the open project's tables."""
+        self.clear()
+
+        start = time.perf_counter()
+
+        db = self.db
+        self.add_rows(_CIRCUITS, ('id',), db.pjt_circuits_table.select('id'))
+        self.add_rows(_BUNDLES, ('id', 'name'), db.pjt_bundles_table.select('id', 'name'))
+
+        for table_name, columns in self._COLUMNS.items():
+            header = ('id',) + tuple(column for column, _ in columns)
+            table = getattr(db, table_name + '_table')
+            self.add_rows(table_name, header, table.select(*header))
+
+        self._built = True
+
+        stats = self.stats
+        stats['builds'] += 1
+        stats['circuits'] = len(self._circuits)
+        stats['wires'] = len(self._wires.parents)
+        stats['bundles'] = len(self._bundle_names)
+        stats['build_ms'] = (time.perf_counter() - start) * 1000.0
+
+    @_check_types.do
+    def add_rows(self, table_name: str, header: tuple[str, ...], rows) -> None:
+        """
+        Index *rows* of *table_name*.
+
+        :param header: The column each position of a row holds; ``id``
+            first.
+        :type header: tuple[str, ...]
+        :param rows: The rows.
+        :type rows: iterable of tuple
+        """
+        if table_name == _CIRCUITS:
+            for row in rows:
+                self._circuits[row[0]] = None
+
+        elif table_name == _BUNDLES:
+            name_index = header.index('name')
+            for row in rows:
+                self._set_bundle_name(row[0], row[name_index])
+
+        else:
+            for position, column in enumerate(header):
+                link = self._link(table_name, column)
+                if link is None:
+                    continue
+
+                for row in rows:
+                    link.set(row[0], row[position])
+
+    @_check_types.do
+    def _link(self, table_name: str, column: str) -> _Link | None:
+        for name, attr in self._COLUMNS.get(table_name, ()):
+            if name == column:
+                return getattr(self, attr)
+
+        return None
+
+    @_check_types.do
+    def _set_bundle_name(self, bundle_id, name: str | None) -> None:
+        old = self._bundle_names.get(bundle_id, None)
+        if old is not None and self._bundle_ids.get(old, None) == bundle_id:
+            del self._bundle_ids[old]
+
+            # the next bundle sharing the old name answers for it now
+            for other_id, other_name in self._bundle_names.items():
+                if other_id != bundle_id and other_name == old:
+                    self._bundle_ids[old] = other_id
+                    break
+
+        name = name or f'Bundle {bundle_id}'
+        self._bundle_names[bundle_id] = name
+        self._bundle_order.setdefault(bundle_id, len(self._bundle_order))
+        self._bundle_ids.setdefault(name, bundle_id)
+
+    @_check_types.do
+    def _drop_bundle(self, bundle_id) -> None:
+        name = self._bundle_names.pop(bundle_id, None)
+        self._bundle_order.pop(bundle_id, None)
+        self._bundle_ods.pop(bundle_id, None)
+
+        if name is not None and self._bundle_ids.get(name, None) == bundle_id:
+            del self._bundle_ids[name]
+
+            for other_id, other_name in self._bundle_names.items():
+                if other_name == name:
+                    self._bundle_ids[name] = other_id
+                    break
+
+    # -- queries -------------------------------------------------------------
+
+    @_check_types.do
+    def circuit_ids(self) -> list:
+        """Every circuit of the project, in table order."""
+        return list(self._circuits)
+
+    @_check_types.do
+    def wire_bundles(self, wire_id) -> set:
+        """The ids of the bundles *wire_id* is laid in."""
+        bundles = set()
+        for concentric_wire_id in self._concentric_wires.children_of(wire_id):
+            layer_id = self._wire_layers.parent(concentric_wire_id)
+            bundle_id = self._concentrics.parent(self._layers.parent(layer_id))
+            # a deleted bundle can leave its concentric rows behind
+            if bundle_id in self._bundle_names:
+                bundles.add(bundle_id)
+
+        return bundles
+
+    @_check_types.do
+    def bundle_wires(self, bundle_id) -> list:
+        """
+        The wire ids laid in *bundle_id*, one per concentric position (a
+        wire taking two positions is listed twice).
+        """
+        wires = []
+        for concentric_id in self._concentrics.children_of(bundle_id):
+            for layer_id in self._layers.children_of(concentric_id):
+                for concentric_wire_id in self._wire_layers.children_of(layer_id):
+                    wire_id = self._concentric_wires.parent(concentric_wire_id)
+                    if wire_id is not None:
+                        wires.append(wire_id)
+
+        return wires
+
+    @_check_types.do
+    def bundle_circuits(self, bundle_id) -> set:
+        """The ids of the circuits with a wire in *bundle_id*."""
+        parent = self._wires.parent
+        return {parent(wire_id) for wire_id in self.bundle_wires(bundle_id)} - {None}
+
+    @_check_types.do
+    def bundle_names(self, circuit_id) -> list[str]:
+        """The names of the bundles *circuit_id*'s wires are laid in, in table order."""
+        bundles = set()
+        for wire_id in self._wires.children_of(circuit_id):
+            bundles.update(self.wire_bundles(wire_id))
+
+        names = []
+        for bundle_id in sorted(bundles, key=self._bundle_order.__getitem__):
+            name = self._bundle_names[bundle_id]
+            if name not in names:
+                names.append(name)
+
+        return names
+
+    @_check_types.do
+    def bundle_wire_ods(self, name: str) -> list[float] | None:
+        """
+        The outside diameters of the wires in the bundle called *name*
+        (see :func:`~.design_rules.bundle_wire_ods`), or ``None`` when
+        there is no such bundle. Cached per bundle until a wire's part or
+        the bundle's membership changes.
+        """
+        bundle_id = self._bundle_ids.get(name, None)
+        if bundle_id is None:
+            return None
+
+        ods = self._bundle_ods.get(bundle_id, None)
+        if ods is None:
+            ods = []
+            for wire_id in self.bundle_wires(bundle_id):
+                od = self._wire_od(wire_id)
+                if od:
+                    ods.append(od)
+
+            self._bundle_ods[bundle_id] = ods
+
+        return ods
+
+    @_check_types.do
+    def _wire_od(self, wire_id) -> float | None:
+        if wire_id in self._wire_ods:
+            return self._wire_ods[wire_id]
+
+        od = None
+        try:
+            wire = self.db.pjt_wires_table[wire_id]
+            od = _design_rules.safe(_design_rules.safe(wire, 'part'), 'od_mm')
+            od = float(od) if od else None
+        except Exception:  # NOQA
+            pass
+
+        self._wire_ods[wire_id] = od
+        return od
+
+    # -- write observer (PJTTables) ------------------------------------------
+
+    @_check_types.do
+    def table_written(self, table_name: str, row_id, values: dict[str, _Any] | None) -> None:
+        """Queue one write; applied by :meth:`apply_pending`."""
+        if self._overflow or table_name not in _WATCHED:
+            return
+
+        watched = _WATCHED[table_name]
+        if values is not None and watched is not None and watched.isdisjoint(values):
+            # a bundle inserted without a name still needs one
+            if table_name != _BUNDLES or row_id in self._bundle_names:
+                return
+
+        pending = self._pending
+        if len(pending) >= _PENDING_LIMIT:
+            self._overflow = True
+            pending.clear()
+            return
+
+        pending.append((table_name, row_id, values))
+        self.stats['events'] += 1
+
+        if len(pending) == 1 and self._on_pending is not None:
+            self._on_pending()
+
+    @_check_types.do
+    def tables_reset(self) -> None:
+        """Another project was loaded -- nothing indexed holds any more."""
+        self._pending.clear()
+        self._overflow = True
+
+        if self._on_pending is not None:
+            self._on_pending()
+
+    @property
+    @_check_types.do
+    def pending(self) -> bool:
+        return bool(self._pending) or self._overflow
+
+    @_check_types.do
+    def reset_pending(self) -> None:
+        """Drop the queued writes -- a full :meth:`build` is about to read them."""
+        self._pending.clear()
+        self._overflow = False
+
+    @_check_types.do
+    def apply_pending(self) -> tuple[set, set] | None:
+        """
+        Apply the queued writes to the index.
+
+        :returns: ``(touched, removed)`` -- the circuits whose rows have
+            to be built and checked again (new ones included) and the
+            circuits that were deleted -- or ``None`` when the index can't
+            be brought up to date from the queue and has to be built
+            again.
+        :rtype: tuple[set, set] | None
+        """
+        if self._overflow or not self._built:
+            return None
+
+        start = time.perf_counter()
+
+        touched = set()
+        removed = set()
+
+        while self._pending:
+            pending = self._pending
+            self._pending = []
+
+            for table_name, row_id, values in pending:
+                self._apply(table_name, row_id, values, touched, removed)
+
+        # rows left pointing at a deleted circuit still report it
+        circuits = self._circuits
+        touched = {circuit_id for circuit_id in touched if circuit_id in circuits}
+
+        self.stats['touched'] += len(touched)
+        self.stats['apply_ms'] += (time.perf_counter() - start) * 1000.0
+
+        return touched, removed
+
+    @_check_types.do
+    def _apply(self, table_name: str, row_id, values: dict[str, _Any] | None,
+               touched: set, removed: set) -> None:
+        if table_name == _CIRCUITS:
+            if values is None:
+                if row_id in self._circuits:
+                    del self._circuits[row_id]
+                    removed.add(row_id)
+            else:
+                self._circuits[row_id] = None
+                removed.discard(row_id)
+                touched.add(row_id)
+
+            return
+
+        if table_name == _POINTS3D:
+            # a wire's length follows its end points
+            topology = self.db.topology
+            if values is not None and topology.built:
+                parent = self._wires.parent
+                for ref_table, _, ref_id in topology.references(row_id):
+                    if ref_table == _WIRES:
+                        touched.add(parent(ref_id))
+            return
+
+        # touched before and after, so a row moving from one circuit or
+        # bundle to another rechecks both ends
+        bundles = self._touch(table_name, row_id, values, touched)
+
+        if values is None:
+            for _, attr in self._COLUMNS.get(table_name, ()):
+                getattr(self, attr).drop(row_id)
+
+            if table_name == _BUNDLES:
+                self._drop_bundle(row_id)
+
+            if table_name == _WIRES:
+                self._wire_ods.pop(row_id, None)
+
+        else:
+            for column, attr in self._COLUMNS.get(table_name, ()):
+                if column in values:
+                    getattr(self, attr).set(row_id, values[column])
+
+            if table_name == _BUNDLES and ('name' in values or row_id not in self._bundle_names):
+                self._set_bundle_name(row_id, values.get('name', None))
+
+            if table_name == _WIRES and 'part_id' in values:
+                self._wire_ods.pop(row_id, None)
+
+            bundles |= self._touch(table_name, row_id, values, touched)
+
+        for bundle_id in bundles:
+            self._bundle_ods.pop(bundle_id, None)
+
+    @_check_types.do
+    def _touch(self, table_name: str, row_id, values: dict[str, _Any] | None, touched: set) -> set:
+        """
+        Add the circuits a write to *row_id* of *table_name* affects to
+        *touched* and return the bundles whose wire ODs it changes.
+        """
+        if table_name == _WIRES:
+            touched.add(self._wires.parent(row_id))
+
+            if values is None or 'part_id' in values:
+                bundles = self.wire_bundles(row_id)
+                for bundle_id in bundles:
+                    touched.update(self.bundle_circuits(bundle_id))
+
+                return bundles
+
+            return set()
+
+        if table_name == _TERMINALS:
+            touched.add(self._terminals.parent(row_id))
+            return set()
+
+        if table_name in (_CAVITIES, _HOUSINGS):
+            if table_name == _HOUSINGS:
+                cavities = self._cavities.children_of(row_id)
+            else:
+                cavities = (row_id,)
+
+            parent = self._terminals.parent
+            for cavity_id in cavities:
+                for terminal_id in self._terminal_cavities.children_of(cavity_id):
+                    touched.add(parent(terminal_id))
+
+            return set()
+
+        if table_name == _CONCENTRIC_WIRES:
+            touched.add(self._wires.parent(self._concentric_wires.parent(row_id)))
+            layer_id = self._wire_layers.parent(row_id)
+            bundles = {self._concentrics.parent(self._layers.parent(layer_id))}
+
+        elif table_name == _LAYERS:
+            bundles = {self._concentrics.parent(self._layers.parent(row_id))}
+
+        elif table_name == _CONCENTRICS:
+            bundles = {self._concentrics.parent(row_id)}
+
+        else:
+            bundles = {row_id}
+
+        bundles.discard(None)
+        for bundle_id in bundles:
+            touched.update(self.bundle_circuits(bundle_id))
+
+        return bundles
@@ -354,7 +354,7 @@ def bundle_wire_ods(bundle) -> list[float]:
 
 @_check_types.do
 def generate_suggestions(row: "_editor_circuit.CircuitRow",
-                         project_db) -> list[SplitSuggestion]:
+                         project_db, bundle_ods=None) -> list[SplitSuggestion]:
     """Execute the generate suggestions operation.
 
     UNKNOWN details are inferred from the callable name and signature.
@@ -363,6 +363,11 @@ def generate_suggestions(row: "_editor_circuit.CircuitRow",
     :type row: :class:`_editor_circuit.CircuitRow`
     :param project_db: Value for ``project_db``.
     :type project_db: UNKNOWN
+    :param bundle_ods: ``bundle name -> wire ODs`` (``None`` for an
+        unknown bundle), e.g. :meth:`.circuit_index.CircuitIndex.bundle_wire_ods`.
+        Without it every bundle is looked up by scanning the bundles table
+        and its wires are read back through their concentric layers.
+    :type bundle_ods: callable or ``None``
     :returns: Return value. UNKNOWN details.
     :rtype: list[SplitSuggestion]
     """
@@ -379,11 +384,17 @@ def generate_suggestions(row: "_editor_circuit.CircuitRow",
     seen_splits: set[tuple[int, int]] = set()
 
     for bname in row.bundle_names:
-        bundle = find_bundle_by_name(project_db, bname)
-        if bundle is None:
-            continue
+        if bundle_ods is None:
+            bundle = find_bundle_by_name(project_db, bname)
+            if bundle is None:
+                continue
+
+            all_ods = bundle_wire_ods(bundle)
+        else:
+            all_ods = bundle_ods(bname)
+            if all_ods is None:
+                continue
 
-        all_ods = bundle_wire_ods(bundle)
         if len(all_ods) < 2:
             continue
 
@@ -8,6 +8,8 @@
 #   • Design Rules Check  (overcurrent, voltage drop, wire-size warnings)
 #   • Concentric-twist split suggestions (large wire → 2 smaller parallel)
 #   • Async DB load (QThread) so the UI never freezes on large projects
+#   • Incremental re-check: only circuits touched by a table write are
+#     rebuilt and checked again, and land in the model as row updates
 #   • Rendered wire visuals  (primary + stripe + stripped conductor end)
 #   • Housing thumbnail images in the From/To connector columns
 #
@@ -20,6 +22,7 @@ from PySide6 import QtGui
 from PySide6 import QtWidgets
 
 from . import design_rules as _design_rules
+from . import circuit_index as _circuit_index
 from . import bitmaps as _bitmaps
 from ... import check_types as _check_types
 
@@ -106,16 +109,23 @@ class _BuildWorker(QtCore.QObject):
     progress: QtCore.SignalInstance = QtCore.Signal(int)
 
     @_check_types.do
-    def __init__(self, db):
+    def __init__(self, db, index: _circuit_index.CircuitIndex, circuit_ids: set | None = None):
         """Initialise the :class:`_BuildWorker` instance.
 
         UNKNOWN details are inferred from the callable name and signature.
 
         :param db: Database accessor or connection.
         :type db: UNKNOWN
+        :param index: The editor's circuit index.
+        :type index: :class:`_circuit_index.CircuitIndex`
+        :param circuit_ids: Only build and check these circuits. ``None``
+            builds the index again and then every circuit.
+        :type circuit_ids: set | None
         """
         super().__init__()
         self._db = db
+        self._index = index
+        self._circuit_ids = circuit_ids
 
     @_check_types.do
     def run(self):
@@ -124,12 +134,24 @@ class _BuildWorker(QtCore.QObject):
         UNKNOWN details are inferred from the callable name and signature.
         """
         rows: list[CircuitRow] = []
-        circuits = list(self._db.pjt_circuits_table)
+
+        if self._circuit_ids is None:
+            self._index.build()
+            circuits = list(self._db.pjt_circuits_table)
+        else:
+            table = self._db.pjt_circuits_table
+            circuits = []
+            for db_id in self._circuit_ids:
+                try:
+                    circuits.append(table[db_id])
+                except (KeyError, IndexError):
+                    pass
+
         n = max(len(circuits), 1)
 
         for i, circuit in enumerate(circuits):
             try:
-                row = _build_row(circuit, self._db)
+                row = _build_row(circuit, self._db, self._index)
                 rows.append(row)
             except Exception:  # NOQA
                 pass
@@ -138,7 +160,8 @@ class _BuildWorker(QtCore.QObject):
 
         for row in rows:
             row.issues = _design_rules.run_drt(row)
-            row.suggestions = _design_rules.generate_suggestions(row, self._db)
+            row.suggestions = _design_rules.generate_suggestions(
+                row, self._db, self._index.bundle_wire_ods)
             row.worst_severity = _design_rules.worst_severity(row.issues)
 
         self.finished.emit(rows)
@@ -181,7 +204,7 @@ def _load_housing_pixmap(housing_obj) -> QtGui.QPixmap | None:
 
 
 @_check_types.do
-def _build_row(circuit, db) -> CircuitRow:
+def _build_row(circuit, db, index: _circuit_index.CircuitIndex | None = None) -> CircuitRow:
     """Build the row.
 
     UNKNOWN details are inferred from the callable name and signature.
@@ -190,6 +213,8 @@ def _build_row(circuit, db) -> CircuitRow:
     :type circuit: UNKNOWN
     :param db: Database accessor or connection.
     :type db: UNKNOWN
+    :param index: Circuit index to look the bundles up in.
+    :type index: :class:`_circuit_index.CircuitIndex` | None
     :returns: Return value. UNKNOWN details.
     :rtype: :class:`CircuitRow`
     """
@@ -309,13 +334,13 @@ def _build_row(circuit, db) -> CircuitRow:
             r.num_conductors = _design_rules.safe(part, "num_conductors", 1) or 1
 
     # Bundle routing
-    r.bundle_names = _bundles_for_circuit(circuit, db)
+    r.bundle_names = _bundles_for_circuit(circuit, db, index)
 
     return r
 
 
 @_check_types.do
-def _bundles_for_circuit(circuit, db) -> list[str]:
+def _bundles_for_circuit(circuit, db, index: _circuit_index.CircuitIndex | None = None) -> list[str]:
     """Execute the bundles for circuit operation.
 
     UNKNOWN details are inferred from the callable name and signature.
@@ -324,9 +349,15 @@ def _bundles_for_circuit(circuit, db) -> list[str]:
     :type circuit: UNKNOWN
     :param db: Database accessor or connection.
     :type db: UNKNOWN
+    :param index: When built, answers from its wire -> bundle links
+        instead of scanning every wire of every bundle.
+    :type index: :class:`_circuit_index.CircuitIndex` | None
     :returns: Return value. UNKNOWN details.
     :rtype: list[str]
     """
+    if index is not None and index.built:
+        return index.bundle_names(circuit.db_id)
+
     cw_ids = {_design_rules.safe(w, "db_id")
               for w in (_design_rules.safe(circuit, "wires", []) or [])}
 
@@ -354,6 +385,25 @@ def _bundles_for_circuit(circuit, db) -> list[str]:
     return names
 
 
+@_check_types.do
+def _runs(positions: list[int]) -> list[tuple[int, int]]:
+    """Group row *positions* into ``(first, last)`` runs of adjacent rows.
+
+    :param positions: Row numbers, in any order.
+    :type positions: list[int]
+    :returns: The runs, in row order.
+    :rtype: list[tuple[int, int]]
+    """
+    runs = []
+    for r in sorted(set(positions)):
+        if runs and runs[-1][1] == r - 1:
+            runs[-1] = (runs[-1][0], r)
+        else:
+            runs.append((r, r))
+
+    return runs
+
+
 # ---------------------------------------------------------------------------
 # Qt Model
 # ---------------------------------------------------------------------------
@@ -376,6 +426,9 @@ class CircuitTableModel(QtCore.QAbstractTableModel):
         super().__init__(parent)
         self._rows: list[CircuitRow] = []
 
+        # circuit db id -> position in _rows
+        self._positions: dict[bytes, int] = {}
+
     @_check_types.do
     def load(self, rows: list[CircuitRow]):
         """Execute the load operation.
@@ -387,6 +440,7 @@ class CircuitTableModel(QtCore.QAbstractTableModel):
         """
         self.beginResetModel()
         self._rows = rows
+        self._reindex()
         self.endResetModel()
 
     @_check_types.do
@@ -397,8 +451,76 @@ class CircuitTableModel(QtCore.QAbstractTableModel):
         """
         self.beginResetModel()
         self._rows = []
+        self._positions = {}
         self.endResetModel()
 
+    @_check_types.do
+    def _reindex(self):
+        self._positions = {row.circuit_db_id: i for i, row in enumerate(self._rows)}
+
+    @_check_types.do
+    def row_of(self, circuit_db_id: bytes) -> int:
+        """The model row showing *circuit_db_id*, ``-1`` if none does."""
+        return self._positions.get(circuit_db_id, -1)
+
+    @_check_types.do
+    def update_rows(self, rows: list[CircuitRow]):
+        """
+        Replace the rows of the circuits in *rows* in place and append
+        the ones not shown yet.
+
+        Replaced rows are announced with one ``dataChanged`` per run of
+        adjacent rows and new ones with a single insert, so the view and
+        the filter proxy only revisit what changed.
+
+        :param rows: Freshly built and checked rows.
+        :type rows: list[CircuitRow]
+        """
+        changed = []
+        added = []
+
+        for row in rows:
+            r = self._positions.get(row.circuit_db_id, None)
+            if r is None:
+                added.append(row)
+            else:
+                self._rows[r] = row
+                changed.append(r)
+
+        last_col = len(COLUMNS) - 1
+        for first, last in _runs(changed):
+            self.dataChanged.emit(self.index(first, 0), self.index(last, last_col))
+
+        if added:
+            first = len(self._rows)
+            self.beginInsertRows(QtCore.QModelIndex(), first, first + len(added) - 1)
+            self._rows.extend(added)
+            for r, row in enumerate(added, first):
+                self._positions[row.circuit_db_id] = r
+
+            self.endInsertRows()
+
+    @_check_types.do
+    def remove_rows(self, circuit_db_ids):
+        """
+        Drop the rows of *circuit_db_ids*, one ``beginRemoveRows`` per run
+        of adjacent rows.
+
+        :param circuit_db_ids: The deleted circuits.
+        :type circuit_db_ids: iterable of bytes
+        """
+        rows = [self._positions[db_id] for db_id in circuit_db_ids if db_id in self._positions]
+        if not rows:
+            return
+
+        # last run first, so the earlier positions stay valid
+        for first, last in reversed(_runs(rows)):
+            self.beginRemoveRows(QtCore.QModelIndex(), first, last)
+            del self._rows[first:last + 1]
+            self.endRemoveRows()
+
+        self._reindex()
+
     @_check_types.do
     def row_at(self, index: QtCore.QModelIndex) -> CircuitRow | None:
         """Execute the row at operation.
@@ -690,6 +812,7 @@ class CircuitTableModel(QtCore.QAbstractTableModel):
             self._rows.insert(ins, item)
 
         self.beginResetModel()
+        self._reindex()
         self.endResetModel()
 
         return True
@@ -1364,6 +1487,12 @@ class CircuitTableView(QtWidgets.QTableView):
 # ---------------------------------------------------------------------------
 # Dock
 # ---------------------------------------------------------------------------
+
+# writes are collected this long before the circuits they touched are
+# checked again, so a drag or a multi-row edit is one re-check, not many
+_RECHECK_DELAY_MS = 150
+
+
 class EditorCircuitPanel(QtWidgets.QDockWidget):
     """
     Usage in mainframe.py:
@@ -1372,7 +1501,14 @@ class EditorCircuitPanel(QtWidgets.QDockWidget):
         self.addDockWidget(Qt.BottomDockWidgetArea, self._circuit_dock)
         # after project opens:
         self._circuit_dock.load_project(self.project_db)
+
+    After the first full load the table follows the project by itself:
+    the panel's :class:`~.circuit_index.CircuitIndex` hears every pjt_*
+    write, and only the circuits a write touched are rebuilt and checked
+    again (on the worker thread) and replaced in the model row by row.
     """
+    # emitted by the circuit index's write hook, from whichever thread wrote
+    _index_pending: QtCore.SignalInstance = QtCore.Signal()
 
     @_check_types.do
     def __init__(self, mainframe):
@@ -1386,10 +1522,19 @@ class EditorCircuitPanel(QtWidgets.QDockWidget):
         super().__init__("Circuit Editor", mainframe)
         self._mainframe = mainframe
         self._project_db = None
+        self._index = None
         self._thread = None
         self._worker = None
+        self._detail_db_id = None
         self.setAllowedAreas(QtCore.Qt.DockWidgetArea.AllDockWidgetAreas)
 
+        self._recheck_timer = QtCore.QTimer(self)
+        self._recheck_timer.setSingleShot(True)
+        self._recheck_timer.setInterval(_RECHECK_DELAY_MS)
+        self._recheck_timer.timeout.connect(self._recheck)
+        self._index_pending.connect(
+            self._recheck_timer.start, QtCore.Qt.ConnectionType.QueuedConnection)
+
         self._model = CircuitTableModel(self)
         self._model.cell_edited.connect(self._on_cell_edited)
 
@@ -1462,7 +1607,16 @@ class EditorCircuitPanel(QtWidgets.QDockWidget):
         :param project_db: Value for ``project_db``.
         :type project_db: UNKNOWN
         """
+        if self._index is not None:
+            self._project_db.remove_write_observer(self._index)
+            self._index = None
+
         self._project_db = project_db
+
+        if project_db is not None:
+            self._index = _circuit_index.CircuitIndex(project_db, self._index_pending.emit)
+            project_db.add_write_observer(self._index)
+
         self.refresh()
 
     @_check_types.do
@@ -1481,17 +1635,93 @@ class EditorCircuitPanel(QtWidgets.QDockWidget):
         # flush stale pixmaps on reload
         _bitmaps.WIRE_PIXMAP_CACHE.clear()
 
+        # the build reads the tables as they are now, so whatever was
+        # written up to here is in it
+        self._recheck_timer.stop()
+        self._index.reset_pending()
+
         self._progress.setValue(0)
         self._progress.show()
+        self._start_worker(None, self._on_loaded)
+        self._worker.progress.connect(self._progress.setValue)
+
+    @_check_types.do
+    def _start_worker(self, circuit_ids: set | None, on_finished):
+        """Build and check *circuit_ids* (every circuit for ``None``) on a
+        worker thread and hand the rows to *on_finished*."""
         self._thread = QtCore.QThread(self)
-        self._worker = _BuildWorker(self._project_db)
+        self._worker = _BuildWorker(self._project_db, self._index, circuit_ids)
         self._worker.moveToThread(self._thread)
         self._thread.started.connect(self._worker.run)  # NOQA
-        self._worker.progress.connect(self._progress.setValue)
-        self._worker.finished.connect(self._on_loaded)
+        self._worker.finished.connect(on_finished)
         self._worker.finished.connect(self._thread.quit)
+        self._thread.finished.connect(self._worker.deleteLater)
+        self._thread.finished.connect(self._thread.deleteLater)
+        self._thread.finished.connect(self._on_worker_done)
         self._thread.start()
 
+    @_check_types.do
+    def _on_worker_done(self):
+        """Handle the worker thread finishing; writes made while it ran are
+        checked now."""
+        self._thread = None
+        self._worker = None
+
+        if self._index is not None and self._index.pending:
+            self._recheck_timer.start()
+
+    @_check_types.do
+    def _recheck(self):
+        """
+        Apply the writes queued on the circuit index and check only the
+        circuits they touched.
+
+        Deleted circuits leave the model right away; the touched ones are
+        rebuilt on the worker thread and replace their rows in
+        :meth:`_on_rechecked`. When the index can't be brought up to date
+        from its queue (another project was loaded, or too many writes
+        piled up) everything is built again.
+        """
+        if self._index is None:
+            return
+
+        if self._thread and self._thread.isRunning():
+            # _on_worker_done looks again
+            return
+
+        changes = self._index.apply_pending()
+        if changes is None:
+            self.refresh()
+            return
+
+        touched, removed = changes
+
+        if removed:
+            self._model.remove_rows(removed)
+
+            if self._detail_db_id in removed:
+                self._detail_db_id = None
+                self._detail.show_row(None)
+
+        if touched:
+            self._start_worker(touched, self._on_rechecked)
+
+    @_check_types.do
+    def _on_rechecked(self, rows: list[CircuitRow]):
+        """Handle the rows of re-checked circuits.
+
+        :param rows: Value for ``rows``.
+        :type rows: list[CircuitRow]
+        """
+        self._model.update_rows(rows)
+
+        for row in rows:
+            if row.circuit_db_id == self._detail_db_id:
+                self._detail.show_row(row)
+                break
+
+        self._update_count()
+
     @_check_types.do
     def highlight_circuit(self, circuit_db_id: bytes):
         """Execute the highlight circuit operation.
@@ -1502,17 +1732,13 @@ class EditorCircuitPanel(QtWidgets.QDockWidget):
         :type circuit_db_id: bytes
         """
         self._view.clearSelection()
-        for r in range(self._model.rowCount()):
-            if self._model.data(self._model.index(r, 0),
-                                QtCore.Qt.ItemDataRole.UserRole) == circuit_db_id:
-
-                pi = self._proxy.mapFromSource(self._model.index(r, 0))
+        r = self._model.row_of(circuit_db_id)
+        if r >= 0:
+            pi = self._proxy.mapFromSource(self._model.index(r, 0))
 
-                if pi.isValid():
-                    self._view.selectRow(pi.row())
-                    self._view.scrollTo(pi)
-
-                break
+            if pi.isValid():
+                self._view.selectRow(pi.row())
+                self._view.scrollTo(pi)
 
     # ── Private ───────────────────────────────────────────────────────
     @_check_types.do
@@ -1619,8 +1845,11 @@ class EditorCircuitPanel(QtWidgets.QDockWidget):
         """
         self._detail.show_row(row)
         if row is None:
+            self._detail_db_id = None
             return
 
+        self._detail_db_id = row.circuit_db_id
+
         project = self._mainframe.project
         if project is None:
             return
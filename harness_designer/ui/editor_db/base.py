@@ -11,6 +11,7 @@ from PySide6.QtWidgets import (QTableView, QAbstractItemView, QHeaderView,
                                QPushButton, QHBoxLayout)
 
 from . import edit_dialog as _edit_dialog
+from . import keyset_pager as _keyset_pager
 from ... import config as _config
 from ... import image as _image
 from ... import check_types as _check_types
@@ -104,6 +105,11 @@ class ScrollTracker:
         self._start_query = time.monotonic_ns()
         self._query_elapsed = 0
 
+        # which way the user last scrolled: 1 down, -1 up, 0 not yet --
+        # the side EditorList prefetches rows on (see track())
+        self.direction = 0
+        self._tracked_row = 0
+
     @_check_types.do
     def start_query(self):
         """Start the query.
@@ -150,6 +156,28 @@ class ScrollTracker:
 
         return res
 
+    @_check_types.do
+    def track(self, first_visible_row: int) -> int:
+        """Note the first visible row after a scroll and return the
+        direction of travel.
+
+        Unlike :meth:`get_buffer_size` this is called on every scroll, not
+        only when a row is missing, and doesn't touch the velocity sample.
+
+        :param first_visible_row: The row at the top of the viewport.
+        :type first_visible_row: int
+        :returns: ``1`` scrolling down, ``-1`` up, ``0`` not moved.
+        :rtype: int
+        """
+        if first_visible_row > self._tracked_row:
+            self.direction = 1
+        elif first_visible_row < self._tracked_row:
+            self.direction = -1
+
+        self._tracked_row = first_visible_row
+
+        return self.direction
+
 
 class _EditorModel(QAbstractTableModel):
     """
@@ -402,7 +430,7 @@ class EditorList(QTableView):
 
         self._where_clause = where_clause or ''
         self._where_params = list(where_params or [])
-        self.rows.clear()
+        self._reset_query()
         self.bitmap_indexes.clear()
         self._clear_selection_state()
         self._row_count = self.record_count
@@ -510,7 +538,7 @@ class EditorList(QTableView):
         else:
             self._header_search.pop(col, None)
 
-        self.rows.clear()
+        self._reset_query()
         self.bitmap_indexes.clear()
         self._clear_selection_state()
         self._row_count = self.record_count
@@ -522,15 +550,20 @@ class EditorList(QTableView):
     # ------------------------------------------------------------------
 
     @_check_types.do
-    def _build_query(self) -> str:
-        """Build the paginated SELECT template from ``column_mapping``.
+    def _build_query(self) -> tuple[str, list[str]]:
+        """Build the SELECT the rows are read with from ``column_mapping``.
 
-        Called once at construction.  The static parts (column list, JOIN
-        clauses, table name) are baked in; the dynamic parts are left as
-        ``str.format`` placeholders: ``{sort_clause}``, ``{start_row}``,
-        ``{end_row}``, and ``{where_clause}``.
+        Called once at construction. Only the static parts (column list,
+        JOIN clauses, table name) are in it -- the filter, sort stack and
+        page bounds are added by :class:`~.keyset_pager.KeysetPager` for
+        each read.
+
+        :returns: The statement and the alias of every selected column, in
+            order.
+        :rtype: tuple[str, list[str]]
         """
         select_cols = []
+        aliases = []
         joins = []
 
         for entry in self.column_mapping.values():
@@ -547,37 +580,37 @@ class EditorList(QTableView):
             else:
                 select_cols.append(f't.{field_name} AS {alias}')
 
+            aliases.append(alias)
+
         if self._has_image:
             select_cols.append('t.image_id AS image_id')
+            aliases.append('image_id')
 
-        query = (f'SELECT * FROM (SELECT ROW_NUMBER() OVER '
-                 f'(ORDER BY {{sort_clause}}) AS RowNum, * '
-                 f'FROM (SELECT {", ".join(select_cols)} '
+        query = (f'SELECT {", ".join(select_cols)} '
                  f'FROM {self.__table_name__} AS t '
-                 f'{" ".join(joins)} {{where_clause}}) AS base) AS paged '
-                 f'WHERE RowNum BETWEEN {{start_row}} AND {{end_row}};')
+                 f'{" ".join(joins)}').rstrip()
 
-        return query
+        return query, aliases
 
     @property
     @_check_types.do
     def record_count(self):
         """Return the record count.
 
-        UNKNOWN details are inferred from the callable name and signature.
+        Cached by the pager until the table is written to -- see
+        :attr:`.keyset_pager.KeysetPager.count`.
 
-        :returns: Property value. UNKNOWN details.
-        :rtype: UNKNOWN
+        :returns: Property value.
+        :rtype: int
         """
-        where_body, params = self._combined_where()
+        return self._pager.count
 
-        sql = f'SELECT COUNT(*) FROM {self.table_name} AS t'
-        if where_body:
-            sql += f' WHERE {where_body}'
-            self.table.execute(sql + ';', params)
-        else:
-            self.table.execute(sql + ';')
-        return self.table.fetchall()[0][0]
+    @_check_types.do
+    def _reset_query(self) -> None:
+        """Hand the current sort stack and filter to the pager, dropping
+        every cached row."""
+        where_body, params = self._combined_where()
+        self._pager.set_query(self.sort_columns, where_body, params)
 
     # ------------------------------------------------------------------
     # Multi-column sort helpers
@@ -671,43 +704,29 @@ class EditorList(QTableView):
     def get_obj_id(self, row):
         """Return the obj ID.
 
-        UNKNOWN details are inferred from the callable name and signature.
-
-        :param row: Value for ``row``.
-        :type row: UNKNOWN
-        :returns: Return value. UNKNOWN details.
-        :rtype: UNKNOWN
+        :param row: The (0-based) view row.
+        :type row: int
+        :returns: The database id of the record shown on *row*.
+        :rtype: bytes | None
         """
-        where_body, params = self._combined_where()
-        where_sql = f'WHERE {where_body}' if where_body else ''
-
-        sql = self._effective_query.format(sort_clause=self.sort_clause,
-                                           row=row, start_row=row, end_row=row,
-                                           where_clause=where_sql)
+        row = self.get_row(row)
 
-        if params:
-            self.table.execute(sql, params)
-        else:
-            self.table.execute(sql)
-
-        rows = self.table.fetchall()
-
-        if rows:
-            # rows[0][0] is RowNum; actual id is at index 1
-            return rows[0][1]
+        if row is not None:
+            # row[0] is RowNum; actual id is at index 1
+            return row[1]
 
     @_check_types.do
     def get_row(self, row):
         """Return the row.
 
-        UNKNOWN details are inferred from the callable name and signature.
-
-        :param row: Value for ``row``.
-        :type row: UNKNOWN
-        :returns: Return value. UNKNOWN details.
-        :rtype: UNKNOWN
+        :param row: The (0-based) view row.
+        :type row: int
+        :returns: ``(RowNum, *columns)``, or ``None`` past the end.
+        :rtype: tuple | None
         """
-        if row not in self.rows:
+        res = self._pager.row(row)
+
+        if res is None:
             self.buffer_size = self.scroll_tracker.get_buffer_size(row)
             start_row = max(0, row - self.buffer_size // 2)
             end_row = start_row + self.buffer_size
@@ -715,39 +734,52 @@ class EditorList(QTableView):
             self.current_row = row
             self.needs_pruning = True
 
-        return self.rows.get(row, None)
+            res = self._pager.row(row)
+
+        return res
 
     @_check_types.do
     def get_rows(self, start, stop):
-        """Return the rows.
-
-        UNKNOWN details are inferred from the callable name and signature.
+        """Read rows ``start`` to ``stop - 1`` into the cache, skipping
+        any already in it.
 
-        :param start: Value for ``start``.
-        :type start: UNKNOWN
-        :param stop: Value for ``stop``.
-        :type stop: UNKNOWN
+        :param start: First (0-based) row.
+        :type start: int
+        :param stop: One past the last row.
+        :type stop: int
         """
         self.scroll_tracker.start_query()
+        self._pager.fetch(start, stop)
+        self.scroll_tracker.stop_query()
 
-        where_body, params = self._combined_where()
-        where_sql = f'WHERE {where_body}' if where_body else ''
-
-        sql = self._effective_query.format(sort_clause=self.sort_clause,
-                                           start_row=start, end_row=stop,
-                                           where_clause=where_sql)
+    @_check_types.do
+    def _on_scrolled(self, _):
+        """Queue a prefetch of the rows past the viewport in the direction
+        the user is scrolling (see :meth:`_prefetch`)."""
+        self.scroll_tracker.track(max(0, self.rowAt(0)))
 
-        if params:
-            self.table.execute(sql, params)
-        else:
-            self.table.execute(sql)
+        if not self._prefetch_pending:
+            self._prefetch_pending = True
+            QTimer.singleShot(0, self._prefetch)
 
-        rows = self.table.fetchall()
+    @_check_types.do
+    def _prefetch(self):
+        """Read the next buffer's worth of rows ahead of the viewport.
+
+        Runs from the event loop once the scroll has been painted, so the
+        rows the next scroll step needs are usually cached before it
+        happens. It reads on the GUI thread -- every database access shares
+        the connector's one cursor -- but each read is a short keyset seek
+        from the rows already cached, not a scan.
+        """
+        self._prefetch_pending = False
 
-        if rows:
-            self.rows.update({i + start: rows[i] for i in range(len(rows))})
+        first_row = self.rowAt(0)
+        if first_row < 0:
+            return
 
-        self.scroll_tracker.stop_query()
+        self._pager.prefetch(first_row, self.scroll_tracker.direction,
+                             max(self.buffer_size, self.rowsPerPage()))
 
     @_check_types.do
     def prune_cache(self, current_row, buffer_size):
@@ -760,12 +792,7 @@ class EditorList(QTableView):
         :param buffer_size: Value for ``buffer_size``.
         :type buffer_size: UNKNOWN
         """
-        keep_range = buffer_size * 2
-        min_row = current_row - keep_range
-        max_row = current_row + keep_range
-
-        self.rows = {k: v for k, v in self.rows.items()
-                     if min_row <= k <= max_row}
+        self._pager.prune(current_row, buffer_size * 2)
 
     # ------------------------------------------------------------------
     # Model data helpers (called from _EditorModel)
@@ -1133,8 +1160,7 @@ class EditorList(QTableView):
 
         dlg.exec()
 
-        if row_id in self.rows:
-            del self.rows[row_id]
+        self._pager.rows.pop(row_id, None)
 
         self._model.invalidate_row(row_id)
 
@@ -1177,7 +1203,7 @@ class EditorList(QTableView):
                 self.sort_columns.pop(pos)
 
         self._rebuild_sort_indicators()
-        self.rows.clear()
+        self._reset_query()
         self._clear_selection_state()
         self._model.reset_all()
 
@@ -1213,7 +1239,6 @@ class EditorList(QTableView):
         self._where_clause = ''
         self._where_params: list = []
         self._header_search: dict[str, str] = {}
-        self._effective_query = self._build_query()
 
         self._label = label
         self.table_name = table.__table_name__
@@ -1221,13 +1246,17 @@ class EditorList(QTableView):
         self.visible_row = 0
         self.scroll_tracker = ScrollTracker()
         self.bitmap_indexes = {}
-        self.rows = {}
+
+        # every row read goes through here -- see keyset_pager.KeysetPager
+        self._pager = _keyset_pager.KeysetPager(table, *self._build_query())
+        self._prefetch_pending = False
         self.selected = None
         self.mainframe = mainframe
         self.downloading_images = {}
 
         # [(col_name, 'ASC'|'DESC'), ...]
         self.sort_columns: list[tuple[str, str]] = []
+        self._reset_query()
 
         self.needs_pruning = False
         self.current_row = 0
@@ -1292,6 +1321,7 @@ class EditorList(QTableView):
         self.selectionModel().selectionChanged.connect(self._on_selection_changed)
         self.activated.connect(self._on_activated)
         header.sectionClicked.connect(self._on_header_clicked)
+        self.verticalScrollBar().valueChanged.connect(self._on_scrolled)
 
         self._idle_timer = QTimer(self)
         self._idle_timer.setInterval(200)
@@ -1342,6 +1372,8 @@ class EditorList(QTableView):
         :param __: Value for ``__``.
         :type __: UNKNOWN
         """
+        # only re-counted if the table has been written to since
+        self._row_count = self.record_count
         self._model.reset_all()
         self.viewport().update()
 
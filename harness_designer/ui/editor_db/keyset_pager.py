@@ -0,0 +1,343 @@
+# © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
+
+"""Keyset (seek) pagination for the catalog grids in :mod:`.base`."""
+
+from typing import Any as _Any
+
+import bisect
+import collections
+
+from ... import check_types as _check_types
+
+
+# filters whose row count is kept; every distinct search typed into a grid
+# is a filter of its own, so the least recently used ones are dropped
+_COUNT_CACHE_SIZE = 256
+
+
+class KeysetPager:
+    """
+    Row source for an :class:`~.base.EditorList`.
+
+    The list used to wrap its whole joined query in ``ROW_NUMBER() OVER
+    (ORDER BY ...)`` and ask for ``RowNum BETWEEN start AND end``, so every
+    page -- and ``get_obj_id`` for a single row -- made the database number
+    and sort the entire filtered catalog first. With 200k terminals that is
+    a full scan and sort on the GUI thread each time the user scrolls past
+    the cached rows.
+
+    Here a page is read relative to a row that is already known: the sort
+    key of that row (the values of the active sort columns plus ``id``,
+    which makes every key unique) becomes a ``WHERE`` that seeks past it,
+    and ``ORDER BY ... LIMIT`` returns the page. Ordered by ``id`` alone
+    that is a primary key range read; ordered by anything else the
+    database only has to keep the top ``LIMIT`` rows while it scans rather
+    than sorting everything. Reading backwards (scrolling up) runs the
+    same seek with every direction flipped.
+
+    The key of the first and last row of every page read is kept as an
+    anchor, so a page anywhere near a place the user has already been is
+    a short seek from the closest anchor. Only a jump to somewhere never
+    visited falls back to an ``OFFSET`` from whichever end is closer.
+
+    NULL sorts as the smallest value, which is what both SQLite and MySQL
+    do for ``ORDER BY`` -- the seek predicates are written to agree with
+    that.
+
+    :attr:`count` is cached per table, filter and parameters across every
+    pager and is only thrown away when the table has been written to (see
+    ``TableBase.write_generation``) or when it is among the least recently
+    used once more than ``_COUNT_CACHE_SIZE`` filters are cached. A write
+    also drops the cached rows and anchors the next time any of them is
+    asked for.
+    """
+
+    # (table name, where body, params) -> (write generation, count)
+    _count_cache: collections.OrderedDict[tuple, tuple[int, int]] = collections.OrderedDict()
+
+    @_check_types.do
+    def __init__(self, table, select_sql: str, columns: list[str]):
+        """
+        :param table: The global_db table the list shows.
+        :param select_sql: ``SELECT <columns> FROM <table> AS t <joins>``
+            -- everything but the ``WHERE``.
+        :type select_sql: str
+        :param columns: The alias of every selected column, in order.
+        :type columns: list[str]
+        """
+        self.table = table
+        self._select_sql = select_sql
+        self._key_index = {alias: i + 1 for i, alias in enumerate(columns)}
+
+        self._sort: list[tuple[str, str]] = [('id', 'ASC')]
+        self._where_body = ''
+        self._where_params: list = []
+
+        # position -> (RowNum, *columns) -- RowNum is position + 1, kept so
+        # the list reads the row exactly as it read the ROW_NUMBER() rows
+        self.rows: dict[int, tuple] = {}
+
+        self._anchors: dict[int, tuple] = {}
+        self._anchor_positions: list[int] = []
+        self._generation = self._table_generation()
+
+        self.stats = dict(queries=0, rows=0, prefetched=0, seeks=0, offsets=0)
+
+    @_check_types.do
+    def _table_generation(self) -> int:
+        return getattr(self.table, 'write_generation', 0)
+
+    @_check_types.do
+    def set_query(self, sort_columns: list[tuple[str, str]], where_body: str, where_params: list) -> None:
+        """
+        Use a new sort stack and filter. Every cached row and anchor is
+        dropped; the cached count is kept if the filter didn't change.
+
+        :param sort_columns: ``[(alias, 'ASC'|'DESC'), ...]``.
+        :param where_body: The ``WHERE`` body, without the keyword.
+        :param where_params: Its bound parameters.
+        """
+        sort = list(sort_columns)
+        if not any(alias == 'id' for alias, _ in sort):
+            # makes every key unique, so a seek never skips or repeats a row
+            sort.append(('id', 'ASC'))
+
+        self._sort = sort
+        self._where_body = where_body
+        self._where_params = list(where_params)
+        self.reset()
+
+    @_check_types.do
+    def reset(self) -> None:
+        """Forget every cached row and anchor."""
+        self.rows.clear()
+        self._anchors.clear()
+        self._anchor_positions.clear()
+        self._generation = self._table_generation()
+
+    @_check_types.do
+    def _check_generation(self) -> None:
+        if self._table_generation() != self._generation:
+            self.reset()
+
+    @property
+    @_check_types.do
+    def count(self) -> int:
+        """The number of rows the current filter matches."""
+        generation = self._table_generation()
+        key = (self.table.__table_name__, self._where_body, tuple(self._where_params))
+
+        cache = self._count_cache
+
+        cached = cache.get(key, None)
+        if cached is not None and cached[0] == generation:
+            cache.move_to_end(key)
+            return cached[1]
+
+        sql = f'SELECT COUNT(*) FROM {self.table.__table_name__} AS t'
+        if self._where_body:
+            sql += f' WHERE {self._where_body}'
+            self.table.execute(sql + ';', self._where_params)
+        else:
+            self.table.execute(sql + ';')
+
+        count = self.table.fetchall()[0][0]
+        cache[key] = (generation, count)
+        cache.move_to_end(key)
+
+        while len(cache) > _COUNT_CACHE_SIZE:
+            cache.popitem(last=False)
+
+        return count
+
+    @_check_types.do
+    def row(self, position: int) -> tuple | None:
+        """The cached row at *position*, if it has been read."""
+        self._check_generation()
+        return self.rows.get(position, None)
+
+    @_check_types.do
+    def fetch(self, start: int, stop: int) -> int:
+        """
+        Make sure rows ``start`` to ``stop - 1`` are cached, reading only
+        the ones that aren't.
+
+        :returns: The number of rows read.
+        :rtype: int
+        """
+        self._check_generation()
+
+        rows = self.rows
+        start = max(0, start)
+        stop = min(stop, self.count)
+
+        while start < stop and start in rows:
+            start += 1
+
+        while stop > start and (stop - 1) in rows:
+            stop -= 1
+
+        if start >= stop:
+            return 0
+
+        limit = stop - start
+
+        # the closest anchors outside the range on either side
+        positions = self._anchor_positions
+        index = bisect.bisect_left(positions, start)
+        before = positions[index - 1] if index else None
+
+        index = bisect.bisect_left(positions, stop, index)
+        after = positions[index] if index < len(positions) else None
+
+        gap_before = start - before if before is not None else None
+        gap_after = after - stop + 1 if after is not None else None
+
+        if gap_before is not None and (gap_after is None or gap_before <= gap_after):
+            self.stats['seeks'] += 1
+            result = self._query(self._anchors[before], False, gap_before - 1, limit)
+        elif gap_after is not None:
+            self.stats['seeks'] += 1
+            result = self._query(self._anchors[after], True, gap_after - 1, limit)
+            result.reverse()
+            start = stop - len(result)
+        elif start <= self.count - stop:
+            self.stats['offsets'] += 1
+            result = self._query(None, False, start, limit)
+        else:
+            self.stats['offsets'] += 1
+            result = self._query(None, True, max(0, self.count - stop), limit)
+            result.reverse()
+            start = stop - len(result)
+
+        for i, values in enumerate(result):
+            rows[start + i] = (start + i + 1,) + tuple(values)
+
+        if result:
+            self._add_anchor(start)
+            self._add_anchor(start + len(result) - 1)
+
+        self.stats['rows'] += len(result)
+
+        return len(result)
+
+    @_check_types.do
+    def prefetch(self, position: int, direction: int, size: int) -> int:
+        """
+        Read ahead of *position* in the scroll *direction* (``1`` down,
+        ``-1`` up, ``0`` both ways) by *size* rows past what's visible.
+
+        :returns: The number of rows read.
+        :rtype: int
+        """
+        count = self.count
+        read = 0
+
+        if direction >= 0:
+            read += self.fetch(position, min(count, position + size * 2))
+
+        if direction <= 0:
+            read += self.fetch(max(0, position - size), position)
+
+        self.stats['prefetched'] += read
+
+        return read
+
+    @_check_types.do
+    def prune(self, position: int, keep: int) -> None:
+        """Drop cached rows further than *keep* from *position*. Anchors
+        are kept -- they are what makes coming back cheap."""
+        low = position - keep
+        high = position + keep
+
+        self.rows = {k: v for k, v in self.rows.items() if low <= k <= high}
+
+    @_check_types.do
+    def _add_anchor(self, position: int) -> None:
+        if position in self._anchors:
+            return
+
+        row = self.rows[position]
+        key_index = self._key_index
+        self._anchors[position] = tuple(row[key_index[alias]] for alias, _ in self._sort)
+        bisect.insort(self._anchor_positions, position)
+
+    @_check_types.do
+    def _query(self, key: tuple | None, reverse: bool, offset: int, limit: int) -> list:
+        """
+        Read *limit* rows after *key* (or from the start), skipping
+        *offset* of them first. ``reverse`` reads in the opposite order of
+        the sort stack, i.e. the rows before *key*.
+        """
+        self.stats['queries'] += 1
+
+        sort = self._sort
+        if reverse:
+            sort = [(alias, 'DESC' if direction == 'ASC' else 'ASC') for alias, direction in sort]
+
+        params = list(self._where_params)
+        sql = self._select_sql
+        if self._where_body:
+            sql += f' WHERE {self._where_body}'
+
+        sql = f'SELECT * FROM ({sql}) AS base'
+
+        if key is not None:
+            seek_sql, seek_params = _seek_predicate(sort, key)
+            sql += f' WHERE {seek_sql}'
+            params.extend(seek_params)
+
+        order = ', '.join(f'{alias} {direction}' for alias, direction in sort)
+        sql += f' ORDER BY {order} LIMIT {int(limit)}'
+
+        if offset:
+            sql += f' OFFSET {int(offset)}'
+
+        if params:
+            self.table.execute(sql + ';', params)
+        else:
+            self.table.execute(sql + ';')
+
+        return list(self.table.fetchall())
+
+
+@_check_types.do
+def _seek_predicate(sort: list[tuple[str, str]], key: tuple) -> tuple[str, list[_Any]]:
+    """
+    ``WHERE`` body matching every row that sorts after *key* in *sort*:
+    ``(c1 after v1) OR (c1 = v1 AND c2 after v2) OR ...``.
+
+    NULL is the smallest value: nothing sorts after it descending, and
+    ascending everything that isn't NULL does.
+    """
+    clauses = []
+    params = []
+
+    equal_sql = []
+    equal_params = []
+
+    for (alias, direction), value in zip(sort, key):
+        if direction == 'ASC':
+            if value is None:
+                after_sql, after_params = f'{alias} IS NOT NULL', []
+            else:
+                after_sql, after_params = f'{alias} > ?', [value]
+        elif value is None:
+            after_sql, after_params = None, []
+        else:
+            after_sql, after_params = f'({alias} < ? OR {alias} IS NULL)', [value]
+
+        if after_sql is not None:
+            clauses.append('(' + ' AND '.join(equal_sql + [after_sql]) + ')')
+            params.extend(equal_params + after_params)
+
+        if value is None:
+            equal_sql.append(f'{alias} IS NULL')
+        else:
+            equal_sql.append(f'{alias} = ?')
+            equal_params.append(value)
+
+    if not clauses:
+        return '0 = 1', []
+
+    return ' OR '.join(clauses), params
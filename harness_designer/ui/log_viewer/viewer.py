@@ -132,9 +132,9 @@ class _LogModel(QtCore.QAbstractTableModel):
     UNKNOWN details are inferred from the class name and surrounding code.
     """
 
-    # Column order is fixed and matches self._data's column order exactly
+    # Column order is fixed and matches self._columns' order exactly
     # (build_message(), _create_logfile() and the CSV header all agree on
-    # it), so index.column() can be used as a DataFrame column position
+    # it), so index.column() can be used as a position into self._columns
     # directly instead of going through a name.
     _HEADERS = ['Timestamp', 'Level', 'Message']
     _COLS = ['timestamp', 'level', 'message']
@@ -152,7 +152,11 @@ class _LogModel(QtCore.QAbstractTableModel):
         """
 
         super().__init__(parent)
-        self._data = pd.DataFrame(columns=['timestamp', 'level', 'message'])
+        # One plain list per column rather than a DataFrame: live entries
+        # arrive a chunk at a time for as long as the viewer is open, and
+        # extending three lists is proportional to the chunk, where a
+        # pd.concat() onto the whole model copied everything shown so far.
+        self._columns = ([], [], [])
 
     @_check_types.do
     def rowCount(self, parent=QtCore.QModelIndex()):
@@ -167,7 +171,7 @@ class _LogModel(QtCore.QAbstractTableModel):
         :rtype: UNKNOWN
         """
 
-        return len(self._data)
+        return len(self._columns[0])
 
     @_check_types.do
     def columnCount(self, parent=QtCore.QModelIndex()):
@@ -210,18 +214,17 @@ class _LogModel(QtCore.QAbstractTableModel):
     @_check_types.do
     def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
         row = index.row()
-        if not index.isValid() or row >= len(self._data):
+        if not index.isValid() or row >= len(self._columns[0]):
             return None
 
-        # .iat is pandas' positional scalar accessor - row/column indexes
-        # straight in, no intermediate Series and no name lookup. data()
-        # runs once per visible cell on every repaint/scroll, so avoiding
-        # that per-call Series allocation actually matters here.
+        # Plain list indexing - no pandas accessor, no intermediate
+        # Series. data() runs once per visible cell on every
+        # repaint/scroll, so that per-call overhead actually matters here.
         if role == QtCore.Qt.ItemDataRole.DisplayRole:
-            return str(self._data.iat[row, index.column()])
+            return str(self._columns[index.column()][row])
 
         if role == QtCore.Qt.ItemDataRole.ForegroundRole:
-            level = str(self._data.iat[row, self._LEVEL_COL]).upper()
+            level = str(self._columns[self._LEVEL_COL][row]).upper()
             for key, colour in _LEVEL_COLOURS.items():
                 if key in level:
                     return colour
@@ -241,14 +244,12 @@ class _LogModel(QtCore.QAbstractTableModel):
 
         self.beginResetModel()
 
-        # No copy: nothing here or downstream ever mutates a column on this
-        # DataFrame in place, and every source (log_handler.write(),
-        # read_log(), the filter helpers below) already hands over a
-        # correctly-typed, independently-owned DataFrame.
+        # tolist() gives fresh lists, so the model owns what append_data()
+        # later extends and never writes into the caller's DataFrame.
         if not df.empty:
-            self._data = df
+            self._columns = tuple(df[column].tolist() for column in self._COLS)
         else:
-            self._data = pd.DataFrame(columns=['timestamp', 'level', 'message'])
+            self._columns = ([], [], [])
 
         self.endResetModel()
 
@@ -266,10 +267,11 @@ class _LogModel(QtCore.QAbstractTableModel):
         if df.empty:
             return
 
-        first = len(self._data)
+        first = len(self._columns[0])
         last = first + len(df) - 1
         self.beginInsertRows(QtCore.QModelIndex(), first, last)
-        self._data = pd.concat([self._data, df], ignore_index=True)
+        for values, column in zip(self._columns, self._COLS):
+            values.extend(df[column].tolist())
         self.endInsertRows()
 
 
@@ -449,13 +451,14 @@ class ViewerPanel(QtWidgets.QSplitter):
         self.expanded_items: set = set()
 
         # The full, ever-growing content of the currently-active (still
-        # being written to) log file. Kept up to date by new_data() below,
-        # which only ever runs on this thread (see the bind() call further
-        # down), so nothing needs to lock access to it. Selecting the
-        # active file's tree node reads from here instead of re-parsing it
-        # off disk, and avoids re-reading a file the writer thread might
-        # be appending to at that exact moment.
-        self._active_buffer = pd.DataFrame(columns=['timestamp', 'level', 'message'])
+        # being written to) log file, as the chunks it arrived in. Kept up
+        # to date by new_data() below, which only ever runs on this thread
+        # (see the bind() call further down), so nothing needs to lock
+        # access to it. Selecting the active file's tree node reads from
+        # here (see _active_frame()) instead of re-parsing it off disk,
+        # and avoids re-reading a file the writer thread might be
+        # appending to at that exact moment.
+        self._active_chunks: List[pd.DataFrame] = []
         # True only when the tree's unfiltered active-file node is what's
         # currently selected - date/hour-filtered views and other files
         # are snapshots and don't live-update.
@@ -520,20 +523,37 @@ class ViewerPanel(QtWidgets.QSplitter):
     def _clear_active_buffer(self):
         """Empty the active-file buffer - called when a new, empty log
         file starts, so nothing from the rotated-out file lingers in it."""
-        self._active_buffer = pd.DataFrame(columns=['timestamp', 'level', 'message'])
+        self._active_chunks = []
 
     @_check_types.do
     def _extend_active_buffer(self, df: pd.DataFrame):
         """Add rows to the active-file buffer.
 
         Used both for the initial full read of the active file at startup
-        and for individual live entries as they're written - a concat onto
-        the (empty, at startup) buffer handles a thousand-row DataFrame the
-        same way it handles a single-row one, so there's no separate
-        "initial load" code path.
+        and for the chunks of live entries LogHandler delivers - either
+        way it's just one more chunk, so there's no separate "initial
+        load" code path. Nothing is copied until _active_frame() is asked
+        for the whole thing.
         """
-        self._active_buffer = pd.concat(
-            [self._active_buffer, df], ignore_index=True)
+        if not df.empty:
+            self._active_chunks.append(df)
+
+    @_check_types.do
+    def _active_frame(self) -> pd.DataFrame:
+        """The active-file buffer as a single DataFrame.
+
+        The chunks are concatenated once, here, and the result kept as the
+        only chunk - so a second call with nothing new in between is free,
+        and live updates never pay for a copy of everything before them.
+        """
+        if not self._active_chunks:
+            return pd.DataFrame(columns=['timestamp', 'level', 'message'])
+
+        if len(self._active_chunks) > 1:
+            self._active_chunks = [
+                pd.concat(self._active_chunks, ignore_index=True)]
+
+        return self._active_chunks[0]
 
     @_check_types.do
     def _load_current_log_initial(self):
@@ -549,8 +569,8 @@ class ViewerPanel(QtWidgets.QSplitter):
                 df = self._read_log_file(current_log_path)
                 self._extend_active_buffer(df)
                 self._viewing_active = True
-                self.current_data = self._active_buffer
-                self.log_list.SetData(self._active_buffer)
+                self.current_data = self._active_frame()
+                self.log_list.SetData(self.current_data)
 
         except Exception as e:
             self.logger.error(f"Failed to load initial log: {e}")
@@ -558,8 +578,8 @@ class ViewerPanel(QtWidgets.QSplitter):
     @_check_types.do
     def new_data(self, data=None):
         """Called via CallAfter, always on the main thread: `data` is a
-        DataFrame for a new entry, or a RotationEvent for a rotation - see
-        LogHandler.bind()."""
+        DataFrame of newly written entries, or a RotationEvent for a
+        rotation - see LogHandler.bind()."""
 
         if self._is_destroyed:
             return
@@ -567,14 +587,16 @@ class ViewerPanel(QtWidgets.QSplitter):
         if isinstance(data, RotationEvent):
             self._handle_rotation(data)
         else:
-            self._handle_new_row(data)
+            self._handle_new_rows(data)
 
     @_check_types.do
-    def _handle_new_row(self, df: pd.DataFrame):
-        """A single entry was written to the still-open active file."""
+    def _handle_new_rows(self, df: pd.DataFrame):
+        """A chunk of entries was written to the still-open active file -
+        everything written since the last chunk, however many that is
+        (LogHandler coalesces them, see LogHandler._deliver())."""
         self._extend_active_buffer(df)
         if self._viewing_active:
-            # AppendData scrolls the new row into view only if the view
+            # AppendData scrolls the new rows into view only if the view
             # was already scrolled to the bottom.
             self.log_list.AppendData(df)
 
@@ -591,9 +613,10 @@ class ViewerPanel(QtWidgets.QSplitter):
         """
         # Was the tail of the file that just rotated out what was on
         # screen? Check before clearing anything - AppendData() for the
-        # entry that triggered this rotation has already run by this
-        # point (write() notifies before checking the size), so this
-        # reflects "were they following the file that just closed."
+        # chunk that triggered this rotation has already run by this
+        # point (LogHandler delivers what it wrote before the
+        # RotationEvent), so this reflects "were they following the file
+        # that just closed."
         was_following_tail = self._viewing_active and self.log_list.is_at_bottom()
         was_viewing_active = self._viewing_active
 
@@ -605,8 +628,8 @@ class ViewerPanel(QtWidgets.QSplitter):
             # file. _viewing_active stays True.
             active_path = self.logger.log_handler.get_current_log_path()
             self._select_tree_item_for_path(active_path)
-            self.current_data = self._active_buffer
-            self.log_list.SetData(self._active_buffer)
+            self.current_data = self._active_frame()
+            self.log_list.SetData(self.current_data)
         elif was_viewing_active:
             # Was reading the file that just rotated out, scrolled away
             # from its tail - leave the displayed content exactly as-is,
@@ -701,8 +724,8 @@ class ViewerPanel(QtWidgets.QSplitter):
             # Already have the full, up-to-date content in memory via
             # new_data() - no need to re-read it off disk (and no risk of
             # reading it while the writer thread is mid-append).
-            self.current_data = self._active_buffer
-            self.log_list.SetData(self._active_buffer)
+            self.current_data = self._active_frame()
+            self.log_list.SetData(self.current_data)
         elif item_type == 'file':
             self._load_log_data(data['path'])
         elif item_type == 'date':
@@ -795,6 +795,9 @@ class MainFrame(QtWidgets.QMainWindow):
             _run('Closing Object Editor....', self.editor_obj.Destroy, 7)
             _run('Closing Assembly Editor....', self.editor_assembly.Destroy, 8)
             _run('Closing Log Viewer....', self.log_viewer.Destroy, 9)
+            if self.project_db is not None:
+                self.project_db.flush()
+
             _run('Closing Database Connection....', self.db_connector.close, 10)
 
             _app.CallLater(_finished)
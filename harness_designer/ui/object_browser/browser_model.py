@@ -0,0 +1,510 @@
+# © 2025-2026 Kevin G. Schlosser <kevin.g.schlosser@gmail.com>
+
+"""Lazy item model behind the object browser tree."""
+
+from typing import Callable as _Callable
+
+import time
+import weakref
+
+from PySide6 import QtCore
+
+from ... import check_types as _check_types
+
+
+# Item data role marking a node as the canonical entry for the object it
+# references -- the one under its category (or, for a wire service loop,
+# under its wire) -- as opposed to a plain-text cross-reference mention
+# nested under a *different* object (e.g. "Housing: X" under a Boot).
+CANONICAL_ROLE = QtCore.Qt.ItemDataRole.UserRole + 1
+
+
+class Node:
+    """
+    One row of the object browser tree.
+
+    ``ref`` is a weak reference to the object the row stands for (``None``
+    for category and group rows) and ``key`` is its ``id()`` for canonical
+    rows. ``builder`` produces the row's cross-reference children the first
+    time the row is expanded and is dropped once it has run; until then the
+    row only holds the canonical children added to it directly (a wire's
+    service loop).
+    """
+
+    __slots__ = ('parent', 'row', 'label', 'ref', 'key', 'canonical', 'children',
+                 'builder', 'expandable', 'staged', '__weakref__')
+
+    def __init__(self, label: str, ref: weakref.ref | None = None,
+                 builder: _Callable[[], list["Node"]] | None = None,
+                 expandable: bool = False, canonical: bool = False,
+                 children: list["Node"] | None = None):
+        self.parent: "Node | None" = None
+        self.row = 0
+        self.label = label
+        self.ref = ref
+        self.key = None
+        self.canonical = canonical
+        self.children: list["Node"] = []
+        self.builder = builder
+        self.expandable = expandable or builder is not None
+        self.staged = False
+
+        if children:
+            for child in children:
+                self.append(child)
+
+    def append(self, child: "Node") -> None:
+        child.parent = self
+        child.row = len(self.children)
+        self.children.append(child)
+
+    def renumber(self, start: int = 0) -> None:
+        children = self.children
+        for i in range(start, len(children)):
+            children[i].row = i
+
+    def walk(self):
+        """Every node below this one, depth first, without building any
+        unexpanded rows."""
+        stack = list(reversed(self.children))
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+
+class BrowserModel(QtCore.QAbstractItemModel):
+    """
+    :class:`QtCore.QAbstractItemModel` over a tree of :class:`Node`.
+
+    The browser used to be a ``QTreeWidget`` holding an item for every
+    object *and* for every cross-reference under it (a housing's cavities,
+    a circuit's wires and terminals, ...), all created while the project
+    loaded, each one a separate insert into the widget. A project with 20k
+    parts built several times that many items before the window showed,
+    and every collected object walked the whole tree looking for dead
+    items.
+
+    Here an object costs one :class:`Node` under its category when it is
+    added. Its cross-reference rows are built by the node's ``builder``
+    when the row is first expanded (Qt asks through :meth:`canFetchMore` /
+    :meth:`fetchMore`), and are read from the database objects as they are
+    at that moment. Canonical nodes are kept in a map keyed by ``id()`` of
+    the object they stand for, so finding the row for a selection, and
+    removing the row of an object that has been collected, don't search
+    the tree.
+
+    Between :meth:`begin_batch` and :meth:`end_batch` (a project load)
+    added nodes are staged on their category and nothing is signalled;
+    :meth:`end_batch` attaches all of them in one model reset. The tree
+    stays consistent while staged -- the view can repaint between the load
+    stages -- it just doesn't show the staged objects yet.
+
+    ``stats`` counts ``added``, ``built`` (rows built on expand),
+    ``removed`` and ``resets``, plus ``batch_ms`` of the last
+    :meth:`end_batch`.
+    """
+
+    @_check_types.do
+    def __init__(self, categories: tuple[str, ...], parent: QtCore.QObject | None = None):
+        super().__init__(parent)
+
+        self._category_labels = categories
+        self._root = Node('')
+        self._categories: dict[str, Node] = {}
+
+        # id(obj) -> canonical node
+        self._nodes: dict[int, Node] = {}
+
+        self._batching = False
+        # insertion ordered; a dict so a staged row can be dropped cheaply
+        self._staged: dict[Node, None] = {}
+
+        self._dead: list[Node] = []
+        self._dead_pending = False
+
+        self.stats = dict(added=0, built=0, removed=0, resets=0, batch_ms=0.0)
+
+        self._build_root()
+
+    @_check_types.do
+    def _build_root(self) -> None:
+        self._root = Node('')
+        self._categories = {}
+
+        top = Node('root', expandable=True)
+        self._root.append(top)
+
+        for label in self._category_labels:
+            node = Node(label, expandable=True)
+            top.append(node)
+            self._categories[label] = node
+
+    @property
+    @_check_types.do
+    def top(self) -> Node:
+        """The single top-level ``root`` row the categories hang off."""
+        return self._root.children[0]
+
+    @_check_types.do
+    def category(self, label: str) -> Node | None:
+        return self._categories.get(label, None)
+
+    @_check_types.do
+    def reset(self) -> None:
+        """Drop every row and go back to empty categories."""
+        self.beginResetModel()
+        self._build_root()
+        self._nodes.clear()
+        self._staged.clear()
+        self._dead.clear()
+        self._batching = False
+        self.endResetModel()
+
+        self.stats['resets'] += 1
+
+    @_check_types.do
+    def begin_batch(self) -> None:
+        """Stage added nodes until :meth:`end_batch`."""
+        self._batching = True
+
+    @_check_types.do
+    def end_batch(self) -> None:
+        """Attach every staged node in a single model reset."""
+        self._batching = False
+
+        staged = self._staged
+        if not staged:
+            return
+
+        start = time.perf_counter()
+
+        self.beginResetModel()
+
+        for node in staged:
+            node.staged = False
+            node.parent.append(node)
+
+        self._staged = {}
+        self.endResetModel()
+
+        self.stats['resets'] += 1
+        self.stats['batch_ms'] = (time.perf_counter() - start) * 1000.0
+
+    # ------------------------------------------------------------------
+    # structure
+    # ------------------------------------------------------------------
+
+    @_check_types.do
+    def _attached(self, node: Node) -> bool:
+        # nodes below a staged node aren't part of the model yet either
+        while node is not None:
+            if node.staged:
+                return False
+            node = node.parent
+
+        return True
+
+    @_check_types.do
+    def add(self, parent: Node, node: Node, obj) -> None:
+        """
+        Add the canonical *node* for *obj* as the last child of *parent*.
+
+        The row is removed by itself once *obj* is collected.
+        """
+        node.canonical = True
+        node.ref = weakref.ref(obj, self._dead_callback(node))
+        node.key = id(obj)
+        self._nodes[node.key] = node
+        self.stats['added'] += 1
+
+        if self._batching and parent.parent is self.top:
+            # rows added straight under a category are held back until
+            # end_batch; the parent is set so the node knows where it goes,
+            # but the category's row count doesn't change under the view.
+            # A row added under an already staged row (a wire's service
+            # loop) just rides along with it.
+            node.staged = True
+            node.parent = parent
+            self._staged[node] = None
+            return
+
+        if not self._attached(parent):
+            parent.append(node)
+            return
+
+        row = len(parent.children)
+        self.beginInsertRows(self.index_of_node(parent), row, row)
+        parent.append(node)
+        self.endInsertRows()
+
+    @_check_types.do
+    def mention(self, label: str, obj) -> Node:
+        """A cross-reference row for *obj* -- removed by itself once *obj*
+        is collected, like the canonical ones."""
+        node = Node(label)
+        if obj is not None:
+            node.ref = weakref.ref(obj, self._dead_callback(node))
+
+        return node
+
+    @_check_types.do
+    def _dead_callback(self, node: Node):
+        node_ref = weakref.ref(node)
+
+        def _callback(_):
+            dead = node_ref()
+            if dead is not None:
+                self._dead.append(dead)
+                self._schedule_remove()
+
+        return _callback
+
+    @_check_types.do
+    def _schedule_remove(self) -> None:
+        # weakref callbacks run wherever the collector happens to run;
+        # the rows are removed from the event loop instead
+        if not self._dead_pending:
+            self._dead_pending = True
+            QtCore.QTimer.singleShot(0, self._remove_dead)
+
+    @_check_types.do
+    def _remove_dead(self) -> None:
+        self._dead_pending = False
+        dead = self._dead
+        self._dead = []
+
+        self.remove_nodes(dead)
+
+    @_check_types.do
+    def remove(self, node: Node) -> None:
+        """Remove *node* and everything below it."""
+        self.remove_nodes([node])
+
+    @_check_types.do
+    def remove_nodes(self, nodes: list[Node]) -> None:
+        """
+        Remove every node in *nodes* and everything below them.
+
+        A single row goes through ``beginRemoveRows``. When several rows
+        of the same parent go at once (a group of objects deleted, or
+        collected, together) they are removed as one layout change
+        instead, so the siblings are renumbered once rather than once per
+        removed row.
+        """
+        groups: dict[int, tuple[Node, list[Node]]] = {}
+
+        for node in nodes:
+            parent = node.parent
+            if parent is None:
+                # already gone, with an ancestor or a reset
+                continue
+
+            for child in [node] + list(node.walk()):
+                if child.key is not None and self._nodes.get(child.key, None) is child:
+                    del self._nodes[child.key]
+
+            self.stats['removed'] += 1
+
+            if node.staged:
+                del self._staged[node]
+                node.parent = None
+                continue
+
+            if node.row >= len(parent.children) or parent.children[node.row] is not node:
+                continue
+
+            if id(parent) not in groups:
+                groups[id(parent)] = (parent, [])
+
+            groups[id(parent)][1].append(node)
+
+        for parent, children in groups.values():
+            attached = self._attached(parent)
+
+            if len(children) == 1:
+                node = children[0]
+
+                if attached:
+                    self.beginRemoveRows(self.index_of_node(parent), node.row, node.row)
+
+                del parent.children[node.row]
+                parent.renumber(node.row)
+                node.parent = None
+
+                if attached:
+                    self.endRemoveRows()
+
+                continue
+
+            if attached:
+                self.layoutAboutToBeChanged.emit()
+
+            first = min(node.row for node in children)
+            removed = set(id(node) for node in children)
+            parent.children = [node for node in parent.children if id(node) not in removed]
+            parent.renumber(first)
+
+            for node in children:
+                node.parent = None
+
+            if attached:
+                self._update_persistent()
+                self.layoutChanged.emit()
+
+    @_check_types.do
+    def _update_persistent(self) -> None:
+        # re-point the view's persistent indexes (expanded rows, the
+        # current row) after a layout change; rows that went away become
+        # invalid
+        old = self.persistentIndexList()
+        new = []
+
+        for index in old:
+            node = index.internalPointer()
+
+            current = node
+            while current is not None and current is not self._root:
+                current = current.parent
+
+            if current is None:
+                new.append(QtCore.QModelIndex())
+            else:
+                new.append(self.createIndex(node.row, index.column(), node))
+
+        self.changePersistentIndexList(old, new)
+
+    @_check_types.do
+    def node_of(self, obj) -> Node | None:
+        """The canonical node of *obj*, if it has one."""
+        node = self._nodes.get(id(obj), None)
+        if node is None or node.ref is None or node.ref() is not obj:
+            return None
+
+        return node
+
+    @_check_types.do
+    def index_of_node(self, node: Node) -> QtCore.QModelIndex:
+        if node is self._root or node.parent is None:
+            return QtCore.QModelIndex()
+
+        return self.createIndex(node.row, 0, node)
+
+    @_check_types.do
+    def index_of(self, obj) -> QtCore.QModelIndex:
+        """The index of the canonical row of *obj*; invalid if it has none
+        or it is still staged."""
+        node = self.node_of(obj)
+        if node is None or not self._attached(node):
+            return QtCore.QModelIndex()
+
+        return self.index_of_node(node)
+
+    @_check_types.do
+    def node(self, index: QtCore.QModelIndex) -> Node:
+        if not index.isValid():
+            return self._root
+
+        return index.internalPointer()
+
+    @_check_types.do
+    def populate(self, node: Node) -> None:
+        """Build the cross-reference rows of *node* if they haven't been."""
+        builder = node.builder
+        if builder is None:
+            return
+
+        node.builder = None
+        children = builder()
+        if not children:
+            return
+
+        self.stats['built'] += len(children)
+
+        attached = self._attached(node)
+        if attached:
+            self.beginInsertRows(self.index_of_node(node), 0, len(children) - 1)
+
+        # cross-references go ahead of any canonical children already
+        # there, the order the tree always showed them in
+        existing = node.children
+        node.children = []
+        for child in children:
+            node.append(child)
+
+        for child in existing:
+            node.append(child)
+
+        if attached:
+            self.endInsertRows()
+
+    @_check_types.do
+    def populate_all(self, node: Node | None = None) -> None:
+        """Build every unexpanded row below *node* (the whole tree by
+        default) -- Expand All and path searches need them."""
+        stack = [node if node is not None else self.top]
+        while stack:
+            current = stack.pop()
+            self.populate(current)
+            stack.extend(current.children)
+
+    # ------------------------------------------------------------------
+    # QAbstractItemModel
+    # ------------------------------------------------------------------
+
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        parent_node = self.node(parent)
+        if column != 0 or row < 0 or row >= len(parent_node.children):
+            return QtCore.QModelIndex()
+
+        return self.createIndex(row, 0, parent_node.children[row])
+
+    def parent(self, index=QtCore.QModelIndex()):  # NOQA
+        if not index.isValid():
+            return QtCore.QModelIndex()
+
+        parent = index.internalPointer().parent
+        if parent is None or parent is self._root:
+            return QtCore.QModelIndex()
+
+        return self.createIndex(parent.row, 0, parent)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.column() > 0:
+            return 0
+
+        return len(self.node(parent).children)
+
+    def columnCount(self, _parent=QtCore.QModelIndex()):
+        return 1
+
+    def hasChildren(self, parent=QtCore.QModelIndex()):
+        node = self.node(parent)
+        return bool(node.children) or node.expandable
+
+    def canFetchMore(self, parent):
+        return self.node(parent).builder is not None
+
+    def fetchMore(self, parent):
+        self.populate(self.node(parent))
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        node = index.internalPointer()
+
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return node.label
+        if role == QtCore.Qt.ItemDataRole.UserRole:
+            return node.ref
+        if role == CANONICAL_ROLE:
+            return node.canonical
+
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return QtCore.Qt.ItemFlag.NoItemFlags
+
+        return QtCore.Qt.ItemFlag.ItemIsEnabled | QtCore.Qt.ItemFlag.ItemIsSelectable
@@ -27,6 +27,7 @@ from ...objects import wire_service_loop as _wire_service_loop
 
 from .. import dock_base as _dock_base
 from ... import check_types as _check_types
+from . import browser_model as _browser_model
 
 if TYPE_CHECKING:
     from .. import mainframe as _mainframe
@@ -242,6 +243,23 @@ class ObjectBrowser(_dock_base.DockBase):
 
         self._ui_obj.reset()
 
+    @_check_types.do
+    def begin_load(self):
+        """
+        Hold back the rows of objects added during a project load; see
+        :meth:`ObjectBrowserPanel.begin_load`.
+        """
+
+        self._ui_obj.begin_load()
+
+    @_check_types.do
+    def end_load(self):
+        """
+        Show every row held back since :meth:`begin_load`.
+        """
+
+        self._ui_obj.end_load()
+
     @_check_types.do
     def set_selected(self, obj):
         """
@@ -281,13 +299,13 @@ class ObjectBrowser(_dock_base.DockBase):
         return self._ui_obj
 
 
-class _BrowserTree(QtWidgets.QTreeWidget):
-    """Tree widget backing :class:`ObjectBrowserPanel`.
+class _BrowserTree(QtWidgets.QTreeView):
+    """Tree view backing :class:`ObjectBrowserPanel`.
 
-    Moving to a different item -- by clicking it *or* by arrow-key
-    navigation, Qt fires the same :attr:`currentItemChanged` signal either
-    way -- selects that item's object in every editor, but only after a
-    short delay. This does double duty:
+    Moving to a different row -- by clicking it *or* by arrow-key
+    navigation, Qt fires the same ``currentChanged`` signal either way --
+    selects that row's object in every editor, but only after a short
+    delay. This does double duty:
 
     * A double click is delivered by Qt as a normal press first (see the
       identical problem/solution in :class:`~..editor_db.base.EditorList`),
@@ -298,53 +316,59 @@ class _BrowserTree(QtWidgets.QTreeWidget):
       the same learned double-click speed :class:`EditorList` maintains, so
       the feel is consistent app-wide instead of a second hand-picked
       constant.
-    * Holding an arrow key re-fires ``currentItemChanged`` for every row
-      passed over; restarting the same timer on each one means only the row
-      the user actually stops on ends up selected/re-centered, instead of
-      every transient row along the way.
+    * Holding an arrow key re-fires ``currentChanged`` for every row passed
+      over; restarting the same timer on each one means only the row the
+      user actually stops on ends up selected/re-centered, instead of every
+      transient row along the way.
     """
 
     _SELECT_MARGIN = 1.5
     _SELECT_MIN_MS = 150
 
     @_check_types.do
-    def __init__(self, panel: "ObjectBrowserPanel"):
+    def __init__(self, panel: "ObjectBrowserPanel", model: _browser_model.BrowserModel):
         """
         Initialise the :class:`_BrowserTree` instance.
 
-        :param panel: Owning panel, used to resolve tree items to objects.
+        :param panel: Owning panel, used to resolve rows to objects.
         :type panel: :class:`ObjectBrowserPanel`
+        :param model: Model the view shows.
+        :type model: :class:`_browser_model.BrowserModel`
         """
 
         super().__init__(panel)
         self._panel = panel
         self._pending_ref = None
 
+        # every row is one line of text; lets the view skip measuring rows
+        self.setUniformRowHeights(True)
+        self.setModel(model)
+
         self._select_timer = QtCore.QTimer(self)
         self._select_timer.setSingleShot(True)
         self._select_timer.timeout.connect(self._fire_pending_select)  # NOQA
 
-        self.currentItemChanged.connect(self._on_current_item_changed)  # NOQA
+        self.selectionModel().currentChanged.connect(self._on_current_changed)  # NOQA
 
     @_check_types.do
-    def _on_current_item_changed(self, current, _previous):
+    def _on_current_changed(self, current, _previous):
         """
         Schedule (or cancel) the deferred cross-editor select whenever the
-        current item changes, from a click or from keyboard navigation.
+        current row changes, from a click or from keyboard navigation.
 
-        :param current: Newly current item, or ``None``.
-        :type current: :class:`QtWidgets.QTreeWidgetItem` | None
-        :param _previous: Previously current item (unused).
-        :type _previous: :class:`QtWidgets.QTreeWidgetItem` | None
+        :param current: Newly current index (invalid for none).
+        :type current: :class:`QtCore.QModelIndex`
+        :param _previous: Previously current index (unused).
+        :type _previous: :class:`QtCore.QModelIndex`
         """
 
         self._select_timer.stop()
         self._pending_ref = None
 
-        if current is None:
+        if not current.isValid():
             return
 
-        ref = current.data(0, QtCore.Qt.ItemDataRole.UserRole)
+        ref = self.model().node(current).ref
         if ref is None or ref() is None:
             return
 
@@ -410,34 +434,32 @@ class _BrowserTree(QtWidgets.QTreeWidget):
 class ObjectBrowserPanel(QtWidgets.QWidget):
     """
     Represent an object browser panel in :mod:`harness_designer.ui.object_browser.objectbrowser`.
+
+    The rows live in a :class:`_browser_model.BrowserModel`. Each ``add_*``
+    method adds the object's own row under its category and hands the
+    model a builder for the cross-reference rows under it (a boot's
+    housing, a circuit's wires, ...); those are only built when the row is
+    expanded. See the model for the batching done during a project load.
     """
 
-    # Item data role marking an item as the canonical entry for the object
-    # it references -- the one under its category (or, for a wire service
-    # loop, under its wire) -- as opposed to a plain-text cross-reference
-    # mention nested under a *different* object (e.g. "Housing: X" under a
-    # Boot). Search only matches canonical entries; see _mark_canonical.
-    _CANONICAL_ROLE = QtCore.Qt.ItemDataRole.UserRole + 1
-
-    # (label shown in the search category dropdown, attribute holding the
-    # live category root item) -- built once in reset(), re-read fresh by
-    # _category_roots() every search since reset() rebuilds the items.
-    _CATEGORY_ATTRS = (
-        ('Boots', '_boots'),
-        ('Bundles', '_bundles'),
-        ('Cavities', '_cavities'),
-        ('Circuits', '_circuits'),
-        ('Covers', '_covers'),
-        ('CPA Locks', '_cpa_locks'),
-        ('Housings', '_housings'),
-        ('Notes', '_notes'),
-        ('Seals', '_seals'),
-        ('Splices', '_splices'),
-        ('Terminals', '_terminals'),
-        ('TPA Locks', '_tpa_locks'),
-        ('Transitions', '_transitions'),
-        ('Wires', '_wires'),
-        ('Wire Markers', '_wire_markers'),
+    # Labels of the category rows, in display order; also the choices of
+    # the search category dropdown.
+    _CATEGORIES = (
+        'Boots',
+        'Bundles',
+        'Cavities',
+        'Circuits',
+        'Covers',
+        'CPA Locks',
+        'Housings',
+        'Notes',
+        'Seals',
+        'Splices',
+        'Terminals',
+        'TPA Locks',
+        'Transitions',
+        'Wires',
+        'Wire Markers',
     )
 
     @_check_types.do
@@ -454,10 +476,11 @@ class ObjectBrowserPanel(QtWidgets.QWidget):
 
         self._objects = []
         self._selected = None
-        self._search_matches: list[QtWidgets.QTreeWidgetItem] = []
         self._search_index = -1
 
-        self._treectrl = _BrowserTree(self)
+        self._model = _browser_model.BrowserModel(self._CATEGORIES, self)
+
+        self._treectrl = _BrowserTree(self, self._model)
         self._treectrl.setHeaderHidden(True)
         self._treectrl.setRootIsDecorated(True)
         self._treectrl.setSelectionMode(
@@ -470,7 +493,7 @@ class ObjectBrowserPanel(QtWidgets.QWidget):
 
         self._search_category = QtWidgets.QComboBox(self)
         self._search_category.addItem('All Categories')
-        for label, _attr in self._CATEGORY_ATTRS:
+        for label in self._CATEGORIES:
             self._search_category.addItem(label)
         self._search_category.currentIndexChanged.connect(self._reset_search)  # NOQA
 
@@ -480,7 +503,7 @@ class ObjectBrowserPanel(QtWidgets.QWidget):
         self._search_status = QtWidgets.QLabel('', self)
 
         self._expand_all_button = QtWidgets.QPushButton('Expand All', self)
-        self._expand_all_button.clicked.connect(self._treectrl.expandAll)  # NOQA
+        self._expand_all_button.clicked.connect(self._expand_all)  # NOQA
 
         self._collapse_all_button = QtWidgets.QPushButton('Collapse All', self)
         self._collapse_all_button.clicked.connect(self._treectrl.collapseAll)  # NOQA
@@ -504,139 +527,111 @@ class ObjectBrowserPanel(QtWidgets.QWidget):
         h_layout.addWidget(self._treectrl)
         v_layout.addLayout(h_layout)
 
-        self._root: QtWidgets.QTreeWidgetItem = None
-        self._boots: QtWidgets.QTreeWidgetItem = None
-        self._bundles: QtWidgets.QTreeWidgetItem = None
-        self._cavities: QtWidgets.QTreeWidgetItem = None
-        self._circuits: QtWidgets.QTreeWidgetItem = None
-        self._covers: QtWidgets.QTreeWidgetItem = None
-        self._cpa_locks: QtWidgets.QTreeWidgetItem = None
-        self._housings: QtWidgets.QTreeWidgetItem = None
-        self._notes: QtWidgets.QTreeWidgetItem = None
-        self._seals: QtWidgets.QTreeWidgetItem = None
-        self._splices: QtWidgets.QTreeWidgetItem = None
-        self._terminals: QtWidgets.QTreeWidgetItem = None
-        self._tpa_locks: QtWidgets.QTreeWidgetItem = None
-        self._transitions: QtWidgets.QTreeWidgetItem = None
-        self._wires: QtWidgets.QTreeWidgetItem = None
-        self._wire_markers: QtWidgets.QTreeWidgetItem = None
-        self._weakrefs = []
-
-    @_check_types.do
-    def _append_item(self, parent: QtWidgets.QTreeWidgetItem, label: str,  # NOQA
-                     has_children: bool = False) -> QtWidgets.QTreeWidgetItem:
-        """
-        Execute the append item operation.
-
-        :param parent: Parent object.
-        :type parent: :class:`QtWidgets.QTreeWidgetItem`
+    @property
+    @_check_types.do
+    def model(self) -> _browser_model.BrowserModel:
+        return self._model
 
-        :param label: Value for ``label``.
-        :type label: str
+    @_check_types.do
+    def reset(self) -> None:
+        """
+        Execute the reset operation.
+        """
 
-        :param has_children: Boolean flag for whether children is available.
-        :type has_children: bool
+        self._model.reset()
+        self._reset_search()
 
-        :rtype: :class:`QtWidgets.QTreeWidgetItem`
+    @_check_types.do
+    def begin_load(self) -> None:
+        """
+        Hold back the rows of every object added from here on until
+        :meth:`end_load`, which shows them all in one model reset.
         """
 
-        item = QtWidgets.QTreeWidgetItem(parent, [label])
-        if has_children:
-            item.setChildIndicatorPolicy(
-                QtWidgets.QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator)
-        return item
+        self._model.begin_batch()
 
     @_check_types.do
-    def reset(self) -> None:
+    def end_load(self) -> None:
         """
-        Execute the reset operation.
+        Show every row added since :meth:`begin_load`.
         """
 
-        self._treectrl.clear()
-        self._root = QtWidgets.QTreeWidgetItem(self._treectrl, ['root'])
-        self._treectrl.addTopLevelItem(self._root)
+        self._model.end_batch()
 
-        self._boots = self._append_item(self._root, 'Boots', True)
-        self._bundles = self._append_item(self._root, 'Bundles', True)
-        self._cavities = self._append_item(self._root, 'Cavities', True)
-        self._circuits = self._append_item(self._root, 'Circuits', True)
-        self._covers = self._append_item(self._root, 'Covers', True)
-        self._cpa_locks = self._append_item(self._root, 'CPA Locks', True)
-        self._housings = self._append_item(self._root, 'Housings', True)
-        self._notes = self._append_item(self._root, 'Notes', True)
-        self._seals = self._append_item(self._root, 'Seals', True)
-        self._splices = self._append_item(self._root, 'Splices', True)
-        self._terminals = self._append_item(self._root, 'Terminals', True)
-        self._tpa_locks = self._append_item(self._root, 'TPA Locks', True)
-        self._transitions = self._append_item(self._root, 'Transitions', True)
-        self._wires = self._append_item(self._root, 'Wires', True)
-        self._wire_markers = self._append_item(self._root, 'Wire Markers', True)
+    @_check_types.do
+    def _expand_all(self) -> None:
+        """Build every row that hasn't been expanded yet, then expand the
+        whole tree."""
 
-        self._weakrefs = []
+        self._model.populate_all()
+        self._treectrl.expandAll()
 
     @_check_types.do
-    def __remove_refs(self, ref):
-        """
-        Remove a weakref.
+    def _add(self, parent: _browser_model.Node, obj, label: str,
+             children=None) -> _browser_model.Node:
         """
+        Add the canonical row of ``obj`` under ``parent``.
 
-        @_check_types.do
-        def iter_tree(parent: QtWidgets.QTreeWidgetItem):
-            """
-            Iterate over the tree.
+        :param parent: Category row (or, for a wire service loop, the
+            wire's row).
+        :type parent: :class:`_browser_model.Node`
+        :param obj: Object the row stands for.
+        :type obj: :class:`_object_base.ObjectBase`
+        :param label: Row text.
+        :type label: str
+        :param children: Called with ``obj`` when the row is first
+            expanded; returns the cross-reference rows under it. ``None``
+            for an object with nothing under it.
+        :type children: collections.abc.Callable | None
+        :rtype: :class:`_browser_model.Node`
+        """
 
-            :param parent: Parent object.
-            :type parent: :class:`QtWidgets.QTreeWidgetItem`
+        builder = None
 
-            :returns: Iterator or iterable result. UNKNOWN details.
-            """
+        if children is not None:
+            # the builder must not keep the object alive -- its row is
+            # removed when the object is collected
+            obj_ref = weakref.ref(obj)
 
-            for i in range(parent.childCount() - 1, -1, -1):
-                child = parent.child(i)
-                d_ref = child.data(0, QtCore.Qt.ItemDataRole.UserRole)
-                if d_ref is not None:
-                    data = d_ref()
-                    if data is None:
-                        parent.removeChild(child)
-                        continue
-                if child.childCount() > 0:
-                    iter_tree(child)
+            def builder():
+                obj_ = obj_ref()
+                if obj_ is None:
+                    return []
 
-        if self._root is not None:
-            iter_tree(self._root)
+                return children(obj_)
 
-        try:
-            self._weakrefs.remove(ref)
-        except ValueError:
-            pass
+        node = _browser_model.Node(label, builder=builder)
+        self._model.add(parent, node, obj)
+        return node
 
     @_check_types.do
-    def _set_data(self, item: QtWidgets.QTreeWidgetItem, ref):  # NOQA
+    def _mention(self, label: str, obj) -> _browser_model.Node:
         """
-        Set the data.
-
-        :param item: Item identifier or value.
-        :type item: :class:`QtWidgets.QTreeWidgetItem`
+        A plain-text cross-reference row for ``obj`` under another object's
+        row. It holds a weakref to ``obj`` (the raw DB row, see
+        :meth:`_resolve_object`) so double clicking it still works.
 
-        :param ref: Value for ``ref``.
-        :type ref: UNKNOWN
+        :param label: Row text.
+        :type label: str
+        :param obj: Referenced object.
+        :rtype: :class:`_browser_model.Node`
         """
 
-        item.setData(0, QtCore.Qt.ItemDataRole.UserRole, ref)
+        return self._model.mention(label, obj)
 
     @_check_types.do
-    def _mark_canonical(self, item: QtWidgets.QTreeWidgetItem) -> None:
+    def _group(self, label: str, children: list) -> _browser_model.Node:  # NOQA
         """
-        Flag ``item`` as an object's canonical entry (see
-        :attr:`_CANONICAL_ROLE`) so search can tell it apart from the
-        plain-text cross-reference mentions of the same object nested under
-        unrelated tree items.
+        A label row ("Wires", "Terminals", ...) grouping cross-references.
 
-        :param item: Item to flag.
-        :type item: :class:`QtWidgets.QTreeWidgetItem`
+        :param label: Row text.
+        :type label: str
+        :param children: Rows under it.
+        :type children: list[:class:`_browser_model.Node`]
+        :rtype: :class:`_browser_model.Node`
         """
 
-        item.setData(0, self._CANONICAL_ROLE, True)
+        return _browser_model.Node(label, expandable=True, children=children)
 
     @_check_types.do
     def add_boot(self, obj: _boot.Boot):
@@ -647,20 +642,16 @@ class ObjectBrowserPanel(QtWidgets.QWidget):
         :type obj: :class:`_boot.Boot`
         """
 
-        ref = weakref.ref(obj, self.__remove_refs)
-        self._weakrefs.append(ref)
-
-        treeitem = self._append_item(self._boots, obj.db_obj.name, True)
-        self._set_data(treeitem, ref)
+        self._add(self._model.category('Boots'), obj, obj.db_obj.name,
+                  self._boot_children)
 
+    @_check_types.do
+    def _boot_children(self, obj: _boot.Boot) -> list:
         housing = obj.db_obj.housing
-        ref2 = weakref.ref(housing, self.__remove_refs)
-        self._weakrefs.append(ref2)
-        child = self._append_item(treeitem, f'Housing: {housing.name}')
-        self._set_data(child, ref2)
+        if housing is None:
+            return []
 
-        self._mark_canonical(treeitem)
-        obj.set_treeitem(treeitem)
+        return [self._mention(f'Housing: {housing.name}', housing)]
 
     @_check_types.do
     def add_bundle(self, obj: _bundle.Bundle):
@@ -671,20 +662,13 @@ class ObjectBrowserPanel(QtWidgets.QWidget):
         :type obj: :class:`_bundle.Bundle`
         """
 
-        ref = weakref.ref(obj, self.__remove_refs)
-        self._weakrefs.append(ref)
-
-        treeitem = self._append_item(self._bundles, obj.db_obj.name, True)
-        self._set_data(treeitem, ref)
+        self._add(self._model.category('Bundles'), obj, obj.db_obj.name,
+                  self._bundle_children)
 
-        for wire in obj.db_obj.wires:
-            ref2 = weakref.ref(wire, self.__remove_refs)
-            self._weakrefs.append(ref2)
-            child = self._append_item(treeitem, f'Wire: {wire.name}')
-            self._set_data(child, ref2)
-
-        self._mark_canonical(treeitem)
-        obj.set_treeitem(treeitem)
+    @_check_types.do
+    def _bundle_children(self, obj: _bundle.Bundle) -> list:
+        return [self._mention(f'Wire: {wire.name}', wire)
+                for wire in obj.db_obj.wires]
 
     @_check_types.do
     def add_cavity(self, obj: _cavity.Cavity):
@@ -695,34 +679,26 @@ class ObjectBrowserPanel(QtWidgets.QWidget):
         :type obj: :class:`_cavity.Cavity`
         """
 
-        ref = weakref.ref(obj, self.__remove_refs)
-        self._weakrefs.append(ref)
+        self._add(self._model.category('Cavities'), obj, obj.db_obj.name,
+                  self._cavity_children)
 
-        treeitem = self._append_item(self._cavities, obj.db_obj.name, True)
-        self._set_data(treeitem, ref)
+    @_check_types.do
+    def _cavity_children(self, obj: _cavity.Cavity) -> list:
+        children = []
 
         housing = obj.db_obj.housing
-        ref2 = weakref.ref(housing, self.__remove_refs)
-        self._weakrefs.append(ref2)
-        child = self._append_item(treeitem, f'Housing: {housing.name}')
-        self._set_data(child, ref2)
+        if housing is not None:
+            children.append(self._mention(f'Housing: {housing.name}', housing))
 
         terminal = obj.db_obj.terminal
         if terminal is not None:
-            ref2 = weakref.ref(terminal, self.__remove_refs)
-            self._weakrefs.append(ref2)
-            child = self._append_item(treeitem, f'Terminal: {terminal.name}')
-            self._set_data(child, ref2)
+            children.append(self._mention(f'Terminal: {terminal.name}', terminal))
 
         seal = obj.db_obj.seal
         if seal is not None:
-            ref2 = weakref.ref(seal, self.__remove_refs)
-            self._weakrefs.append(ref2)
-            child = self._append_item(treeitem, f'Seal: {seal.name}')
-            self._set_data(child, ref2)
+            children.append(self._mention(f'Seal: {seal.name}', seal))
 
-        self._mark_canonical(treeitem)
-        obj.set_treeitem(treeitem)
+        return children
 
     @_check_types.do
     def add_circuit(self, obj: _circuit.Circuit):
@@ -733,42 +709,27 @@ class ObjectBrowserPanel(QtWidgets.QWidget):
         :type obj: :class:`_circuit.Circuit`
         """
 
-        ref = weakref.ref(obj, self.__remove_refs)
-        self._weakrefs.append(ref)
-
-        treeitem = self._append_item(self._circuits, obj.db_obj.name, True)
-        self._set_data(treeitem, ref)
-
-        wire_treeitem = self._append_item(treeitem, 'Wires', True)
-        for wire in obj.db_obj.wires:
-            ref2 = weakref.ref(wire, self.__remove_refs)
-            self._weakrefs.append(ref2)
-            wireitem = self._append_item(wire_treeitem, f'Wire: {wire.name}')
-            self._set_data(wireitem, ref2)
+        self._add(self._model.category('Circuits'), obj, obj.db_obj.name,
+                  self._circuit_children)
 
-        loop_treeitem = self._append_item(treeitem, 'Wire Service Loops', True)
-        for wire in obj.db_obj.wire_service_loops:
-            ref2 = weakref.ref(wire, self.__remove_refs)
-            self._weakrefs.append(ref2)
-            loopitem = self._append_item(loop_treeitem, f'Wire Loop: {wire.name}')
-            self._set_data(loopitem, ref2)
-
-        terminal_treeitem = self._append_item(treeitem, 'Terminals', True)
-        for terminal in obj.db_obj.terminals:
-            ref2 = weakref.ref(terminal, self.__remove_refs)
-            self._weakrefs.append(ref2)
-            terminalitem = self._append_item(terminal_treeitem, f'Terminal: {terminal.name}')
-            self._set_data(terminalitem, ref2)
-
-        splice_treeitem = self._append_item(treeitem, 'Splices', True)
-        for splice in obj.db_obj.splices:
-            ref2 = weakref.ref(splice, self.__remove_refs)
-            self._weakrefs.append(ref2)
-            spliceitem = self._append_item(splice_treeitem, f'Splice: {splice.name}')
-            self._set_data(spliceitem, ref2)
+    @_check_types.do
+    def _circuit_children(self, obj: _circuit.Circuit) -> list:
+        db_obj = obj.db_obj
 
-        self._mark_canonical(treeitem)
-        obj.set_treeitem(treeitem)
+        return [
+            self._group('Wires', [
+                self._mention(f'Wire: {wire.name}', wire)
+                for wire in db_obj.wires]),
+            self._group('Wire Service Loops', [
+                self._mention(f'Wire Loop: {loop.name}', loop)
+                for loop in db_obj.wire_service_loops]),
+            self._group('Terminals', [
+                self._mention(f'Terminal: {terminal.name}', terminal)
+                for terminal in db_obj.terminals]),
+            self._group('Splices', [
+                self._mention(f'Splice: {splice.name}', splice)
+                for splice in db_obj.splices]),
+        ]
 
     @_check_types.do
     def add_cover(self, obj: _cover.Cover):
@@ -779,21 +740,8 @@ class ObjectBrowserPanel(QtWidgets.QWidget):
         :type obj: :class:`_cover.Cover`
         """
 
-        ref = weakref.ref(obj, self.__remove_refs)
-        self._weakrefs.append(ref)
-
-        treeitem = self._append_item(self._covers, obj.db_obj.name, True)
-        self._set_data(treeitem, ref)
-
-        housing = obj.db_obj.housing
-        if housing is not None:
-            ref2 = weakref.ref(housing, self.__remove_refs)
-            self._weakrefs.append(ref2)
-            child = self._append_item(treeitem, f'Housing: {housing.name}')
-            self._set_data(child, ref2)
-
-        self._mark_canonical(treeitem)
-        obj.set_treeitem(treeitem)
+        self._add(self._model.category('Covers'), obj, obj.db_obj.name,
+                  self._housing_mention)
 
     @_check_types.do
     def add_cpa_lock(self, obj: _cpa_lock.CPALock):
@@ -804,21 +752,17 @@ class ObjectBrowserPanel(QtWidgets.QWidget):
         :type obj: :class:`_cpa_lock.CPALock`
         """
 
-        ref = weakref.ref(obj, self.__remove_refs)
-        self._weakrefs.append(ref)
-
-        treeitem = self._append_item(self._cpa_locks, obj.db_obj.name, True)
-        self._set_data(treeitem, ref)
+        self._add(self._model.category('CPA Locks'), obj, obj.db_obj.name,
+                  self._housing_mention)
 
+    @_check_types.do
+    def _housing_mention(self, obj) -> list:
+        # covers, CPA and TPA locks only reference the housing they sit on
         housing = obj.db_obj.housing
-        if housing is not None:
-            ref2 = weakref.ref(housing, self.__remove_refs)
-            self._weakrefs.append(ref2)
-            child = self._append_item(treeitem, f'Housing: {housing.name}')
-            self._set_data(child, ref2)
+        if housing is None:
+            return []
 
-        self._mark_canonical(treeitem)
-        obj.set_treeitem(treeitem)
+        return [self._mention(f'Housing: {housing.name}', housing)]
 
     @_check_types.do
     def add_housing(self, obj: _housing.Housing):
@@ -829,52 +773,35 @@ class ObjectBrowserPanel(QtWidgets.QWidget):
         :type obj: :class:`_housing.Housing`
         """
 
-        ref = weakref.ref(obj, self.__remove_refs)
-        self._weakrefs.append(ref)
+        self._add(self._model.category('Housings'), obj, obj.db_obj.name,
+                  self._housing_children)
 
-        treeitem = self._append_item(self._housings, obj.db_obj.name, True)
-        self._set_data(treeitem, ref)
-
-        seal = obj.db_obj.seal
-        cover = obj.db_obj.cover
-        cpa_lock = obj.db_obj.cpa_lock
-        tpa_locks = obj.db_obj.tpa_locks
-        cavities = obj.db_obj.cavities
+    @_check_types.do
+    def _housing_children(self, obj: _housing.Housing) -> list:
+        db_obj = obj.db_obj
+        children = []
 
+        seal = db_obj.seal
         if seal is not None:
-            ref2 = weakref.ref(seal, self.__remove_refs)
-            self._weakrefs.append(ref2)
-            child = self._append_item(treeitem, f'Seal: {seal.name}')
-            self._set_data(child, ref2)
+            children.append(self._mention(f'Seal: {seal.name}', seal))
 
+        cover = db_obj.cover
         if cover is not None:
-            ref2 = weakref.ref(cover, self.__remove_refs)
-            self._weakrefs.append(ref2)
-            child = self._append_item(treeitem, f'Cover: {cover.name}')
-            self._set_data(child, ref2)
+            children.append(self._mention(f'Cover: {cover.name}', cover))
 
+        cpa_lock = db_obj.cpa_lock
         if cpa_lock is not None:
-            ref2 = weakref.ref(cpa_lock, self.__remove_refs)
-            self._weakrefs.append(ref2)
-            child = self._append_item(treeitem, f'CPA Lock: {cpa_lock.name}')
-            self._set_data(child, ref2)
+            children.append(self._mention(f'CPA Lock: {cpa_lock.name}', cpa_lock))
 
-        tpa_locks_treeitem = self._append_item(treeitem, 'TPA Locks', True)
-        for lock in tpa_locks:
-            ref2 = weakref.ref(lock, self.__remove_refs)
-            self._weakrefs.append(ref2)
-            lockitem = self._append_item(tpa_locks_treeitem, f'TPA Lock: {lock.name}')
-            self._set_data(lockitem, ref2)
+        children.append(self._group('TPA Locks', [
+            self._mention(f'TPA Lock: {lock.name}', lock)
+            for lock in db_obj.tpa_locks]))
 
-        cavities_treeitem = self._append_item(treeitem, 'Cavities', True)
-        for cavity in cavities:
-            ref2 = weakref.ref(cavity, self.__remove_refs)
-            self._weakrefs.append(ref2)
-            cavityitem = self._append_item(cavities_treeitem, f'Cavity: {cavity.name}')
-            self._set_data(cavityitem, ref2)
+        children.append(self._group('Cavities', [
+            self._mention(f'Cavity: {cavity.name}', cavity)
+            for cavity in db_obj.cavities]))
 
-        self._mark_canonical(treeitem)
-        obj.set_treeitem(treeitem)
+        return children
 
     @_check_types.do
     def add_note(self, obj: _note.Note):
@@ -885,14 +812,7 @@ class ObjectBrowserPanel(QtWidgets.QWidget):
         :type obj: :class:`_note.Note`
         """
 
-        ref = weakref.ref(obj, self.__remove_refs)
-        self._weakrefs.append(ref)
-
-        treeitem = self._append_item(self._notes, obj.db_obj.notes)
-        self._set_data(treeitem, ref)
-
-        self._mark_canonical(treeitem)
-        obj.set_treeitem(treeitem)
+        self._add(self._model.category('Notes'), obj, obj.db_obj.notes)
 
     @_check_types.do
     def add_seal(self, obj: _seal.Seal):
@@ -903,34 +823,26 @@ class ObjectBrowserPanel(QtWidgets.QWidget):
         :type obj: :class:`_seal.Seal`
         """
 
-        ref = weakref.ref(obj, self.__remove_refs)
-        self._weakrefs.append(ref)
-
-        treeitem = self._append_item(self._seals, obj.db_obj.name, True)
-        self._set_data(treeitem, ref)
+        self._add(self._model.category('Seals'), obj, obj.db_obj.name,
+                  self._seal_children)
 
-        housing = obj.db_obj.housing
-        cavity = obj.db_obj.cavity
-        terminal = obj.db_obj.terminal
+    @_check_types.do
+    def _seal_children(self, obj: _seal.Seal) -> list:
+        db_obj = obj.db_obj
 
+        housing = db_obj.housing
         if housing is not None:
-            ref2 = weakref.ref(housing, self.__remove_refs)
-            self._weakrefs.append(ref2)
-            child = self._append_item(treeitem, f'Housing: {housing.name}')
-            self._set_data(child, ref2)
-        elif cavity is not None:
-            ref2 = weakref.ref(cavity, self.__remove_refs)
-            self._weakrefs.append(ref2)
-            child = self._append_item(treeitem, f'Cavity: {cavity.name}')
-            self._set_data(child, ref2)
-        elif terminal is not None:
-            ref2 = weakref.ref(terminal, self.__remove_refs)
-            self._weakrefs.append(ref2)
-            child = self._append_item(treeitem, f'Terminal: {terminal.name}')
-            self._set_data(child, ref2)
-
-        self._mark_canonical(treeitem)
-        obj.set_treeitem(treeitem)
+            return [self._mention(f'Housing: {housing.name}', housing)]
+
+        cavity = db_obj.cavity
+        if cavity is not None:
+            return [self._mention(f'Cavity: {cavity.name}', cavity)]
+
+        terminal = db_obj.terminal
+        if terminal is not None:
+            return [self._mention(f'Terminal: {terminal.name}', terminal)]
+
+        return []
 
     @_check_types.do
     def add_splice(self, obj: _splice.Splice):
@@ -941,20 +853,13 @@ class ObjectBrowserPanel(QtWidgets.QWidget):
         :type obj: :class:`_splice.Splice`
         """
 
-        ref = weakref.ref(obj, self.__remove_refs)
-        self._weakrefs.append(ref)
-
-        treeitem = self._append_item(self._splices, obj.db_obj.name, True)
-        self._set_data(treeitem, ref)
-
-        for wire in obj.db_obj.wires:
-            ref2 = weakref.ref(wire, self.__remove_refs)
-            self._weakrefs.append(ref2)
-            child = self._append_item(treeitem, f'Wire: {wire.name}')
-            self._set_data(child, ref2)
+        self._add(self._model.category('Splices'), obj, obj.db_obj.name,
+                  self._splice_children)
 
-        self._mark_canonical(treeitem)
-        obj.set_treeitem(treeitem)
+    @_check_types.do
+    def _splice_children(self, obj: _splice.Splice) -> list:
+        return [self._mention(f'Wire: {wire.name}', wire)
+                for wire in obj.db_obj.wires]
 
     @_check_types.do
     def add_terminal(self, obj: _terminal.Terminal):
@@ -965,34 +870,27 @@ class ObjectBrowserPanel(QtWidgets.QWidget):
         :type obj: :class:`_terminal.Terminal`
         """
 
-        ref = weakref.ref(obj, self.__remove_refs)
-        self._weakrefs.append(ref)
-
-        treeitem = self._append_item(self._terminals, obj.db_obj.name, True)
-        self._set_data(treeitem, ref)
+        self._add(self._model.category('Terminals'), obj, obj.db_obj.name,
+                  self._terminal_children)
 
-        seal = obj.db_obj.seal
-        cavity = obj.db_obj.cavity
-        circuit = obj.db_obj.circuit
+    @_check_types.do
+    def _terminal_children(self, obj: _terminal.Terminal) -> list:
+        db_obj = obj.db_obj
+        children = []
 
+        seal = db_obj.seal
         if seal is not None:
-            ref2 = weakref.ref(seal, self.__remove_refs)
-            self._weakrefs.append(ref2)
-            child = self._append_item(treeitem, f'Seal: {seal.name}')
-            self._set_data(child, ref2)
+            children.append(self._mention(f'Seal: {seal.name}', seal))
+
+        cavity = db_obj.cavity
         if cavity is not None:
-            ref2 = weakref.ref(cavity, self.__remove_refs)
-            self._weakrefs.append(ref2)
-            child = self._append_item(treeitem, f'Cavity: {cavity.name}')
-            self._set_data(child, ref2)
+            children.append(self._mention(f'Cavity: {cavity.name}', cavity))
+
+        circuit = db_obj.circuit
         if circuit is not None:
-            ref2 = weakref.ref(circuit, self.__remove_refs)
-            self._weakrefs.append(ref2)
-            child = self._append_item(treeitem, f'Circuit: {circuit.name}')
-            self._set_data(child, ref2)
+            children.append(self._mention(f'Circuit: {circuit.name}', circuit))
 
-        self._mark_canonical(treeitem)
-        obj.set_treeitem(treeitem)
+        return children
 
     @_check_types.do
     def add_tpa_lock(self, obj: _tpa_lock.TPALock):
@@ -1003,20 +901,8 @@ class ObjectBrowserPanel(QtWidgets.QWidget):
         :type obj: :class:`_tpa_lock.TPALock`
         """
 
-        ref = weakref.ref(obj, self.__remove_refs)
-        self._weakrefs.append(ref)
-
-        treeitem = self._append_item(self._tpa_locks, obj.db_obj.name, True)
-        self._set_data(treeitem, ref)
-
-        housing = obj.db_obj.housing
-        ref2 = weakref.ref(housing, self.__remove_refs)
-        self._weakrefs.append(ref2)
-        child = self._append_item(treeitem, f'Housing: {housing.name}')
-        self._set_data(child, ref2)
-
-        self._mark_canonical(treeitem)
-        obj.set_treeitem(treeitem)
+        self._add(self._model.category('TPA Locks'), obj, obj.db_obj.name,
+                  self._housing_mention)
 
     @_check_types.do
     def add_transition(self, obj: _transition.Transition):
@@ -1027,36 +913,34 @@ class ObjectBrowserPanel(QtWidgets.QWidget):
         :type obj: :class:`_transition.Transition`
         """
 
-        ref = weakref.ref(obj, self.__remove_refs)
-        self._weakrefs.append(ref)
+        self._add(self._model.category('Transitions'), obj, obj.db_obj.name,
+                  self._transition_children)
 
-        treeitem = self._append_item(self._transitions, obj.db_obj.name, True)
-        self._set_data(treeitem, ref)
+    @_check_types.do
+    def _transition_children(self, obj: _transition.Transition) -> list:
+        db_obj = obj.db_obj
+        branches = [db_obj.branch1, db_obj.branch2, db_obj.branch3,
+                    db_obj.branch4, db_obj.branch5, db_obj.branch6]
 
-        branches = [obj.db_obj.branch1, obj.db_obj.branch2, obj.db_obj.branch3,
-                    obj.db_obj.branch4, obj.db_obj.branch5, obj.db_obj.branch6]
+        children = []
 
         for i, branch in enumerate(branches):
             if branch is None:
                 continue
 
-            branch_treeitem = self._append_item(treeitem, f'Branch {i + 1}', True)
+            branch_children = []
+
             bundle = branch.bundle
             if bundle is not None:
-                ref2 = weakref.ref(bundle, self.__remove_refs)
-                self._weakrefs.append(ref2)
-                child = self._append_item(branch_treeitem, f'Bundle: {bundle.name}')
-                self._set_data(child, ref2)
+                branch_children.append(self._mention(f'Bundle: {bundle.name}', bundle))
+
+            branch_children.append(self._group('Wires', [
+                self._mention(f'Wire: {wire.name}', wire)
+                for wire in branch.wires]))
 
-            wires_treeitem = self._append_item(branch_treeitem, 'Wires', True)
-            for wire in branch.wires:
-                ref2 = weakref.ref(wire, self.__remove_refs)
-                self._weakrefs.append(ref2)
-                child = self._append_item(wires_treeitem, f'Wire: {wire.name}')
-                self._set_data(child, ref2)
+            children.append(self._group(f'Branch {i + 1}', branch_children))
 
-        self._mark_canonical(treeitem)
-        obj.set_treeitem(treeitem)
+        return children
 
     @_check_types.do
     def add_wire(self, obj: _wire.Wire):
@@ -1067,38 +951,27 @@ class ObjectBrowserPanel(QtWidgets.QWidget):
         :type obj: :class:`_wire.Wire`
         """
 
-        ref = weakref.ref(obj, self.__remove_refs)
-        self._weakrefs.append(ref)
+        self._add(self._model.category('Wires'), obj, obj.db_obj.name,
+                  self._wire_children)
 
-        treeitem = self._append_item(self._wires, obj.db_obj.name, True)
-        self._set_data(treeitem, ref)
-
-        terminals = obj.db_obj.terminals
-        circuit = obj.db_obj.circuit
-        wire_markers = obj.db_obj.wire_markers
+    @_check_types.do
+    def _wire_children(self, obj: _wire.Wire) -> list:
+        db_obj = obj.db_obj
+        children = []
 
+        circuit = db_obj.circuit
         if circuit is not None:
-            ref2 = weakref.ref(circuit, self.__remove_refs)
-            self._weakrefs.append(ref2)
-            child = self._append_item(treeitem, f'Circuit: {circuit.name}')
-            self._set_data(child, ref2)
+            children.append(self._mention(f'Circuit: {circuit.name}', circuit))
 
-        terminals_treeitem = self._append_item(treeitem, 'Terminals', True)
-        for terminal in terminals:
-            ref2 = weakref.ref(terminal, self.__remove_refs)
-            self._weakrefs.append(ref2)
-            child = self._append_item(terminals_treeitem, f'Terminal: {terminal.name}')
-            self._set_data(child, ref2)
+        children.append(self._group('Terminals', [
+            self._mention(f'Terminal: {terminal.name}', terminal)
+            for terminal in db_obj.terminals]))
 
-        markers_treeitem = self._append_item(treeitem, 'Wire Markers', True)
-        for marker in wire_markers:
-            ref2 = weakref.ref(marker, self.__remove_refs)
-            self._weakrefs.append(ref2)
-            child = self._append_item(markers_treeitem, f'Marker: {marker.name}')
-            self._set_data(child, ref2)
+        children.append(self._group('Wire Markers', [
+            self._mention(f'Marker: {marker.name}', marker)
+            for marker in db_obj.wire_markers]))
 
-        self._mark_canonical(treeitem)
-        obj.set_treeitem(treeitem)
+        return children
 
     @_check_types.do
     def add_wire_marker(self, obj: _wire_marker.WireMarker):
@@ -1109,20 +982,16 @@ class ObjectBrowserPanel(QtWidgets.QWidget):
         :type obj: :class:`_wire_marker.WireMarker`
         """
 
-        ref = weakref.ref(obj, self.__remove_refs)
-        self._weakrefs.append(ref)
-
-        treeitem = self._append_item(self._wire_markers, obj.db_obj.name, True)
-        self._set_data(treeitem, ref)
+        self._add(self._model.category('Wire Markers'), obj, obj.db_obj.name,
+                  self._wire_marker_children)
 
+    @_check_types.do
+    def _wire_marker_children(self, obj: _wire_marker.WireMarker) -> list:
         wire = obj.db_obj.wire
-        ref2 = weakref.ref(wire, self.__remove_refs)
-        self._weakrefs.append(ref2)
-        child = self._append_item(treeitem, f'Wire: {wire.name}')
-        self._set_data(child, ref2)
+        if wire is None:
+            return []
 
-        self._mark_canonical(treeitem)
-        obj.set_treeitem(treeitem)
+        return [self._mention(f'Wire: {wire.name}', wire)]
 
     @_check_types.do
     def add_wire_service_loop(self, obj: _wire_service_loop.WireServiceLoop):
@@ -1131,10 +1000,10 @@ class ObjectBrowserPanel(QtWidgets.QWidget):
 
         A wire has at most one service loop, so it isn't a browsable
         category of its own the way boots/seals/etc. are -- it's shown
-        nested under its wire's existing tree item instead. Requires the
-        wire's own item to already exist (``add_wire`` runs first, both
-        during project load and for an interactive add onto an
-        already-placed wire); silently does nothing otherwise.
+        nested under its wire's existing row instead. Requires the wire's
+        own row to already exist (``add_wire`` runs first, both during
+        project load and for an interactive add onto an already-placed
+        wire); silently does nothing otherwise.
 
         :param obj: Object instance to operate on.
         :type obj: :class:`_wire_service_loop.WireServiceLoop`
@@ -1148,40 +1017,32 @@ class ObjectBrowserPanel(QtWidgets.QWidget):
         if wire_obj is None:
             return
 
-        wire_treeitem = wire_obj.get_treeitem()
-        if wire_treeitem is None:
+        wire_node = self._model.node_of(wire_obj)
+        if wire_node is None:
             return
 
-        ref = weakref.ref(obj, self.__remove_refs)
-        self._weakrefs.append(ref)
+        self._add(wire_node, obj, f'Wire Service Loop: {obj.db_obj.name}',
+                  self._wire_service_loop_children)
 
-        treeitem = self._append_item(
-            wire_treeitem, f'Wire Service Loop: {obj.db_obj.name}', True)
-        self._set_data(treeitem, ref)
+    @_check_types.do
+    def _wire_service_loop_children(self, obj: _wire_service_loop.WireServiceLoop) -> list:
+        children = []
 
         terminal = obj.db_obj.terminal
-        circuit = obj.db_obj.circuit
-
         if terminal is not None:
-            ref2 = weakref.ref(terminal, self.__remove_refs)
-            self._weakrefs.append(ref2)
-            child = self._append_item(treeitem, f'Terminal: {terminal.name}')
-            self._set_data(child, ref2)
+            children.append(self._mention(f'Terminal: {terminal.name}', terminal))
 
+        circuit = obj.db_obj.circuit
         if circuit is not None:
-            ref2 = weakref.ref(circuit, self.__remove_refs)
-            self._weakrefs.append(ref2)
-            child = self._append_item(treeitem, f'Circuit: {circuit.name}')
-            self._set_data(child, ref2)
+            children.append(self._mention(f'Circuit: {circuit.name}', circuit))
 
-        self._mark_canonical(treeitem)
-        obj.set_treeitem(treeitem)
+        return children
 
     @_check_types.do
     def set_selected(self, obj: "_object_base.ObjectBase"):
         """
         Reflect a selection made in one of the editors: expand the tree
-        down to the object's item, highlight it, and scroll it into view.
+        down to the object's row, highlight it, and scroll it into view.
         Called by ``mainframe._set_selected`` for every selection change,
         including this panel's own (see :meth:`select_object`) -- driving
         the tree here too keeps behavior identical no matter which editor
@@ -1193,46 +1054,44 @@ class ObjectBrowserPanel(QtWidgets.QWidget):
 
         if obj is None:
             self._treectrl.clearSelection()
-            self._treectrl.setCurrentItem(None)
+            self._treectrl.setCurrentIndex(QtCore.QModelIndex())
             return
 
-        treeitem = obj.get_treeitem()
-        if treeitem is None:
-            # object types the browser has no category for (project,
-            # generic, project_model, wire_layout, bundle_layout) and
-            # gizmo objects (RotationRings, MoveArrows) never get one
+        # object types the browser has no category for (project, generic,
+        # project_model, wire_layout, bundle_layout), gizmo objects
+        # (RotationRings, MoveArrows) and rows still held back by a
+        # project load have no index
+        if not self._model.index_of(obj).isValid():
             return
 
-        self._focus_item(treeitem)
-
-    @_check_types.do
-    def _expand_ancestors(self, item: QtWidgets.QTreeWidgetItem) -> None:
-        """
-        Expand every ancestor of ``item`` so it is actually visible.
-
-        :param item: Item to reveal.
-        :type item: :class:`QtWidgets.QTreeWidgetItem`
-        """
-
-        parent = item.parent()
-        while parent is not None:
-            parent.setExpanded(True)
-            parent = parent.parent()
+        self._focus_node(self._model.node_of(obj))
 
     @_check_types.do
-    def _focus_item(self, item: QtWidgets.QTreeWidgetItem) -> None:
+    def _focus_node(self, node: _browser_model.Node) -> None:
         """
-        Expand down to ``item``, make it current, and scroll it into view.
+        Expand down to ``node``, make it current, and scroll it into view.
         Shared by :meth:`set_selected` (a selection made in an editor) and
         :meth:`_goto_match` (a search hit).
 
-        :param item: Item to focus.
-        :type item: :class:`QtWidgets.QTreeWidgetItem`
+        :param node: Row to focus.
+        :type node: :class:`_browser_model.Node`
         """
 
-        self._expand_ancestors(item)
-        self._treectrl.setCurrentItem(item)
-        self._treectrl.scrollToItem(item)
+        ancestors = []
+        parent = node.parent
+        while parent is not None and parent.parent is not None:
+            ancestors.append(parent)
+            parent = parent.parent
+
+        # top down; building an ancestor's cross-references moves the rows
+        # below it, so the index of the node is only taken at the end
+        for ancestor in reversed(ancestors):
+            self._model.populate(ancestor)
+            self._treectrl.expand(self._model.index_of_node(ancestor))
+
+        index = self._model.index_of_node(node)
+        self._treectrl.setCurrentIndex(index)
+        self._treectrl.scrollTo(index)
 
     @_check_types.do
     def _resolve_object(self, obj):
@@ -1304,51 +1163,27 @@ class ObjectBrowserPanel(QtWidgets.QWidget):
         _menu_ops.show_properties_for_object(self.mainframe, obj)
 
     @_check_types.do
-    def _category_roots(self) -> dict[str, QtWidgets.QTreeWidgetItem]:
+    def _category_roots(self) -> dict[str, _browser_model.Node]:
         """
-        Return the current category label -> live root item mapping.
+        Return the current category label -> category row mapping.
 
         Resolved fresh on every call (rather than cached) since
-        :meth:`reset` replaces every category item wholesale.
+        :meth:`reset` replaces every category row wholesale.
 
-        :rtype: dict[str, :class:`QtWidgets.QTreeWidgetItem`]
+        :rtype: dict[str, :class:`_browser_model.Node`]
         """
 
-        return {label: getattr(self, attr) for label, attr in self._CATEGORY_ATTRS}
-
-    @_check_types.do
-    def _ancestor_category(self, item: QtWidgets.QTreeWidgetItem):
-        """
-        Return the category root ``item`` lives under, or ``None``.
-
-        Walks up to the nearest ancestor that is one of the category roots
-        -- a wire service loop's canonical item, for example, is a child of
-        its wire's item, itself a child of the "Wires" root, two levels up.
-
-        :param item: Item to categorize.
-        :type item: :class:`QtWidgets.QTreeWidgetItem`
-        :rtype: :class:`QtWidgets.QTreeWidgetItem` | None
-        """
-
-        roots = self._category_roots().values()
-        parent = item.parent()
-        while parent is not None:
-            for root in roots:
-                if root is parent:
-                    return parent
-            parent = parent.parent()
-
-        return None
+        return {label: self._model.category(label) for label in self._CATEGORIES}
 
     @_check_types.do
     def _find_matches(self, keyword: str,
-                      category_label: str) -> list[QtWidgets.QTreeWidgetItem]:
+                      category_label: str) -> list[_browser_model.Node]:
         """
         Return the search hits for ``keyword``, trying path-style traversal
         first and falling back to a plain name search.
 
         ``keyword`` may use ``:`` or ``.`` as a level marker to walk down
-        the tree as displayed -- e.g. ``"Housing 1:Cavity 1"`` finds items
+        the tree as displayed -- e.g. ``"Housing 1:Cavity 1"`` finds rows
         under "Housing 1" (any depth, including cross-reference mentions
         like "Cavity: Cavity 1") that in turn contain "Cavity 1". A marker
         only counts as such with no adjacent whitespace, so
@@ -1356,15 +1191,15 @@ class ObjectBrowserPanel(QtWidgets.QWidget):
         string. If no marker is present, or the path search finds nothing
         (the marker character turns out to just be part of a real name,
         e.g. "Housing 1.5"), falls back to a plain substring match of the
-        whole original ``keyword`` against every *canonical* item's own
+        whole original ``keyword`` against every *canonical* row's own
         label -- cross-reference mentions never match in that fallback.
 
         :param keyword: Lowercased search text.
         :type keyword: str
         :param category_label: Combo box selection; ``'All Categories'``
-            (or anything not in :attr:`_CATEGORY_ATTRS`) searches everything.
+            (or anything not in :attr:`_CATEGORIES`) searches everything.
         :type category_label: str
-        :rtype: list[:class:`QtWidgets.QTreeWidgetItem`]
+        :rtype: list[:class:`_browser_model.Node`]
         """
 
         segments = self._split_path_query(keyword)
@@ -1397,31 +1232,33 @@ class ObjectBrowserPanel(QtWidgets.QWidget):
 
     @_check_types.do
     def _find_path_matches(self, segments: list[str],
-                           category_label: str) -> list[QtWidgets.QTreeWidgetItem]:
+                           category_label: str) -> list[_browser_model.Node]:
         """
         Resolve a marker-separated path, one segment per tree level.
 
-        Every item (canonical entries and cross-reference mentions alike)
+        Every row (canonical entries and cross-reference mentions alike)
         is fair game here -- unlike the plain name fallback, the point is
         to follow the tree exactly as displayed, and a housing's cavities,
         for instance, only appear nested under it as cross-references (the
         canonical cavity entries live entirely separately, under the
-        top-level "Cavities" category).
+        top-level "Cavities" category). That means the cross-reference
+        rows of everything searched have to exist, so the rows under the
+        starting point that were never expanded are built first.
 
         :param segments: Path segments in top-to-bottom order.
         :type segments: list[str]
         :param category_label: Restricts the first segment's search the
             same way :meth:`_find_name_matches` does; later segments only
-            ever search inside items already found, so they need no
+            ever search inside rows already found, so they need no
             separate restriction.
         :type category_label: str
-        :rtype: list[:class:`QtWidgets.QTreeWidgetItem`]
+        :rtype: list[:class:`_browser_model.Node`]
         """
 
         category_root = self._category_roots().get(category_label)
-        start = category_root if category_root is not None else self._root
-        if start is None:
-            return []
+        start = category_root if category_root is not None else self._model.top
+
+        self._model.populate_all(start)
 
         candidates = self._items_containing(start, segments[0])
 
@@ -1437,69 +1274,53 @@ class ObjectBrowserPanel(QtWidgets.QWidget):
         return candidates
 
     @_check_types.do
-    def _items_containing(self, root_item: QtWidgets.QTreeWidgetItem,
-                          needle: str) -> list[QtWidgets.QTreeWidgetItem]:
+    def _items_containing(self, root_node: _browser_model.Node,  # NOQA
+                          needle: str) -> list[_browser_model.Node]:
         """
-        Return every descendant of ``root_item`` (any depth, not including
-        ``root_item`` itself) whose label contains ``needle``.
+        Return every row below ``root_node`` (any depth, not including
+        ``root_node`` itself) whose label contains ``needle``.
 
-        :param root_item: Item to search under.
-        :type root_item: :class:`QtWidgets.QTreeWidgetItem`
+        :param root_node: Row to search under.
+        :type root_node: :class:`_browser_model.Node`
         :param needle: Lowercased substring to look for.
         :type needle: str
-        :rtype: list[:class:`QtWidgets.QTreeWidgetItem`]
+        :rtype: list[:class:`_browser_model.Node`]
         """
 
-        found = []
-
-        @_check_types.do
-        def _walk(parent):
-            for i in range(parent.childCount()):
-                child = parent.child(i)
-                if needle in child.text(0).lower():
-                    found.append(child)
-
-                _walk(child)
-
-        _walk(root_item)
-        return found
+        return [node for node in root_node.walk() if needle in node.label.lower()]
 
     @_check_types.do
     def _find_name_matches(self, keyword: str,
-                           category_label: str) -> list[QtWidgets.QTreeWidgetItem]:
+                           category_label: str) -> list[_browser_model.Node]:
         """
-        Return every canonical item whose own label contains ``keyword``
-        (case-insensitive), optionally restricted to one category's subtree.
+        Return every canonical row whose own label contains ``keyword``
+        (case-insensitive), optionally restricted to one category.
 
         Cross-reference mentions (e.g. "Housing: X" under a Boot) are never
-        matched -- only entries :meth:`_mark_canonical` flagged.
+        matched -- only canonical rows, which always exist, so nothing has
+        to be built to search them.
 
         :param keyword: Lowercased search text.
         :type keyword: str
         :param category_label: Combo box selection; ``'All Categories'``
-            (or anything not in :attr:`_CATEGORY_ATTRS`) searches everything.
+            (or anything not in :attr:`_CATEGORIES`) searches everything.
         :type category_label: str
-        :rtype: list[:class:`QtWidgets.QTreeWidgetItem`]
+        :rtype: list[:class:`_browser_model.Node`]
         """
 
-        category_root = self._category_roots().get(category_label)
-        matches = []
+        roots = self._category_roots()
+        category_root = roots.get(category_label)
+        if category_root is not None:
+            roots = [category_root]
+        else:
+            roots = list(roots.values())
 
-        @_check_types.do
-        def _walk(parent):
-            for i in range(parent.childCount()):
-                child = parent.child(i)
-
-                if (child.data(0, self._CANONICAL_ROLE) and
-                        keyword in child.text(0).lower() and
-                        (category_root is None or
-                         self._ancestor_category(child) is category_root)):
-                    matches.append(child)
-
-                _walk(child)
+        matches = []
 
-        if self._root is not None:
-            _walk(self._root)
+        for root in roots:
+            for node in root.walk():
+                if node.canonical and keyword in node.label.lower():
+                    matches.append(node)
 
         return matches
 
@@ -1535,21 +1356,20 @@ class ObjectBrowserPanel(QtWidgets.QWidget):
         self._search_status.setText(f'{self._search_index + 1} of {len(matches)}')
 
     @_check_types.do
-    def _goto_match(self, item: QtWidgets.QTreeWidgetItem) -> None:
+    def _goto_match(self, node: _browser_model.Node) -> None:
         """
         Focus a search hit in the tree and select its object in every
         editor -- equivalent to clicking the row, but immediate since a
         deliberate Search click carries no double-click ambiguity to guard
         against.
 
-        :param item: Matched item.
-        :type item: :class:`QtWidgets.QTreeWidgetItem`
+        :param node: Matched row.
+        :type node: :class:`_browser_model.Node`
         """
 
-        self._focus_item(item)
+        self._focus_node(node)
 
-        ref = item.data(0, QtCore.Qt.ItemDataRole.UserRole)
-        obj = ref() if ref is not None else None
+        obj = node.ref() if node.ref is not None else None
         if obj is not None:
             self.select_object(obj)
 
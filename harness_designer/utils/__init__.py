@@ -37,6 +37,8 @@ get_documents = _paths.get_documents
 compute_smooth_normals = _mn.compute_smooth_normals
 compute_face_normals = _mn.compute_face_normals
 compute_normals = _mn.compute_normals
+compute_indexed_normals = _mn.compute_indexed_normals
+expand_indexed = _mn.expand_indexed
 compute_face_indexes = _mn.compute_face_indexes
 
 
@@ -199,3 +199,110 @@ def compute_face_indexes(vertices):
     indices_array = np.arange(len(vertices), dtype=np.uint32)
 
     return indices_array
+
+
+@_check_types.do
+def compute_indexed_normals(
+    vertices: np.ndarray,
+    faces: np.ndarray
+) -> tuple[np.ndarray, int, np.ndarray]:
+    """
+    Compute smooth normals for an indexed mesh.
+
+    Same smooth normals as :func:`compute_normals`, but every distinct
+    (position, smooth normal) pair is stored once and the triangles
+    reference it through an element array. Face normals are not stored at
+    all -- the faces/edges geometry shaders derive them per triangle when
+    flat shading is selected, so flat/smooth stays a per-draw switch.
+
+    Vertices are kept in order of first use so neighbouring triangles keep
+    referencing neighbouring vertices (post-transform cache locality).
+
+    Args:
+        vertices: numpy array of shape (V, 3) - original vertex positions
+        faces: numpy array of shape (F, 3) - triangle indices into vertices array
+
+    Returns:
+        tuple: (packed_array, vertex_count, indices)
+            - packed_array: single flat float32 array holding the unique
+              vertex positions and smooth normals packed end to end; every
+              block is vertex_count*3 floats:
+                  [0   : n*3)  positions
+                  [n*3 : n*6)  smooth normals
+            - vertex_count: number of unique vertices
+            - indices: uint32 element array of length F*3, pass its length
+              to glDrawElements
+    """
+    _, face_normals = _process_verts_for_normals(vertices, faces)
+
+    V = len(vertices)
+    vertex_normal_sum = np.zeros((V, 3), dtype=float)
+
+    repeated_face_normals = np.repeat(face_normals, 3, axis=0)
+    vertex_indices = faces.ravel()
+    np.add.at(vertex_normal_sum, vertex_indices, repeated_face_normals)
+
+    vn_norm = np.linalg.norm(vertex_normal_sum, axis=1, keepdims=True)
+    safe_vn_norm = np.maximum(vn_norm, 1e-6)
+    smooth_normals = vertex_normal_sum / safe_vn_norm
+
+    isolated = (vn_norm.squeeze() < 1e-6)
+    if np.any(isolated):
+        smooth_normals[isolated] = 0.0
+
+    # One row per triangle corner, deduplicated on the exact float32 values
+    # the GPU would see -- two corners only merge if they are bit-identical.
+    corners = np.concatenate(
+        (vertices[vertex_indices], smooth_normals[vertex_indices]),
+        axis=1).astype(np.float32)
+
+    _, first_use, inverse = np.unique(
+        corners, axis=0, return_index=True, return_inverse=True)
+
+    # np.unique sorts lexicographically; renumber by first use instead
+    order = np.argsort(first_use, kind='stable')
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+
+    unique_corners = corners[first_use[order]]
+    indices = rank[inverse.ravel()].astype(np.uint32)
+
+    packed = np.concatenate((unique_corners[:, :3].ravel(),
+                             unique_corners[:, 3:].ravel()))
+
+    return packed, len(unique_corners), indices
+
+
+@_check_types.do
+def expand_indexed(packed: np.ndarray, vertex_count: int,
+                   indices: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Expand an indexed mesh from :func:`compute_indexed_normals` back into
+    the triangle-soup blocks :func:`compute_normals` would have produced.
+
+    Returns:
+        tuple: (vertices_array, smooth_normals_array, face_normals_array),
+            each a flat float32 array of len(indices)*3 floats.
+    """
+    n = vertex_count
+
+    positions = np.asarray(packed[:n * 3], dtype=np.float32).reshape(-1, 3)
+    smooth = np.asarray(packed[n * 3:n * 6], dtype=np.float32).reshape(-1, 3)
+
+    indices = np.asarray(indices, dtype=np.int64)
+    triangles = positions[indices].reshape(-1, 3, 3).astype(float)
+
+    face_normals = np.cross(triangles[:, 1] - triangles[:, 0],  # NOQA
+                            triangles[:, 2] - triangles[:, 0])
+
+    norms = np.linalg.norm(face_normals, axis=1, keepdims=True)
+    face_normals = face_normals / np.maximum(norms, 1e-6)
+
+    degenerate = (norms.squeeze(axis=1) < 1e-6)
+    if np.any(degenerate):
+        face_normals[degenerate] = 0.0
+
+    face_normals_array = np.repeat(
+        face_normals[:, np.newaxis, :], 3, axis=1).astype(np.float32).ravel()
+
+    return (positions[indices].ravel(), smooth[indices].ravel(), face_normals_array)